@@ -33,6 +33,13 @@ except ImportError as e:
     print(f"⚠️ Risk Bridge not available: {e}")
     RISK_BRIDGE_AVAILABLE = False
 
+# Shared market feed daemon (one upstream websocket for all monitors)
+try:
+    from core.monitoring.market_feed import feed_available, stream_ticks
+    MARKET_FEED_AVAILABLE = True
+except ImportError:
+    MARKET_FEED_AVAILABLE = False
+
 # Crash protection
 MAX_RECONNECT_ATTEMPTS = 100
 RECONNECT_DELAY = 5
@@ -302,8 +309,25 @@ class WebSocketMonitor:
                         self.display_status()
                         break
 
+    async def connect_feed(self) -> bool:
+        """Consume ticks from the local market feed daemon; False if it is not running"""
+        if not (MARKET_FEED_AVAILABLE and feed_available()):
+            return False
+
+        print("\n🔌 Using shared market feed daemon")
+        try:
+            async for tick in stream_ticks(list(POSITIONS)):
+                await self.handle_message(tick.as_ticker_message())
+        except (ConnectionError, OSError) as e:
+            print(f"⚠️  Market feed unavailable ({e}), falling back to direct WebSocket")
+            return False
+        return True
+
     async def connect(self):
         """Connect to Coinbase WebSocket"""
+        if await self.connect_feed():
+            return
+
         try:
             import websockets
         except ImportError:
@@ -31,6 +31,8 @@ sys.path.insert(0, str(SS3_ROOT / 'src'))  # For pandas_ta shim
 from dotenv import load_dotenv
 load_dotenv(SS3_ROOT / '.env', override=True)
 
+from core.config.brain_store import get_brain_store
+
 # Trading profiles
 try:
     from core.config.trading_profiles import get_profile_for_symbol, ProfileType, PROFILES
@@ -105,8 +107,7 @@ class OvernightRunner:
     def _load_brain(self) -> dict:
         """Load BRAIN.json"""
         try:
-            with open(self.brain_path) as f:
-                return json.load(f)
+            return get_brain_store(self.brain_path).read()
         except Exception as e:
             logger.error(f"Failed to load BRAIN.json: {e}")
             return {}
@@ -125,6 +126,7 @@ class OvernightRunner:
             self.data_pipeline = None
 
         # Research Swarm
+        self._research_future = None
         try:
             from core.integrations.research_swarm import ResearchSwarm
             self.research_swarm = ResearchSwarm()
@@ -216,14 +218,15 @@ class OvernightRunner:
         if self.moondev:
             logger.info("\n[1.5/5] MoonDev Strategy Signals...")
             try:
-                import ccxt
                 import pandas as pd
+                from core.exchanges.client_pool import get_exchange
 
                 # Exchanges: binance.us, kraken, coinbase (user confirmed)
+                # Pooled clients: markets load once per process, not per cycle
                 exchanges = [
-                    ('binanceus', ccxt.binanceus()),
-                    ('kraken', ccxt.kraken()),
-                    ('coinbase', ccxt.coinbase()),
+                    ('binanceus', get_exchange('binanceus')),
+                    ('kraken', get_exchange('kraken')),
+                    ('coinbase', get_exchange('coinbase')),
                 ]
 
                 def get_ohlcv_multi(sym: str):
@@ -278,22 +281,30 @@ class OvernightRunner:
                 logger.error(f"  MoonDev error: {e}")
                 results['components']['moondev'] = f'ERROR: {e}'
 
-        # 2. Research Swarm (dispatch async)
+        # 2. Research Swarm (runs on the swarm's own pool - never blocks the cycle)
         if self.research_swarm:
             logger.info("\n[2/4] Research Swarm...")
             try:
+                # Harvest the report from the previous dispatch, if it has finished
+                if self._research_future is not None and self._research_future.done():
+                    finished, self._research_future = self._research_future, None
+                    swarm_result = finished.result()
+                    results['research_swarm'] = swarm_result.get('synthesis')
+                    results['manus_task'] = swarm_result.get('sources', {}).get('manus', {}).get('url')
+                    logger.info(f"  Research ready ({swarm_result.get('elapsed_seconds')}s), Manus task: {results.get('manus_task')}")
+
                 # Only run deep research every 4 cycles (1 hour if 15min interval)
-                if self.cycle_count % 4 == 1:
-                    swarm_result = self.research_swarm.research(
+                if self.cycle_count % 4 == 1 and self._research_future is None:
+                    self._research_future = self.research_swarm.submit(
                         query="Current crypto market conditions, regime, and top opportunities",
                         context=f"SS_III cycle {self.cycle_count}",
                         asset="BTC",
-                        wait_for_manus=False,  # Don't block - Manus runs async
-                        manus_timeout=30  # Short timeout if we do wait
+                        wait_for_manus=False  # Manus is polled in the background
                     )
                     results['components']['research_swarm'] = 'DISPATCHED'
-                    results['manus_task'] = swarm_result.get('sources', {}).get('manus', {}).get('url')
-                    logger.info(f"  Manus task: {results.get('manus_task')}")
+                elif self._research_future is not None:
+                    results['components']['research_swarm'] = 'RUNNING'
+                    logger.info("  Previous research still running")
                 else:
                     results['components']['research_swarm'] = 'SKIPPED (runs hourly)'
                     logger.info("  Skipped (runs hourly)")
@@ -8,6 +8,7 @@ Usage:
     python bin/position_monitor.py              # Run once
     python bin/position_monitor.py --daemon     # Run continuously (every 60s)
     python bin/position_monitor.py --dry-run    # Check prices without executing
+    python bin/position_monitor.py --stream     # React to every market feed tick
 
 Config: BRAIN.json → positions_monitor section
 """
@@ -18,6 +19,7 @@ import json
 import time
 import argparse
 import logging
+import queue
 import requests
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +37,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger('position_monitor')
 
+try:
+    from core.monitoring.market_feed import connect_feed
+except ImportError:
+    connect_feed = None
+
+from core.monitoring.trigger_index import ABOVE, BELOW, TriggerIndex
+
 # NTFY for notifications
 NTFY_TOPIC = "sovereignshadow_dc4d2fa1"
 
@@ -94,6 +103,16 @@ class PositionMonitor:
         self.positions = self._load_positions()
         self.watchlist = self._load_watchlist()
 
+        # TP/SL ladders and watchlist levels, looked up per price by bisect
+        self.triggers = TriggerIndex()
+        self._index_triggers()
+
+        # Live prices from the shared market feed daemon when it is running
+        symbols = {p.symbol for p in self.positions} | {w.symbol for w in self.watchlist}
+        self.feed = connect_feed(symbols) if connect_feed and symbols else None
+        if self.feed:
+            logger.info("✓ Using shared market feed for prices")
+
         # Watchlist check counter (check every N cycles to reduce API calls)
         self.watchlist_check_interval = 5  # Check watchlist every 5 position cycles
         self.cycle_count = 0
@@ -104,13 +123,14 @@ class PositionMonitor:
     def _init_exchange(self):
         """Initialize Coinbase connection via ccxt"""
         try:
-            import ccxt
+            from core.exchanges.client_pool import get_exchange
             config = json.load(open(self.config_path))
 
-            exchange = ccxt.coinbase({
-                'apiKey': config['exchange']['key'],
-                'secret': config['exchange']['secret'],
-            })
+            exchange = get_exchange(
+                'coinbase',
+                apiKey=config['exchange']['key'],
+                secret=config['exchange']['secret'],
+            )
 
             # Test connection
             exchange.fetch_balance()
@@ -180,8 +200,48 @@ class PositionMonitor:
         with open(self.brain_path, 'w') as f:
             json.dump(brain, f, indent=2)
 
+    def _index_triggers(self):
+        """(Re)arm the trigger index from the current positions and watchlist"""
+        self.triggers.clear()
+        for position in self.positions:
+            self.triggers.add(position.symbol, position.stop_loss, BELOW, ('SL', position))
+            self.triggers.add(position.symbol, position.take_profit, ABOVE, ('TP1', position))
+            if position.take_profit_2:
+                self.triggers.add(position.symbol, position.take_profit_2, ABOVE, ('TP2', position))
+        for item in self.watchlist:
+            self.triggers.add(item.symbol, item.alert_below, BELOW, ('WATCH', item))
+            self.triggers.add(item.symbol, item.alert_above, ABOVE, ('WATCH', item))
+
+    def get_prices(self, symbols) -> Dict[str, float]:
+        """Prices for many symbols: market feed first, then one bulk Coinbase fetch"""
+        prices = {}
+        symbols = list(dict.fromkeys(symbols))
+        if self.feed:
+            for symbol in symbols:
+                price = self.feed.get_price(symbol, max_age=120)
+                if price is not None:
+                    prices[symbol] = price
+
+        missing = [s for s in symbols if s not in prices]
+        if missing and self.exchange:
+            try:
+                tickers = self.exchange.fetch_tickers([f"{s}/USDC" for s in missing])
+                for symbol in missing:
+                    ticker = tickers.get(f"{symbol}/USDC") or {}
+                    if ticker.get('last') is not None:
+                        prices[symbol] = ticker['last']
+            except Exception as e:
+                logger.error(f"Bulk price fetch failed for {len(missing)} symbols: {e}")
+
+        return prices
+
     def get_current_price(self, symbol: str, delay: float = 0.1) -> Optional[float]:
-        """Fetch current price from Coinbase with rate limiting"""
+        """Current price from the market feed, else Coinbase REST with rate limiting"""
+        if self.feed:
+            price = self.feed.get_price(symbol, max_age=120)
+            if price is not None:
+                return price
+
         if not self.exchange:
             return None
 
@@ -193,9 +253,10 @@ class PositionMonitor:
             logger.error(f"Failed to get price for {symbol}: {e}")
             return None
 
-    def check_position(self, position: Position) -> Dict:
+    def check_position(self, position: Position, current_price: Optional[float] = None) -> Dict:
         """Check if position hit TP or SL"""
-        current_price = self.get_current_price(position.symbol)
+        if current_price is None:
+            current_price = self.get_current_price(position.symbol)
 
         if current_price is None:
             return {'action': 'ERROR', 'reason': 'Could not fetch price'}
@@ -214,15 +275,19 @@ class PositionMonitor:
             'reason': None
         }
 
+        hits = {kind for kind, target in
+                (t.payload for t in self.triggers.satisfied(position.symbol, current_price))
+                if target is position}
+
         # Check STOP LOSS
-        if current_price <= position.stop_loss:
+        if 'SL' in hits:
             result['action'] = 'SELL_SL'
             result['reason'] = f"Stop loss hit: ${current_price:.4f} <= ${position.stop_loss:.4f}"
             result['sell_qty'] = position.qty  # Sell all
 
         # Check TAKE PROFIT
-        elif current_price >= position.take_profit:
-            if position.take_profit_2 and current_price < position.take_profit_2:
+        elif 'TP1' in hits or 'TP2' in hits:
+            if position.take_profit_2 and 'TP2' not in hits:
                 # Partial sell at TP1
                 result['action'] = 'SELL_TP1'
                 result['reason'] = f"TP1 hit: ${current_price:.4f} >= ${position.take_profit:.4f}"
@@ -283,15 +348,23 @@ class PositionMonitor:
         except Exception as e:
             logger.error(f"Notification failed: {e}")
 
-    def check_watchlist(self) -> List[Dict]:
+    def check_watchlist(self, prices: Optional[Dict[str, float]] = None) -> List[Dict]:
         """Check watchlist items for price alerts"""
         alerts = []
+        if prices is None:
+            prices = self.get_prices(item.symbol for item in self.watchlist)
 
-        for item in self.watchlist:
-            price = self.get_current_price(item.symbol)
-            if price is None:
-                continue
+        for symbol, price in prices.items():
+            items = [t.payload[1] for t in self.triggers.satisfied(symbol, price) if t.payload[0] == 'WATCH']
+            alerts.extend(self._watch_alerts(items, price))
 
+        return alerts
+
+    def _watch_alerts(self, items: List[WatchItem], price: float) -> List[Dict]:
+        """Notify for watchlist items whose level the price is beyond"""
+        alerts = []
+
+        for item in {id(i): i for i in items}.values():
             alert = None
             if price <= item.alert_below:
                 alert = {
@@ -334,8 +407,15 @@ class PositionMonitor:
         logger.info(f"Position Check @ {datetime.now().strftime('%H:%M:%S')} (cycle {self.cycle_count})")
         logger.info(f"{'='*50}")
 
-        for position in self.positions:
-            result = self.check_position(position)
+        # One bulk price fetch per cycle instead of a rate-limited call per symbol
+        check_watchlist = bool(self.watchlist) and self.cycle_count % self.watchlist_check_interval == 0
+        symbols = [p.symbol for p in self.positions]
+        if check_watchlist:
+            symbols += [w.symbol for w in self.watchlist]
+        prices = self.get_prices(symbols)
+
+        for position in list(self.positions):
+            result = self.check_position(position, prices.get(position.symbol))
             results.append(result)
 
             # Handle error case
@@ -359,31 +439,20 @@ class PositionMonitor:
             )
 
             # Execute if needed
-            if result['action'] in ['SELL_SL', 'SELL_TP', 'SELL_TP1']:
-                success = self.execute_sell(
-                    symbol=result['symbol'],
-                    qty=result['sell_qty'],
-                    reason=result['reason']
-                )
-
-                if success and result['action'] == 'SELL_TP1':
-                    # Update position with remaining qty
-                    position.qty -= result['sell_qty']
-                    position.entry_price = result['current_price']  # Reset entry for trailing
-                elif success:
-                    # Remove position entirely
-                    self.positions.remove(position)
+            self._execute(position, result)
 
         # Save updated positions
         if not self.dry_run:
             self._save_positions()
 
-        # Check watchlist only every N cycles (to reduce API calls - 34 items is a lot)
-        if self.watchlist and (self.cycle_count % self.watchlist_check_interval == 0):
+        # Check watchlist only every N cycles (to reduce notification noise)
+        if check_watchlist:
             logger.info(f"\n{'='*50}")
             logger.info(f"Watchlist Check ({len(self.watchlist)} items)")
             logger.info(f"{'='*50}")
-            alerts = self.check_watchlist()
+            alerts = self.check_watchlist(
+                {w.symbol: prices[w.symbol] for w in self.watchlist if w.symbol in prices}
+            )
             if alerts:
                 logger.info(f"Triggered {len(alerts)} watchlist alert(s)")
         elif self.watchlist:
@@ -392,6 +461,77 @@ class PositionMonitor:
 
         return results
 
+    def _execute(self, position: Position, result: Dict):
+        """Sell if the check says so and update the tracked position"""
+        if result['action'] not in ['SELL_SL', 'SELL_TP', 'SELL_TP1']:
+            return
+
+        success = self.execute_sell(
+            symbol=result['symbol'],
+            qty=result['sell_qty'],
+            reason=result['reason']
+        )
+
+        if success and result['action'] == 'SELL_TP1':
+            # Update position with remaining qty
+            position.qty -= result['sell_qty']
+            position.entry_price = result['current_price']  # Reset entry for trailing
+        elif success:
+            # Remove position entirely
+            self.positions.remove(position)
+            self.triggers.remove_where(lambda t: t.payload[1] is position, position.symbol)
+
+    def handle_tick(self, symbol: str, price: float) -> List[Dict]:
+        """
+        React to one streamed price: only triggers crossed since the last
+        tick are looked at (O(log n)), so quiet ticks cost a bisect.
+        """
+        hits = self.triggers.update(symbol, price)
+        results = []
+
+        positions = [t.payload[1] for t in hits if t.payload[0] != 'WATCH']
+        for position in {id(p): p for p in positions}.values():
+            if not any(p is position for p in self.positions):
+                continue
+            result = self.check_position(position, price)
+            logger.info(f"[{result['action']}] {symbol}: ${price:.4f} ({result['pnl_pct']:+.2f}%)")
+            self._execute(position, result)
+            results.append(result)
+
+        watched = [t.payload[1] for t in hits if t.payload[0] == 'WATCH']
+        if watched:
+            self._watch_alerts(watched, price)
+
+        if results and not self.dry_run:
+            self._save_positions()
+        return results
+
+    def run_stream(self):
+        """Run off market feed ticks instead of a polling interval"""
+        if not self.feed:
+            logger.error("Market feed daemon not running - use --daemon for polling mode")
+            return
+
+        ticks = queue.Queue()
+        self.feed.on_tick = ticks.put  # feed thread only enqueues; sells run here
+        logger.info(f"Streaming {len(self.triggers)} triggers across {len(self.triggers.symbols())} symbols")
+
+        self.notify(
+            title="🟢 Position Monitor Started",
+            message=f"Tracking {len(self.positions)} positions\nMode: market feed stream"
+        )
+
+        try:
+            while True:
+                tick = ticks.get()
+                self.handle_tick(tick.symbol, tick.price)
+        except KeyboardInterrupt:
+            logger.info("Stopped by user")
+            self.notify(
+                title="🔴 Position Monitor Stopped",
+                message="Manual shutdown"
+            )
+
     def run_daemon(self, interval_seconds: int = 60):
         """Run continuously"""
         logger.info(f"Starting daemon mode (checking every {interval_seconds}s)")
@@ -418,6 +558,7 @@ def main():
     parser.add_argument('--daemon', action='store_true', help='Run continuously')
     parser.add_argument('--interval', type=int, default=60, help='Check interval in seconds')
     parser.add_argument('--dry-run', action='store_true', help='Check only, no execution')
+    parser.add_argument('--stream', action='store_true', help='React to market feed ticks (needs market_feed daemon)')
     args = parser.parse_args()
 
     monitor = PositionMonitor(dry_run=args.dry_run)
@@ -442,7 +583,9 @@ def main():
         }, indent=2))
         return
 
-    if args.daemon:
+    if args.stream:
+        monitor.run_stream()
+    elif args.daemon:
         monitor.run_daemon(interval_seconds=args.interval)
     else:
         monitor.run_check()
@@ -13,6 +13,7 @@ Usage:
 import os
 import sys
 import json
+import queue
 import time
 import requests
 import subprocess
@@ -24,6 +25,13 @@ from typing import Optional
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+try:
+    from core.monitoring.market_feed import connect_feed
+except ImportError:
+    connect_feed = None
+
+from core.monitoring.trigger_index import ABOVE, BELOW, TriggerIndex
+
 # =============================================================================
 # ASSET CLASSIFICATION SYSTEM
 # =============================================================================
@@ -170,6 +178,29 @@ def fetch_prices(symbols: list, api_key: str) -> dict:
         print(f"Error fetching prices: {e}")
         return {}
 
+def prices_from_feed(feed, symbols: list) -> dict:
+    """
+    PriceData from the shared market feed for symbols it can fully describe
+    (fresh tick, 24h open and an hour of history); the rest still go to REST.
+    """
+    results = {}
+    for symbol in symbols:
+        tick = feed.get_tick(symbol, max_age=120)
+        change_1h = feed.change_pct(symbol, 3600)
+        if tick is None or tick.change_24h_pct is None or change_1h is None:
+            continue
+        results[symbol] = PriceData(
+            symbol=symbol,
+            price=tick.price,
+            change_24h=tick.change_24h_pct,
+            change_1h=change_1h,
+            volume_24h=(tick.volume_24h or 0) * tick.price,
+            market_cap=0,
+            timestamp=datetime.fromtimestamp(tick.ts),
+            tier=ASSET_TO_TIER.get(symbol, "unknown")
+        )
+    return results
+
 # =============================================================================
 # ALERT SYSTEM
 # =============================================================================
@@ -181,6 +212,7 @@ class AlertManager:
         self.cooldown_minutes = 15
         self.alerts_today = []
         self.state_file = PROJECT_ROOT / "memory" / "alert_state.json"
+        self.triggers = TriggerIndex()  # tier thresholds as price levels, for ticks
         self.load_state()
 
     def load_state(self):
@@ -247,6 +279,65 @@ class AlertManager:
 
         return alerts
 
+    def arm_triggers(self, price_data: PriceData):
+        """
+        Turn the tier thresholds into price levels around the 1h/24h reference
+        prices implied by the latest scan, so streamed ticks between scans are
+        checked with a bisect instead of re-evaluating every rule.
+        """
+        tier_config = ASSET_TIERS.get(price_data.tier, ASSET_TIERS["watchlist"])
+        threshold = tier_config["price_change_alert"]
+        symbol = price_data.symbol
+        self.triggers.last_price[symbol] = price_data.price  # ticks fire on crossings from here
+
+        for kind, change, pct in (("price_1h", price_data.change_1h, threshold),
+                                  ("price_24h", price_data.change_24h, threshold * 1.5)):
+            if price_data.price <= 0 or change <= -100:
+                continue
+            reference = price_data.price / (1 + change / 100)
+            # Stable ids: re-arming on the next scan replaces the old levels
+            self.triggers.add(symbol, reference * (1 + pct / 100), ABOVE,
+                              (kind, reference, price_data.tier), once=True, trigger_id=f"{symbol}_{kind}_up")
+            self.triggers.add(symbol, reference * (1 - pct / 100), BELOW,
+                              (kind, reference, price_data.tier), once=True, trigger_id=f"{symbol}_{kind}_down")
+
+    def on_price(self, symbol: str, price: float) -> list:
+        """Alerts for one streamed price, from the levels armed at the last scan"""
+        hits = self.triggers.update(symbol, price)
+        if not hits:
+            return []
+
+        cooldown_key = f"{symbol}_alert"
+        if cooldown_key in self.alert_cooldowns and datetime.now() < self.alert_cooldowns[cooldown_key]:
+            return []
+
+        alerts = []
+        for trigger in hits:
+            kind, reference, tier = trigger.payload
+            tier_config = ASSET_TIERS.get(tier, ASSET_TIERS["watchlist"])
+            threshold = tier_config["price_change_alert"]
+            change = (price / reference - 1) * 100
+            if kind == "price_1h":
+                direction = "PUMPING" if change > 0 else "DUMPING"
+                message = f"{symbol} {direction} {abs(change):.1f}% in 1 hour!"
+                priority = "urgent" if abs(change) >= threshold * 1.5 else tier_config["priority"]
+            else:
+                direction = "UP" if change > 0 else "DOWN"
+                message = f"{symbol} {direction} {abs(change):.1f}% in 24 hours"
+                priority = tier_config["priority"]
+            alerts.append({
+                "type": kind,
+                "symbol": symbol,
+                "tier": tier,
+                "message": message,
+                "change": change,
+                "price": price,
+                "priority": priority
+            })
+
+        self.alert_cooldowns[cooldown_key] = datetime.now() + timedelta(minutes=self.cooldown_minutes)
+        return alerts
+
     def process_alerts(self, alerts: list, voice_enabled: bool = True):
         """Process and send alerts"""
         for alert in alerts:
@@ -354,10 +445,10 @@ class AlertManager:
 # MAIN SCANNER
 # =============================================================================
 
-def run_scan(voice_enabled: bool = True):
+def run_scan(voice_enabled: bool = True, feed=None, alert_mgr: Optional[AlertManager] = None):
     """Run a single price scan"""
     api_key = load_api_key()
-    if not api_key:
+    if not api_key and feed is None:
         print("ERROR: CRYPTOCOMPARE_API_KEY not found in .env")
         return
 
@@ -366,15 +457,19 @@ def run_scan(voice_enabled: bool = True):
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}")
 
-    # Fetch all prices
-    prices = fetch_prices(ALL_ASSETS, api_key)
+    # Fetch all prices (market feed first, REST for whatever it cannot cover)
+    prices = prices_from_feed(feed, ALL_ASSETS) if feed else {}
+    missing = [s for s in ALL_ASSETS if s not in prices]
+    if missing and api_key:
+        prices.update(fetch_prices(missing, api_key))
 
     if not prices:
         print("Failed to fetch prices")
         return
 
-    # Initialize alert manager
-    alert_mgr = AlertManager()
+    # Initialize alert manager (the daemon keeps one across scans)
+    if alert_mgr is None:
+        alert_mgr = AlertManager()
 
     # Check each asset
     all_alerts = []
@@ -391,6 +486,7 @@ def run_scan(voice_enabled: bool = True):
                 # Check alerts
                 alerts = alert_mgr.check_alert_conditions(p)
                 all_alerts.extend(alerts)
+                alert_mgr.arm_triggers(p)
 
     # Process any alerts
     if all_alerts:
@@ -400,16 +496,42 @@ def run_scan(voice_enabled: bool = True):
         print(f"\n✅ No alerts triggered. Markets stable.")
 
     print(f"\n{'='*60}")
+    return alert_mgr
+
+def watch_ticks(feed, alert_mgr: AlertManager, seconds: float, voice_enabled: bool = True):
+    """Check streamed ticks against the armed trigger levels until the next scan"""
+    ticks = queue.Queue()
+    feed.on_tick = ticks.put
+    deadline = time.monotonic() + seconds
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                tick = ticks.get(timeout=remaining)
+            except queue.Empty:
+                return
+            alerts = alert_mgr.on_price(tick.symbol, tick.price)
+            if alerts:
+                alert_mgr.process_alerts(alerts, voice_enabled)
+    finally:
+        feed.on_tick = None
 
 def run_daemon(interval: int = 60):
     """Run continuous monitoring"""
     print("Starting daemon mode... Press Ctrl+C to stop")
+    feed = connect_feed(ALL_ASSETS) if connect_feed else None
+    alert_mgr = AlertManager()
 
     while True:
         try:
-            run_scan(voice_enabled=True)
+            run_scan(voice_enabled=True, feed=feed, alert_mgr=alert_mgr)
             print(f"\nNext scan in {interval} seconds...")
-            time.sleep(interval)
+            if feed:
+                watch_ticks(feed, alert_mgr, interval)
+            else:
+                time.sleep(interval)
         except KeyboardInterrupt:
             print("\nDaemon stopped.")
             break
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+🏦 AAVE Block Watcher
+Event-driven health-factor monitoring for AAVE v3 positions
+
+Instead of polling getUserAccountData on a timer with several separate
+RPC calls, the watcher:
+- checks eth_blockNumber (one tiny call) and does nothing until a new block
+- on a new block, reads every account, per-reserve balance and oracle price
+  in ONE Multicall3 aggregate3 eth_call pinned to that block
+- caches the decoded state per block number
+- recomputes health factor and liquidation distance locally when prices
+  move between blocks (on_price), so alerts fire without touching the RPC
+
+Talks raw JSON-RPC with hand-rolled ABI encoding (no web3 dependency), so
+any callable `rpc(method, params)` works - including a local stub in tests.
+
+Usage:
+    watcher = AaveBlockWatcher(JsonRpc(os.getenv('INFURA_URL')), [user_address])
+    watcher.subscribe(lambda alert: print(alert['message']))
+    watcher.start()
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# AAVE v3 Ethereum mainnet
+AAVE_POOL = "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2"
+AAVE_DATA_PROVIDER = "0x7B4EB56E7CD4b454BA8ff71E4518426369a138a3"
+AAVE_ORACLE = "0x54586bE62E3c3580375aE3723C145253060Ca0C2"
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Function selectors (first 4 bytes of keccak256 of the signature)
+SEL_GET_USER_ACCOUNT_DATA = "bf92857c"    # Pool.getUserAccountData(address)
+SEL_GET_RESERVES_LIST = "d1946dbc"        # Pool.getReservesList()
+SEL_GET_USER_RESERVE_DATA = "28dd2d01"    # DataProvider.getUserReserveData(address,address)
+SEL_GET_RESERVE_CONFIG = "3e150141"       # DataProvider.getReserveConfigurationData(address)
+SEL_GET_ASSETS_PRICES = "9d23d9f2"        # Oracle.getAssetsPrices(address[])
+SEL_AGGREGATE3 = "82ad56cb"               # Multicall3.aggregate3((address,bool,bytes)[])
+
+BASE_DECIMALS = 8          # AAVE v3 base currency = USD with 8 decimals
+MAX_UINT256 = 2**256 - 1
+COVERAGE_TOLERANCE = 1e-3  # relative gap between summed reserves and account totals
+
+# Same thresholds as core/modules/safety/aave_monitor_v2.py
+CRITICAL_HF = 1.6
+WARNING_HF = 2.0
+SAFE_HF = 3.0
+
+
+class RpcError(RuntimeError):
+    """JSON-RPC error response"""
+
+
+# ============================================================================
+# ABI helpers (static words, address[], and Multicall3 aggregate3)
+# ============================================================================
+
+def _word(value: int) -> bytes:
+    return int(value).to_bytes(32, "big")
+
+
+def _address_word(address: str) -> bytes:
+    return bytes(12) + bytes.fromhex(address[2:] if address.startswith("0x") else address)
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(-len(data) % 32)
+
+
+def words(data: bytes) -> List[int]:
+    return [int.from_bytes(data[i:i + 32], "big") for i in range(0, len(data) - len(data) % 32, 32)]
+
+
+def to_address(word: int) -> str:
+    return "0x" + word.to_bytes(32, "big")[12:].hex()
+
+
+def encode_call(selector: str, *addresses: str) -> bytes:
+    """Calldata for a function taking only address arguments"""
+    return bytes.fromhex(selector) + b"".join(_address_word(a) for a in addresses)
+
+
+def encode_address_array_call(selector: str, addresses: Sequence[str]) -> bytes:
+    """Calldata for f(address[])"""
+    return (bytes.fromhex(selector) + _word(32) + _word(len(addresses))
+            + b"".join(_address_word(a) for a in addresses))
+
+
+def decode_address_array(data: bytes) -> List[str]:
+    w = words(data)
+    start = w[0] // 32
+    return [to_address(x) for x in w[start + 1:start + 1 + w[start]]]
+
+
+def decode_uint_array(data: bytes) -> List[int]:
+    w = words(data)
+    start = w[0] // 32
+    return w[start + 1:start + 1 + w[start]]
+
+
+def encode_aggregate3(calls: Sequence[Tuple[str, bytes]], allow_failure: bool = True) -> bytes:
+    """aggregate3((address target, bool allowFailure, bytes callData)[])"""
+    tuples = []
+    for target, calldata in calls:
+        tuples.append(_address_word(target) + _word(int(allow_failure)) + _word(96)
+                      + _word(len(calldata)) + _pad(calldata))
+    heads, offset = [], 32 * len(tuples)
+    for encoded in tuples:
+        heads.append(_word(offset))
+        offset += len(encoded)
+    return (bytes.fromhex(SEL_AGGREGATE3) + _word(32) + _word(len(tuples))
+            + b"".join(heads) + b"".join(tuples))
+
+
+def decode_aggregate3(data: bytes) -> List[Tuple[bool, bytes]]:
+    """Result[] = (bool success, bytes returnData)[]"""
+    base = int.from_bytes(data[0:32], "big")
+    count = int.from_bytes(data[base:base + 32], "big")
+    heads = base + 32
+    results = []
+    for i in range(count):
+        tuple_at = heads + int.from_bytes(data[heads + 32 * i:heads + 32 * (i + 1)], "big")
+        success = bool(int.from_bytes(data[tuple_at:tuple_at + 32], "big"))
+        bytes_at = tuple_at + int.from_bytes(data[tuple_at + 32:tuple_at + 64], "big")
+        length = int.from_bytes(data[bytes_at:bytes_at + 32], "big")
+        results.append((success, data[bytes_at + 32:bytes_at + 32 + length]))
+    return results
+
+
+# ============================================================================
+# Transport
+# ============================================================================
+
+class JsonRpc:
+    """Minimal JSON-RPC over one keep-alive HTTP session"""
+
+    def __init__(self, url: str, session: Optional[requests.Session] = None, timeout: float = 10):
+        self.url = url
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+        self.calls = 0
+
+    def __call__(self, method: str, params: list) -> Any:
+        self.calls += 1
+        response = self.session.post(self.url, json={
+            "jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params
+        }, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json()
+        if body.get("error"):
+            raise RpcError(body["error"])
+        return body["result"]
+
+
+# ============================================================================
+# State
+# ============================================================================
+
+@dataclass
+class ReservePosition:
+    """One user's balance in one reserve (raw token units)"""
+    asset: str
+    collateral: int
+    debt: int
+    collateral_enabled: bool
+
+
+@dataclass
+class AccountState:
+    """getUserAccountData + per-reserve balances at one block"""
+    user: str
+    block: int
+    collateral_base: int
+    debt_base: int
+    available_borrows_base: int
+    liquidation_threshold: int      # 1e4, value-weighted across collateral (eMode aware)
+    ltv: int                        # 1e4
+    health_factor_wei: int
+    reserves: Dict[str, ReservePosition] = field(default_factory=dict)
+
+    @property
+    def health_factor(self) -> float:
+        if self.health_factor_wei >= MAX_UINT256 or self.debt_base == 0:
+            return float("inf")
+        return self.health_factor_wei / 1e18
+
+
+@dataclass
+class BlockState:
+    block: int
+    fetched_at: float
+    prices: Dict[str, int]                 # asset -> base currency (1e8 USD)
+    accounts: Dict[str, AccountState]
+
+
+def assess_level(hf: float) -> str:
+    if hf == float("inf"):
+        return "NONE"
+    if hf < CRITICAL_HF:
+        return "CRITICAL"
+    if hf < WARNING_HF:
+        return "WARNING"
+    if hf < SAFE_HF:
+        return "CAUTION"
+    return "SAFE"
+
+
+def compute_health(account: AccountState, prices: Dict[str, int], decimals: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Health factor and liquidation distance from balances and prices.
+
+    Uses the account's on-chain weighted liquidation threshold, so eMode and
+    per-reserve thresholds are honoured; with the block's own prices this
+    reproduces the on-chain health factor.
+    """
+    lt = account.liquidation_threshold / 1e4
+    collateral_usd, debt_usd = 0.0, 0.0
+    collateral_by_asset: Dict[str, Tuple[float, float]] = {}
+    for asset, position in account.reserves.items():
+        price = prices.get(asset)
+        if price is None:
+            continue
+        unit = 10 ** decimals.get(asset, 18)
+        usd_price = price / 10 ** BASE_DECIMALS
+        if position.collateral and position.collateral_enabled:
+            qty = position.collateral / unit
+            collateral_usd += qty * usd_price
+            collateral_by_asset[asset] = (qty, usd_price)
+        if position.debt:
+            debt_usd += position.debt / unit * usd_price
+
+    if not account.reserves:
+        # No per-reserve data: fall back to the account totals from the block
+        collateral_usd = account.collateral_base / 10 ** BASE_DECIMALS
+        debt_usd = account.debt_base / 10 ** BASE_DECIMALS
+
+    weighted = collateral_usd * lt
+    hf = weighted / debt_usd if debt_usd > 0 else float("inf")
+
+    liquidation_prices = {}
+    if debt_usd > 0:
+        for asset, (qty, usd_price) in collateral_by_asset.items():
+            # Price of this asset (others unchanged) at which HF reaches 1
+            liq_price = usd_price - (weighted - debt_usd) / (qty * lt) if qty and lt else None
+            liquidation_prices[asset] = round(liq_price, 6) if liq_price and liq_price > 0 else None
+
+    return {
+        "health_factor": hf,
+        "collateral_usd": round(collateral_usd, 2),
+        "debt_usd": round(debt_usd, 2),
+        "liquidation_threshold_pct": round(lt * 100, 2),
+        # Uniform collateral price drop (debt unchanged) that brings HF to 1
+        "liquidation_drop_pct": round((1 - 1 / hf) * 100, 2) if 1 < hf < float("inf") else (0.0 if hf <= 1 else None),
+        "liquidation_prices": liquidation_prices,
+        "level": assess_level(hf)
+    }
+
+
+# ============================================================================
+# Watcher
+# ============================================================================
+
+class AaveBlockWatcher:
+    """
+    One multicall per new block; local recomputation in between.
+
+    `reserves` limits which reserves are read per user; by default the
+    pool's full reserve list is scanned once, then only reserves where a
+    watched user holds a balance are read each block (rescanned every
+    `rescan_blocks`). If the narrowed reserves no longer add up to the
+    account's on-chain collateral/debt totals (a new supply or borrow
+    elsewhere), the block is re-read across every reserve straight away.
+    """
+
+    def __init__(self, rpc: Callable[[str, list], Any], users: Iterable[str],
+                 reserves: Optional[Sequence[str]] = None,
+                 pool: str = AAVE_POOL, data_provider: str = AAVE_DATA_PROVIDER,
+                 oracle: str = AAVE_ORACLE, multicall: str = MULTICALL3,
+                 poll_interval: float = 1.0, rescan_blocks: int = 300, keep_blocks: int = 8):
+        self.rpc = rpc
+        self.users = [u.lower() for u in users]
+        self.pool = pool
+        self.data_provider = data_provider
+        self.oracle = oracle
+        self.multicall = multicall
+        self.poll_interval = poll_interval
+        self.rescan_blocks = rescan_blocks
+        self.keep_blocks = keep_blocks
+
+        self._fixed_reserves = [r.lower() for r in reserves] if reserves else None
+        self._all_reserves: List[str] = list(self._fixed_reserves or [])
+        self._active_reserves: List[str] = list(self._all_reserves)
+        self._last_scan_block = -1
+        self.decimals: Dict[str, int] = {}
+
+        self._blocks: "OrderedDict[int, BlockState]" = OrderedDict()
+        self._price_overrides: Dict[str, int] = {}
+        self._levels: Dict[str, str] = {}
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.multicalls = 0
+
+    # ------------------------------------------------------------------
+    # RPC
+    # ------------------------------------------------------------------
+
+    def block_number(self) -> int:
+        return int(self.rpc("eth_blockNumber", []), 16)
+
+    def _eth_call(self, to: str, data: bytes, block: Optional[int] = None) -> bytes:
+        tag = hex(block) if block is not None else "latest"
+        result = self.rpc("eth_call", [{"to": to, "data": "0x" + data.hex()}, tag])
+        return bytes.fromhex(result[2:])
+
+    def _aggregate(self, calls: List[Tuple[str, bytes]], block: Optional[int]) -> List[Tuple[bool, bytes]]:
+        self.multicalls += 1
+        return decode_aggregate3(self._eth_call(self.multicall, encode_aggregate3(calls), block))
+
+    def _discover(self, block: int):
+        """Reserve list + decimals (one pool call, one multicall for any new decimals)"""
+        if self._fixed_reserves is None:
+            self._all_reserves = [r.lower() for r in
+                                  decode_address_array(self._eth_call(self.pool, encode_call(SEL_GET_RESERVES_LIST), block))]
+        missing = [r for r in self._all_reserves if r not in self.decimals]
+        if missing:
+            results = self._aggregate([(self.data_provider, encode_call(SEL_GET_RESERVE_CONFIG, r)) for r in missing], block)
+            for reserve, (ok, data) in zip(missing, results):
+                if ok:
+                    self.decimals[reserve] = words(data)[0]
+        self._active_reserves = list(self._all_reserves)
+        self._last_scan_block = block
+
+    # ------------------------------------------------------------------
+    # Per-block refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, block: Optional[int] = None) -> BlockState:
+        """
+        Read everything for `block` (default: latest) in one multicall (two
+        when a watched user touched a reserve outside the active set); cached per block
+        """
+        block = self.block_number() if block is None else block
+        with self._lock:
+            cached = self._blocks.get(block)
+            if cached is not None:
+                return cached
+
+            if self._last_scan_block < 0 or block - self._last_scan_block >= self.rescan_blocks:
+                self._discover(block)
+
+            previous = next(reversed(self._blocks.values()), None)
+            reserves = self._active_reserves
+            accounts, prices = self._read(block, reserves, previous)
+            if len(reserves) < len(self._all_reserves) and self._untracked_balances(accounts, prices):
+                # A watched user opened a position in a reserve we stopped reading
+                logger.info(f"AAVE reserve set changed at block {block} - rediscovering")
+                reserves = self._active_reserves = list(self._all_reserves)
+                accounts, prices = self._read(block, reserves, previous)
+
+            # Next blocks only read reserves someone actually holds
+            held = {r for a in accounts.values() for r in a.reserves}
+            if held:
+                self._active_reserves = [r for r in reserves if r in held]
+
+            state = BlockState(block, time.time(), prices, accounts)
+            self._blocks[block] = state
+            while len(self._blocks) > self.keep_blocks:
+                self._blocks.popitem(last=False)
+            # Chain prices are authoritative again
+            self._price_overrides.clear()
+
+        self._evaluate()
+        return state
+
+    def _read(self, block: int, reserves: List[str],
+              previous: Optional[BlockState]) -> Tuple[Dict[str, AccountState], Dict[str, int]]:
+        """Account data, per-reserve balances and prices for `reserves` in one multicall"""
+        calls = [(self.pool, encode_call(SEL_GET_USER_ACCOUNT_DATA, u)) for u in self.users]
+        calls += [(self.data_provider, encode_call(SEL_GET_USER_RESERVE_DATA, r, u))
+                  for u in self.users for r in reserves]
+        calls.append((self.oracle, encode_address_array_call(SEL_GET_ASSETS_PRICES, reserves)))
+        results = self._aggregate(calls, block)
+
+        accounts: Dict[str, AccountState] = {}
+        for i, user in enumerate(self.users):
+            ok, data = results[i]
+            if not ok:
+                if previous and user in previous.accounts:
+                    accounts[user] = previous.accounts[user]
+                continue
+            w = words(data)
+            accounts[user] = AccountState(user, block, *w[:6])
+
+        cursor = len(self.users)
+        for user in self.users:
+            for reserve in reserves:
+                ok, data = results[cursor]
+                cursor += 1
+                if not ok or user not in accounts:
+                    continue
+                # (aToken, stableDebt, variableDebt, principalStable, scaledVariable,
+                #  stableRate, liquidityRate, stableRateLastUpdated, usageAsCollateralEnabled)
+                w = words(data)
+                if w[0] or w[1] or w[2]:
+                    accounts[user].reserves[reserve] = ReservePosition(reserve, w[0], w[1] + w[2], bool(w[8]))
+
+        ok, data = results[-1]
+        prices = dict(zip(reserves, decode_uint_array(data))) if ok else dict(previous.prices if previous else {})
+        return accounts, prices
+
+    def _untracked_balances(self, accounts: Dict[str, AccountState], prices: Dict[str, int]) -> bool:
+        """True when summed reserve balances miss part of an account's on-chain collateral or debt"""
+        for account in accounts.values():
+            collateral = debt = 0
+            for asset, position in account.reserves.items():
+                price = prices.get(asset)
+                if price is None:
+                    return True
+                unit = 10 ** self.decimals.get(asset, 18)
+                if position.collateral and position.collateral_enabled:
+                    collateral += position.collateral * price // unit
+                debt += position.debt * price // unit
+            for local, onchain in ((collateral, account.collateral_base), (debt, account.debt_base)):
+                if abs(local - onchain) > max(len(account.reserves), 1) + COVERAGE_TOLERANCE * onchain:
+                    return True
+        return False
+
+    def poll(self) -> Optional[BlockState]:
+        """Refresh only when a new block has arrived"""
+        block = self.block_number()
+        latest = self.latest_block
+        if latest is not None and block <= latest:
+            return None
+        return self.refresh(block)
+
+    # ------------------------------------------------------------------
+    # Local recomputation
+    # ------------------------------------------------------------------
+
+    def on_price(self, asset: str, price_usd: float):
+        """Feed an off-chain price (e.g. CEX tick) - re-evaluates HF without RPC calls"""
+        with self._lock:
+            self._price_overrides[asset.lower()] = int(round(price_usd * 10 ** BASE_DECIMALS))
+        self._evaluate()
+
+    @property
+    def latest_block(self) -> Optional[int]:
+        with self._lock:
+            return next(reversed(self._blocks), None)
+
+    def block_state(self, block: Optional[int] = None) -> Optional[BlockState]:
+        with self._lock:
+            if block is None:
+                return next(reversed(self._blocks.values()), None)
+            return self._blocks.get(block)
+
+    def health(self, user: str, block: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Current health view for `user` (block prices + any newer off-chain prices)"""
+        with self._lock:
+            state = self.block_state(block)
+            if state is None or user.lower() not in state.accounts:
+                return None
+            prices = dict(state.prices)
+            if block is None:
+                prices.update(self._price_overrides)
+            account = state.accounts[user.lower()]
+            view = compute_health(account, prices, self.decimals)
+            view.update({
+                "user": account.user,
+                "block": state.block,
+                "block_age_s": round(time.time() - state.fetched_at, 1),
+                "onchain_health_factor": account.health_factor,
+                "repriced": block is None and bool(self._price_overrides)
+            })
+            return view
+
+    def _evaluate(self):
+        alerts = []
+        with self._lock:
+            for user in self.users:
+                view = self.health(user)
+                if view is None:
+                    continue
+                previous = self._levels.get(user)
+                level = view["level"]
+                if level != previous:
+                    self._levels[user] = level
+                    if previous is not None or level not in ("SAFE", "NONE"):
+                        alerts.append(dict(view, previous_level=previous, timestamp=datetime.now().isoformat(),
+                                           message=f"AAVE {user[:8]}… health factor {view['health_factor']:.3f} "
+                                                   f"({previous or 'new'} → {level})"))
+        for alert in alerts:
+            for listener in list(self._listeners):
+                try:
+                    listener(alert)
+                except Exception as e:
+                    logger.error(f"AAVE alert listener failed: {e}")
+
+    def subscribe(self, listener: Callable[[Dict[str, Any]], None]) -> Callable[[], None]:
+        """Call `listener(alert)` whenever a user's risk level changes"""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"AAVE watcher poll failed: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="aave-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
@@ -0,0 +1,336 @@
+"""
+🌙 Strategy Library Backtest Harness
+Ranks the whole moondev strategy library in one pass
+
+Instead of one conda subprocess per file with stdout scraping
+(backtest_runner.run_backtest_in_conda), each strategy class is imported
+directly and run in a process pool:
+
+- OHLCV is loaded once and shared as a read-only memory map
+  (architect_forge verification_pool format); each worker builds the
+  backtesting.py frame once, not per strategy
+- Module-level side effects of the scripts (CSV loads, Backtest runs,
+  plots) are stripped; per-bar debug prints are silenced
+- Every file runs under its own timeout; errors, timeouts and crashed
+  workers become result rows instead of stopping the run
+- Stats are returned as one structured DataFrame
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import math
+import os
+import re
+import signal
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from ds_star.architect_forge.verification_pool import load_shared_ohlcv, write_shared_ohlcv
+
+STRATEGY_PATTERNS = ("*_BT.py", "*_BTFinal.py")
+
+# backtesting.py stat -> results column
+STAT_COLUMNS = {
+    'Return [%]': 'return_pct',
+    'Buy & Hold Return [%]': 'buy_hold_return_pct',
+    'Max. Drawdown [%]': 'max_drawdown_pct',
+    'Sharpe Ratio': 'sharpe',
+    'Sortino Ratio': 'sortino',
+    'Calmar Ratio': 'calmar',
+    'Win Rate [%]': 'win_rate_pct',
+    '# Trades': 'trades',
+    'Profit Factor': 'profit_factor',
+    'Expectancy [%]': 'expectancy_pct',
+    'Exposure Time [%]': 'exposure_pct',
+    'Equity Final [$]': 'equity_final'
+}
+
+_FENCED_BLOCK = re.compile(r"```(?:python|py)?[ \t]*\n(.*?)(?:```|\Z)", re.S)  # Replies may be cut off mid-block
+_CODE_START = re.compile(r"^(import |from |class |def |@|#)")
+
+
+def discover_strategy_files(directory: Union[str, Path], patterns: Sequence[str] = STRATEGY_PATTERNS,
+                            prefer_final: bool = True) -> List[Path]:
+    """Backtest scripts in `directory`; with prefer_final, X_BTFinal.py replaces X_BT.py"""
+    directory = Path(directory)
+    files = sorted({p for pattern in patterns for p in directory.glob(pattern)})
+    if not prefer_final:
+        return files
+    by_name: Dict[str, Path] = {}
+    for path in files:
+        name = re.sub(r"_BT(Final)?$", "", path.stem)
+        if name not in by_name or path.stem.endswith("_BTFinal"):
+            by_name[name] = path
+    return sorted(by_name.values())
+
+
+def extract_strategy_source(text: str) -> str:
+    """
+    Python source of a generated script. Many files are LLM replies: take the
+    largest fenced block that defines a Strategy, then trim any leading prose
+    and any top-level prose paragraphs trailing the code. Broken code itself
+    is left alone so it fails loudly rather than running half a strategy.
+    """
+    blocks = [b for b in _FENCED_BLOCK.findall(text) if "Strategy" in b]
+    source = max(blocks, key=len) if blocks else text
+    lines = source.splitlines()
+    start = next((i for i, line in enumerate(lines) if _CODE_START.match(line)), 0)
+    lines = lines[start:]
+    while lines:
+        try:
+            ast.parse("\n".join(lines))
+            break
+        except SyntaxError as e:
+            at = (e.lineno or 0) - 1
+            trailing_prose = 0 < at < len(lines) and not lines[at - 1].strip() \
+                and lines[at][:1] not in (" ", "\t", "")
+            if not trailing_prose:
+                break
+            lines = lines[:at]
+    return "\n".join(lines)
+
+
+def _is_import_only(node: ast.stmt) -> bool:
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return True
+    if isinstance(node, ast.Try):  # try: import talib / except ImportError: ...
+        return all(_is_import_only(n) or isinstance(n, ast.Pass) for n in node.body)
+    return False
+
+
+def _is_literal_assignment(node: ast.stmt) -> bool:
+    value = getattr(node, 'value', None)
+    if not isinstance(node, (ast.Assign, ast.AnnAssign)) or value is None:
+        return False
+    try:
+        ast.literal_eval(value)
+        return True
+    except ValueError:
+        return False
+
+
+class _DropPrints(ast.NodeTransformer):
+    """print(...) statements -> pass, so per-bar f-strings are never even formatted"""
+
+    def visit_Expr(self, node: ast.Expr):
+        call = node.value
+        if isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == 'print':
+            return ast.copy_location(ast.Pass(), node)
+        return node
+
+
+def strip_side_effects(source: str) -> str:
+    """Keep imports, definitions and literal constants; drop data loading, runs, plots and prints"""
+    tree = ast.parse(source)
+    tree.body = [
+        node for node in tree.body
+        if _is_import_only(node)
+        or isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        or _is_literal_assignment(node)
+    ]
+    return ast.unparse(ast.fix_missing_locations(_DropPrints().visit(tree)))
+
+
+def _quiet_print(*args, **kwargs):
+    pass
+
+
+def load_strategy_classes(path: Union[str, Path]) -> List[type]:
+    """Import a strategy script without running it; returns its Strategy subclasses"""
+    from backtesting import Strategy
+
+    path = Path(path)
+    source = strip_side_effects(extract_strategy_source(path.read_text(errors='replace')))
+    module = types.ModuleType(f"moondev_{path.stem}")
+    module.__file__ = str(path)
+    module.print = _quiet_print  # Prints inside expressions survive _DropPrints
+    exec(compile(source, str(path), 'exec'), module.__dict__)
+    return [
+        obj for obj in vars(module).values()
+        if isinstance(obj, type) and issubclass(obj, Strategy) and obj is not Strategy
+        and obj.__module__ == module.__name__
+    ]
+
+
+def load_ohlcv_csv(path: Union[str, Path]) -> pd.DataFrame:
+    """Read an OHLCV CSV the way the moondev scripts do (lower-cased, unnamed columns dropped)"""
+    data = pd.read_csv(path)
+    data.columns = data.columns.str.strip().str.lower()
+    data = data.drop(columns=[col for col in data.columns if 'unnamed' in col])
+    time_col = next(col for col in ('datetime', 'timestamp', 'date', 'time') if col in data.columns)
+    data = data.rename(columns={time_col: 'timestamp'})
+    return data[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+
+
+def to_backtesting_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """OHLCV with a 'timestamp' column -> backtesting.py layout (capitalised, DatetimeIndex)"""
+    frame = df.rename(columns={'open': 'Open', 'high': 'High', 'low': 'Low',
+                               'close': 'Close', 'volume': 'Volume'})
+    frame = frame.set_index(pd.to_datetime(frame['timestamp'])).drop(columns=['timestamp'])
+    frame.index.name = 'datetime'
+    return frame
+
+
+def _stat_value(value: Any) -> Any:
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_WORKER_DATA: Dict[str, pd.DataFrame] = {}
+
+
+class StrategyTimeout(Exception):
+    pass
+
+
+def _init_worker(data_path: str):
+    """Build the backtesting frame once per worker process from the shared map"""
+    _WORKER_DATA['ohlcv'] = to_backtesting_frame(load_shared_ohlcv(data_path))
+
+
+def _on_alarm(signum, frame):
+    raise StrategyTimeout()
+
+
+def _run_strategy_file(path: str, settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Backtest every Strategy class in one file; never raises"""
+    from backtesting import Backtest
+
+    started = time.perf_counter()
+    base = {'file': Path(path).name, 'strategy': None, 'status': 'ok', 'error': ''}
+    rows: List[Dict[str, Any]] = []
+    timeout = settings.get('timeout')
+    if timeout:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    sink = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+            classes = load_strategy_classes(path)
+            if not classes:
+                rows.append(dict(base, status='no_strategy', error='No Strategy subclass found'))
+            for cls in classes:
+                row = dict(base, strategy=cls.__name__)
+                try:
+                    stats = Backtest(_WORKER_DATA['ohlcv'], cls, cash=settings['cash'],
+                                     commission=settings['commission']).run()
+                    row.update({column: _stat_value(stats.get(stat)) for stat, column in STAT_COLUMNS.items()})
+                except StrategyTimeout:
+                    raise
+                except Exception as e:
+                    row.update(status='error', error=f"{type(e).__name__}: {e}")
+                rows.append(row)
+    except StrategyTimeout:
+        rows.append(dict(base, status='timeout', error=f"Exceeded {timeout}s"))
+    except Exception as e:
+        rows.append(dict(base, status='error', error=f"{type(e).__name__}: {e}"))
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    elapsed = time.perf_counter() - started
+    for row in rows:
+        row['elapsed_seconds'] = round(elapsed, 3)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+def run_strategy_library(
+    strategy_files: Iterable[Union[str, Path]],
+    ohlcv: pd.DataFrame,
+    work_dir: Union[str, Path] = "data/backtest_harness",
+    max_workers: Optional[int] = None,
+    timeout: float = 300.0,
+    cash: float = 1_000_000,
+    commission: float = 0.002,
+    sort_by: str = 'sharpe'
+) -> pd.DataFrame:
+    """
+    Backtest every strategy file against one dataset and return the results table
+
+    Args:
+        strategy_files: Scripts to run (see discover_strategy_files)
+        ohlcv: OHLCV with a 'timestamp' column or DatetimeIndex
+        work_dir: Where the shared memory-mapped dataset is written
+        max_workers: Pool size (default: all cores)
+        timeout: Per-file wall-clock limit in seconds
+        sort_by: Results column to rank by (descending)
+
+    Returns:
+        One row per strategy class (or per failed file) with status, error and stats
+    """
+    files = [str(p) for p in strategy_files]
+    data_path = str(write_shared_ohlcv(ohlcv, Path(work_dir), tag="library"))
+    settings = {'timeout': timeout, 'cash': cash, 'commission': commission}
+    rows: List[Dict[str, Any]] = []
+
+    def run_pool(paths: List[str], workers: int) -> List[str]:
+        """Run `paths`; return those lost to a crashed worker"""
+        lost = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data_path,)) as pool:
+            futures = {pool.submit(_run_strategy_file, path, settings): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    rows.extend(future.result())
+                except BrokenProcessPool:
+                    lost.append(futures[future])
+        return lost
+
+    lost = run_pool(files, max_workers or os.cpu_count() or 1)
+    for path in lost:
+        # Isolate: re-run each casualty alone so one crashing script can't take others down
+        if run_pool([path], 1):
+            rows.append({'file': Path(path).name, 'strategy': None, 'status': 'crashed',
+                         'error': 'Worker process died', 'elapsed_seconds': None})
+
+    table = pd.DataFrame(rows, columns=['file', 'strategy', 'status', 'error', 'elapsed_seconds']
+                         + list(STAT_COLUMNS.values()))
+    if sort_by in table.columns:
+        table = table.sort_values(sort_by, ascending=False, na_position='last').reset_index(drop=True)
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest the moondev strategy library in parallel")
+    parser.add_argument("--strategies", default=str(Path(__file__).resolve().parents[2] / "research" / "moondev_strategies"))
+    parser.add_argument("--data", required=True, help="OHLCV CSV (datetime, open, high, low, close, volume)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--out", default="data/execution_results/strategy_library.csv")
+    parser.add_argument("--all-versions", action="store_true", help="Run _BT and _BTFinal variants")
+    args = parser.parse_args()
+
+    files = discover_strategy_files(args.strategies, prefer_final=not args.all_versions)
+    print(f"🌙 Backtesting {len(files)} strategy files on {args.data}")
+    started = time.perf_counter()
+    table = run_strategy_library(files, load_ohlcv_csv(args.data), max_workers=args.workers,
+                                 timeout=args.timeout)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(out, index=False)
+    print(f"✅ {len(table)} rows in {time.perf_counter() - started:.1f}s -> {out}")
+    print(table['status'].value_counts().to_string())
+    print(table.head(20).to_string())
+
+
+if __name__ == "__main__":
+    main()
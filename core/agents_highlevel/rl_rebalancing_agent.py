@@ -20,7 +20,6 @@ import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
-from collections import deque
 import random
 
 # Import centralized portfolio config
@@ -62,29 +61,127 @@ except ImportError:
 
 
 class ReplayBuffer:
-    """Experience replay buffer for training stability"""
+    """
+    Experience replay buffer for training stability
+
+    Preallocated circular buffer of typed NumPy arrays: push is an O(1) row
+    write and sample draws a vectorized index batch (no per-sample Python
+    objects). Arrays are allocated on the first push if state_size is not given.
 
-    def __init__(self, capacity: int = 10000):
-        self.buffer = deque(maxlen=capacity)
+    With prioritized=True, sampling is proportional to priority^alpha and
+    sample_with_info returns importance-sampling weights (annealed by beta)
+    plus the indices to pass back to update_priorities.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        state_size: Optional[int] = None,
+        prioritized: bool = False,
+        alpha: float = 0.6,
+        beta: float = 0.4,
+        priority_eps: float = 1e-5,
+        seed: Optional[int] = None
+    ):
+        self.capacity = capacity
+        self.prioritized = prioritized
+        self.alpha = alpha
+        self.beta = beta
+        self.priority_eps = priority_eps
+        self.rng = np.random.default_rng(seed)
+        self.position = 0
+        self.size = 0
+        self.states = None
+        if state_size is not None:
+            self._allocate((state_size,))
+
+    def _allocate(self, state_shape: Tuple[int, ...]):
+        self.states = np.zeros((self.capacity,) + state_shape, dtype=np.float32)
+        self.next_states = np.zeros((self.capacity,) + state_shape, dtype=np.float32)
+        self.actions = np.zeros(self.capacity, dtype=np.int64)
+        self.rewards = np.zeros(self.capacity, dtype=np.float32)
+        self.dones = np.zeros(self.capacity, dtype=np.float32)
+        self.priorities = np.zeros(self.capacity, dtype=np.float64)
+        self.max_priority = 1.0
 
     def push(self, state, action, reward, next_state, done):
         """Add experience to buffer"""
-        self.buffer.append((state, action, reward, next_state, done))
+        if self.states is None:
+            self._allocate(np.shape(state))
+        i = self.position
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self.priorities[i] = self.max_priority # New experience is sampled at least once
+        self.position = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        """Add many experiences at once (e.g. a replayed historical portfolio)"""
+        states = np.asarray(states, dtype=np.float32)
+        n = len(states)
+        if n == 0:
+            return
+        if self.states is None:
+            self._allocate(states.shape[1:])
+        start = self.position
+        if n > self.capacity: # Only the newest experiences survive anyway
+            keep = slice(n - self.capacity, n)
+            states, actions, rewards = states[keep], np.asarray(actions)[keep], np.asarray(rewards)[keep]
+            next_states, dones = np.asarray(next_states)[keep], np.asarray(dones)[keep]
+            start = (start + n - self.capacity) % self.capacity
+        idx = (start + np.arange(len(states))) % self.capacity
+        self.states[idx] = states
+        self.actions[idx] = actions
+        self.rewards[idx] = rewards
+        self.next_states[idx] = next_states
+        self.dones[idx] = dones
+        self.priorities[idx] = self.max_priority
+        self.position = int((self.position + n) % self.capacity)
+        self.size = min(self.size + n, self.capacity)
+
+    def _sample_indices(self, batch_size: int) -> np.ndarray:
+        if not self.prioritized:
+            return self.rng.integers(0, self.size, size=batch_size)
+        scaled = self.priorities[:self.size] ** self.alpha
+        cumulative = np.cumsum(scaled)
+        targets = self.rng.random(batch_size) * cumulative[-1]
+        return np.minimum(np.searchsorted(cumulative, targets, side="right"), self.size - 1)
 
     def sample(self, batch_size: int):
         """Sample random batch from buffer"""
-        batch = random.sample(self.buffer, min(batch_size, len(self.buffer)))
-        states, actions, rewards, next_states, dones = zip(*batch)
-        return (
-            np.array(states),
-            np.array(actions),
-            np.array(rewards),
-            np.array(next_states),
-            np.array(dones)
+        batch, _, _ = self.sample_with_info(batch_size)
+        return batch
+
+    def sample_with_info(self, batch_size: int):
+        """Sample a batch plus (indices, importance weights); weights are all 1 without prioritization"""
+        batch_size = min(batch_size, self.size)
+        idx = self._sample_indices(batch_size)
+        if self.prioritized:
+            probs = self.priorities[idx] ** self.alpha / np.sum(self.priorities[:self.size] ** self.alpha)
+            weights = (self.size * probs) ** -self.beta
+            weights = (weights / weights.max()).astype(np.float32)
+        else:
+            weights = np.ones(batch_size, dtype=np.float32)
+        batch = (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx]
         )
+        return batch, idx, weights
+
+    def update_priorities(self, indices: np.ndarray, td_errors: np.ndarray):
+        """Set priorities of sampled experiences from their TD errors"""
+        priorities = np.abs(np.asarray(td_errors, dtype=np.float64)) + self.priority_eps
+        self.priorities[indices] = priorities
+        self.max_priority = max(self.max_priority, float(priorities.max()))
 
     def __len__(self):
-        return len(self.buffer)
+        return self.size
 
 
 class RLRebalancingAgent:
@@ -108,7 +205,8 @@ class RLRebalancingAgent:
         epsilon_decay: float = 0.995,
         memory_capacity: int = 10000,
         batch_size: int = 32,
-        model_path: str = "models/rl_rebalancer.pth"
+        model_path: str = "models/rl_rebalancer.pth",
+        prioritized_replay: bool = False
     ):
         """
         Initialize RL agent
@@ -124,6 +222,7 @@ class RLRebalancingAgent:
             memory_capacity: Size of replay buffer
             batch_size: Training batch size
             model_path: Path to save/load model
+            prioritized_replay: Sample experiences by TD error instead of uniformly
         """
         self.state_size = state_size
         self.action_size = action_size
@@ -136,7 +235,7 @@ class RLRebalancingAgent:
         self.model_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Experience replay
-        self.memory = ReplayBuffer(memory_capacity)
+        self.memory = ReplayBuffer(memory_capacity, state_size, prioritized=prioritized_replay)
 
         # Training statistics
         self.episode = 0
@@ -295,17 +394,18 @@ class RLRebalancingAgent:
             return 0.0
 
         # Sample batch from replay buffer
-        states, actions, rewards, next_states, dones = self.memory.sample(self.batch_size)
+        (states, actions, rewards, next_states, dones), indices, weights = \
+            self.memory.sample_with_info(self.batch_size)
 
-        # Convert to tensors
-        states = torch.FloatTensor(states).to(self.device)
-        actions = torch.LongTensor(actions).to(self.device)
-        rewards = torch.FloatTensor(rewards).to(self.device)
-        next_states = torch.FloatTensor(next_states).to(self.device)
-        dones = torch.FloatTensor(dones).to(self.device)
+        # Convert to tensors (buffer arrays are already typed - no copies)
+        states = torch.from_numpy(states).to(self.device)
+        actions = torch.from_numpy(actions).to(self.device)
+        rewards = torch.from_numpy(rewards).to(self.device)
+        next_states = torch.from_numpy(next_states).to(self.device)
+        dones = torch.from_numpy(dones).to(self.device)
 
         # Current Q values
-        current_q_values = self.policy_net(states).gather(1, actions.unsqueeze(1))
+        current_q_values = self.policy_net(states).gather(1, actions.unsqueeze(1)).squeeze(1)
 
         # Next Q values from target network
         with torch.no_grad():
@@ -313,7 +413,13 @@ class RLRebalancingAgent:
             target_q_values = rewards + (1 - dones) * self.gamma * next_q_values
 
         # Compute loss and update
-        loss = self.criterion(current_q_values.squeeze(), target_q_values)
+        if self.memory.prioritized:
+            td_errors = current_q_values - target_q_values
+            weights = torch.from_numpy(weights).to(self.device)
+            loss = (weights * td_errors.pow(2)).mean()
+            self.memory.update_priorities(indices, td_errors.detach().cpu().numpy())
+        else:
+            loss = self.criterion(current_q_values, target_q_values)
 
         self.optimizer.zero_grad()
         loss.backward()
@@ -321,6 +427,69 @@ class RLRebalancingAgent:
 
         return loss.item()
 
+    def learn(
+        self,
+        env,
+        total_steps: int,
+        train_every: int = 4,
+        gradient_steps: int = 1,
+        warmup_steps: Optional[int] = None,
+        target_update_every: int = 1000
+    ) -> Dict[str, Any]:
+        """
+        Training loop decoupled from gradient updates
+
+        Collects `train_every` environment steps between updates and then runs
+        `gradient_steps` minibatch updates, so cheap environment steps (e.g.
+        replaying historical portfolios) are not gated on the network.
+
+        Args:
+            env: gymnasium-style environment - reset() -> (state, info),
+                 step(action) -> (next_state, reward, terminated, truncated, info)
+            total_steps: Environment steps to run
+            train_every: Environment steps between training rounds
+            gradient_steps: Minibatch updates per training round
+            warmup_steps: Steps collected before training starts (default batch_size)
+            target_update_every: Environment steps between target network syncs
+
+        Returns:
+            Summary with steps, episodes, updates and mean loss
+        """
+        warmup_steps = self.batch_size if warmup_steps is None else warmup_steps
+        state, _ = env.reset()
+        episode_reward = 0.0
+        episodes = updates = 0
+        losses = []
+
+        for step in range(1, total_steps + 1):
+            action = self.select_action(state, training=True)
+            next_state, reward, terminated, truncated, _ = env.step(action)
+            self.memory.push(state, action, reward, next_state, terminated)
+            episode_reward += reward
+            state = next_state
+
+            if terminated or truncated:
+                self.end_episode(episode_reward)
+                episodes += 1
+                episode_reward = 0.0
+                state, _ = env.reset()
+
+            if step >= warmup_steps and step % train_every == 0:
+                for _ in range(gradient_steps):
+                    losses.append(self.train())
+                    updates += 1
+
+            if step % target_update_every == 0:
+                self.update_target_network()
+
+        self.losses.extend(losses)
+        return {
+            "steps": total_steps,
+            "episodes": episodes,
+            "updates": updates,
+            "mean_loss": float(np.mean(losses)) if losses else 0.0
+        }
+
     def update_target_network(self):
         """Copy weights from policy network to target network"""
         if TORCH_AVAILABLE:
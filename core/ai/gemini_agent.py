@@ -22,6 +22,8 @@ from enum import Enum
 
 import google.generativeai as genai
 
+from core.ai.llm_gateway import gateway
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 # =============================================================================
@@ -94,13 +96,15 @@ class GeminiNeuralAgent:
         genai.configure(api_key=self.api_key)
 
         # Use Gemini 2.0 Flash (latest, fastest)
+        self.model_name = 'gemini-2.0-flash-exp'
+        self.generation_config = {
+            'temperature': 0.3,  # Lower = more focused
+            'top_p': 0.8,
+            'max_output_tokens': 2048,
+        }
         self.model = genai.GenerativeModel(
-            'gemini-2.0-flash-exp',
-            generation_config={
-                'temperature': 0.3,  # Lower = more focused
-                'top_p': 0.8,
-                'max_output_tokens': 2048,
-            }
+            self.model_name,
+            generation_config=self.generation_config
         )
 
         # Trading rules from your config
@@ -125,6 +129,18 @@ class GeminiNeuralAgent:
                     return line.split("=", 1)[1].strip()
         return os.environ.get("GEMINI_API_KEY", "")
 
+    async def _generate_cached(self, prompt: str, caller: str) -> str:
+        """Run a prompt through the shared LLM gateway (cached + coalesced)."""
+        return await asyncio.to_thread(
+            gateway.call,
+            provider="gemini",
+            model=self.model_name,
+            prompt=prompt,
+            fetch=lambda: self.model.generate_content(prompt).text,
+            temperature=self.generation_config['temperature'],
+            caller=caller,
+        )
+
     # =========================================================================
     # SIGNAL GENERATION
     # =========================================================================
@@ -183,12 +199,10 @@ Analyze the data and respond with ONLY valid JSON (no markdown, no backticks):
 }}"""
 
         try:
-            response = await asyncio.to_thread(
-                self.model.generate_content, prompt
-            )
+            text = await self._generate_cached(prompt, "GeminiNeuralAgent.generate_signal")
 
             # Parse JSON response
-            text = response.text.strip()
+            text = text.strip()
             # Remove markdown code blocks if present
             if text.startswith("```"):
                 text = text.split("```")[1]
@@ -270,11 +284,9 @@ Analyze and respond with ONLY valid JSON:
 }}"""
 
         try:
-            response = await asyncio.to_thread(
-                self.model.generate_content, prompt
-            )
+            text = await self._generate_cached(prompt, "GeminiNeuralAgent.deep_analyze")
 
-            text = response.text.strip()
+            text = text.strip()
             if text.startswith("```"):
                 text = text.split("```")[1]
                 if text.startswith("json"):
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+LLM GATEWAY - Shared call layer for every AI provider
+One place where prompts go out, so repeated market questions only pay once.
+
+Usage:
+    from core.ai.llm_gateway import gateway
+    text = gateway.call(
+        provider="lmstudio", model="local-model", prompt=prompt,
+        fetch=lambda: post_to_provider(prompt),
+        temperature=0.3, caller="LocalLLM.analyze",
+    )
+
+Features:
+- Response cache keyed on (provider, model, normalized prompt, temperature)
+- TTL expiry + LRU eviction once the cache is full
+- Identical in-flight requests coalesced into one upstream call (followers
+  wait at most the request timeout, then raise TimeoutError)
+- Latency / token metrics per caller
+"""
+
+import re
+import time
+import threading
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("shadow.llm_gateway")
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_WAIT_SECONDS = 120.0
+
+# Rough chars-per-token ratio used when the provider doesn't report usage
+CHARS_PER_TOKEN = 4
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace so cosmetic prompt differences share a cache entry."""
+    return _WHITESPACE.sub(" ", prompt or "").strip()
+
+
+def estimate_tokens(text: Any) -> int:
+    """Approximate token count for providers that don't return usage."""
+    if text is None:
+        return 0
+    return max(1, len(str(text)) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class CallerStats:
+    """Per-caller counters."""
+    calls: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    upstream_calls: int = 0
+    errors: int = 0
+    upstream_latency_s: float = 0.0
+    max_latency_s: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def avg_latency_s(self) -> float:
+        return self.upstream_latency_s / self.upstream_calls if self.upstream_calls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["avg_latency_s"] = round(self.avg_latency_s, 4)
+        data["upstream_latency_s"] = round(self.upstream_latency_s, 4)
+        data["max_latency_s"] = round(self.max_latency_s, 4)
+        return data
+
+
+@dataclass
+class _InFlight:
+    """A pending upstream call that followers wait on."""
+    event: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class LLMGateway:
+    """
+    Thread-safe cache + single-flight wrapper around provider calls.
+
+    The gateway never talks to a provider itself - callers hand it a
+    zero-argument `fetch` callable that performs the actual request.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 wait_timeout: float = DEFAULT_WAIT_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.wait_timeout = wait_timeout
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, _InFlight] = {}
+        self._stats: Dict[str, CallerStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str,
+                 temperature: Optional[float] = None,
+                 extra: Hashable = None) -> Tuple:
+        """Build the cache key for a request."""
+        temp = None if temperature is None else round(float(temperature), 4)
+        return (provider, model, normalize_prompt(prompt), temp, extra)
+
+    def call(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        fetch: Callable[[], Any],
+        temperature: Optional[float] = None,
+        caller: str = "unknown",
+        extra: Hashable = None,
+        ttl_seconds: Optional[float] = None,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+        usage: Optional[Callable[[Any], Dict[str, int]]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Return a cached response or run `fetch` once for all identical callers.
+
+        Args:
+            provider / model / prompt / temperature: cache key components
+            fetch: zero-arg callable doing the upstream request
+            caller: label metrics are recorded under
+            extra: any other hashable request option that changes the answer
+                   (max_tokens, system prompt, ...)
+            ttl_seconds: override the gateway TTL for this entry
+            should_cache: predicate - falsy results (errors) are not stored
+            usage: maps a result to {"prompt_tokens", "completion_tokens"}
+            timeout: longest a follower waits on an identical in-flight call
+                     (default: the gateway's wait_timeout) before TimeoutError
+        """
+        key = self.make_key(provider, model, prompt, temperature, extra)
+        now = time.monotonic()
+
+        with self._lock:
+            stats = self._stats.setdefault(caller, CallerStats())
+            stats.calls += 1
+
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._cache.move_to_end(key)
+                    stats.cache_hits += 1
+                    return value
+                del self._cache[key]
+
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = _InFlight()
+                self._inflight[key] = pending
+            else:
+                stats.coalesced += 1
+
+        if not leader:
+            wait = self.wait_timeout if timeout is None else timeout
+            if not pending.event.wait(wait):
+                with self._lock:
+                    stats.errors += 1
+                raise TimeoutError(f"{provider}/{model}: in-flight call still running after {wait:.0f}s")
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        started = time.perf_counter()
+        try:
+            result = fetch()
+        except BaseException as e:
+            pending.error = e
+            with self._lock:
+                stats.errors += 1
+                self._inflight.pop(key, None)
+            pending.event.set()
+            raise
+
+        latency = time.perf_counter() - started
+        if usage is not None:
+            try:
+                tokens = usage(result) or {}
+            except Exception:
+                tokens = {}
+        else:
+            tokens = {}
+        prompt_tokens = tokens.get("prompt_tokens", estimate_tokens(prompt))
+        completion_tokens = tokens.get("completion_tokens", estimate_tokens(result))
+        cacheable = should_cache(result) if should_cache else True
+
+        with self._lock:
+            stats.upstream_calls += 1
+            stats.upstream_latency_s += latency
+            stats.max_latency_s = max(stats.max_latency_s, latency)
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            if cacheable:
+                self._put(key, result, ttl_seconds)
+            else:
+                stats.errors += 1
+            pending.result = result
+            self._inflight.pop(key, None)
+
+        pending.event.set()
+        logger.debug(f"{caller}: {provider}/{model} upstream {latency:.2f}s")
+        return result
+
+    def _put(self, key: Tuple, value: Any, ttl_seconds: Optional[float] = None):
+        """Store under the lock; caller holds self._lock"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._cache[key] = (time.monotonic() + ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def store(self, provider: str, model: str, prompt: str, value: Any,
+              temperature: Optional[float] = None, extra: Hashable = None,
+              ttl_seconds: Optional[float] = None):
+        """Cache a response fetched outside call() (e.g. by a fallback provider)."""
+        with self._lock:
+            self._put(self.make_key(provider, model, prompt, temperature, extra), value, ttl_seconds)
+
+    def invalidate(self, provider: Optional[str] = None) -> int:
+        """Drop cached responses (all, or just one provider's). Returns count dropped."""
+        with self._lock:
+            if provider is None:
+                dropped = len(self._cache)
+                self._cache.clear()
+                return dropped
+            keys = [k for k in self._cache if k[0] == provider]
+            for k in keys:
+                del self._cache[k]
+            return len(keys)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-caller metrics plus cache occupancy."""
+        with self._lock:
+            return {
+                "cache_entries": len(self._cache),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "in_flight": len(self._inflight),
+                "callers": {name: s.to_dict() for name, s in self._stats.items()},
+            }
+
+    def reset_metrics(self):
+        with self._lock:
+            self._stats.clear()
+
+
+def is_ok_text(result: Any) -> bool:
+    """Default cache predicate for text providers that report failures as 'Error: ...'."""
+    return isinstance(result, str) and bool(result) and not result.startswith("Error")
+
+
+# Global instance shared by SmartAI, GeminiNeuralAgent and LocalLLM
+gateway = LLMGateway()
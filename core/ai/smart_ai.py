@@ -13,6 +13,7 @@ Features:
 - Auto-fallback if current provider fails
 - Health check endpoint
 - Alerts via NTFY when provider goes down
+- Responses cached / coalesced through core.ai.llm_gateway
 """
 
 import os
@@ -23,6 +24,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from core.ai.llm_gateway import gateway, is_ok_text, normalize_prompt
+
 logger = logging.getLogger("shadow.smart_ai")
 
 # Config
@@ -31,6 +34,7 @@ REPLIT_URL = os.getenv(
     "https://1cba4940-c378-451a-a9f4-741e180329ee-00-togxk2caarue.picard.replit.dev"
 )
 NTFY_TOPIC = os.getenv("NTFY_TOPIC", "sovereignshadow_dc4d2fa1")
+REQUEST_TIMEOUT = 60  # seconds per chat request
 CACHE_FILE = Path("/Volumes/LegacySafe/SS_III/data/ai_provider_cache.json")
 
 # Provider priority (in order of preference)
@@ -175,9 +179,11 @@ class SmartAI:
         except Exception as e:
             logger.error(f"Alert failed: {e}")
 
-    def ask(self, message: str, system_prompt: str = None, retries: int = 2) -> str:
+    def ask(self, message: str, system_prompt: str = None, retries: int = 2,
+            use_cache: bool = True, caller: str = "SmartAI.ask") -> str:
         """
         Ask the AI. Automatically uses working provider with fallback.
+        Identical questions within the gateway TTL share one upstream call.
         """
         # Ensure we have a working provider
         if not self.working_provider:
@@ -186,6 +192,44 @@ class SmartAI:
         if not self.working_provider:
             return "Error: All AI providers are down. Check API keys."
 
+        if not use_cache:
+            return self._ask_upstream(message, system_prompt, retries)
+
+        asked = self.working_provider
+        extra = normalize_prompt(system_prompt) if system_prompt else None
+        answered = {}
+
+        def fetch() -> str:
+            text = self._ask_upstream(message, system_prompt, retries)
+            answered["provider"] = self.working_provider
+            return text
+
+        def answered_by_asked(text: str) -> bool:
+            provider = answered.get("provider")
+            return is_ok_text(text) and provider is not None and provider["name"] == asked["name"]
+
+        try:
+            result = gateway.call(
+                provider=asked["name"],
+                model=asked["model"],
+                prompt=message,
+                fetch=fetch,
+                caller=caller,
+                extra=extra,
+                should_cache=answered_by_asked,
+                timeout=REQUEST_TIMEOUT * (retries + 1),
+            )
+        except TimeoutError as e:
+            return f"Error: {e}"
+
+        # Fell back mid-request: cache under the provider that actually answered
+        fallback = answered.get("provider")
+        if fallback is not None and fallback["name"] != asked["name"] and is_ok_text(result):
+            gateway.store(fallback["name"], fallback["model"], message, result, extra=extra)
+        return result
+
+    def _ask_upstream(self, message: str, system_prompt: str = None, retries: int = 2) -> str:
+        """Send the prompt to the Replit proxy, falling back across providers."""
         # Try current provider
         for attempt in range(retries + 1):
             try:
@@ -196,7 +240,7 @@ class SmartAI:
                 resp = requests.post(
                     f"{self.base_url}/api/terminal/chat",
                     json=payload,
-                    timeout=60
+                    timeout=REQUEST_TIMEOUT
                 )
                 result = resp.json()
 
@@ -226,14 +270,16 @@ class SmartAI:
         """Quick market analysis."""
         return self.ask(
             f"Analyze {asset} - give sentiment, key levels, recommendation. Be concise.",
-            system_prompt="You are an elite crypto analyst. Be direct and actionable."
+            system_prompt="You are an elite crypto analyst. Be direct and actionable.",
+            caller="SmartAI.analyze_market"
         )
 
     def rwa_insight(self, topic: str) -> str:
         """RWA-specific analysis."""
         return self.ask(
             f"RWA Analysis: {topic}",
-            system_prompt="You are an RWA tokenization expert. Focus on LINK, INJ, QNT, ONDO, PLUME."
+            system_prompt="You are an RWA tokenization expert. Focus on LINK, INJ, QNT, ONDO, PLUME.",
+            caller="SmartAI.rwa_insight"
         )
 
     def get_status(self) -> Dict[str, Any]:
@@ -242,7 +288,8 @@ class SmartAI:
             "working_provider": self.working_provider["name"] if self.working_provider else None,
             "model": self.working_provider["model"] if self.working_provider else None,
             "all_providers": self.provider_status,
-            "last_check": self.last_health_check.isoformat() if self.last_health_check else None
+            "last_check": self.last_health_check.isoformat() if self.last_health_check else None,
+            "gateway": gateway.get_metrics()
         }
 
 
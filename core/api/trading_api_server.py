@@ -8,6 +8,7 @@ Endpoints:
 - GET  /api/strategy/performance  - Strategy metrics and performance
 - POST /api/trade/execute         - Execute trades with validation
 - POST /api/dashboard/update      - Dashboard event updates
+- GET  /api/dashboard/clients     - WebSocket client lag/queue metrics
 - WS   /ws/dashboard              - Real-time dashboard stream
 
 Part of the Sovereign Shadow Trading System
@@ -35,6 +36,7 @@ except ImportError:
     sys.exit(1)
 
 from core.trading.tactical_risk_gate import TacticalRiskGate, TradeRequest, ValidationResult
+from core.dashboard.broadcast_hub import BroadcastHub
 from strategy_knowledge_base import StrategyKnowledgeBase
 
 logger = logging.getLogger(__name__)
@@ -113,70 +115,44 @@ class HealthCheckResponse(BaseModel):
 # ============================================================================
 
 class ConnectionManager:
-    """Manages WebSocket connections for real-time dashboard updates"""
+    """
+    Manages WebSocket connections for real-time dashboard updates.
+
+    Sends go through a BroadcastHub: each message is serialized once and
+    queued per client with its own sender task, so one slow dashboard no
+    longer stalls the others. Lagging clients have stale dashboard frames
+    coalesced/dropped; see `stats()` for per-client lag.
+    """
     
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.reconnect_attempts: Dict[WebSocket, int] = {}
-        self.max_reconnect_attempts = 3
+    def __init__(self, hub: Optional[BroadcastHub] = None):
+        self.hub = hub or BroadcastHub()
+    
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return self.hub.websockets
     
     async def connect(self, websocket: WebSocket):
         try:
             await websocket.accept()
-            self.active_connections.append(websocket)
-            self.reconnect_attempts[websocket] = 0
-            logger.info(f"🔌 WebSocket connected ({len(self.active_connections)} active)")
+            self.hub.add(websocket)
         except Exception as e:
             logger.error(f"Failed to accept WebSocket connection: {e}")
             raise
     
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if websocket in self.reconnect_attempts:
-            del self.reconnect_attempts[websocket]
-        logger.info(f"🔌 WebSocket disconnected ({len(self.active_connections)} active)")
+        self.hub.remove(websocket)
     
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients with reconnection handling"""
-        dead_connections = []
-        for connection in self.active_connections[:]:  # Copy list to avoid modification during iteration
-            try:
-                await connection.send_json(message)
-                # Reset reconnect attempts on successful send
-                if connection in self.reconnect_attempts:
-                    self.reconnect_attempts[connection] = 0
-            except (WebSocketDisconnect, ConnectionResetError, BrokenPipeError) as e:
-                logger.warning(f"WebSocket disconnected during broadcast: {type(e).__name__}")
-                dead_connections.append(connection)
-            except Exception as e:
-                logger.warning(f"Failed to send to WebSocket: {e}")
-                # Track failed attempts
-                if connection in self.reconnect_attempts:
-                    self.reconnect_attempts[connection] += 1
-                    if self.reconnect_attempts[connection] >= self.max_reconnect_attempts:
-                        dead_connections.append(connection)
-                else:
-                    self.reconnect_attempts[connection] = 1
-        
-        # Clean up dead connections
-        for dead in dead_connections:
-            self.disconnect(dead)
+        """Queue message for all connected clients (never waits on a socket)"""
+        self.hub.publish(message)
     
     async def send_personal(self, websocket: WebSocket, message: dict):
-        """Send message to specific client with error handling"""
-        try:
-            await websocket.send_json(message)
-            # Reset reconnect attempts on successful send
-            if websocket in self.reconnect_attempts:
-                self.reconnect_attempts[websocket] = 0
-        except (WebSocketDisconnect, ConnectionResetError, BrokenPipeError) as e:
-            logger.warning(f"WebSocket disconnected: {type(e).__name__}")
-            self.disconnect(websocket)
-            raise
-        except Exception as e:
-            logger.error(f"Failed to send personal message: {e}")
-            raise
+        """Queue message for one client, in order with its broadcasts"""
+        if not self.hub.send_to(websocket, message):
+            logger.warning("send_personal to a disconnected WebSocket")
+    
+    def stats(self) -> dict:
+        return self.hub.stats()
 
 
 # ============================================================================
@@ -483,6 +459,11 @@ class TradingAPIServer:
                 timestamp=datetime.now().isoformat()
             )
         
+        @self.app.get("/api/dashboard/clients", tags=["dashboard"])
+        async def dashboard_clients():
+            """Per-client WebSocket queue depth, drops and send lag"""
+            return self.ws_manager.stats()
+        
         @self.app.websocket("/ws/dashboard")
         async def websocket_dashboard(websocket: WebSocket):
             """WebSocket endpoint for real-time dashboard updates"""
@@ -491,7 +472,7 @@ class TradingAPIServer:
             
             try:
                 # Send initial state
-                await websocket.send_json({
+                await self.ws_manager.send_personal(websocket, {
                     "event": "connected",
                     "data": {
                         "session_start": self.server_start_time.isoformat(),
@@ -506,12 +487,12 @@ class TradingAPIServer:
                     
                     # Handle ping/pong
                     if data.get("type") == "ping":
-                        await websocket.send_json({"type": "pong"})
+                        await self.ws_manager.send_personal(websocket, {"type": "pong"})
                     
                     # Handle data requests
                     elif data.get("type") == "request_stats":
                         stats = self.risk_gate.get_session_stats()
-                        await websocket.send_json({
+                        await self.ws_manager.send_personal(websocket, {
                             "event": "stats_update",
                             "data": stats
                         })
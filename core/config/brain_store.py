@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Brain Store - Shared in-process access to BRAIN.json
+
+Readers get the cached parsed document; the file is only re-parsed when its
+mtime/inode/size change. Writers take a cross-process file lock, re-read
+the current file, apply their change and replace the file atomically
+(temp file + rename), so concurrent writers no longer clobber each other
+and readers never see a half-written file.
+
+Usage:
+    from core.config.brain_store import get_brain_store
+
+    store = get_brain_store()
+    total = store.get("portfolio.exchanges.total", 0)
+    store.set("portfolio.snapshot_time", "2025-01-01")
+    store.update(lambda brain: brain.setdefault("sessions", []).append(entry))
+    store.subscribe(lambda paths, brain: print("changed:", paths))
+"""
+
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path("/Volumes/LegacySafe/SS_III")
+BRAIN_PATH = PROJECT_ROOT / "BRAIN.json"
+
+PathLike = Union[str, Sequence[str]]
+Listener = Callable[[List[Optional[str]], Dict[str, Any]], None]
+
+_MISSING = object()
+
+
+def _split(path: PathLike) -> List[str]:
+    if isinstance(path, str):
+        return [part for part in path.split(".") if part]
+    return list(path)
+
+
+def get_path(document: Dict[str, Any], path: PathLike, default: Any = None) -> Any:
+    """Look up a dotted path ("portfolio.exchanges.total") in a nested dict"""
+    node = document
+    for key in _split(path):
+        if not isinstance(node, dict) or key not in node:
+            return default
+        node = node[key]
+    return node
+
+
+def set_path(document: Dict[str, Any], path: PathLike, value: Any):
+    """Set a dotted path, creating intermediate dicts as needed"""
+    keys = _split(path)
+    if not keys:
+        raise ValueError("Empty BRAIN path")
+    node = document
+    for key in keys[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            child = node[key] = {}
+        node = child
+    node[keys[-1]] = value
+
+
+class BrainStore:
+    """
+    Cached, lock-protected view of one BRAIN.json file.
+
+    The cached document is shared: `read(copy=False)` and `get()` hand out
+    the cached objects for cheap read-only use; mutate only through
+    `set()`, `merge()` or `update()`.
+    """
+
+    def __init__(self, path: Union[str, Path] = BRAIN_PATH, indent: int = 2):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.indent = indent
+        self._lock = threading.RLock()
+        self._document: Dict[str, Any] = {}
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._listeners: List[Listener] = []
+        self.version = 0
+        self.reads = 0
+        self.parses = 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_ino, st.st_size
+
+    def _refresh(self) -> bool:
+        """Re-parse if the file changed on disk; returns True when it did"""
+        signature = self._stat()
+        if signature == self._signature:
+            return False
+        if signature is None:
+            document = {}
+        else:
+            try:
+                document = json.loads(self.path.read_text())
+            except (OSError, ValueError) as e:
+                # Keep serving the last good copy; a foreign non-atomic writer may be mid-write
+                logger.warning(f"Could not parse {self.path}: {e}")
+                return False
+            self.parses += 1
+        self._document = document if isinstance(document, dict) else {}
+        self._signature = signature
+        self.version += 1
+        return True
+
+    def read(self, copy: bool = True) -> Dict[str, Any]:
+        """Current document; a deep copy unless `copy=False`"""
+        with self._lock:
+            self.reads += 1
+            if self._refresh() and self.version > 1:
+                self._notify([None])
+            document = self._document
+        return _deepcopy(document) if copy else document
+
+    def get(self, path: PathLike, default: Any = None) -> Any:
+        return get_path(self.read(copy=False), path, default)
+
+    @property
+    def etag(self) -> str:
+        """Changes whenever the document on disk changes"""
+        with self._lock:
+            self._refresh()
+            mtime, inode, size = self._signature or (0, 0, 0)
+        return f"{inode:x}-{mtime:x}-{size:x}"
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "a") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _write(self, document: Dict[str, Any]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(document, f, indent=self.indent)
+                f.flush()
+                os.fsync(f.fileno())
+            if self.path.exists():
+                os.chmod(tmp, os.stat(self.path).st_mode & 0o777)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        self._document = document
+        self._signature = self._stat()
+        self.version += 1
+
+    def update(self, mutate: Callable[[Dict[str, Any]], Any], paths: Optional[List[str]] = None,
+               touch: bool = True) -> Any:
+        """
+        Read-modify-write under the file lock.
+
+        `mutate` receives a private copy of the freshest document and edits
+        it in place (or returns a replacement dict). `paths` names what
+        changed for listeners. Returns the mutator's result.
+        """
+        with self._file_lock():
+            self._refresh()
+            document = _deepcopy(self._document)
+            result = mutate(document)
+            if isinstance(result, dict) and result is not document:
+                document = result
+            if touch:
+                document["last_updated"] = datetime.now().isoformat()
+            self._write(document)
+            self._notify(paths or [None])
+        return result
+
+    def set(self, path: PathLike, value: Any, touch: bool = True):
+        self.update(lambda brain: set_path(brain, path, value), [".".join(_split(path))], touch)
+
+    def merge(self, path: PathLike, values: Dict[str, Any], touch: bool = True):
+        """Shallow-merge `values` into the dict at `path` ("" for the root)"""
+        def apply(brain):
+            target = get_path(brain, path, _MISSING) if _split(path) else brain
+            if not isinstance(target, dict):
+                target = {}
+                set_path(brain, path, target)
+            target.update(values)
+        prefix = ".".join(_split(path))
+        self.update(apply, [f"{prefix}.{k}" if prefix else k for k in values], touch)
+
+    def replace(self, document: Dict[str, Any], touch: bool = True):
+        """Write a whole document (legacy save_brain callers)"""
+        self.update(lambda _: dict(document), touch=touch)
+
+    # ------------------------------------------------------------------
+    # Change notification
+    # ------------------------------------------------------------------
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """
+        Call `listener(paths, document)` after every change.
+
+        `paths` lists dotted paths written through this store, or [None] when
+        the change came from another process. Returns an unsubscribe function.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+        def unsubscribe():
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return unsubscribe
+
+    def _notify(self, paths: List[Optional[str]]):
+        for listener in list(self._listeners):
+            try:
+                listener(paths, self._document)
+            except Exception as e:
+                logger.error(f"BRAIN listener failed: {e}")
+
+
+def _deepcopy(document: Dict[str, Any]) -> Dict[str, Any]:
+    return copy.deepcopy(document)
+
+
+_stores: Dict[Path, BrainStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_brain_store(path: Optional[Union[str, Path]] = None) -> BrainStore:
+    """Process-wide store for `path` (defaults to the project BRAIN.json)"""
+    key = Path(path or BRAIN_PATH).absolute()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = BrainStore(key)
+        return store
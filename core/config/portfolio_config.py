@@ -12,10 +12,14 @@ Usage:
 
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from core.config.brain_store import get_brain_store
+
 # Paths
 PROJECT_ROOT = Path("/Volumes/LegacySafe/SS_III")
 BRAIN_PATH = PROJECT_ROOT / "BRAIN.json"
@@ -25,8 +29,7 @@ BRAIN_JOT_PATH = PROJECT_ROOT / "BRAIN_JOT.json"
 def load_brain() -> Dict[str, Any]:
     """Load BRAIN.json - the source of truth."""
     try:
-        if BRAIN_PATH.exists():
-            return json.loads(BRAIN_PATH.read_text())
+        return get_brain_store(BRAIN_PATH).read()
     except Exception as e:
         print(f"Warning: Could not load BRAIN.json: {e}")
     return {}
@@ -158,15 +161,11 @@ def update_portfolio_value(new_value: float, source: str = "manual") -> bool:
         True if successful
     """
     try:
-        brain = load_brain()
-        if "portfolio" not in brain:
-            brain["portfolio"] = {}
-
-        brain["portfolio"]["total_value_usd"] = new_value
-        brain["portfolio"]["last_update"] = datetime.now().isoformat()
-        brain["portfolio"]["update_source"] = source
-
-        BRAIN_PATH.write_text(json.dumps(brain, indent=2))
+        get_brain_store(BRAIN_PATH).merge("portfolio", {
+            "total_value_usd": new_value,
+            "last_update": datetime.now().isoformat(),
+            "update_source": source
+        }, touch=False)
         return True
     except Exception as e:
         print(f"Error updating portfolio: {e}")
@@ -0,0 +1,293 @@
+"""
+Fan-out hub for dashboard websockets.
+
+Every broadcast is serialized once and queued per client; each client has
+its own sender task, so a dashboard on bad Wi-Fi only delays itself.
+Queues are bounded: frequent dashboard frames (market/stats updates) are
+coalesced - a newer frame replaces a still-queued older one of the same
+kind - and when a queue fills up, the oldest droppable frame is discarded.
+Frames that must arrive (trade events, personal replies) are never dropped;
+a client that cannot keep up even with those is disconnected rather than
+allowed to grow memory without bound.
+
+Works with anything exposing `async send_text(str)` and `async close(code)`
+(Starlette/FastAPI WebSocket), so it has no web framework dependency.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, FrozenSet, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COALESCE_EVENTS = frozenset({
+    "market_update",
+    "stats_update",
+    "health_factor_update",
+    "portfolio_update",
+    "price_update",
+})
+
+_AUTO = object()
+CLOSE_TRY_AGAIN_LATER = 1013
+
+
+def _is_disconnect(error: BaseException) -> bool:
+    return isinstance(error, (ConnectionError, EOFError)) or "Disconnect" in type(error).__name__
+
+
+@dataclass
+class ClientStats:
+    """Per-client delivery metrics (lag is enqueue -> send completed)"""
+    client: str
+    connected_at: float = field(default_factory=time.time)
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    failures: int = 0
+    queue_depth: int = 0
+    last_lag_ms: float = 0.0
+    avg_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    last_sent_at: Optional[float] = None
+
+    def record_send(self, lag_ms: float):
+        self.sent += 1
+        self.last_lag_ms = lag_ms
+        self.avg_lag_ms = lag_ms if self.sent == 1 else 0.8 * self.avg_lag_ms + 0.2 * lag_ms
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self.last_sent_at = time.time()
+
+
+class _Frame:
+    __slots__ = ("text", "key", "droppable", "enqueued_at")
+
+    def __init__(self, text: str, key: Optional[str], droppable: bool):
+        self.text = text
+        self.key = key
+        self.droppable = droppable
+        self.enqueued_at = time.perf_counter()
+
+
+class _Client:
+
+    def __init__(self, websocket: Any):
+        self.websocket = websocket
+        self.queue: Deque[_Frame] = deque()
+        self.pending: Dict[str, _Frame] = {}
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.closed = False
+        address = getattr(websocket, "client", None)
+        self.stats = ClientStats(client=f"{address[0]}:{address[1]}" if address else hex(id(websocket)))
+
+
+class BroadcastHub:
+    """
+    Per-client bounded queues with one sender task each.
+
+    `publish` never awaits a socket: it serializes the message once, drops
+    or coalesces stale frames for lagging clients and returns immediately.
+    """
+
+    def __init__(self, max_queue: int = 100, send_timeout: float = 10.0, max_failures: int = 3,
+                 coalesce_events: Iterable[str] = DEFAULT_COALESCE_EVENTS):
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.max_failures = max_failures
+        self.coalesce_events: FrozenSet[str] = frozenset(coalesce_events)
+        self._clients: Dict[int, _Client] = {}
+        self.published = 0
+        self.disconnected_slow = 0
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+
+    def add(self, websocket: Any) -> ClientStats:
+        """Register an accepted websocket and start its sender (needs a running loop)"""
+        client = _Client(websocket)
+        client.task = asyncio.get_running_loop().create_task(self._sender(client))
+        self._clients[id(websocket)] = client
+        logger.info(f"🔌 WebSocket connected ({len(self._clients)} active)")
+        return client.stats
+
+    def remove(self, websocket: Any):
+        client = self._clients.pop(id(websocket), None)
+        if client is None:
+            return
+        client.closed = True
+        client.queue.clear()
+        client.pending.clear()
+        if client.task is not None and client.task is not asyncio.current_task():
+            client.task.cancel()
+        logger.info(f"🔌 WebSocket disconnected ({len(self._clients)} active)")
+
+    @property
+    def websockets(self) -> List[Any]:
+        return [client.websocket for client in self._clients.values()]
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def _key_for(self, message: Dict[str, Any], coalesce_key: Any) -> Optional[str]:
+        if coalesce_key is not _AUTO:
+            return coalesce_key
+        event = message.get("event") if isinstance(message, dict) else None
+        return event if event in self.coalesce_events else None
+
+    @staticmethod
+    def serialize(message: Any) -> str:
+        # Same compact encoding as Starlette's send_json
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+    def publish(self, message: Any, coalesce_key: Any = _AUTO, droppable: Optional[bool] = None) -> int:
+        """
+        Queue `message` for every client; returns how many clients got it.
+
+        `coalesce_key` defaults to the event name for DEFAULT_COALESCE_EVENTS
+        (None disables coalescing). Coalescible frames are droppable by
+        default, everything else is delivered or the client is dropped.
+        """
+        text = self.serialize(message)
+        key = self._key_for(message, coalesce_key)
+        if droppable is None:
+            droppable = key is not None
+        self.published += 1
+        queued = 0
+        for client in list(self._clients.values()):
+            if self._enqueue(client, text, key, droppable):
+                queued += 1
+        return queued
+
+    def send_to(self, websocket: Any, message: Any, coalesce_key: Any = None) -> bool:
+        """Queue a message for one client (in order with its broadcasts)"""
+        client = self._clients.get(id(websocket))
+        if client is None:
+            return False
+        key = self._key_for(message, coalesce_key)
+        return self._enqueue(client, self.serialize(message), key, key is not None)
+
+    def _enqueue(self, client: _Client, text: str, key: Optional[str], droppable: bool) -> bool:
+        if client.closed:
+            return False
+        stats = client.stats
+
+        if key is not None:
+            queued = client.pending.get(key)
+            if queued is not None:
+                # Keep the latest only; the frame keeps its queue position
+                queued.text = text
+                stats.coalesced += 1
+                return True
+
+        if len(client.queue) >= self.max_queue:
+            stale = next((frame for frame in client.queue if frame.droppable), None)
+            if stale is None:
+                if droppable:
+                    stats.dropped += 1
+                    return False
+                self._disconnect_slow(client)
+                return False
+            client.queue.remove(stale)
+            if stale.key is not None and client.pending.get(stale.key) is stale:
+                del client.pending[stale.key]
+            stats.dropped += 1
+
+        frame = _Frame(text, key, droppable)
+        client.queue.append(frame)
+        if key is not None:
+            client.pending[key] = frame
+        stats.queue_depth = len(client.queue)
+        client.wakeup.set()
+        return True
+
+    def _disconnect_slow(self, client: _Client):
+        logger.warning(f"Dropping slow WebSocket client {client.stats.client}: "
+                       f"{len(client.queue)} undeliverable frames queued")
+        self.disconnected_slow += 1
+        websocket = client.websocket
+        self.remove(websocket)
+        close = getattr(websocket, "close", None)
+        if close is not None:
+            try:
+                asyncio.get_running_loop().create_task(close(code=CLOSE_TRY_AGAIN_LATER))
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    async def _sender(self, client: _Client):
+        stats = client.stats
+        consecutive_failures = 0
+        try:
+            while not client.closed:
+                if not client.queue:
+                    client.wakeup.clear()
+                    await client.wakeup.wait()
+                    continue
+                frame = client.queue.popleft()
+                if frame.key is not None and client.pending.get(frame.key) is frame:
+                    del client.pending[frame.key]
+                stats.queue_depth = len(client.queue)
+                try:
+                    await asyncio.wait_for(client.websocket.send_text(frame.text), self.send_timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    stats.failures += 1
+                    consecutive_failures += 1
+                    if _is_disconnect(e) or consecutive_failures >= self.max_failures:
+                        logger.warning(f"WebSocket {stats.client} send failed: {type(e).__name__}")
+                        self.remove(client.websocket)
+                        return
+                    continue
+                consecutive_failures = 0
+                stats.record_send((time.perf_counter() - frame.enqueued_at) * 1000)
+        except asyncio.CancelledError:
+            pass
+
+    async def drain(self, timeout: float = 5.0) -> bool:
+        """Wait until every client queue is empty (tests, graceful shutdown)"""
+        deadline = time.monotonic() + timeout
+        while any(client.queue for client in self._clients.values()):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.005)
+        return True
+
+    async def close(self):
+        tasks = [client.task for client in self._clients.values() if client.task]
+        for websocket in self.websockets:
+            self.remove(websocket)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        clients = []
+        for client in self._clients.values():
+            row = asdict(client.stats)
+            row["queue_depth"] = len(client.queue)
+            row["oldest_queued_ms"] = ((time.perf_counter() - client.queue[0].enqueued_at) * 1000
+                                       if client.queue else 0.0)
+            clients.append(row)
+        return {
+            "active_clients": len(clients),
+            "published": self.published,
+            "disconnected_slow": self.disconnected_slow,
+            "max_queue": self.max_queue,
+            "clients": clients
+        }
@@ -0,0 +1,343 @@
+"""
+Precomputed API snapshots and a background job queue.
+
+Dashboard endpoints serve pre-serialized JSON from a SnapshotCache instead
+of rebuilding the payload (and hitting exchanges) on every poll. Each entry
+is tagged with the version of the data it was built from - a BRAIN.json
+etag, a file signature, or the current candle - and is rebuilt only when
+that source moves on. The body's hash doubles as the HTTP ETag, so
+unchanged polls can be answered with 304 Not Modified.
+
+SnapshotRefresher rebuilds snapshots in a background thread (per-symbol
+payloads right after each candle close); JobQueue runs long requests such
+as a full trading cycle off the request thread and tracks their status.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+Builder = Callable[[], Union[Any, Tuple[Any, int]]]
+
+
+def file_signature(path: Union[str, Path]) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, inode, size) - changes whenever the file is rewritten"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_ino, st.st_size
+
+
+@dataclass
+class Snapshot:
+    key: str
+    body: bytes
+    etag: str
+    status: int = 200
+    source: Hashable = None
+    built_at: float = field(default_factory=time.time)
+    expires_at: Optional[float] = None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.built_at
+
+    def fresh(self, source: Hashable = None, now: Optional[float] = None) -> bool:
+        if self.source != source:
+            return False
+        return self.expires_at is None or (now or time.time()) < self.expires_at
+
+
+class SnapshotCache:
+    """
+    Serialized JSON payloads keyed by endpoint (and symbol).
+
+    `get_or_build` is single-flight per key: concurrent pollers of a stale
+    snapshot wait for one rebuild instead of each recomputing it.
+    """
+
+    def __init__(self, error_ttl: float = 60.0):
+        self.error_ttl = error_ttl
+        self._entries: Dict[str, Snapshot] = {}
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._listeners: List[Callable[[Snapshot], None]] = []
+        self.builds = 0
+
+    def get(self, key: str, source: Hashable = None) -> Optional[Snapshot]:
+        snapshot = self._entries.get(key)
+        if snapshot is not None and snapshot.fresh(source):
+            return snapshot
+        return None
+
+    def peek(self, key: str) -> Optional[Snapshot]:
+        """Latest snapshot regardless of freshness"""
+        return self._entries.get(key)
+
+    def put(self, key: str, payload: Any, source: Hashable = None, status: int = 200,
+            ttl: Optional[float] = None) -> Snapshot:
+        body = json.dumps(payload, default=str).encode()
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        if ttl is None and status >= 400:
+            ttl = self.error_ttl
+        snapshot = Snapshot(key, body, etag, status, source,
+                            expires_at=time.time() + ttl if ttl else None)
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = snapshot
+        if previous is None or previous.etag != snapshot.etag:
+            for listener in list(self._listeners):
+                try:
+                    listener(snapshot)
+                except Exception as e:
+                    logger.error(f"Snapshot listener failed for {key}: {e}")
+        return snapshot
+
+    def get_or_build(self, key: str, source: Hashable, build: Builder,
+                     ttl: Optional[float] = None) -> Snapshot:
+        """
+        Serve the cached snapshot for `source`, or rebuild it.
+
+        `build` returns a payload or (payload, status); exceptions become a
+        500 snapshot that is retried after `error_ttl`.
+        """
+        snapshot = self.get(key, source)
+        if snapshot is not None:
+            return snapshot
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            snapshot = self.get(key, source)
+            if snapshot is not None:
+                return snapshot
+            self.builds += 1
+            try:
+                result = build()
+            except Exception as e:
+                logger.error(f"Snapshot build failed for {key}: {e}")
+                return self.put(key, {"error": str(e)}, source, status=500)
+            payload, status = result if isinstance(result, tuple) else (result, 200)
+            return self.put(key, payload, source, status, ttl)
+
+    def subscribe(self, listener: Callable[[Snapshot], None]) -> Callable[[], None]:
+        """Call `listener(snapshot)` whenever a key's content (etag) changes"""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def discard(self, key: str):
+        """Drop a snapshot and its (idle) build lock"""
+        with self._lock:
+            self._entries.pop(key, None)
+            build_lock = self._build_locks.get(key)
+            if build_lock is not None and not build_lock.locked():
+                del self._build_locks[key]
+
+    def keys(self) -> List[str]:
+        return list(self._entries)
+
+
+def candle_index(timeframe_seconds: int, now: Optional[float] = None) -> int:
+    """Index of the candle containing `now`; changes exactly at candle close"""
+    return int((now or time.time()) // timeframe_seconds)
+
+
+class SnapshotRefresher:
+    """
+    Keeps snapshots warm from a background thread.
+
+    Static snapshots are (key, source_fn, build) triples, re-checked every
+    `poll_seconds` and rebuilt when source_fn() changes. Per-symbol
+    snapshots are rebuilt once per candle, `close_delay` seconds after the
+    close so the exchange has published the finished bar.
+
+    Symbols passed to watch() are kept for good; symbols first seen through
+    get_symbol() are kept only once they built successfully (status 200),
+    and only the `max_on_demand` most recently requested of those. Cached
+    snapshots of symbols that are not kept are dropped, so arbitrary
+    requests cannot grow the cache.
+    """
+
+    def __init__(self, cache: SnapshotCache, poll_seconds: float = 2.0,
+                 timeframe_seconds: int = 3600, close_delay: float = 5.0, max_on_demand: int = 32):
+        self.cache = cache
+        self.poll_seconds = poll_seconds
+        self.timeframe_seconds = timeframe_seconds
+        self.close_delay = close_delay
+        self._static: Dict[str, Tuple[Callable[[], Hashable], Builder]] = {}
+        self._symbol_builders: Dict[str, Callable[[str], Any]] = {}
+        self._symbols: Set[str] = set()
+        self._on_demand: "OrderedDict[str, None]" = OrderedDict()
+        self.max_on_demand = max_on_demand
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, key: str, source: Callable[[], Hashable], build: Builder):
+        self._static[key] = (source, build)
+
+    def register_symbol(self, prefix: str, build: Callable[[str], Any]):
+        """`build(symbol)` payloads cached under f"{prefix}:{symbol}" per candle"""
+        self._symbol_builders[prefix] = build
+
+    def watch(self, symbol: str):
+        with self._lock:
+            self._symbols.add(symbol.upper())
+
+    def _touch(self, symbol: str) -> List[str]:
+        """Mark an on-demand symbol as recently requested; returns the stalest evicted past the cap"""
+        evicted = []
+        with self._lock:
+            if symbol in self._symbols:
+                return evicted
+            self._on_demand[symbol] = None
+            self._on_demand.move_to_end(symbol)
+            while len(self._on_demand) > self.max_on_demand:
+                evicted.append(self._on_demand.popitem(last=False)[0])
+        return evicted
+
+    def _kept(self, symbol: str) -> bool:
+        with self._lock:
+            return symbol in self._symbols or symbol in self._on_demand
+
+    def _forget(self, symbol: str):
+        for prefix in list(self._symbol_builders):
+            self.cache.discard(f"{prefix}:{symbol}")
+
+    @property
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return sorted(self._symbols.union(self._on_demand))
+
+    def candle(self, now: Optional[float] = None) -> int:
+        return candle_index(self.timeframe_seconds, (now or time.time()) - self.close_delay)
+
+    def get(self, key: str) -> Snapshot:
+        """Snapshot for a static key, built on demand if the refresher has not caught up"""
+        source, build = self._static[key]
+        return self.cache.get_or_build(key, source(), build)
+
+    def get_symbol(self, prefix: str, symbol: str) -> Snapshot:
+        symbol = symbol.upper()
+        build = self._symbol_builders[prefix]
+        key = f"{prefix}:{symbol}"
+        snapshot = self.cache.get_or_build(key, self.candle(), lambda: build(symbol))
+        if snapshot.status == 200:
+            for evicted in self._touch(symbol):
+                self._forget(evicted)
+        elif not self._kept(symbol):
+            self.cache.discard(key)
+        return snapshot
+
+    def run_once(self, now: Optional[float] = None):
+        for key in list(self._static):
+            self.get(key)
+        candle = self.candle(now)
+        for prefix, build in list(self._symbol_builders.items()):
+            for symbol in self.symbols:
+                self.cache.get_or_build(f"{prefix}:{symbol}", candle, lambda s=symbol, b=build: b(s))
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Snapshot refresh failed: {e}")
+            self._stop.wait(self.poll_seconds)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="snapshot-refresher", daemon=True)
+        self._thread.start()
+        logger.info(f"Snapshot refresher started ({len(self._static)} static, "
+                    f"{len(self._symbol_builders)} per-symbol builders)")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+
+class JobQueue:
+    """
+    Background execution for slow requests.
+
+    Jobs run on a small thread pool; `submit` returns immediately with a job
+    record the client polls by id. With `dedupe`, a second submit of the same
+    kind while one is queued or running returns the existing job.
+    """
+
+    def __init__(self, max_workers: int = 1, keep: int = 50):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api-job")
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.keep = keep
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args, dedupe: bool = True, **kwargs) -> Dict[str, Any]:
+        with self._lock:
+            if dedupe:
+                for job in reversed(self._jobs.values()):
+                    if job["kind"] == kind and job["status"] in ("queued", "running"):
+                        return dict(job)
+            job_id = f"{kind}-{datetime.now().strftime('%Y%m%d%H%M%S')}-{next(self._ids)}"
+            job = {
+                "id": job_id,
+                "kind": kind,
+                "status": "queued",
+                "submitted_at": datetime.now().isoformat(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+                "error": None
+            }
+            self._jobs[job_id] = job
+            while len(self._jobs) > self.keep:
+                oldest = next(iter(self._jobs.values()))
+                if oldest["status"] in ("queued", "running"):
+                    break
+                self._jobs.popitem(last=False)
+            submitted = dict(job)
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return submitted
+
+    def _run(self, job: Dict[str, Any], fn: Callable[..., Any], args: tuple, kwargs: dict):
+        with self._lock:
+            job["status"] = "running"
+            job["started_at"] = datetime.now().isoformat()
+        try:
+            result = fn(*args, **kwargs)
+            update = {"status": "done", "result": result}
+        except Exception as e:
+            logger.error(f"Job {job['id']} failed: {e}\n{traceback.format_exc()}")
+            update = {"status": "failed", "error": str(e)}
+        with self._lock:
+            job.update(update, finished_at=datetime.now().isoformat())
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{k: v for k, v in job.items() if k != "result"}
+                    for job in self._jobs.values() if kind is None or job["kind"] == kind]
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
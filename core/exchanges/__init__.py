@@ -7,6 +7,7 @@ from .base_connector import BaseExchangeConnector, OrderSide, OrderType
 from .coinbase_connector import CoinbaseConnector
 from .okx_connector import OKXConnector
 from .kraken_connector import KrakenConnector
+from .client_pool import ClientPool, get_exchange
 
 __all__ = [
     "BaseExchangeConnector",
@@ -15,4 +16,6 @@ __all__ = [
     "CoinbaseConnector",
     "OKXConnector",
     "KrakenConnector",
+    "ClientPool",
+    "get_exchange",
 ]
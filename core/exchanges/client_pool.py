@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow II - Exchange Client Pool
+One configured ccxt client per (venue, credentials) per process
+
+Every ccxt instance owns its own HTTP session, rate limiter and market
+table, and the first call on a fresh instance downloads the full market
+list. Modules that build clients per cycle or per request pay that cost
+again each time. The pool hands out a shared client instead, and primes
+its markets from an on-disk cache so a cold start only hits the network
+when the cache is older than its TTL. The cache is keyed by venue plus the
+non-credential config (options such as defaultType or sandbox URLs change
+the market table), so keyed and public clients of one setup share a file.
+
+    from core.exchanges.client_pool import get_exchange
+
+    kraken = get_exchange("kraken")
+    coinbase = get_exchange("coinbase", apiKey=key, secret=secret)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import ccxt
+except ImportError:
+    ccxt = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+MARKET_CACHE_DIR = Path(os.getenv("CCXT_MARKET_CACHE_DIR", PROJECT_ROOT / "data" / "cache" / "ccxt_markets"))
+MARKET_CACHE_TTL = float(os.getenv("CCXT_MARKET_CACHE_TTL", 6 * 3600))
+
+CREDENTIAL_FIELDS = ("apiKey", "secret", "password", "uid", "privateKey", "walletAddress")
+
+
+def _default_factory(venue: str, config: Dict[str, Any]):
+    if ccxt is None:
+        raise ImportError("ccxt is required for exchange clients (pip install ccxt)")
+    return getattr(ccxt, venue)(config)
+
+
+def _settings(config: Dict[str, Any]) -> str:
+    return json.dumps({k: v for k, v in config.items() if k not in CREDENTIAL_FIELDS}, sort_keys=True, default=str)
+
+
+def _fingerprint(config: Dict[str, Any]) -> str:
+    """Stable key for a client config; secrets are hashed, never kept in the key"""
+    creds = "|".join(str(config.get(f) or "") for f in CREDENTIAL_FIELDS)
+    return hashlib.sha256((creds + "|" + _settings(config)).encode()).hexdigest()[:16]
+
+
+def _market_fingerprint(config: Dict[str, Any]) -> str:
+    """Market cache key: the config without credentials"""
+    return hashlib.sha256(_settings(config).encode()).hexdigest()[:12]
+
+
+class ClientPool:
+    """Process-wide registry of ccxt clients with a disk-backed market cache"""
+
+    def __init__(self, cache_dir: Path = MARKET_CACHE_DIR, markets_ttl: float = MARKET_CACHE_TTL,
+                 factory: Callable[[str, Dict[str, Any]], Any] = _default_factory):
+        self.cache_dir = Path(cache_dir)
+        self.markets_ttl = markets_ttl
+        self.factory = factory
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+        self._venue_locks: Dict[str, threading.Lock] = {}
+        self._market_keys: Dict[int, str] = {}
+
+    def get(self, venue: str, load_markets: bool = True, **config) -> Any:
+        """
+        Shared client for this venue and config. Credentials left as None are
+        dropped, so public and unconfigured-key callers share one client.
+        """
+        venue = venue.lower()
+        config = {k: v for k, v in config.items() if v is not None}
+        config.setdefault("enableRateLimit", True)
+        key = (venue, _fingerprint(config))
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self.factory(venue, config)
+                self._clients[key] = client
+                self._market_keys[id(client)] = _market_fingerprint(config)
+                logger.debug(f"Created {venue} client ({len(self._clients)} pooled)")
+            venue_lock = self._venue_locks.setdefault(venue, threading.Lock())
+
+        if load_markets and not getattr(client, "markets", None):
+            with venue_lock:
+                if not client.markets:
+                    try:
+                        self.load_markets(client, venue)
+                    except Exception as e:
+                        # ccxt will retry lazily on the first call that needs markets
+                        logger.warning(f"{venue} markets not loaded yet: {e}")
+        return client
+
+    # ------------------------------------------------------------------
+    # Market metadata cache
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, venue: str, market_key: str) -> Path:
+        return self.cache_dir / f"{venue}_{market_key}.json"
+
+    def _read_cache(self, venue: str, market_key: str) -> Optional[Dict[str, Any]]:
+        path = self._cache_path(venue, market_key)
+        try:
+            if time.time() - path.stat().st_mtime > self.markets_ttl:
+                return None
+            data = json.loads(path.read_text())
+            return data if data.get("markets") else None
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, venue: str, market_key: str, client: Any):
+        data = {
+            "venue": venue,
+            "saved_at": time.time(),
+            "markets": list(client.markets.values()),
+            "currencies": client.currencies or None,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{venue}.", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp, self._cache_path(venue, market_key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache {venue} markets: {e}")
+
+    def load_markets(self, client: Any, venue: Optional[str] = None, reload: bool = False,
+                     config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Markets from the disk cache when fresh, else from the exchange (then
+        cached). Pass `config` for clients that did not come from this pool.
+        """
+        venue = (venue or client.id).lower()
+        if config is not None:
+            market_key = _market_fingerprint(config)
+        else:
+            market_key = self._market_keys.get(id(client)) or _market_fingerprint({"enableRateLimit": True})
+        if not reload:
+            cached = self._read_cache(venue, market_key)
+            if cached is not None:
+                markets = client.set_markets(cached["markets"], cached.get("currencies"))
+                logger.debug(f"Loaded {len(markets)} {venue} markets from cache")
+                return markets
+
+        markets = client.load_markets(reload=True)
+        self._write_cache(venue, market_key, client)
+        return markets
+
+    def invalidate(self, venue: Optional[str] = None):
+        """Drop cached market files (all venues when venue is None)"""
+        paths = self.cache_dir.glob(f"{venue.lower()}_*.json" if venue else "*.json")
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clients(self) -> Dict[Tuple[str, str], Any]:
+        with self._lock:
+            return dict(self._clients)
+
+    def close_all(self):
+        """Close pooled HTTP sessions (process shutdown / tests)"""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            self._market_keys.clear()
+        for client in clients:
+            session = getattr(client, "session", None)
+            if session is not None and hasattr(session, "close"):
+                try:
+                    session.close()
+                except Exception:
+                    pass
+
+
+POOL = ClientPool()
+
+
+def get_exchange(venue: str, load_markets: bool = True, **config) -> Any:
+    """Shared ccxt client from the process-wide pool"""
+    return POOL.get(venue, load_markets=load_markets, **config)
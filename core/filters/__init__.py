@@ -7,6 +7,6 @@ Modules:
 - market_filters: Fear & Greed Index and DXY correlation filters
 """
 
-from .market_filters import MarketFilters, Signal
+from .market_filters import OracleMarketFilters
 
-__all__ = ['MarketFilters', 'Signal']
+__all__ = ['OracleMarketFilters']
@@ -5,12 +5,13 @@ No stale web research. Direct from Coinbase, Kraken, Binance, OKX.
 """
 
 import os
-import ccxt
 from typing import Dict, List, Optional
 from statistics import median, mean
 from pathlib import Path
 from dotenv import load_dotenv
 
+from core.exchanges.client_pool import get_exchange
+
 load_dotenv(Path(__file__).parent.parent.parent / '.env')
 
 
@@ -29,45 +30,45 @@ class ExchangeConsensus:
 
         # Coinbase
         try:
-            self.exchanges['coinbase'] = ccxt.coinbase({
-                'apiKey': os.getenv('COINBASE_API_KEY'),
-                'secret': os.getenv('COINBASE_API_SECRET'),
-                'enableRateLimit': True,
-            })
+            self.exchanges['coinbase'] = get_exchange(
+                'coinbase',
+                apiKey=os.getenv('COINBASE_API_KEY'),
+                secret=os.getenv('COINBASE_API_SECRET'),
+            )
             print("✓ Coinbase connected")
         except Exception as e:
             print(f"✗ Coinbase: {e}")
 
         # Kraken
         try:
-            self.exchanges['kraken'] = ccxt.kraken({
-                'apiKey': os.getenv('KRAKEN_API_KEY'),
-                'secret': os.getenv('KRAKEN_API_SECRET'),
-                'enableRateLimit': True,
-            })
+            self.exchanges['kraken'] = get_exchange(
+                'kraken',
+                apiKey=os.getenv('KRAKEN_API_KEY'),
+                secret=os.getenv('KRAKEN_API_SECRET'),
+            )
             print("✓ Kraken connected")
         except Exception as e:
             print(f"✗ Kraken: {e}")
 
         # Binance US
         try:
-            self.exchanges['binance'] = ccxt.binanceus({
-                'apiKey': os.getenv('BINANCE_API_KEY'),
-                'secret': os.getenv('BINANCE_API_SECRET'),
-                'enableRateLimit': True,
-            })
+            self.exchanges['binance'] = get_exchange(
+                'binanceus',
+                apiKey=os.getenv('BINANCE_API_KEY'),
+                secret=os.getenv('BINANCE_API_SECRET'),
+            )
             print("✓ Binance US connected")
         except Exception as e:
             print(f"✗ Binance US: {e}")
 
         # OKX
         try:
-            self.exchanges['okx'] = ccxt.okx({
-                'apiKey': os.getenv('OKX_API_KEY'),
-                'secret': os.getenv('OKX_API_SECRET'),
-                'password': os.getenv('OKX_PASSPHRASE'),
-                'enableRateLimit': True,
-            })
+            self.exchanges['okx'] = get_exchange(
+                'okx',
+                apiKey=os.getenv('OKX_API_KEY'),
+                secret=os.getenv('OKX_API_SECRET'),
+                password=os.getenv('OKX_PASSPHRASE'),
+            )
             print("✓ OKX connected")
         except Exception as e:
             print(f"✗ OKX: {e}")
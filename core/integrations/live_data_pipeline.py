@@ -14,7 +14,6 @@ import os
 import json
 import requests
 import asyncio
-import ccxt
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -22,6 +21,8 @@ from dataclasses import dataclass, asdict
 from dotenv import load_dotenv
 import pandas as pd
 
+from core.exchanges.client_pool import get_exchange
+
 # Load environment
 # Trading profiles for dynamic SL/TP
 try:
@@ -82,11 +83,12 @@ class LiveDataPipeline:
         self.birdeye_key = os.getenv('BIRDEYE_API_KEY')
         self.gemini_key = os.getenv('GEMINI_API_KEY')
 
-        # Initialize CCXT exchange (Coinbase)
-        self.exchange = ccxt.coinbase({
-            'apiKey': os.getenv('COINBASE_API_KEY'),
-            'secret': os.getenv('COINBASE_API_SECRET'),
-        })
+        # Shared CCXT client (Coinbase) - markets cached across instances and runs
+        self.exchange = get_exchange(
+            'coinbase',
+            apiKey=os.getenv('COINBASE_API_KEY'),
+            secret=os.getenv('COINBASE_API_SECRET'),
+        )
 
         # DISCOVERY watchlist - assets to find buying opportunities
         self.symbols = [
@@ -284,17 +286,23 @@ class LiveDataPipeline:
     # =========================================================================
 
     def detect_regime(self, symbol: str) -> Dict[str, Any]:
-        """Detect market regime using Strategy Engine"""
+        """
+        Market regime from the shared regime service snapshot
+
+        The whole watchlist is classified in one pass per candle close, so
+        repeated calls (and other consumers) read the same result instead
+        of refetching 30 days of OHLCV per symbol.
+        """
         try:
-            from core.strategies.strategy_engine import MarketRegimeDetector
+            from core.regime.regime_service import regime_service
 
-            detector = MarketRegimeDetector()
-            ohlcv = self.get_ohlcv(symbol, days=30)
+            regime_service.watch(self.symbols)
+            reading = regime_service.get(symbol)
 
-            if ohlcv.empty:
+            if reading is None:
                 return {'regime': 'Unknown', 'adx': 0, 'atr_percentile': 50}
 
-            return detector.detect_regime(ohlcv)
+            return reading.to_dict()
 
         except Exception as e:
             print(f"Regime detection error: {e}")
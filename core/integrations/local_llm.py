@@ -10,6 +10,10 @@ import requests
 import json
 from typing import Dict, Optional
 
+from core.ai.llm_gateway import gateway, is_ok_text
+
+REQUEST_TIMEOUT = 120  # seconds; local models can be slow on long prompts
+
 
 class LocalLLM:
     """Connect to LM Studio local server."""
@@ -54,8 +58,29 @@ class LocalLLM:
 
         raise ValueError(f"Could not parse JSON from: {text[:200]}")
 
-    def analyze(self, prompt: str, max_tokens: int = 500, temperature: float = 0.3) -> str:
-        """Send analysis request to local LLM."""
+    def analyze(self, prompt: str, max_tokens: int = 500, temperature: float = 0.3,
+                use_cache: bool = True, caller: str = "LocalLLM.analyze") -> str:
+        """Send analysis request to local LLM (cached + coalesced via the LLM gateway)."""
+        if not use_cache:
+            return self._analyze_upstream(prompt, max_tokens, temperature)
+
+        try:
+            return gateway.call(
+                provider="lmstudio",
+                model=f"{self.model}@{self.base_url}",
+                prompt=prompt,
+                fetch=lambda: self._analyze_upstream(prompt, max_tokens, temperature),
+                temperature=temperature,
+                caller=caller,
+                extra=max_tokens,
+                should_cache=is_ok_text,
+                timeout=REQUEST_TIMEOUT,
+            )
+        except TimeoutError as e:
+            return f"Error: {e}"
+
+    def _analyze_upstream(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """POST the prompt to the LM Studio chat completions endpoint."""
         try:
             response = requests.post(
                 f"{self.base_url}/chat/completions",
@@ -65,7 +90,7 @@ class LocalLLM:
                     "max_tokens": max_tokens,
                     "temperature": temperature  # Lower = more consistent
                 },
-                timeout=120
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             return response.json()["choices"][0]["message"]["content"]
@@ -97,7 +122,7 @@ Respond in JSON format:
 
 JSON only, no markdown:"""
 
-        result = self.analyze(prompt)
+        result = self.analyze(prompt, caller="LocalLLM.market_analysis")
 
         try:
             return self._parse_json_response(result)
@@ -132,7 +157,7 @@ Respond in JSON:
 
 JSON only:"""
 
-        result = self.analyze(prompt)
+        result = self.analyze(prompt, caller="LocalLLM.validate_trade")
 
         try:
             return self._parse_json_response(result)
@@ -170,7 +195,7 @@ Respond in JSON:
 
 JSON only:"""
 
-        result = self.analyze(prompt, max_tokens=800)
+        result = self.analyze(prompt, max_tokens=800, caller="LocalLLM.portfolio_risk")
 
         try:
             return self._parse_json_response(result)
@@ -11,10 +11,10 @@ Bridges:
 - All modules → TacticalRiskGate + REFLECT (AI critique)
 
 Active Modules:
-1. SENTINEL - AdvancedRiskManager (circuit breaker, ATR sizing)
-2. ORACLE - MarketFilters (Fear & Greed, DXY correlation)
-3. REGIME - HMMRegimeDetector (Trending/MeanReverting/Volatile)
-4. FLOW - OnChainSignals (exchange flows, whale alerts)
+1. SENTINEL - SentinelAdvancedRiskModule (circuit breaker, ATR sizing)
+2. ORACLE - OracleMarketFilters (Fear & Greed, DXY correlation)
+3. REGIME - RegimeHMMDetector (online forward filter, every closed bar)
+4. FLOW - FlowOnChainSignals (exchange flows, whale alerts)
 5. REFLECT - ReflectAgent (self-critique, 11-22% decision improvement)
 6. MOONDEV - Top 3 verified signals from 450 backtested:
    - MomentumBreakout_AI7: +12.5% return, +23.2% alpha
@@ -44,10 +44,10 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from core.trading.tactical_risk_gate import TacticalRiskGate, TradeRequest, ValidationResult
-from core.risk.advanced_risk_module import AdvancedRiskManager
-from core.filters.market_filters import MarketFilters
-from core.regime.hmm_regime_detector import HMMRegimeDetector
-from core.signals.onchain_signals import OnChainSignals
+from core.risk.advanced_risk_module import SentinelAdvancedRiskModule
+from core.filters.market_filters import OracleMarketFilters
+from core.regime.hmm_regime_detector import RegimeHMMDetector
+from core.signals.onchain_signals import FlowOnChainSignals
 from core.agents.reflect_agent import ReflectAgent
 
 # MoonDev verified signals (top 3 from 450 backtested)
@@ -110,27 +110,33 @@ class RealtimeRiskBridge:
             self.tactical_gate = None
 
         try:
-            self.sentinel = AdvancedRiskManager()
+            self.sentinel = SentinelAdvancedRiskModule()
         except Exception as e:
-            logger.warning(f"AdvancedRiskManager init failed: {e}")
+            logger.warning(f"SentinelAdvancedRiskModule init failed: {e}")
             self.sentinel = None
 
         try:
-            self.oracle = MarketFilters()
+            self.oracle = OracleMarketFilters()
         except Exception as e:
-            logger.warning(f"MarketFilters init failed: {e}")
+            logger.warning(f"OracleMarketFilters init failed: {e}")
             self.oracle = None
 
         try:
-            self.regime_detector = HMMRegimeDetector()
+            regime_config = {
+                "model_path": str(PROJECT_ROOT / "data" / "models" / "regime_hmm.pkl"),
+                "train_window": 24 * 90,
+                **self.config.get("regime_config", {})
+            }
+            self.regime_detector = RegimeHMMDetector(regime_config)
         except Exception as e:
-            logger.warning(f"HMMRegimeDetector init failed: {e}")
+            logger.warning(f"RegimeHMMDetector init failed: {e}")
             self.regime_detector = None
+        self._regime_pipeline = None
 
         try:
-            self.flow_signals = OnChainSignals()
+            self.flow_signals = FlowOnChainSignals()
         except Exception as e:
-            logger.warning(f"OnChainSignals init failed: {e}")
+            logger.warning(f"FlowOnChainSignals init failed: {e}")
             self.flow_signals = None
 
         try:
@@ -294,11 +300,18 @@ class RealtimeRiskBridge:
             logger.error(f"ORACLE update failed: {e}")
 
     def update_regime_detection(self, symbol: str = "BTC", force: bool = False):
-        """Update HMM regime detection"""
+        """
+        Update HMM regime detection
+
+        Runs on every closed 1h bar: the detector keeps its forward-filter
+        state, so each new bar is an O(K^2) update instead of a full 30-day
+        Viterbi decode. The 30-day history is only pulled to (re)train -
+        walk-forward and warm-started - and to prime the filter.
+        """
         now = datetime.now()
 
-        # Update every 15 minutes unless forced
-        if not force and (now - self.last_regime_update).seconds < 900:
+        # Cheap now - poll once a minute; only newly closed bars are processed
+        if not force and (now - self.last_regime_update).total_seconds() < 60:
             return
 
         self.last_regime_update = now
@@ -307,21 +320,38 @@ class RealtimeRiskBridge:
             return
 
         try:
-            # Get OHLCV data from CCXT
-            from core.integrations.live_data_pipeline import LiveDataPipeline
-            pipeline = LiveDataPipeline()
-            ohlcv = pipeline.get_ohlcv(symbol, days=30)
-
-            if not ohlcv.empty:
-                # Fit model if needed
-                if self.regime_detector.should_retrain():
-                    self.regime_detector.fit(ohlcv)
-
-                # Predict current regime
-                regime_type, regime_info = self.regime_detector.predict_regime(ohlcv)
-                self.risk_state.current_regime = regime_type.value if hasattr(regime_type, 'value') else str(regime_type)
-
-                logger.info(f"REGIME updated: {self.risk_state.current_regime}")
+            if self._regime_pipeline is None:
+                from core.integrations.live_data_pipeline import LiveDataPipeline
+                self._regime_pipeline = LiveDataPipeline()
+
+            detector = self.regime_detector
+            retrain = detector.should_retrain()
+            primed = detector.current_regime is not None
+
+            # Full history to (re)train / prime, otherwise just the last day of bars
+            full = retrain or not primed
+            ohlcv = self._regime_pipeline.get_ohlcv(symbol, days=30 if full else 1)
+
+            # Gap since the last bar we saw (bridge was down) - re-prime from history
+            if not full and not ohlcv.empty and ohlcv.index[0] > detector.last_timestamp:
+                full = True
+                ohlcv = self._regime_pipeline.get_ohlcv(symbol, days=30)
+
+            if ohlcv.empty:
+                return
+
+            # Last candle is still forming - only closed bars go into the filter
+            closed = ohlcv.iloc[:-1]
+
+            if retrain:
+                detector.train_model(closed)
+            if full:
+                detector.reset_filter()
+
+            regime = detector.update_from_frame(closed)
+            if regime:
+                self.risk_state.current_regime = regime
+                logger.info(f"REGIME updated: {regime} {detector.regime_probabilities()}")
         except Exception as e:
             logger.error(f"Regime update failed: {e}")
 
@@ -647,8 +677,38 @@ class WebSocketRiskMonitor:
         self.positions = {}  # Will be loaded from config
         self.running = False
 
+    async def connect_feed(self, product_ids: List[str]) -> bool:
+        """Feed the bridge from the shared market feed daemon; False if it is not running"""
+        from core.monitoring.market_feed import feed_available, stream_ticks, symbol_of
+
+        if not feed_available():
+            return False
+
+        self.running = True
+        logger.info(f"Using shared market feed for {product_ids}")
+        try:
+            async for tick in stream_ticks([symbol_of(p) for p in product_ids]):
+                if not self.running:
+                    break
+                self.bridge.ingest_price_tick(PriceTick(
+                    symbol=tick.symbol,
+                    price=tick.price,
+                    high_24h=tick.high_24h if tick.high_24h is not None else tick.price,
+                    low_24h=tick.low_24h if tick.low_24h is not None else tick.price,
+                    volume_24h=tick.volume_24h or 0,
+                    timestamp=datetime.fromtimestamp(tick.ts),
+                    source='market_feed'
+                ))
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"Market feed unavailable ({e}), falling back to direct WebSocket")
+            return False
+        return True
+
     async def connect_coinbase(self, product_ids: List[str]):
         """Connect to Coinbase WebSocket and feed bridge"""
+        if await self.connect_feed(product_ids):
+            return
+
         try:
             import websockets
         except ImportError:
@@ -9,11 +9,14 @@ one authoritative source. All results pushed to Replit for persistence.
 
 import os
 import json
+import time
 import asyncio
+import threading
 import requests
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from dotenv import load_dotenv
 
@@ -197,23 +200,227 @@ class DSStarAnalyzer:
         )
 
 
+def extract_manus_analysis(task_result: Dict) -> str:
+    """Concatenate the assistant output_text blocks of a Manus task"""
+    analysis = ""
+    for msg in task_result.get('output', []) or []:
+        if msg.get('role') == 'assistant':
+            for content in msg.get('content', []):
+                if content.get('type') == 'output_text':
+                    analysis += content.get('text', '')
+    return analysis
+
+
+class ManusWatch:
+    """Handle for a Manus task being polled in the background"""
+
+    def __init__(self, task_id: str, url: str = None):
+        self.task_id = task_id
+        self.url = url
+        self.status = 'pending'  # pending -> complete | failed | timeout | cancelled
+        self.result: Optional[ResearchResult] = None
+        self.polls = 0
+        self._done = threading.Event()
+        self._callbacks: List[Callable[['ManusWatch'], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the task settles (or timeout). Returns True if settled."""
+        return self._done.wait(timeout)
+
+    def add_callback(self, callback: Callable[['ManusWatch'], None]):
+        """Run callback(watch) on completion - immediately if already settled"""
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        self._run_callback(callback)
+
+    def _settle(self, status: str, result: Optional[ResearchResult] = None):
+        with self._lock:
+            if self._done.is_set():
+                return
+            self.status = status
+            self.result = result
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self._run_callback(callback)
+
+    def _run_callback(self, callback):
+        try:
+            callback(self)
+        except Exception as e:
+            print(f"   ⚠ Manus callback error: {e}")
+
+
+class ManusPoller:
+    """
+    Polls Manus tasks on daemon threads with exponential backoff.
+
+    Replaces the blocking poll loop inside ResearchSwarm.research - callers
+    get a ManusWatch back and either wait on it or register callbacks.
+    """
+
+    def __init__(
+        self,
+        manus: ManusClient,
+        initial_interval: float = 5.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        timeout: float = 1800.0
+    ):
+        self.manus = manus
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self._watches: Dict[str, ManusWatch] = {}
+        self._stop = threading.Event()
+
+    def watch(
+        self,
+        task_id: str,
+        url: str = None,
+        on_complete: Callable[[ManusWatch], None] = None,
+        timeout: float = None
+    ) -> ManusWatch:
+        """Start (or join) background polling for a task"""
+        existing = self._watches.get(task_id)
+        if existing is not None:
+            if on_complete:
+                existing.add_callback(on_complete)
+            return existing
+
+        watch = ManusWatch(task_id, url)
+        if on_complete:
+            watch.add_callback(on_complete)
+        self._watches[task_id] = watch
+
+        thread = threading.Thread(
+            target=self._poll_loop,
+            args=(watch, timeout if timeout is not None else self.timeout),
+            name=f"manus-poll-{task_id}",
+            daemon=True
+        )
+        thread.start()
+        return watch
+
+    def stop(self):
+        """Cancel all outstanding polls"""
+        self._stop.set()
+
+    def _poll_loop(self, watch: ManusWatch, timeout: float):
+        deadline = time.monotonic() + timeout
+        interval = self.initial_interval
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    watch._settle('timeout')
+                    return
+                if self._stop.wait(min(interval, remaining)):
+                    watch._settle('cancelled')
+                    return
+
+                watch.polls += 1
+                try:
+                    task_result = self.manus.get_task(watch.task_id)
+                except Exception as e:
+                    print(f"   ⚠ Manus poll error ({watch.task_id}): {e}")
+                    task_result = {}
+
+                status = task_result.get('status', 'unknown')
+                if status == 'completed':
+                    watch._settle('complete', ResearchResult(
+                        source='manus',
+                        query='',
+                        analysis=extract_manus_analysis(task_result),
+                        confidence=85.0,  # Manus with web access gets high confidence
+                        sources_cited=[],
+                        scholarly_refs=[],
+                        timestamp=datetime.now().isoformat(),
+                        raw_response=task_result
+                    ))
+                    return
+                if status == 'failed':
+                    watch._settle('failed')
+                    return
+
+                interval = min(interval * self.backoff, self.max_interval)
+        finally:
+            self._watches.pop(watch.task_id, None)
+
+
 class ResearchSwarm:
     """
     Coordinates all three AIs for unified research
 
     Flow:
-    1. Dispatch query to all three AIs in parallel
-    2. Collect independent analyses
-    3. Synthesize into unified report
-    4. Push to Replit for persistence
+    1. Dispatch query to all three AIs in parallel (independent timeouts)
+    2. Collect independent analyses; Manus keeps polling in the background
+    3. Synthesize into unified report (cached per query/asset/day)
+    4. Push to Replit for persistence (again when Manus lands)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        gemini_timeout: float = 120.0,
+        ds_star_timeout: float = 60.0,
+        manus_dispatch_timeout: float = 30.0,
+        manus_poll_timeout: float = 1800.0
+    ):
         self.manus = ManusClient()
         self.gemini = GeminiResearcher()
         self.ds_star = DSStarAnalyzer()
         self.replit_url = os.getenv('REPLIT_API_URL')
 
+        self.timeouts = {
+            'manus': manus_dispatch_timeout,
+            'gemini': gemini_timeout,
+            'ds_star': ds_star_timeout,
+        }
+        self.manus_poller = ManusPoller(self.manus, timeout=manus_poll_timeout)
+
+        # Long-lived pool: a timed-out source keeps its worker, it doesn't block the caller
+        self._pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="research-swarm")
+        # submit() runs research() here, never on _pool: a parent job holding a
+        # source worker would starve its own per-source jobs into timeouts
+        self._submit_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="research-swarm-submit")
+        self._report_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(query: str, asset: str = None, day: str = None) -> tuple:
+        """Reports are cached per (query, asset, day)"""
+        return (
+            " ".join(query.split()).lower(),
+            asset.upper() if asset else None,
+            day or date.today().isoformat()
+        )
+
+    def get_cached_report(self, query: str, asset: str = None) -> Optional[Dict[str, Any]]:
+        """Return today's synthesized report for this query/asset, if any"""
+        with self._cache_lock:
+            report = self._report_cache.get(self._cache_key(query, asset))
+        if report is None or report.get('degraded'):
+            # Reports where Gemini/DS-Star errored or timed out are retried
+            return None
+        return report
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._report_cache.clear()
+
+    def submit(self, query: str, **kwargs) -> Future:
+        """Run research() in the background and return a Future (non-blocking)"""
+        return self._submit_pool.submit(self.research, query, **kwargs)
+
     def research(
         self,
         query: str,
@@ -221,7 +428,9 @@ class ResearchSwarm:
         asset: str = None,
         require_scholarly: bool = True,
         wait_for_manus: bool = True,
-        manus_timeout: int = 300
+        manus_timeout: int = 300,
+        use_cache: bool = True,
+        on_manus_complete: Callable[[Dict[str, Any]], None] = None
     ) -> Dict[str, Any]:
         """
         Execute multi-AI research
@@ -231,12 +440,21 @@ class ResearchSwarm:
             context: Additional context (SS_III state, portfolio, etc.)
             asset: Specific asset being analyzed (BTC, ETH, etc.)
             require_scholarly: Enforce academic/scholarly sources
-            wait_for_manus: If True, poll Manus until complete (default: True)
+            wait_for_manus: If True, wait for Manus to complete (default: True)
             manus_timeout: Max seconds to wait for Manus (default: 300)
+            use_cache: Serve today's report for the same query/asset if present
+            on_manus_complete: Called with the updated report once Manus lands
 
         Returns:
             Unified research report with all sources
         """
+        key = self._cache_key(query, asset)
+        if use_cache:
+            cached = self.get_cached_report(query, asset)
+            if cached is not None:
+                print(f"RESEARCH SWARM - cache hit ({asset or 'General'}, {key[2]})")
+                return cached
+
         print(f"\n{'='*70}")
         print("RESEARCH SWARM - Multi-AI Collaboration")
         print(f"{'='*70}")
@@ -244,10 +462,75 @@ class ResearchSwarm:
         print(f"Asset: {asset or 'General'}")
         print(f"{'='*70}\n")
 
+        started = time.monotonic()
+
+        # 1. Fan out to all three sources at once
+        print("Dispatching MANUS, GEMINI/GIO and DS-STAR in parallel...")
+        futures = {
+            'manus': self._pool.submit(self._dispatch_manus, query, context),
+            'gemini': self._pool.submit(self.gemini.research, query, context),
+            'ds_star': self._pool.submit(self.ds_star.analyze, query, asset),
+        }
+
         results = {}
+        for name, future in futures.items():
+            timeout = self.timeouts[name]
+            remaining = max(0.0, timeout - (time.monotonic() - started))
+            try:
+                value = future.result(timeout=remaining)
+            except FuturesTimeout:
+                future.cancel()
+                results[name] = {'status': 'timeout', 'error': f'no response within {timeout:.0f}s'}
+                print(f"   ⚠ {name} timeout after {timeout:.0f}s")
+                continue
+            except Exception as e:
+                results[name] = {'status': 'error', 'error': str(e)}
+                print(f"   ✗ {name} error: {e}")
+                continue
+
+            results[name] = value if isinstance(value, dict) else asdict(value)
+            if name == 'gemini':
+                print(f"   ✓ Gemini complete (confidence: {value.confidence}%)")
+                print(f"   Scholarly refs: {len(value.scholarly_refs)}")
+            elif name == 'ds_star':
+                print(f"   ✓ DS-Star complete")
+            else:
+                print(f"   ✓ Manus task created: {value.get('task_id')}")
+
+        # 2. Manus runs long - poll it in the background
+        watch = None
+        task_id = results['manus'].get('task_id')
+        if task_id:
+            watch = self.manus_poller.watch(
+                task_id,
+                url=results['manus'].get('url'),
+                on_complete=lambda w: self._on_manus_complete(key, w, on_manus_complete)
+            )
+            if wait_for_manus:
+                print(f"   ⏳ Waiting for Manus (max {manus_timeout}s)...")
+                watch.wait(max(0.0, manus_timeout - (time.monotonic() - started)))
+                if not watch.done:
+                    print(f"   ⚠ Manus still running after {manus_timeout}s - will update report when done")
 
-        # 1. Dispatch to Manus (async task - will complete later)
-        print("[1/3] Dispatching to MANUS (Deep Research)...")
+        # 3. Create unified report (under the cache lock so a Manus completion
+        #    racing with us is either folded in here or applied afterwards)
+        print("\n[SYNTHESIS] Creating unified report...")
+        with self._cache_lock:
+            if watch is not None and watch.done:
+                results['manus'] = self._manus_result_dict(watch)
+            unified = self._synthesize(query, results)
+            unified['elapsed_seconds'] = round(time.monotonic() - started, 2)
+            unified['degraded'] = self._is_degraded(results)
+            self._store_report(key, unified)
+
+        # 4. Push to Replit
+        print("\n[PUSH] Sending to Replit...")
+        self._push_to_replit(unified)
+
+        return unified
+
+    def _dispatch_manus(self, query: str, context: str) -> Dict[str, Any]:
+        """Create the Manus deep-research task (does not wait for it)"""
         manus_prompt = f"""RESEARCH SWARM TASK - Deep Analysis Required
 
 QUERY: {query}
@@ -270,100 +553,71 @@ FOCUS AREAS:
 
 Provide a detailed, evidence-based analysis with full source citations.
 """
-        try:
-            manus_task = self.manus.create_task(
-                prompt=manus_prompt,
-                agent_profile='manus-1.6-max',
-                task_mode='agent'
-            )
-            task_id = manus_task.get('task_id')
-            results['manus'] = {
-                'status': 'dispatched',
-                'task_id': task_id,
-                'url': manus_task.get('task_url')
-            }
-            print(f"   ✓ Manus task created: {task_id}")
-
-            # Wait for Manus to complete if requested
-            if wait_for_manus and task_id:
-                import time
-                print(f"   ⏳ Waiting for Manus (max {manus_timeout}s)...")
-                start_time = time.time()
-                poll_interval = 10  # Check every 10 seconds
-
-                while time.time() - start_time < manus_timeout:
-                    time.sleep(poll_interval)
-                    elapsed = int(time.time() - start_time)
-
-                    try:
-                        task_result = self.manus.get_task(task_id)
-                        status = task_result.get('status', 'unknown')
-
-                        if status == 'completed':
-                            # Extract the analysis
-                            output = task_result.get('output', [])
-                            analysis = ""
-                            for msg in output:
-                                if msg.get('role') == 'assistant':
-                                    for content in msg.get('content', []):
-                                        if content.get('type') == 'output_text':
-                                            analysis += content.get('text', '')
-
-                            results['manus'] = {
-                                'status': 'complete',
-                                'task_id': task_id,
-                                'url': manus_task.get('task_url'),
-                                'analysis': analysis,
-                                'confidence': 85.0
-                            }
-                            print(f"   ✓ Manus completed ({elapsed}s) - {len(analysis)} chars")
-                            break
-                        elif status == 'failed':
-                            results['manus']['status'] = 'failed'
-                            print(f"   ✗ Manus task failed")
-                            break
-                        else:
-                            print(f"   ... Manus status: {status} ({elapsed}s)")
-                    except Exception as poll_e:
-                        print(f"   ⚠ Poll error: {poll_e}")
-                else:
-                    print(f"   ⚠ Manus timeout after {manus_timeout}s - results still pending")
-                    results['manus']['status'] = 'timeout'
-
-        except Exception as e:
-            results['manus'] = {'status': 'error', 'error': str(e)}
-            print(f"   ✗ Manus error: {e}")
-
-        # 2. Query Gemini (synchronous)
-        print("\n[2/3] Querying GEMINI/GIO (Research Analysis)...")
-        try:
-            gemini_result = self.gemini.research(query, context)
-            results['gemini'] = asdict(gemini_result)
-            print(f"   ✓ Gemini complete (confidence: {gemini_result.confidence}%)")
-            print(f"   Scholarly refs: {len(gemini_result.scholarly_refs)}")
-        except Exception as e:
-            results['gemini'] = {'status': 'error', 'error': str(e)}
-            print(f"   ✗ Gemini error: {e}")
+        manus_task = self.manus.create_task(
+            prompt=manus_prompt,
+            agent_profile='manus-1.6-max',
+            task_mode='agent'
+        )
+        return {
+            'status': 'dispatched',
+            'task_id': manus_task.get('task_id'),
+            'url': manus_task.get('task_url')
+        }
 
-        # 3. Query DS-Star (local)
-        print("\n[3/3] Analyzing with DS-STAR (Decision Support)...")
-        try:
-            ds_result = self.ds_star.analyze(query, asset)
-            results['ds_star'] = asdict(ds_result)
-            print(f"   ✓ DS-Star complete")
-        except Exception as e:
-            results['ds_star'] = {'status': 'error', 'error': str(e)}
-            print(f"   ✗ DS-Star error: {e}")
+    @staticmethod
+    def _manus_result_dict(watch: ManusWatch) -> Dict[str, Any]:
+        """Shape a settled ManusWatch like the other raw_results entries"""
+        if watch.status == 'complete' and watch.result is not None:
+            return {
+                'status': 'complete',
+                'task_id': watch.task_id,
+                'url': watch.url,
+                'analysis': watch.result.analysis,
+                'confidence': watch.result.confidence
+            }
+        return {'status': watch.status, 'task_id': watch.task_id, 'url': watch.url}
 
-        # 4. Create unified report
-        print("\n[SYNTHESIS] Creating unified report...")
-        unified = self._synthesize(query, results)
+    @staticmethod
+    def _is_degraded(results: Dict) -> bool:
+        return any(
+            results.get(name, {}).get('status') in ('error', 'timeout')
+            for name in ('gemini', 'ds_star')
+        )
 
-        # 5. Push to Replit
-        print("\n[PUSH] Sending to Replit...")
-        self._push_to_replit(unified)
+    def _store_report(self, key: tuple, report: Dict[str, Any]):
+        """Cache a report and drop entries from previous days (caller holds lock)"""
+        self._report_cache[key] = report
+        for stale in [k for k in self._report_cache if k[2] != key[2]]:
+            del self._report_cache[stale]
 
-        return unified
+    def _on_manus_complete(
+        self,
+        key: tuple,
+        watch: ManusWatch,
+        callback: Callable[[Dict[str, Any]], None] = None
+    ):
+        """Fold a finished Manus task into the cached report and re-push it"""
+        with self._cache_lock:
+            report = self._report_cache.get(key)
+            if report is None:
+                # research() hasn't stored the report yet - it will read the watch itself
+                return
+            if report['raw_results'].get('manus', {}).get('status') == watch.status:
+                return
+            results = dict(report['raw_results'])
+            results['manus'] = self._manus_result_dict(watch)
+            updated = self._synthesize(report['query'], results)
+            updated['elapsed_seconds'] = report.get('elapsed_seconds')
+            updated['degraded'] = report.get('degraded', False)
+            self._store_report(key, updated)
+
+        print(f"   ✓ Manus {watch.status} ({watch.task_id}) after {watch.polls} polls - report updated")
+        self._push_to_replit(updated)
+        if callback:
+            try:
+                callback(updated)
+            except Exception as e:
+                print(f"   ⚠ on_manus_complete error: {e}")
 
     def _synthesize(self, query: str, results: Dict) -> Dict[str, Any]:
         """Synthesize multiple AI results into unified report"""
@@ -467,23 +721,14 @@ Provide a detailed, evidence-based analysis with full source citations.
             return False
 
     def poll_manus(self, task_id: str) -> Optional[ResearchResult]:
-        """Poll Manus for completed task results"""
+        """Poll Manus once for completed task results"""
         try:
             result = self.manus.get_task(task_id)
             if result.get('status') == 'completed':
-                # Extract analysis from output
-                output = result.get('output', [])
-                analysis = ""
-                for msg in output:
-                    if msg.get('role') == 'assistant':
-                        for content in msg.get('content', []):
-                            if content.get('type') == 'output_text':
-                                analysis += content.get('text', '')
-
                 return ResearchResult(
                     source='manus',
                     query='',
-                    analysis=analysis,
+                    analysis=extract_manus_analysis(result),
                     confidence=85.0,  # Manus with web access gets high confidence
                     sources_cited=[],
                     scholarly_refs=[],  # Would need to parse from analysis
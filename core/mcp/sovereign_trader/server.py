@@ -15,6 +15,7 @@ SS3_ROOT = Path("/Volumes/LegacySafe/SS_III")
 sys.path.insert(0, str(SS3_ROOT))
 
 from mcp.server.fastmcp import FastMCP
+from core.config.brain_store import get_brain_store, set_path
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', stream=sys.stderr)
@@ -25,6 +26,7 @@ mcp = FastMCP("sovereign-trader")
 
 # Paths
 BRAIN_PATH = SS3_ROOT / "BRAIN.json"
+BRAIN = get_brain_store(BRAIN_PATH)
 ENV_PATH = SS3_ROOT / ".env"
 
 def load_env():
@@ -36,15 +38,20 @@ def load_env():
                 os.environ[k] = v
 
 def load_brain():
-    """Load BRAIN.json state."""
-    if BRAIN_PATH.exists():
-        return json.loads(BRAIN_PATH.read_text())
-    return {}
+    """Load BRAIN.json state (private copy of the cached document)."""
+    return BRAIN.read()
 
 def save_brain(brain):
-    """Save BRAIN.json state."""
-    brain['last_updated'] = datetime.now().isoformat()
-    BRAIN_PATH.write_text(json.dumps(brain, indent=2))
+    """Save BRAIN.json state (whole document, atomic). Prefer BRAIN.set/update for partial writes."""
+    BRAIN.replace(brain)
+
+def record_trade(trade, history=False):
+    """Write the pending trade (and optionally append it to trade_history) without touching other keys."""
+    def apply(brain):
+        brain['pending_trade'] = trade
+        if history:
+            brain.setdefault('trade_history', []).append(trade)
+    BRAIN.update(apply, ['pending_trade', 'trade_history'] if history else ['pending_trade'])
 
 # Load environment on startup
 load_env()
@@ -177,10 +184,10 @@ def refresh_balances() -> str:
                 results.append(f"Coinbase: Error - {e}")
 
         # Update BRAIN.json
-        brain = load_brain()
-        brain['portfolio']['exchanges']['total'] = round(total, 2)
-        brain['portfolio']['snapshot_time'] = datetime.now().strftime('%Y-%m-%d')
-        save_brain(brain)
+        def apply(brain):
+            set_path(brain, 'portfolio.exchanges.total', round(total, 2))
+            set_path(brain, 'portfolio.snapshot_time', datetime.now().strftime('%Y-%m-%d'))
+        BRAIN.update(apply, ['portfolio.exchanges.total', 'portfolio.snapshot_time'])
 
         return f"""
 BALANCES REFRESHED
@@ -349,8 +356,7 @@ def propose_trade(exchange: str = "", side: str = "", symbol: str = "", amount_u
     }
 
     # Store proposal in BRAIN
-    brain['pending_trade'] = proposal
-    save_brain(brain)
+    record_trade(proposal)
 
     return f"""
 TRADE PROPOSAL
@@ -432,14 +438,9 @@ def execute_trade(trade_id: str = "") -> str:
             pending['status'] = 'EXECUTED'
             pending['order_id'] = str(order.order_id) if hasattr(order, 'order_id') else 'unknown'
             pending['executed_at'] = datetime.now().isoformat()
-            brain['pending_trade'] = pending
 
             # Log to trade history
-            if 'trade_history' not in brain:
-                brain['trade_history'] = []
-            brain['trade_history'].append(pending)
-
-            save_brain(brain)
+            record_trade(pending, history=True)
 
             return f"""
 TRADE EXECUTED
@@ -456,8 +457,7 @@ Trade logged to BRAIN.json
     except Exception as e:
         pending['status'] = 'FAILED'
         pending['error'] = str(e)
-        brain['pending_trade'] = pending
-        save_brain(brain)
+        record_trade(pending)
         return f"TRADE FAILED: {e}"
 
 
@@ -471,8 +471,7 @@ def cancel_trade() -> str:
         return "No pending trade to cancel"
 
     trade_id = pending.get('id')
-    brain['pending_trade'] = None
-    save_brain(brain)
+    record_trade(None)
 
     return f"Trade {trade_id} cancelled"
 
@@ -5,47 +5,43 @@ Machine Learning Module for SOVEREIGN_SHADOW_3
 FreqAI-inspired self-adaptive ML scaffold for crypto trading.
 
 Key components:
-- AdaptiveMLEngine: Self-retraining ML engine (<4h model age)
-- FeatureEngineering: 100+ technical indicators from OHLCV
-- OutlierDetector: IsolationForest-based anomaly detection
-- ModelMetrics: Training performance tracking
-- PredictionResult: Structured prediction outputs
+- AdaptFreqAIScaffold: Self-retraining ML model scaffold (scikit-learn)
+- FreqAITrainingScheduler: rolling-window background retrains with atomic model hot-swap
+- DepthOrderBookRLEnv: Gym environment for order book execution (gymnasium)
+- VectorDepthOrderBookEnv: N order book environments stepped at once (NumPy; gymnasium VectorEnv API)
+- OrderBookRecorder / OrderBookReader: streamed binary order book captures, mmap replay
 
 Example:
-    from core.ml import AdaptiveMLEngine, FeatureEngineering
+    from core.ml import VectorDepthOrderBookEnv
 
-    # Initialize engine
-    engine = AdaptiveMLEngine(
-        model_type='lightgbm',
-        retrain_hours=4.0
-    )
-
-    # Train on OHLCV data
-    metrics = engine.train(df)
+    env = VectorDepthOrderBookEnv(num_envs=256, config={"num_levels": 5})
+    obs, info = env.reset(seed=0)
+    obs, rewards, terminated, truncated, info = env.step(env.sample_actions())
+"""
 
-    # Make predictions
-    predictions = engine.predict(recent_df)
+from .vector_orderbook_env import VectorDepthOrderBookEnv, load_orderbook_snapshots
+from .orderbook_store import OrderBookRecorder, OrderBookReader
 
-    for pred in predictions:
-        print(f"Signal: {pred.signal}, Confidence: {pred.probability}")
-"""
+try:
+    from .freqai_scaffold import AdaptFreqAIScaffold
+    from .freqai_scheduler import FreqAITrainingScheduler
+except ImportError:  # scikit-learn not installed
+    AdaptFreqAIScaffold = None
+    FreqAITrainingScheduler = None
 
-from .freqai_scaffold import (
-    AdaptiveMLEngine,
-    FeatureEngineering,
-    OutlierDetector,
-    ModelMetrics,
-    PredictionResult,
-    create_sample_data
-)
+try:
+    from .orderbook_rl_scaffold import DepthOrderBookRLEnv
+except ImportError:  # gymnasium not installed
+    DepthOrderBookRLEnv = None
 
 __all__ = [
-    'AdaptiveMLEngine',
-    'FeatureEngineering',
-    'OutlierDetector',
-    'ModelMetrics',
-    'PredictionResult',
-    'create_sample_data'
+    'AdaptFreqAIScaffold',
+    'FreqAITrainingScheduler',
+    'DepthOrderBookRLEnv',
+    'VectorDepthOrderBookEnv',
+    'load_orderbook_snapshots',
+    'OrderBookRecorder',
+    'OrderBookReader'
 ]
 
 __version__ = '1.0.0'
@@ -6,12 +6,87 @@ Sovereign Shadow III
 Usage:
     python collect_orderbook_data.py --symbol BTC/USD --duration 60 --interval 5
     python collect_orderbook_data.py --symbol ETH/USD --duration 120 --interval 10
+    python collect_orderbook_data.py --symbol BTC/USD --format json   # legacy single JSON file
+
+Binary recordings stream to chunked .obk files as they are captured (see
+orderbook_store.py) and are replayed with OrderBookReader / memory maps.
+The JSON format records the same way and converts the chunks to one JSON
+file when collection ends.
 """
 
 import argparse
+import json
 import os
-from datetime import datetime
-from orderbook_rl_scaffold import OrderBookCollector
+import time
+
+
+def record_binary(args):
+    """Stream snapshots straight to disk - nothing accumulates in memory"""
+    import ccxt
+    from orderbook_store import OrderBookRecorder
+
+    exchange = getattr(ccxt, args.exchange)({'enableRateLimit': True})
+    deadline = time.time() + args.duration * 60
+
+    with OrderBookRecorder(args.output_dir, args.symbol, levels=args.depth) as recorder:
+        print(f"  Output: {recorder.directory}/{recorder.stem}_*.obk")
+        try:
+            while time.time() < deadline:
+                started = time.time()
+                try:
+                    book = exchange.fetch_order_book(args.symbol, limit=args.depth)
+                    recorder.record(book.get('timestamp') or started * 1000, book['bids'], book['asks'])
+                except Exception as e:
+                    print(f"  Snapshot failed: {e}")
+                time.sleep(max(0.0, args.interval - (time.time() - started)))
+        except KeyboardInterrupt:
+            print("\n\nCollection interrupted by user")
+
+    print(f"\n{'='*70}")
+    print("COLLECTION COMPLETE")
+    print(f"{'='*70}")
+    print(f"Total snapshots: {recorder.records_written}")
+    if args.format == 'binary':
+        for path in recorder.chunk_paths:
+            print(f"File saved: {path} ({os.path.getsize(path) / 1024:.2f} KB)")
+    return recorder
+
+
+def export_json(recorder, args) -> str:
+    """Convert a finished recording to the legacy JSON list and drop its chunks"""
+    from orderbook_store import OrderBookReader
+
+    snapshots = []
+    for path in recorder.chunk_paths:
+        for timestamps, bids, asks in OrderBookReader(path).iter_chunks():
+            for t, bid, ask in zip(timestamps, bids, asks):
+                bid, ask = bid[bid[:, 1] > 0], ask[ask[:, 1] > 0]
+                best_bid = float(bid[0, 0]) if len(bid) else None
+                best_ask = float(ask[0, 0]) if len(ask) else None
+                bid_volume, ask_volume = float(bid[:, 1].sum()), float(ask[:, 1].sum())
+                snapshots.append({
+                    "timestamp": float(t),
+                    "symbol": args.symbol,
+                    "bids": bid.tolist(),
+                    "asks": ask.tolist(),
+                    "spread": best_ask - best_bid if best_bid is not None and best_ask is not None else None,
+                    "imbalance": ((bid_volume - ask_volume) / (bid_volume + ask_volume)
+                                  if bid_volume + ask_volume else 0.0)
+                })
+
+    filepath = os.path.join(args.output_dir, f"{recorder.stem}.json")
+    with open(filepath, 'w') as f:
+        json.dump(snapshots, f)
+    for path in recorder.chunk_paths:
+        os.remove(path)
+
+    print(f"File saved: {filepath} ({os.path.getsize(filepath) / 1024:.2f} KB)")
+    spreads = [s["spread"] for s in snapshots if s["spread"] is not None]
+    if spreads:
+        print(f"\nAverage spread: ${sum(spreads) / len(spreads):.2f}")
+        print(f"Average imbalance: {sum(s['imbalance'] for s in snapshots) / len(snapshots):.4f}")
+    return filepath
+
 
 def main():
     parser = argparse.ArgumentParser(description='Collect order book data from Coinbase')
@@ -27,66 +102,20 @@ def main():
                         help='Exchange to use (default: coinbase)')
     parser.add_argument('--output-dir', type=str, default='data/orderbook',
                         help='Output directory (default: data/orderbook)')
+    parser.add_argument('--format', type=str, default='binary', choices=['binary', 'json'],
+                        help='binary = streamed .obk chunks (default), json = one JSON file converted at the end')
 
     args = parser.parse_args()
 
     # Create output directory
     os.makedirs(args.output_dir, exist_ok=True)
 
-    # Initialize collector
-    print(f"\nInitializing {args.exchange} order book collector...")
-    collector = OrderBookCollector(exchange_id=args.exchange)
-
-    # Create filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    symbol_clean = args.symbol.replace('/', '_')
-    filename = f"{symbol_clean}_{args.duration}min_{timestamp}.json"
-    filepath = os.path.join(args.output_dir, filename)
-
-    # Collect data
-    print(f"\nCollecting {args.symbol} order book data...")
-    print(f"  Duration: {args.duration} minutes")
-    print(f"  Interval: {args.interval} seconds")
-    print(f"  Depth: {args.depth} levels")
-    print(f"  Output: {filepath}")
-    print(f"\nCollection started at {datetime.now()}")
+    print(f"\nStreaming {args.symbol} order book ({args.depth} levels every {args.interval}s "
+          f"for {args.duration} min) from {args.exchange}...")
     print("Press Ctrl+C to stop early\n")
-
-    try:
-        snapshots = collector.collect_historical_snapshots(
-            symbol=args.symbol,
-            duration_minutes=args.duration,
-            interval_seconds=args.interval,
-            depth=args.depth
-        )
-
-        # Save data
-        collector.save_snapshots(snapshots, filepath)
-
-        print(f"\n{'='*70}")
-        print("COLLECTION COMPLETE")
-        print(f"{'='*70}")
-        print(f"Total snapshots: {len(snapshots)}")
-        print(f"File saved: {filepath}")
-        print(f"File size: {os.path.getsize(filepath) / 1024:.2f} KB")
-
-        # Show sample statistics
-        if snapshots:
-            avg_spread = sum(s.spread for s in snapshots) / len(snapshots)
-            avg_imbalance = sum(s.imbalance for s in snapshots) / len(snapshots)
-            print(f"\nAverage spread: ${avg_spread:.2f}")
-            print(f"Average imbalance: {avg_imbalance:.4f}")
-
-    except KeyboardInterrupt:
-        print("\n\nCollection interrupted by user")
-        if snapshots:
-            print(f"Saving {len(snapshots)} snapshots collected so far...")
-            collector.save_snapshots(snapshots, filepath)
-            print(f"Partial data saved to: {filepath}")
-
-    except Exception as e:
-        print(f"\nError during collection: {e}")
-        raise
+    recorder = record_binary(args)
+    if args.format == 'json' and recorder.records_written:
+        export_json(recorder, args)
 
 
 if __name__ == "__main__":
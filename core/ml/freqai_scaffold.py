@@ -1,12 +1,84 @@
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier # Example ML model
 from sklearn.metrics import classification_report
 
 logger = logging.getLogger(__name__)
 
+
+def build_model(config: Dict) -> Any:
+    """
+    Creates an untrained model from configuration.
+    Extend this for different model types (e.g., XGBoost, LightGBM, Neural Networks).
+    """
+    model_type = config.get("model_type", "RandomForest")
+    n_jobs = config.get("n_jobs", -1) # Train on all cores
+    if model_type == "RandomForest":
+        return RandomForestClassifier(n_estimators=config.get("n_estimators", 100),
+                                      random_state=config.get("random_state", 42),
+                                      n_jobs=n_jobs)
+    if model_type == "SGD":
+        from sklearn.linear_model import SGDClassifier
+        return SGDClassifier(loss="log_loss", random_state=config.get("random_state", 42))
+    # Add more model types here as needed
+    logger.warning(f"Unsupported model type: {model_type}. Defaulting to RandomForest.")
+    return RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=n_jobs)
+
+
+def fit_model(config: Dict, X: np.ndarray, y: np.ndarray,
+              previous: Optional[Tuple[Any, Any]] = None) -> Tuple[Any, Any]:
+    """
+    Fits a (model, scaler) pair - pure function so it can run in a worker process.
+
+    With `previous`, the fit is a warm start instead of a rebuild:
+    - models with partial_fit are updated incrementally on the new window
+    - RandomForest grows `warm_start_trees` new trees on the new window and
+      keeps only the newest `n_estimators` trees (a rolling forest); this
+      needs the window to hold exactly the forest's classes, otherwise the
+      forest is rebuilt (old and new trees must agree on classes_)
+    The previous scaler is reused on warm starts so old and new trees see
+    the same feature space.
+    """
+    if previous is not None:
+        import copy
+        model, scaler = copy.deepcopy(previous[0]), previous[1]
+    else:
+        model, scaler = build_model(config), None
+        if config.get("scale_features", False):
+            from sklearn.preprocessing import StandardScaler
+            scaler = StandardScaler().fit(X)
+
+    X_fit = scaler.transform(X) if scaler is not None else X
+
+    if previous is not None and hasattr(model, "partial_fit"):
+        model.partial_fit(X_fit, y)
+    elif previous is not None and isinstance(model, RandomForestClassifier) \
+            and set(np.unique(y)) == set(model.classes_):
+        max_trees = config.get("n_estimators", 100)
+        model.set_params(warm_start=True,
+                         n_estimators=len(model.estimators_) + config.get("warm_start_trees", 20))
+        model.fit(X_fit, y)
+        if len(model.estimators_) > max_trees:
+            model.estimators_ = model.estimators_[-max_trees:]
+        model.set_params(n_estimators=len(model.estimators_), warm_start=False)
+    elif hasattr(model, "partial_fit") and not isinstance(model, RandomForestClassifier):
+        model.partial_fit(X_fit, y, classes=np.unique(y))
+    else:
+        if previous is not None:
+            model = build_model(config) # Class set changed - rebuild
+        model.fit(X_fit, y)
+
+    if config.get("training_report", False):
+        report = classification_report(y, model.predict(X_fit), output_dict=True, zero_division=0)
+        logger.debug(f"Training Report:\n{json.dumps(report, indent=2)}")
+
+    return model, scaler
+
+
 class AdaptFreqAIScaffold:
     """
     ADAPT: FreqAI Self-Adaptive ML Scaffold
@@ -14,6 +86,10 @@ class AdaptFreqAIScaffold:
     machine learning models for predictive trading signals. This scaffold allows
     for dynamic model training, evaluation, and adaptive adjustments based on
     real-time performance.
+
+    The active (model, scaler) pair is swapped in as one reference, so
+    predictions never see a half-updated model while a retrain - in-process
+    or from FreqAITrainingScheduler - completes.
     """
 
     def __init__(self, config: Dict = None):
@@ -21,64 +97,69 @@ class AdaptFreqAIScaffold:
         self.model_type = self.config.get("model_type", "RandomForest")
         self.features: List[str] = self.config.get("features", ['open', 'high', 'low', 'close', 'volume'])
         self.label: str = self.config.get("label", 'signal') # Target variable (e.g., buy/sell signal)
-        self.model: Optional[Any] = None # The ML model instance
-        self.scaler: Optional[Any] = None # Optional scaler for features
         self.is_trained: bool = False
         self.min_samples_to_train = self.config.get("min_samples_to_train", 100)
+        self.train_window: Optional[int] = self.config.get("train_window") # Rolling window (rows) for adapt_model
+        self._active: Tuple[Optional[Any], Optional[Any]] = (None, None) # (model, scaler)
+        self._swap_lock = threading.Lock()
+        self.model_version = 0
 
         logger.info(f"ADAPT FreqAI Scaffold initialized with model type: {self.model_type}")
 
-    def _initialize_model(self):
-        """
-        Initializes the machine learning model based on configuration.
-        Extend this for different model types (e.g., XGBoost, LightGBM, Neural Networks).
-        """
-        if self.model_type == "RandomForest":
-            self.model = RandomForestClassifier(n_estimators=self.config.get("n_estimators", 100), 
-                                                random_state=self.config.get("random_state", 42))
-        # Add more model types here as needed
-        else:
-            logger.warning(f"Unsupported model type: {self.model_type}. Defaulting to RandomForest.")
-            self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+    @property
+    def model(self) -> Optional[Any]:
+        return self._active[0]
+
+    @property
+    def scaler(self) -> Optional[Any]:
+        return self._active[1]
 
-    def train_model(self, data: pd.DataFrame):
+    def swap_model(self, model: Any, scaler: Any = None):
+        """Atomically replaces the active model (used by background retrains)"""
+        with self._swap_lock:
+            self._active = (model, scaler)
+            self.model_version += 1
+            self.is_trained = model is not None
+
+    def engineer_features(self, data: pd.DataFrame) -> pd.DataFrame:
         """
-        Trains or re-trains the ML model using provided historical data.
-        Data should include features and the target label.
+        Feature engineering hook - returns the model's feature columns.
+        Override to derive indicators; FeatureCache only recomputes new rows.
         """
+        return data[self.features]
+
+    def _validate_training_data(self, data: pd.DataFrame) -> bool:
         if data.empty or len(data) < self.min_samples_to_train:
             logger.warning(f"Insufficient data ({len(data)} samples) to train model. Minimum required: {self.min_samples_to_train}")
-            self.is_trained = False
-            return
+            return False
 
         # Ensure all required features and label are in data
         required_cols = self.features + [self.label]
         if not all(col in data.columns for col in required_cols):
             missing = [col for col in required_cols if col not in data.columns]
             logger.error(f"Missing required columns for training: {missing}")
+            return False
+        return True
+
+    def train_model(self, data: pd.DataFrame, warm_start: bool = False):
+        """
+        Trains or re-trains the ML model using provided historical data.
+        Data should include features and the target label.
+        With warm_start the current model is extended instead of rebuilt (see fit_model).
+        """
+        if not self._validate_training_data(data):
             self.is_trained = False
             return
 
-        X = data[self.features]
-        y = data[self.label]
-
-        # Optional: Feature scaling
-        if self.config.get("scale_features", False):
-            from sklearn.preprocessing import StandardScaler
-            self.scaler = StandardScaler()
-            X = self.scaler.fit_transform(X)
+        X = self.engineer_features(data).to_numpy(dtype=float)
+        y = data[self.label].to_numpy()
+        previous = self._active if warm_start and self.model is not None else None
 
-        self._initialize_model()
         try:
-            self.model.fit(X, y)
-            self.is_trained = True
-            logger.info(f"FreqAI model ({self.model_type}) trained successfully on {len(data)} samples.")
-
-            # Evaluate performance on training data (can be extended to validation set)
-            y_pred = self.model.predict(X)
-            report = classification_report(y, y_pred, output_dict=True, zero_division=0)
-            logger.debug(f"Training Report:\n{json.dumps(report, indent=2)}")
-            
+            model, scaler = fit_model(self.config, X, y, previous)
+            self.swap_model(model, scaler)
+            logger.info(f"FreqAI model ({self.model_type}) {'warm-started' if previous else 'trained'} "
+                        f"successfully on {len(data)} samples.")
         except Exception as e:
             logger.error(f"Error during model training: {e}")
             self.is_trained = False
@@ -88,7 +169,8 @@ class AdaptFreqAIScaffold:
         Generates a trading signal based on the current market features.
         `current_features` should be a DataFrame with the same feature columns used in training.
         """
-        if not self.is_trained or self.model is None:
+        model, scaler = self._active # One read - never straddles a swap
+        if not self.is_trained or model is None:
             logger.warning("Model not trained. Cannot generate prediction.")
             return "NO_SIGNAL_UNTRAINED"
 
@@ -96,13 +178,13 @@ class AdaptFreqAIScaffold:
             logger.warning("Invalid current features for prediction.")
             return "NO_SIGNAL_INVALID_FEATURES"
 
-        X_predict = current_features[self.features]
+        X_predict = current_features[self.features].to_numpy(dtype=float)
 
-        if self.scaler:
-            X_predict = self.scaler.transform(X_predict)
+        if scaler is not None:
+            X_predict = scaler.transform(X_predict)
 
         try:
-            prediction = self.model.predict(X_predict)
+            prediction = model.predict(X_predict)
             # Assuming binary classification (0 or 1 for signal)
             signal = prediction[0]
             logger.debug(f"FreqAI predicted signal: {signal}")
@@ -111,19 +193,63 @@ class AdaptFreqAIScaffold:
             logger.error(f"Error during prediction: {e}")
             return "NO_SIGNAL_ERROR"
 
+    def predict_batch(self, features: Union[pd.DataFrame, Mapping[str, pd.DataFrame]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Scores many symbols with one model call.
+        `features` is either a DataFrame indexed by symbol (one row each) or a
+        mapping of symbol -> feature frame, whose latest row is used.
+        Returns {symbol: {"signal": ..., "probability": ...}}; probability is the
+        predicted class's probability (None for models without predict_proba).
+        Symbols that cannot be scored get the same NO_SIGNAL_* values as predict_signal.
+        """
+        model, scaler = self._active # One read - never straddles a swap
+        if isinstance(features, pd.DataFrame):
+            rows = {symbol: features.loc[[symbol]] for symbol in features.index.unique()}
+        else:
+            rows = {symbol: frame.iloc[[-1]] for symbol, frame in features.items() if not frame.empty}
+        results = {symbol: {"signal": "NO_SIGNAL_INVALID_FEATURES", "probability": None}
+                   for symbol in (features.index.unique() if isinstance(features, pd.DataFrame) else features)}
+
+        if not self.is_trained or model is None:
+            return {symbol: {"signal": "NO_SIGNAL_UNTRAINED", "probability": None} for symbol in results}
+
+        valid = [symbol for symbol, row in rows.items() if all(col in row.columns for col in self.features)]
+        if not valid:
+            return results
+
+        X_predict = np.vstack([rows[symbol][self.features].to_numpy(dtype=float)[-1] for symbol in valid])
+        if scaler is not None:
+            X_predict = scaler.transform(X_predict)
+
+        try:
+            if hasattr(model, "predict_proba"):
+                proba = model.predict_proba(X_predict)
+                best = proba.argmax(axis=1)
+                signals = model.classes_[best]
+                confidence = proba[np.arange(len(valid)), best]
+            else:
+                signals = model.predict(X_predict)
+                confidence = [None] * len(valid)
+        except Exception as e:
+            logger.error(f"Error during batch prediction: {e}")
+            return {symbol: {"signal": "NO_SIGNAL_ERROR", "probability": None} for symbol in results}
+
+        for symbol, signal, probability in zip(valid, signals, confidence):
+            results[symbol] = {"signal": signal.item() if hasattr(signal, "item") else signal,
+                               "probability": None if probability is None else float(probability)}
+        logger.debug(f"FreqAI scored {len(valid)} symbols in one batch")
+        return results
+
     def adapt_model(self, new_data: pd.DataFrame):
         """
         Trigger adaptive re-training or model adjustment based on new data or performance.
-        This could involve:
-        - Periodically retraining the model with new data.
-        - Retraining if performance metrics drop below a threshold.
-        - Updating model parameters dynamically.
-        For this scaffold, it simply re-trains with combined old and new data.
+        Trains on the trailing `train_window` rows only and warm-starts from the
+        current model when there is one. For retrains off the calling thread,
+        use FreqAITrainingScheduler.
         """
         logger.info("Initiating model adaptation (re-training with new data).")
-        # In a real FreqAI system, this would be more sophisticated, involving
-        # incremental learning, hyperparameter optimization, or model switching.
-        self.train_model(new_data) # Simple re-train with new data
+        window = new_data.tail(self.train_window) if self.train_window else new_data
+        self.train_model(window, warm_start=self.model is not None)
 
 # Example usage (for testing)
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+import pandas as pd
+
+from core.ml.freqai_scaffold import AdaptFreqAIScaffold, fit_model
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureCache:
+    """
+    Incremental cache of engineered features keyed by the frame index.
+
+    Only rows newer than the cached tail are engineered; `lookback` rows of
+    history are passed along so rolling-window features stay correct.
+    """
+
+    def __init__(self, engineer: Callable[[pd.DataFrame], pd.DataFrame], lookback: int = 0,
+                 max_rows: Optional[int] = None):
+        self.engineer = engineer
+        self.lookback = lookback
+        self.max_rows = max_rows
+        self._features: Optional[pd.DataFrame] = None
+        self.rows_engineered = 0
+        self._lock = threading.Lock()
+
+    def get(self, data: pd.DataFrame) -> pd.DataFrame:
+        with self._lock:
+            cached = self._features
+            if cached is None or cached.empty or cached.index[-1] not in data.index:
+                fresh = self.engineer(data)
+                self.rows_engineered += len(data)
+                cached = fresh
+            else:
+                end = data.index.get_loc(cached.index[-1]) + 1
+                if end < len(data):
+                    tail = data.iloc[max(0, end - self.lookback):]
+                    fresh = self.engineer(tail).iloc[end - max(0, end - self.lookback):]
+                    self.rows_engineered += len(data) - end
+                    cached = pd.concat([cached, fresh])
+            if self.max_rows:
+                cached = cached.iloc[-self.max_rows:]
+            self._features = cached
+            return cached.reindex(data.index).dropna()
+
+    def clear(self):
+        with self._lock:
+            self._features = None
+
+
+class FreqAITrainingScheduler:
+    """
+    Rolling-window background retrains for an AdaptFreqAIScaffold.
+
+    Each retrain fits on the trailing `train_window` rows in a worker process
+    (fit_model uses all cores via n_jobs) and warm-starts from the live model.
+    The result is hot-swapped into the scaffold when the job completes, so
+    predict_signal keeps serving the previous model meanwhile and never blocks.
+    At most one retrain runs at a time; submissions while busy are coalesced
+    into a single follow-up run on the newest data.
+    """
+
+    def __init__(self, scaffold: AdaptFreqAIScaffold, train_window: Optional[int] = None,
+                 retrain_interval: float = 3600.0, feature_lookback: int = 0,
+                 use_process: bool = True):
+        self.scaffold = scaffold
+        self.train_window = train_window or scaffold.train_window or 5000
+        self.retrain_interval = retrain_interval
+        self.features = FeatureCache(scaffold.engineer_features, lookback=feature_lookback,
+                                     max_rows=self.train_window + feature_lookback)
+        self._executor = ProcessPoolExecutor(max_workers=1) if use_process \
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="freqai-train")
+        self._lock = threading.RLock() # Callbacks run inline when a job is already done
+        self._running: Optional[Future] = None
+        self._pending: Optional[pd.DataFrame] = None
+        self.last_trained_at = 0.0
+        self.retrain_count = 0
+
+    @property
+    def busy(self) -> bool:
+        return self._running is not None
+
+    def due(self) -> bool:
+        return time.time() - self.last_trained_at >= self.retrain_interval
+
+    def submit(self, data: pd.DataFrame, force: bool = False) -> Optional[Future]:
+        """Queue a retrain on the trailing window of `data`; returns the running job (if any)"""
+        if not force and not self.due():
+            return None
+        with self._lock:
+            if self._running is not None:
+                self._pending = data
+                return self._running
+            return self._start(data)
+
+    def _start(self, data: pd.DataFrame) -> Optional[Future]:
+        window = data.tail(self.train_window)
+        if not self.scaffold._validate_training_data(window):
+            return None
+        X = self.features.get(window)
+        y = window.loc[X.index, self.scaffold.label]
+        model, scaler = self.scaffold._active
+        previous = (model, scaler) if model is not None else None
+        future = self._executor.submit(fit_model, self.scaffold.config,
+                                       X.to_numpy(dtype=float), y.to_numpy(), previous)
+        self._running = future
+        future.add_done_callback(self._on_done)
+        logger.info(f"FreqAI retrain submitted ({len(X)} rows, "
+                    f"{'warm start' if previous else 'cold start'})")
+        return future
+
+    def _on_done(self, future: Future):
+        try:
+            model, scaler = future.result()
+            self.scaffold.swap_model(model, scaler)
+            self.last_trained_at = time.time()
+            self.retrain_count += 1
+            logger.info(f"FreqAI model hot-swapped (version {self.scaffold.model_version})")
+        except Exception as e:
+            logger.error(f"FreqAI background retrain failed: {e}")
+        with self._lock:
+            self._running = None
+            pending, self._pending = self._pending, None
+            if pending is not None:
+                self._start(pending)
+
+    def wait(self, timeout: Optional[float] = None):
+        """Block until the current (and any coalesced) retrain has been swapped in"""
+        deadline = time.time() + timeout if timeout else None
+        while True:
+            with self._lock:
+                future = self._running
+            if future is None:
+                return
+            try:
+                future.result(timeout=None if deadline is None else max(0.0, deadline - time.time()))
+            except Exception:
+                pass # Logged by _on_done
+            while self._running is future:
+                time.sleep(0.005)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
@@ -0,0 +1,201 @@
+import logging
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# File layout (little-endian):
+#   header  64 bytes: magic "SSOB", version u16, levels u16, created f64, symbol 48 bytes utf-8 (NUL padded)
+#   records float64 x (1 + 4 * levels): timestamp, bids[levels][price, qty], asks[levels][price, qty]
+# The record count is implied by the file size, so appending never rewrites the header and a
+# torn trailing record (crash mid-write) is simply ignored by the reader.
+MAGIC = b"SSOB"
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<4sHHd48s")
+FILE_SUFFIX = ".obk"
+
+
+def record_width(levels: int) -> int:
+    return 1 + 4 * levels
+
+
+def read_header(path: Union[str, Path]) -> dict:
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path}: truncated header")
+    magic, version, levels, created, symbol = _HEADER.unpack(raw[:_HEADER.size])
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not an order book chunk (magic {magic!r})")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported version {version}")
+    return {"version": version, "levels": levels, "created": created,
+            "symbol": symbol.rstrip(b"\0").decode()}
+
+
+class OrderBookRecorder:
+    """
+    Streams order book snapshots to chunked fixed-width binary files.
+
+    Records are staged in a preallocated buffer and appended every
+    `flush_every` snapshots; a new chunk file is started every
+    `chunk_records` snapshots. Books deeper than `levels` are truncated,
+    shallower ones are zero-padded.
+    """
+
+    def __init__(self, directory: Union[str, Path], symbol: str, levels: int = 20,
+                 chunk_records: int = 100_000, flush_every: int = 64):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.symbol = symbol
+        self.levels = levels
+        self.chunk_records = chunk_records
+        self.flush_every = flush_every
+
+        self._buffer = np.zeros((flush_every, record_width(levels)), dtype="<f8")
+        self._buffered = 0
+        self._file = None
+        self._chunk_index = 0
+        self._chunk_count = 0
+        self.records_written = 0
+        self.chunk_paths: List[Path] = []
+        self.stem = f"{symbol.replace('/', '_')}_{time.strftime('%Y%m%d_%H%M%S')}"
+
+    def record(self, timestamp: float, bids: Sequence[Sequence[float]], asks: Sequence[Sequence[float]]):
+        """Stage one snapshot (ccxt-style [[price, qty], ...] per side, best level first)"""
+        row = self._buffer[self._buffered]
+        row[:] = 0.0
+        row[0] = timestamp
+        levels = self.levels
+        for offset, side in ((1, bids), (1 + 2 * levels, asks)):
+            book = np.asarray([lvl[:2] for lvl in side[:levels]], dtype=np.float64).reshape(-1)
+            row[offset:offset + len(book)] = book
+        self._buffered += 1
+        if self._buffered == self.flush_every:
+            self.flush()
+
+    def flush(self):
+        start = 0
+        while start < self._buffered:
+            if self._file is None or self._chunk_count >= self.chunk_records:
+                self._open_chunk()
+            take = min(self._buffered - start, self.chunk_records - self._chunk_count)
+            self._file.write(self._buffer[start:start + take].tobytes())
+            self._chunk_count += take
+            self.records_written += take
+            start += take
+        self._buffered = 0
+        if self._file is not None:
+            self._file.flush()
+
+    def _open_chunk(self):
+        if self._file is not None:
+            self._file.close()
+        path = self.directory / f"{self.stem}_{self._chunk_index:04d}{FILE_SUFFIX}"
+        self._file = open(path, "wb")
+        header = _HEADER.pack(MAGIC, VERSION, self.levels, time.time(), self.symbol.encode()[:48])
+        self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+        self._chunk_index += 1
+        self._chunk_count = 0
+        self.chunk_paths.append(path)
+        logger.info(f"Order book chunk opened: {path}")
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class OrderBookChunk:
+    """Memory-mapped view of one chunk file"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        header = read_header(self.path)
+        self.symbol = header["symbol"]
+        self.levels = header["levels"]
+        width = record_width(self.levels)
+        count = (os.path.getsize(self.path) - HEADER_SIZE) // (width * 8)
+        self.records = np.memmap(self.path, dtype="<f8", mode="r", offset=HEADER_SIZE,
+                                 shape=(count, width)) if count else np.zeros((0, width))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.records[:, 0]
+
+    @property
+    def bids(self) -> np.ndarray:
+        """(n, levels, 2) view - no copy"""
+        return self.records[:, 1:1 + 2 * self.levels].reshape(len(self), self.levels, 2)
+
+    @property
+    def asks(self) -> np.ndarray:
+        return self.records[:, 1 + 2 * self.levels:].reshape(len(self), self.levels, 2)
+
+
+class OrderBookReader:
+    """
+    Reads a recording (a chunk file, or a directory of chunks) via memory maps.
+
+    A directory may hold recordings of several symbols; chunks are picked by
+    the symbol in their header, and `symbol` is required when more than one
+    is present (replaying them concatenated would interleave markets).
+
+    iter_chunks() yields zero-copy (timestamps, bids, asks) views per chunk;
+    load() concatenates them into replay arrays for backtests and
+    VectorDepthOrderBookEnv.
+    """
+
+    def __init__(self, path: Union[str, Path], symbol: Optional[str] = None):
+        path = Path(path)
+        if path.is_dir():
+            by_symbol = {}
+            for p in sorted(path.glob(f"*{FILE_SUFFIX}")):
+                by_symbol.setdefault(read_header(p)["symbol"], []).append(p)
+            if symbol is None and len(by_symbol) > 1:
+                raise ValueError(f"{path} holds recordings for {', '.join(sorted(by_symbol))} - pass symbol=")
+            paths = by_symbol.get(symbol, []) if symbol is not None else next(iter(by_symbol.values()), [])
+        else:
+            paths = [path]
+        self.chunks = [OrderBookChunk(p) for p in paths]
+        if not self.chunks:
+            where = f"{path} for {symbol}" if symbol else str(path)
+            raise FileNotFoundError(f"No {FILE_SUFFIX} chunks in {where}")
+        self.symbol = self.chunks[0].symbol
+        self.levels = self.chunks[0].levels
+        if any(c.levels != self.levels for c in self.chunks):
+            raise ValueError("Chunks were recorded with different depths")
+
+    def __len__(self) -> int:
+        return sum(len(c) for c in self.chunks)
+
+    def iter_chunks(self) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        for chunk in self.chunks:
+            if len(chunk):
+                yield chunk.timestamps, chunk.bids, chunk.asks
+
+    def load(self, levels: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(timestamps (T,), bids (T, levels, 2), asks (T, levels, 2)) for the whole recording"""
+        levels = min(levels or self.levels, self.levels)
+        parts = list(self.iter_chunks())
+        if not parts:
+            empty = np.zeros((0, levels, 2))
+            return np.zeros(0), empty, empty.copy()
+        return (np.concatenate([t for t, _, _ in parts]),
+                np.concatenate([b[:, :levels] for _, b, _ in parts]),
+                np.concatenate([a[:, :levels] for _, _, a in parts]))
@@ -0,0 +1,331 @@
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+import numpy as np
+
+try:
+    import gymnasium
+    from gymnasium import spaces
+    from gymnasium.vector.utils import batch_space
+    _VectorEnvBase = gymnasium.vector.VectorEnv
+    try:
+        from gymnasium.vector import AutoresetMode
+        _SAME_STEP = AutoresetMode.SAME_STEP
+    except ImportError:  # gymnasium < 1.1
+        _SAME_STEP = "SameStep"
+except ImportError:  # stepping is NumPy-only; only the space objects need gymnasium
+    gymnasium = spaces = batch_space = None
+    _VectorEnvBase = object
+    _SAME_STEP = "SameStep"
+
+logger = logging.getLogger(__name__)
+
+HOLD, BUY, SELL = 0, 1, 2
+
+
+def load_orderbook_snapshots(path: Union[str, Path], num_levels: int, symbol: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Loads recorded order book snapshots into replay arrays.
+
+    Accepts a binary recording from OrderBookRecorder (an .obk chunk or a
+    directory of chunks, memory-mapped), the JSON written by
+    collect_orderbook_data.py --format json (a list of snapshots, or
+    {"snapshots": [...]}, each with ccxt-style 'bids'/'asks' lists of
+    [price, volume]) or an .npz with 'bids' and 'asks' arrays. `symbol`
+    picks one recording from a directory holding several symbols.
+
+    Returns (bids, asks), each float64 of shape (T, num_levels, 2). Books
+    shallower than num_levels are padded with zero-quantity levels one tick
+    beyond the last recorded price.
+    """
+    path = Path(path)
+    if path.is_dir() or path.suffix == ".obk":
+        from .orderbook_store import OrderBookReader
+        reader = OrderBookReader(path, symbol=symbol)
+        if reader.levels < num_levels:
+            raise ValueError(f"{path} was recorded with {reader.levels} levels, {num_levels} requested")
+        _, bids, asks = reader.load(num_levels)
+        return bids, asks
+
+    if path.suffix == ".npz":
+        with np.load(path) as data:
+            return data["bids"][:, :num_levels].astype(np.float64), data["asks"][:, :num_levels].astype(np.float64)
+
+    with open(path) as f:
+        raw = json.load(f)
+    snapshots = raw.get("snapshots", []) if isinstance(raw, dict) else raw
+
+    bids = np.zeros((len(snapshots), num_levels, 2))
+    asks = np.zeros((len(snapshots), num_levels, 2))
+    for t, snap in enumerate(snapshots):
+        for side, out, direction in (("bids", bids, -1), ("asks", asks, 1)):
+            levels = np.asarray([lvl[:2] for lvl in snap[side][:num_levels]], dtype=np.float64).reshape(-1, 2)
+            out[t, :len(levels)] = levels
+            if 0 < len(levels) < num_levels:
+                tick = abs(levels[-1, 0] - levels[-2, 0]) if len(levels) > 1 else 0.0
+                pad = num_levels - len(levels)
+                out[t, len(levels):, 0] = levels[-1, 0] + direction * tick * np.arange(1, pad + 1)
+    return bids, asks
+
+
+class VectorDepthOrderBookEnv(_VectorEnvBase):
+    """
+    DEPTH: Vectorized Order Book RL Environment
+    Steps N copies of DepthOrderBookRLEnv at once on preallocated NumPy arrays,
+    behind the gymnasium.vector.VectorEnv API.
+
+    Execution and reward rules match DepthOrderBookRLEnv (fills against the
+    best level only, same penalties and portfolio term). Books are either
+    synthetic (random-walk mid, levels regenerated around it) or replayed from
+    recorded snapshots, with each environment starting at its own random offset.
+
+    State (N = num_envs, L = num_levels):
+        bids, asks: (N, L, 2) [price, qty], best level first
+        mid_price, cash, holdings, start_price: (N,)
+
+    Observation: float32 (N, 4 * L + 3) laid out like the single env's dict
+    observation flattened: mid_price, bids (price/qty interleaved), asks, cash,
+    asset_holdings.
+
+    Action: the single env's Dict action batched - {"action_type": (N,),
+    "price_level_offset": (N,), "quantity_fraction": (N, 1)} - as sampled
+    from `action_space`. With gymnasium installed, single_/observation_space
+    and single_/action_space are the usual space objects (None without it).
+
+    Environments that finish their episode are reset automatically inside
+    step() (same-step autoreset): the returned observation is the first one
+    of the new episode, and info["final_obs"] / info["final_info"] hold the
+    terminal ones, masked by info["_final_obs"].
+    """
+
+    metadata = {"autoreset_mode": _SAME_STEP, "render_modes": []}
+    render_mode = None
+
+    def __init__(self, num_envs: int, config: Dict = None,
+                 replay: Optional[Tuple[np.ndarray, np.ndarray]] = None, seed: Optional[int] = None):
+        self.config = config or {}
+        self.num_envs = num_envs
+        self.num_levels = self.config.get("num_levels", 5)
+        self.initial_price = self.config.get("initial_price", 100.0)
+        self.price_tick_size = self.config.get("price_tick_size", 0.01)
+        self.initial_cash = self.config.get("initial_cash", 10000.0)
+        self.initial_asset_holdings = self.config.get("initial_asset_holdings", 0.0)
+        self.max_order_size = self.config.get("max_order_size", 10.0)
+        self.max_steps = self.config.get("max_steps", 100)
+        self.rng = np.random.default_rng(seed)
+
+        n, levels = num_envs, self.num_levels
+        self.bids = np.zeros((n, levels, 2))
+        self.asks = np.zeros((n, levels, 2))
+        self.mid_price = np.zeros(n)
+        self.start_price = np.zeros(n)
+        self.cash = np.zeros(n)
+        self.holdings = np.zeros(n)
+        self.current_step = np.zeros(n, dtype=np.int64)
+        self.observation_dim = 4 * levels + 3
+        self._obs = np.zeros((n, self.observation_dim), dtype=np.float32)
+        self._level_offsets = np.arange(1, levels + 1) * self.price_tick_size
+        self._all = np.ones(n, dtype=bool)
+
+        self.single_observation_space = self.single_action_space = None
+        self.observation_space = self.action_space = None
+        if spaces is not None:
+            self.single_action_space = spaces.Dict({
+                "action_type": spaces.Discrete(3),  # HOLD, BUY, SELL
+                "price_level_offset": spaces.Discrete(2 * levels + 1, start=-levels),
+                "quantity_fraction": spaces.Box(low=0.0, high=1.0, shape=(1,), dtype=np.float32)
+            })
+            self.single_observation_space = spaces.Box(low=-np.inf, high=np.inf,
+                                                       shape=(self.observation_dim,), dtype=np.float32)
+            self.action_space = batch_space(self.single_action_space, n)
+            self.observation_space = batch_space(self.single_observation_space, n)
+
+        self.replay_bids = self.replay_asks = None
+        self.cursor = np.zeros(n, dtype=np.int64)
+        if replay is not None:
+            self.replay_bids, self.replay_asks = (np.asarray(a, dtype=np.float64)[:, :levels] for a in replay)
+            if len(self.replay_bids) <= self.max_steps:
+                raise ValueError(f"Replay has {len(self.replay_bids)} snapshots, need more than max_steps={self.max_steps}")
+
+        logger.info(f"DEPTH Vector Order Book RL Environment initialized ({n} envs, "
+                    f"{'replay' if replay is not None else 'synthetic'} books).")
+
+    @classmethod
+    def from_snapshots(cls, path: Union[str, Path], num_envs: int, config: Dict = None,
+                       seed: Optional[int] = None, symbol: Optional[str] = None) -> "VectorDepthOrderBookEnv":
+        """Builds a replay environment from a collect_orderbook_data.py recording"""
+        num_levels = (config or {}).get("num_levels", 5)
+        return cls(num_envs, config, replay=load_orderbook_snapshots(path, num_levels, symbol), seed=seed)
+
+    # ------------------------------------------------------------------
+    # Book generation
+    # ------------------------------------------------------------------
+
+    def _synthetic_books(self, mask: np.ndarray):
+        """Regenerates the books of masked envs around their mid price"""
+        k = int(mask.sum())
+        mid = self.mid_price[mask][:, None]
+        self.bids[mask, :, 0] = mid - self._level_offsets
+        self.asks[mask, :, 0] = mid + self._level_offsets
+        self.bids[mask, :, 1] = self.rng.uniform(1, 10, (k, self.num_levels)) * self.rng.uniform(0.8, 1.2, (k, self.num_levels))
+        self.asks[mask, :, 1] = self.rng.uniform(1, 10, (k, self.num_levels)) * self.rng.uniform(0.8, 1.2, (k, self.num_levels))
+
+    def _load_replay(self, mask: np.ndarray):
+        t = self.cursor[mask]
+        self.bids[mask] = self.replay_bids[t]
+        self.asks[mask] = self.replay_asks[t]
+        self.mid_price[mask] = (self.bids[mask, 0, 0] + self.asks[mask, 0, 0]) / 2
+
+    def _update_market(self):
+        if self.replay_bids is not None:
+            self.cursor += 1
+            self._load_replay(self._all)
+        else:
+            self.mid_price += self.rng.normal(0, self.price_tick_size * 2, self.num_envs)
+            np.maximum(self.mid_price, self.price_tick_size, out=self.mid_price)
+            self._synthetic_books(self._all)
+
+    # ------------------------------------------------------------------
+    # Gym-style API
+    # ------------------------------------------------------------------
+
+    def reset(self, seed: Optional[int] = None, options: Optional[Dict] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Resets all envs (or only those in options["reset_mask"]) and returns
+        observations for all
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        mask = (options or {}).get("reset_mask")
+        self._reset(self._all if mask is None else np.asarray(mask, dtype=bool))
+        return self._get_observation(), {"portfolio_value": self._portfolio_value()}
+
+    def _reset(self, mask: np.ndarray):
+        k = int(mask.sum())
+
+        self.current_step[mask] = 0
+        self.cash[mask] = self.initial_cash
+        self.holdings[mask] = self.initial_asset_holdings
+
+        if self.replay_bids is not None:
+            self.cursor[mask] = self.rng.integers(0, len(self.replay_bids) - self.max_steps, k)
+            self._load_replay(mask)
+        else:
+            self.mid_price[mask] = self.initial_price
+            self._synthetic_books(mask)
+        self.start_price[mask] = self.mid_price[mask]
+
+    def step(self, actions: Mapping[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict]:
+        """
+        Steps every env with a batch of actions.
+
+        Args:
+            actions: batched Dict action (an `action_space` sample)
+                action_type: (N,) ints, 0=HOLD 1=BUY 2=SELL
+                price_level_offset: (N,) ints in [-num_levels, num_levels] (ticks from mid)
+                quantity_fraction: (N,) or (N, 1) floats in [0, 1] of max_order_size
+
+        Returns:
+            observations (N, obs_dim), rewards (N,), terminated (N,), truncated (N,), info
+        """
+        action_type = np.asarray(actions["action_type"]).reshape(-1)
+        quantity = np.clip(np.asarray(actions["quantity_fraction"], dtype=np.float64).reshape(-1),
+                           0.0, 1.0) * self.max_order_size
+        target = self.mid_price + np.asarray(actions["price_level_offset"]).reshape(-1) * self.price_tick_size
+        self.current_step += 1
+
+        best_ask, best_ask_qty = self.asks[:, 0, 0], self.asks[:, 0, 1]
+        best_bid, best_bid_qty = self.bids[:, 0, 0], self.bids[:, 0, 1]
+        reward = np.zeros(self.num_envs)
+        executed_price = np.zeros(self.num_envs)
+        executed_qty = np.zeros(self.num_envs)
+
+        # BUY: crosses the best ask
+        buy = action_type == BUY
+        buy_cross = buy & (best_ask_qty > 0) & (target >= best_ask)
+        buy_qty = np.minimum(quantity, best_ask_qty)
+        buy_ok = buy_cross & (self.cash >= buy_qty * best_ask)
+        self.cash -= np.where(buy_ok, buy_qty * best_ask, 0.0)
+        self.holdings += np.where(buy_ok, buy_qty, 0.0)
+        reward = np.where(buy_ok, buy_qty * (self.start_price - best_ask), reward)
+        reward = np.where(buy_cross & ~buy_ok, -1.0, reward)
+        reward = np.where(buy & ~buy_cross, -0.1, reward)
+        executed_price = np.where(buy_ok, best_ask, executed_price)
+        executed_qty = np.where(buy_ok, buy_qty, executed_qty)
+
+        # SELL: crosses the best bid
+        sell = action_type == SELL
+        sell_cross = sell & (best_bid_qty > 0) & (target <= best_bid)
+        sell_qty = np.minimum(quantity, best_bid_qty)
+        sell_ok = sell_cross & (self.holdings >= sell_qty)
+        self.cash += np.where(sell_ok, sell_qty * best_bid, 0.0)
+        self.holdings -= np.where(sell_ok, sell_qty, 0.0)
+        reward = np.where(sell_ok, sell_qty * (best_bid - self.start_price), reward)
+        reward = np.where(sell_cross & ~sell_ok, -1.0, reward)
+        reward = np.where(sell & ~sell_cross, -0.1, reward)
+        executed_price = np.where(sell_ok, best_bid, executed_price)
+        executed_qty = np.where(sell_ok, sell_qty, executed_qty)
+
+        self._update_market()
+
+        portfolio_value = self._portfolio_value()
+        baseline = self.initial_cash + self.initial_asset_holdings * self.start_price
+        reward = reward + (portfolio_value - baseline) / self.start_price / self.max_steps
+
+        terminated = self.current_step >= self.max_steps
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        info = {"portfolio_value": portfolio_value,
+                "executed_price": executed_price,
+                "executed_quantity": executed_qty}
+
+        if terminated.any():
+            info["final_portfolio_value"] = np.where(terminated, portfolio_value, np.nan)
+            info["final_obs"] = self._get_observation()
+            info["_final_obs"] = terminated.copy()
+            info["final_info"] = {"portfolio_value": portfolio_value.copy()}
+            info["_final_info"] = terminated.copy()
+            self._reset(terminated)
+
+        return self._get_observation(), reward, terminated, truncated, info
+
+    def _portfolio_value(self) -> np.ndarray:
+        return self.cash + self.holdings * self.mid_price
+
+    def _get_observation(self) -> np.ndarray:
+        levels = self.num_levels
+        obs = self._obs
+        obs[:, 0] = self.mid_price
+        obs[:, 1:1 + 2 * levels] = self.bids.reshape(self.num_envs, -1)
+        obs[:, 1 + 2 * levels:1 + 4 * levels] = self.asks.reshape(self.num_envs, -1)
+        obs[:, -2] = self.cash
+        obs[:, -1] = self.holdings
+        return obs.copy()
+
+    def sample_actions(self) -> Dict[str, np.ndarray]:
+        """Uniform random batch of actions, shaped like an `action_space` sample (no gymnasium needed)"""
+        return {"action_type": self.rng.integers(0, 3, self.num_envs),
+                "price_level_offset": self.rng.integers(-self.num_levels, self.num_levels + 1, self.num_envs),
+                "quantity_fraction": self.rng.random((self.num_envs, 1)).astype(np.float32)}
+
+    def close(self, **kwargs):
+        """Nothing to release - state lives in NumPy arrays"""
+
+
+# Example usage (throughput check)
+if __name__ == "__main__":
+    import time
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    env = VectorDepthOrderBookEnv(num_envs=1024, config={"num_levels": 5, "max_steps": 100}, seed=0)
+    obs, info = env.reset()
+
+    started = time.perf_counter()
+    steps = 1000
+    for _ in range(steps):
+        obs, reward, terminated, truncated, info = env.step(env.sample_actions())
+    elapsed = time.perf_counter() - started
+
+    print(f"{steps * env.num_envs / elapsed:,.0f} env-steps/s "
+          f"({env.num_envs} envs x {steps} steps in {elapsed:.2f}s)")
@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+"""
+📡 Market Feed - one exchange websocket, many local consumers
+
+The scanner, risk bridge, position monitor and alert daemon each used to
+open their own Coinbase websocket or poll REST for the same tickers. This
+daemon holds the upstream subscription once, normalizes ticker messages
+into `Tick`s and fans them out over a Unix socket (newline-delimited JSON).
+
+Protocol (client -> daemon, one JSON object per line):
+    {"op": "subscribe", "symbols": ["BTC", "ETH"]}     # "*" = everything
+    {"op": "unsubscribe", "symbols": ["ETH"]}
+    {"op": "price", "symbol": "BTC"}                    # one-shot latest tick
+
+Daemon -> client:
+    {"type": "history", "symbol": "BTC", "samples": [[ts, price], ...]}
+    {"type": "tick", "symbol": "BTC", "price": ..., ...}
+    {"type": "price", "symbol": "BTC", "tick": {...} | null}
+    {"type": "error", "symbol": "XYZ", "product_id": "XYZ-USD", "reason": "..."}
+
+Subscribing to a symbol the daemon is not streaming yet adds it to the
+upstream subscription. Products are subscribed upstream one per message,
+so a product the exchange rejects is dropped (and reported to the clients
+that asked for it) without losing the rest. Slow clients are conflated to
+the latest tick per symbol instead of queueing a backlog.
+
+Usage:
+    python core/monitoring/market_feed.py --products BTC-USD ETH-USD FET-USD
+
+    feed = MarketFeedClient(["BTC"]).start()      # sync consumers
+    price = feed.get_price("BTC", max_age=60)
+
+    async for tick in stream_ticks(["BTC"]):      # async consumers
+        ...
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import socket
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = os.getenv("MARKET_FEED_SOCKET", "/tmp/sovereign_market_feed.sock")
+COINBASE_WS_URL = "wss://ws-feed.exchange.coinbase.com"
+DEFAULT_QUOTE = "USD"
+ALL = "*"
+PRODUCT_ID_RE = re.compile(r"^[A-Z0-9]{1,20}-[A-Z0-9]{2,10}$")
+
+
+# ============================================================================
+# Normalized ticks
+# ============================================================================
+
+@dataclass
+class Tick:
+    """Normalized ticker update"""
+    symbol: str
+    product_id: str
+    price: float
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    open_24h: Optional[float] = None
+    high_24h: Optional[float] = None
+    low_24h: Optional[float] = None
+    volume_24h: Optional[float] = None
+    ts: float = 0.0
+    exchange: str = "coinbase"
+
+    @property
+    def change_24h_pct(self) -> Optional[float]:
+        if not self.open_24h:
+            return None
+        return (self.price - self.open_24h) / self.open_24h * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Tick":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+    def as_ticker_message(self) -> Dict[str, Any]:
+        """Coinbase ticker-channel shape, for handlers written against the raw feed"""
+        message = {"type": "ticker", "product_id": self.product_id, "price": str(self.price)}
+        for key in ("open_24h", "high_24h", "low_24h", "volume_24h"):
+            value = getattr(self, key)
+            if value is not None:
+                message[key] = str(value)
+        if self.bid is not None:
+            message["best_bid"] = str(self.bid)
+        if self.ask is not None:
+            message["best_ask"] = str(self.ask)
+        return message
+
+
+def symbol_of(product_id: str) -> str:
+    return product_id.split("-")[0].upper() if "-" in product_id else product_id.upper()
+
+
+def product_for(symbol: str, quote: str = DEFAULT_QUOTE) -> str:
+    return symbol.upper() if "-" in symbol else f"{symbol.upper()}-{quote}"
+
+
+def valid_product(product_id: str) -> bool:
+    return bool(PRODUCT_ID_RE.match(product_id))
+
+
+def _float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_coinbase(message: Dict[str, Any]) -> Optional[Tick]:
+    """Coinbase Exchange `ticker` channel message -> Tick"""
+    if message.get("type") != "ticker":
+        return None
+    price = _float(message.get("price"))
+    product_id = message.get("product_id", "")
+    if price is None or not product_id:
+        return None
+    return Tick(
+        symbol=symbol_of(product_id),
+        product_id=product_id,
+        price=price,
+        bid=_float(message.get("best_bid")),
+        ask=_float(message.get("best_ask")),
+        open_24h=_float(message.get("open_24h")),
+        high_24h=_float(message.get("high_24h")),
+        low_24h=_float(message.get("low_24h")),
+        volume_24h=_float(message.get("volume_24h")),
+        ts=time.time(),
+    )
+
+
+class TickCache:
+    """Latest tick per symbol plus a sparse price history for N-minute changes"""
+
+    def __init__(self, history_seconds: float = 2 * 3600, history_step: float = 30.0):
+        self.history_step = history_step
+        self.latest: Dict[str, Tick] = {}
+        self.history: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._maxlen = int(history_seconds / history_step) + 2
+
+    def update(self, tick: Tick):
+        self.latest[tick.symbol] = tick
+        samples = self.history.setdefault(tick.symbol, deque(maxlen=self._maxlen))
+        if not samples or tick.ts - samples[-1][0] >= self.history_step:
+            samples.append((tick.ts, tick.price))
+
+    def seed(self, symbol: str, samples: Iterable[Iterable[float]]):
+        """Merge history received from the daemon (e.g. after connecting)"""
+        history = self.history.setdefault(symbol, deque(maxlen=self._maxlen))
+        merged = sorted({(float(t), float(p)) for t, p in list(history) + [tuple(s) for s in samples]})
+        history.clear()
+        history.extend(merged)
+
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[Tick]:
+        tick = self.latest.get(symbol.upper())
+        if tick is None or (max_age is not None and time.time() - tick.ts > max_age):
+            return None
+        return tick
+
+    def change_pct(self, symbol: str, seconds: float) -> Optional[float]:
+        """% change versus the oldest sample at least `seconds` old (None if history is shorter)"""
+        tick = self.latest.get(symbol.upper())
+        samples = self.history.get(symbol.upper())
+        if tick is None or not samples:
+            return None
+        cutoff = tick.ts - seconds
+        reference = None
+        for ts, price in reversed(samples):
+            if ts <= cutoff:
+                reference = price
+                break
+        if not reference:
+            return None
+        return (tick.price - reference) / reference * 100
+
+
+# ============================================================================
+# Daemon
+# ============================================================================
+
+class _Subscriber:
+    """One local client: symbol filter + conflating outbox"""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.symbols: Set[str] = set()
+        self.pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.replies: Deque[Dict[str, Any]] = deque()
+        self.wakeup = asyncio.Event()
+        self.conflated = 0
+
+    def wants(self, symbol: str) -> bool:
+        return ALL in self.symbols or symbol in self.symbols
+
+    def offer(self, tick: Tick):
+        if tick.symbol in self.pending:
+            self.conflated += 1
+            self.pending.move_to_end(tick.symbol)
+        self.pending[tick.symbol] = dict(tick.to_dict(), type="tick")
+        self.wakeup.set()
+
+    def reply(self, message: Dict[str, Any]):
+        self.replies.append(message)
+        self.wakeup.set()
+
+
+class MarketFeedDaemon:
+    """
+    Holds the upstream exchange websocket once and serves local subscribers.
+
+    `connect(url)` must return an async context manager yielding an object
+    with `async send(str)` that is async-iterable over incoming messages
+    (the `websockets` client; tests pass a fake).
+    """
+
+    def __init__(self, products: Iterable[str] = (), socket_path: str = DEFAULT_SOCKET,
+                 ws_url: str = COINBASE_WS_URL, connect: Optional[Callable[[str], Any]] = None,
+                 reconnect_delay: float = 5.0, cache: Optional[TickCache] = None):
+        self.products: Set[str] = set()
+        for product in map(product_for, products):
+            if valid_product(product):
+                self.products.add(product)
+            else:
+                logger.warning(f"Market feed ignoring malformed product id {product!r}")
+        self.socket_path = socket_path
+        self.ws_url = ws_url
+        self._connect = connect or self._default_connect
+        self.reconnect_delay = reconnect_delay
+        self.cache = cache or TickCache()
+        self._subscribers: List[_Subscriber] = []
+        self._requesters: Dict[str, Set[_Subscriber]] = {}
+        self._unacked: Deque[str] = deque()
+        self.rejected: Dict[str, str] = {}
+        self._ws = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+        self.connected = asyncio.Event()
+        self.stats = {"ticks": 0, "upstream_connects": 0, "upstream_errors": 0, "clients": 0,
+                      "rejected_products": 0}
+
+    @staticmethod
+    def _default_connect(url: str):
+        try:
+            import websockets
+        except ImportError as e:
+            raise RuntimeError("market feed daemon needs the 'websockets' package") from e
+        return websockets.connect(url, ping_interval=30)
+
+    # ------------------------------------------------------------------
+    # Upstream
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _subscribe_message(products: Iterable[str]) -> str:
+        return json.dumps({"type": "subscribe", "product_ids": sorted(products), "channels": ["ticker"]})
+
+    async def _subscribe_upstream(self, ws, products: Iterable[str]):
+        """
+        One subscribe per product: Coinbase rejects a whole subscribe message
+        over a single bad product id, and replies in order ("subscriptions"
+        ack or "error"), so the unacked queue says which product failed.
+        """
+        for product in sorted(products):
+            self._unacked.append(product)
+            await ws.send(self._subscribe_message([product]))
+
+    async def _upstream(self):
+        while self._running:
+            try:
+                async with self._connect(self.ws_url) as ws:
+                    self._ws = ws
+                    self._unacked.clear()
+                    self.stats["upstream_connects"] += 1
+                    await self._subscribe_upstream(ws, self.products)
+                    self.connected.set()
+                    logger.info(f"📡 Market feed upstream connected ({len(self.products)} products)")
+                    async for raw in ws:
+                        try:
+                            message = json.loads(raw)
+                            tick = normalize_coinbase(message)
+                        except (json.JSONDecodeError, TypeError, AttributeError):
+                            continue
+                        if tick is not None:
+                            self.publish(tick)
+                        else:
+                            self._on_control(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["upstream_errors"] += 1
+                logger.warning(f"Market feed upstream error: {e} - reconnecting in {self.reconnect_delay}s")
+            finally:
+                self._ws = None
+                self.connected.clear()
+            if self._running:
+                await asyncio.sleep(self.reconnect_delay)
+
+    def _on_control(self, message: Dict[str, Any]):
+        kind = message.get("type")
+        if kind == "subscriptions":
+            if self._unacked:
+                product = self._unacked.popleft()
+                self._requesters.pop(product, None)
+        elif kind == "error":
+            reason = message.get("reason") or message.get("message") or "rejected by exchange"
+            text = f"{message.get('message', '')} {reason}"
+            product = next((p for p in self._unacked if p in text), None)
+            if product is not None:
+                self._unacked.remove(product)
+            elif self._unacked:
+                product = self._unacked.popleft()
+            if product is None:
+                logger.warning(f"Market feed upstream error: {reason}")
+                return
+            self._reject(product, reason)
+
+    def _reject(self, product: str, reason: str, requester: Optional[_Subscriber] = None):
+        """Drop a product the exchange (or validation) refused and tell whoever asked for it"""
+        self.products.discard(product)
+        self.rejected[product] = reason
+        self.stats["rejected_products"] += 1
+        logger.warning(f"Market feed dropped {product}: {reason}")
+        symbol = symbol_of(product)
+        notify = self._requesters.pop(product, set())
+        notify.update(s for s in self._subscribers if symbol in s.symbols)
+        if requester is not None:
+            notify.add(requester)
+        for subscriber in notify:
+            subscriber.symbols.discard(symbol)
+            subscriber.reply({"type": "error", "symbol": symbol, "product_id": product, "reason": reason})
+
+    async def add_products(self, products: Iterable[str], requester: Optional[_Subscriber] = None):
+        new = set()
+        for product in {product_for(p) for p in products} - self.products:
+            if valid_product(product):
+                new.add(product)
+            else:
+                self._reject(product, "malformed product id", requester)
+        if not new:
+            return
+        self.products |= new
+        if requester is not None:
+            for product in new:
+                self._requesters.setdefault(product, set()).add(requester)
+        if self._ws is not None:
+            try:
+                await self._subscribe_upstream(self._ws, new)
+            except Exception as e:
+                logger.warning(f"Market feed subscribe failed for {sorted(new)}: {e}")
+
+    def publish(self, tick: Tick):
+        self.cache.update(tick)
+        self.stats["ticks"] += 1
+        for subscriber in self._subscribers:
+            if subscriber.wants(tick.symbol):
+                subscriber.offer(tick)
+
+    # ------------------------------------------------------------------
+    # Local clients
+    # ------------------------------------------------------------------
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        subscriber = _Subscriber(writer)
+        self._subscribers.append(subscriber)
+        self.stats["clients"] = len(self._subscribers)
+        sender = asyncio.get_running_loop().create_task(self._sender(subscriber))
+        try:
+            while self._running:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                await self._handle_request(subscriber, request)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._subscribers.remove(subscriber)
+            for requesters in self._requesters.values():
+                requesters.discard(subscriber)
+            self.stats["clients"] = len(self._subscribers)
+            sender.cancel()
+            writer.close()
+
+    async def _handle_request(self, subscriber: _Subscriber, request: Dict[str, Any]):
+        op = request.get("op")
+        if op == "subscribe":
+            symbols = {s.upper() if s != ALL else ALL for s in request.get("symbols", [])}
+            added = symbols - subscriber.symbols
+            subscriber.symbols |= symbols
+            await self.add_products((s for s in added if s != ALL), subscriber)
+            wanted = self.cache.latest if ALL in added else {s: self.cache.latest[s] for s in added
+                                                              if s in self.cache.latest}
+            for symbol, tick in wanted.items():
+                samples = list(self.cache.history.get(symbol, ()))
+                subscriber.reply({"type": "history", "symbol": symbol, "samples": samples})
+                subscriber.offer(tick)
+        elif op == "unsubscribe":
+            subscriber.symbols -= {s.upper() for s in request.get("symbols", [])}
+        elif op == "price":
+            symbol = str(request.get("symbol", "")).upper()
+            tick = self.cache.get(symbol)
+            if tick is None:
+                await self.add_products([symbol], subscriber)
+            subscriber.reply({"type": "price", "symbol": symbol, "tick": tick.to_dict() if tick else None})
+
+    async def _sender(self, subscriber: _Subscriber):
+        try:
+            while True:
+                await subscriber.wakeup.wait()
+                subscriber.wakeup.clear()
+                messages = list(subscriber.replies) + list(subscriber.pending.values())
+                subscriber.replies.clear()
+                subscriber.pending.clear()
+                if not messages:
+                    continue
+                subscriber.writer.write(b"".join(
+                    json.dumps(m, separators=(",", ":")).encode() + b"\n" for m in messages))
+                await subscriber.writer.drain()
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._running = True
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+        os.chmod(self.socket_path, 0o660)
+        self._tasks.append(asyncio.get_running_loop().create_task(self._upstream()))
+        logger.info(f"📡 Market feed serving on {self.socket_path}")
+
+    async def stop(self):
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for subscriber in list(self._subscribers):
+            subscriber.writer.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.stop()
+
+
+# ============================================================================
+# Clients
+# ============================================================================
+
+def feed_available(socket_path: str = DEFAULT_SOCKET) -> bool:
+    return os.path.exists(socket_path)
+
+
+async def stream_ticks(symbols: Iterable[str] = (ALL,), socket_path: str = DEFAULT_SOCKET) -> AsyncIterator[Tick]:
+    """Async generator over ticks from the local daemon (raises ConnectionError if absent)"""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        writer.write(json.dumps({"op": "subscribe", "symbols": list(symbols)}).encode() + b"\n")
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("market feed daemon closed the connection")
+            message = json.loads(line)
+            if message.get("type") == "tick":
+                yield Tick.from_dict(message)
+            elif message.get("type") == "error":
+                logger.warning(f"Market feed rejected {message.get('product_id')}: {message.get('reason')}")
+    finally:
+        writer.close()
+
+
+class MarketFeedClient:
+    """
+    Thread-backed subscriber for synchronous code (position checks, alert loops).
+
+    Keeps the latest tick per symbol locally, so get_price() is a dict lookup;
+    reconnects on its own if the daemon restarts.
+    """
+
+    def __init__(self, symbols: Iterable[str] = (ALL,), socket_path: str = DEFAULT_SOCKET,
+                 on_tick: Optional[Callable[[Tick], None]] = None, reconnect_delay: float = 2.0):
+        self.symbols: Set[str] = {s.upper() if s != ALL else ALL for s in symbols}
+        self.socket_path = socket_path
+        self.on_tick = on_tick
+        self.reconnect_delay = reconnect_delay
+        self.cache = TickCache()
+        self.connected = threading.Event()
+        self._sock: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._updated = threading.Condition()
+        self.rejected: Dict[str, str] = {}
+
+    def start(self) -> "MarketFeedClient":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="market-feed-client", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def _send(self, message: Dict[str, Any]):
+        with self._send_lock:
+            if self._sock is not None:
+                self._sock.sendall(json.dumps(message).encode() + b"\n")
+
+    def subscribe(self, symbols: Iterable[str]):
+        symbols = {s.upper() for s in symbols} - self.symbols
+        if symbols:
+            self.symbols |= symbols
+            try:
+                self._send({"op": "subscribe", "symbols": sorted(symbols)})
+            except OSError:
+                pass  # resubscribed on reconnect
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(self.socket_path)
+                    self._sock = sock
+                    self._send({"op": "subscribe", "symbols": sorted(self.symbols)})
+                    self.connected.set()
+                    for line in sock.makefile("r", encoding="utf-8"):
+                        self._handle(json.loads(line))
+            except (OSError, ValueError) as e:
+                if not self._stop.is_set():
+                    logger.debug(f"Market feed client disconnected: {e}")
+            finally:
+                self._sock = None
+                self.connected.clear()
+            self._stop.wait(self.reconnect_delay)
+
+    def _handle(self, message: Dict[str, Any]):
+        kind = message.get("type")
+        if kind == "history":
+            self.cache.seed(message["symbol"], message.get("samples", []))
+        elif kind == "error":
+            symbol = message.get("symbol", "")
+            self.symbols.discard(symbol)
+            self.rejected[symbol] = message.get("reason", "")
+            logger.warning(f"Market feed rejected {message.get('product_id', symbol)}: {message.get('reason')}")
+        elif kind == "tick":
+            tick = Tick.from_dict(message)
+            self.cache.update(tick)
+            with self._updated:
+                self._updated.notify_all()
+            if self.on_tick is not None:
+                try:
+                    self.on_tick(tick)
+                except Exception as e:
+                    logger.error(f"Market feed on_tick failed: {e}")
+
+    def wait_for(self, symbols: Iterable[str], timeout: float = 5.0) -> bool:
+        """Block until every symbol has a tick (or timeout)"""
+        symbols = [s.upper() for s in symbols]
+        deadline = time.monotonic() + timeout
+        with self._updated:
+            while not all(s in self.cache.latest for s in symbols):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._updated.wait(remaining)
+        return True
+
+    def get_tick(self, symbol: str, max_age: Optional[float] = 120.0) -> Optional[Tick]:
+        return self.cache.get(symbol, max_age)
+
+    def get_price(self, symbol: str, max_age: Optional[float] = 120.0) -> Optional[float]:
+        tick = self.cache.get(symbol, max_age)
+        return tick.price if tick else None
+
+    def change_pct(self, symbol: str, seconds: float) -> Optional[float]:
+        return self.cache.change_pct(symbol, seconds)
+
+
+def connect_feed(symbols: Iterable[str], socket_path: str = DEFAULT_SOCKET,
+                 wait: float = 3.0) -> Optional[MarketFeedClient]:
+    """Started client if the daemon is running, else None (callers fall back to REST)"""
+    if not feed_available(socket_path):
+        return None
+    client = MarketFeedClient(symbols, socket_path=socket_path).start()
+    if wait:
+        client.wait_for(symbols, timeout=wait)
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Market feed ingestion daemon")
+    parser.add_argument("--products", nargs="+", default=["BTC-USD", "ETH-USD"])
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    daemon = MarketFeedDaemon(args.products, socket_path=args.socket)
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        logger.info("Market feed stopped")
+
+
+if __name__ == "__main__":
+    main()
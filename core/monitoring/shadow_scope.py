@@ -9,12 +9,15 @@ import aiohttp
 import json
 import time
 import logging
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
+from pathlib import Path
 import numpy as np
-import pandas as pd
-from collections import defaultdict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from core.monitoring.tick_store import TickStore, ScopeSnapshot
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -65,17 +68,15 @@ class ShadowScope:
             'MATIC/USD', 'LINK/USDT', 'ADA/USD', 'DOT/USD'
         ]
         
-        # Data storage
-        self.market_data = defaultdict(list)
-        self.volatility_surfaces = {}
-        self.correlation_matrices = {}
-        self.vwap_data = {}
-        
         # Configuration
         self.update_interval = 1.0  # 1 second updates
         self.history_length = 1000  # Keep 1000 ticks
         self.volatility_window = 24  # 24-hour volatility window
         
+        # Data storage - columnar ring buffers per (pair, exchange); volatility,
+        # VWAP and correlations are maintained incrementally on every tick
+        self.store = TickStore(capacity=self.history_length, sample_interval=self.update_interval)
+        
         # Performance metrics
         self.stats = {
             'ticks_processed': 0,
@@ -89,12 +90,9 @@ class ShadowScope:
         """Start the core intelligence scanning"""
         logger.info("🧠 ShadowScope Core Intelligence Layer Starting")
         
-        # Start all monitoring tasks
+        # Start all monitoring tasks (analytics update per tick inside the store)
         tasks = [
             asyncio.create_task(self._monitor_exchanges()),
-            asyncio.create_task(self._calculate_volatility()),
-            asyncio.create_task(self._update_correlations()),
-            asyncio.create_task(self._calculate_vwap()),
             asyncio.create_task(self._data_quality_monitor())
         ]
         
@@ -126,6 +124,9 @@ class ShadowScope:
                         self._store_tick_data(result)
                         valid_ticks += 1
                 
+                # Swap in a fresh snapshot for dashboards
+                self.store.publish()
+                
                 # Update statistics
                 self.stats['ticks_processed'] += valid_ticks
                 self.stats['last_update'] = datetime.now()
@@ -194,193 +195,56 @@ class ShadowScope:
         return base_prices.get(pair, 100.0)
     
     def _store_tick_data(self, tick: MarketTick):
-        """Store tick data with history management"""
-        key = f"{tick.exchange}_{tick.pair}"
-        
-        # Add new tick
-        self.market_data[key].append(tick)
-        
-        # Maintain history length
-        if len(self.market_data[key]) > self.history_length:
-            self.market_data[key] = self.market_data[key][-self.history_length:]
-    
-    async def _calculate_volatility(self):
-        """Calculate volatility surfaces for all pairs"""
-        while True:
-            try:
-                for pair in self.pairs:
-                    volatility = await self._compute_pair_volatility(pair)
-                    if volatility:
-                        self.volatility_surfaces[pair] = volatility
-                
-                await asyncio.sleep(60)  # Update every minute
-                
-            except Exception as e:
-                logger.error(f"❌ Volatility calculation error: {e}")
-                await asyncio.sleep(30)
+        """Store tick data (ring buffer per pair/exchange, O(1))"""
+        self.store.append_tick(tick)
     
-    async def _compute_pair_volatility(self, pair: str) -> Optional[VolatilitySurface]:
+    def _compute_pair_volatility(self, pair: str) -> Optional[VolatilitySurface]:
         """Compute volatility surface for a pair"""
-        try:
-            # Collect all price data for this pair
-            prices = []
-            for key, ticks in self.market_data.items():
-                if key.endswith(f"_{pair}"):
-                    for tick in ticks[-100:]:  # Last 100 ticks
-                        prices.append(tick.price)
-            
-            if len(prices) < 20:
-                return None
-            
-            # Calculate volatility metrics
-            prices_array = np.array(prices)
-            returns = np.diff(np.log(prices_array))
-            
-            # Spot volatility (short-term)
-            spot_vol = np.std(returns[-10:]) * np.sqrt(3600)  # Annualized
-            
-            # ATM volatility (at-the-money)
-            atm_vol = np.std(returns) * np.sqrt(3600)
-            
-            # Volatility skew (simplified)
-            skew = np.mean(returns[returns > 0]) - np.mean(returns[returns < 0])
-            
-            # Term structure (simplified)
-            term_structure = {
-                '1h': spot_vol,
-                '4h': atm_vol,
-                '24h': atm_vol * 1.1
-            }
-            
-            return VolatilitySurface(
-                pair=pair,
-                spot_vol=spot_vol,
-                atm_vol=atm_vol,
-                skew=skew,
-                term_structure=term_structure,
-                timestamp=datetime.now()
-            )
-            
-        except Exception as e:
-            logger.error(f"❌ Volatility computation error for {pair}: {e}")
+        vol = self.store.volatility(pair)
+        if vol is None:
             return None
+        
+        return VolatilitySurface(
+            pair=pair,
+            spot_vol=vol['spot_vol'],
+            atm_vol=vol['atm_vol'],
+            skew=vol['skew'],
+            term_structure={
+                '1h': vol['spot_vol'],
+                '4h': vol['atm_vol'],
+                '24h': vol['atm_vol'] * 1.1
+            },
+            timestamp=datetime.now()
+        )
     
-    async def _update_correlations(self):
-        """Update correlation matrices"""
-        while True:
-            try:
-                # Collect price data for all pairs
-                pair_prices = {}
-                
-                for pair in self.pairs:
-                    prices = []
-                    for key, ticks in self.market_data.items():
-                        if key.endswith(f"_{pair}"):
-                            for tick in ticks[-100:]:
-                                prices.append(tick.price)
-                    
-                    if len(prices) > 20:
-                        pair_prices[pair] = prices[-50:]  # Last 50 prices
-                
-                if len(pair_prices) >= 2:
-                    correlation_matrix = self._compute_correlation_matrix(pair_prices)
-                    if correlation_matrix:
-                        self.correlation_matrices['main'] = correlation_matrix
-                
-                await asyncio.sleep(300)  # Update every 5 minutes
-                
-            except Exception as e:
-                logger.error(f"❌ Correlation update error: {e}")
-                await asyncio.sleep(60)
-    
-    def _compute_correlation_matrix(self, pair_prices: Dict[str, List[float]]) -> Optional[CorrelationMatrix]:
-        """Compute correlation matrix from price data"""
-        try:
-            pairs = list(pair_prices.keys())
-            
-            # Ensure all arrays have the same length
-            min_length = min(len(prices) for prices in pair_prices.values())
-            aligned_prices = {}
-            
-            for pair, prices in pair_prices.items():
-                aligned_prices[pair] = prices[-min_length:]
-            
-            # Create DataFrame
-            df = pd.DataFrame(aligned_prices)
-            
-            # Calculate returns
-            returns = df.pct_change().dropna()
-            
-            # Compute correlation matrix
-            correlation_matrix = returns.corr().values
-            
-            # Calculate confidence (based on data quality)
-            confidence = min(1.0, len(returns) / 50)  # Max confidence at 50+ data points
-            
-            return CorrelationMatrix(
-                pairs=pairs,
-                correlations=correlation_matrix,
-                timestamp=datetime.now(),
-                confidence=confidence
-            )
-            
-        except Exception as e:
-            logger.error(f"❌ Correlation computation error: {e}")
+    def _compute_correlation_matrix(self) -> Optional[CorrelationMatrix]:
+        """Exponentially weighted correlation matrix from the tick store"""
+        pairs, correlations, samples = self.store.correlation()
+        if len(pairs) < 2 or samples == 0:
             return None
-    
-    async def _calculate_vwap(self):
-        """Calculate Volume Weighted Average Price"""
-        while True:
-            try:
-                for pair in self.pairs:
-                    vwap = self._compute_vwap(pair)
-                    if vwap:
-                        self.vwap_data[pair] = vwap
-                
-                await asyncio.sleep(10)  # Update every 10 seconds
-                
-            except Exception as e:
-                logger.error(f"❌ VWAP calculation error: {e}")
-                await asyncio.sleep(30)
+        
+        return CorrelationMatrix(
+            pairs=pairs,
+            correlations=correlations,
+            timestamp=datetime.now(),
+            confidence=min(1.0, samples / 50)  # Max confidence at 50+ samples
+        )
     
     def _compute_vwap(self, pair: str) -> Optional[float]:
-        """Compute VWAP for a pair"""
-        try:
-            total_volume = 0
-            volume_price_sum = 0
-            
-            for key, ticks in self.market_data.items():
-                if key.endswith(f"_{pair}"):
-                    for tick in ticks[-100:]:  # Last 100 ticks
-                        total_volume += tick.volume
-                        volume_price_sum += tick.price * tick.volume
-            
-            if total_volume > 0:
-                return volume_price_sum / total_volume
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ VWAP computation error for {pair}: {e}")
-            return None
+        """Compute VWAP for a pair (last 100 ticks per exchange)"""
+        return self.store.vwap(pair)
     
     async def _data_quality_monitor(self):
         """Monitor data quality and system health"""
         while True:
             try:
-                # Count active exchanges
-                active_exchanges = 0
-                for exchange in self.exchanges.keys():
-                    has_data = any(key.startswith(f"{exchange}_") for key in self.market_data.keys())
-                    if has_data:
-                        active_exchanges += 1
-                
-                # Count monitored pairs
-                monitored_pairs = len(set(key.split('_')[-1] for key in self.market_data.keys()))
+                # Count active exchanges / monitored pairs from the store index
+                active_exchanges = len(self.store.exchanges())
+                monitored_pairs = len(self.store.pairs())
                 
                 # Calculate data quality score
                 total_expected_data = len(self.exchanges) * len(self.pairs)
-                actual_data = len(self.market_data)
+                actual_data = sum(len(self.store.exchanges(pair)) for pair in self.store.pairs())
                 data_quality = min(1.0, actual_data / total_expected_data)
                 
                 # Update statistics
@@ -400,24 +264,23 @@ class ShadowScope:
     
     def get_current_prices(self, pair: str) -> Dict[str, float]:
         """Get current prices across all exchanges"""
-        prices = {}
-        for key, ticks in self.market_data.items():
-            if key.endswith(f"_{pair}") and ticks:
-                exchange = key.split('_')[0]
-                prices[exchange] = ticks[-1].price
-        return prices
+        return self.store.current_prices(pair)
     
     def get_volatility_surface(self, pair: str) -> Optional[VolatilitySurface]:
         """Get volatility surface for a pair"""
-        return self.volatility_surfaces.get(pair)
+        return self._compute_pair_volatility(pair)
     
     def get_correlation_matrix(self) -> Optional[CorrelationMatrix]:
         """Get current correlation matrix"""
-        return self.correlation_matrices.get('main')
+        return self._compute_correlation_matrix()
     
     def get_vwap(self, pair: str) -> Optional[float]:
         """Get VWAP for a pair"""
-        return self.vwap_data.get(pair)
+        return self.store.vwap(pair)
+    
+    def get_snapshot(self) -> ScopeSnapshot:
+        """Latest published snapshot (lock-free, safe from any thread)"""
+        return self.store.snapshot
     
     def get_stats(self) -> Dict[str, Any]:
         """Get system statistics"""
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+📈 Tick Store - columnar multi-venue market data for ShadowScope
+
+- one NumPy ring buffer per (pair, exchange), O(1) append, no list slicing
+- pair -> venues index, so per-pair reads never scan other keys
+- volatility (fast/slow EWMA of per-venue log returns), skew and windowed
+  VWAP are updated incrementally on every tick
+- an exponentially weighted correlation matrix is updated from sampled
+  pair returns (every `sample_interval` seconds of tick time)
+- dashboards read `store.snapshot`: an immutable object swapped in by
+  reference on publish(), so readers never take a lock
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+FIELDS = ("ts", "price", "volume", "bid", "ask", "reliability")
+TS, PRICE, VOLUME, BID, ASK, RELIABILITY = range(len(FIELDS))
+
+# Same per-tick scaling ShadowScope has always reported volatility in
+VOL_SCALE = math.sqrt(3600)
+
+
+def _alpha(halflife: float) -> float:
+    return 1.0 - math.exp(math.log(0.5) / halflife)
+
+
+class TickRing:
+    """Fixed-capacity columnar ring buffer for one (pair, exchange)"""
+
+    __slots__ = ("capacity", "data", "head", "count", "appends", "pv_sum", "v_sum")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = np.zeros((len(FIELDS), capacity), dtype=np.float64)
+        self.head = 0           # next write position
+        self.count = 0
+        self.appends = 0
+        self.pv_sum = 0.0       # VWAP window sums (see TickStore.vwap_window)
+        self.v_sum = 0.0
+
+    def append(self, row: Tuple[float, ...]):
+        self.data[:, self.head] = row
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.appends += 1
+
+    def ago(self, k: int) -> np.ndarray:
+        """Row written k appends ago (0 = latest)"""
+        return self.data[:, (self.head - 1 - k) % self.capacity]
+
+    def latest(self) -> Optional[np.ndarray]:
+        return self.ago(0) if self.count else None
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """Oldest-to-newest copy of one field (last n ticks)"""
+        n = self.count if n is None else min(n, self.count)
+        idx = (np.arange(self.head - n, self.head)) % self.capacity
+        return self.data[FIELDS.index(name), idx]
+
+
+@dataclass
+class PairStats:
+    """Incremental per-pair analytics across all venues"""
+    pair: str
+    fast_var: float = 0.0
+    slow_var: float = 0.0
+    up_mean: float = 0.0
+    down_mean: float = 0.0
+    returns: int = 0
+    ticks: int = 0
+    pv_sum: float = 0.0
+    v_sum: float = 0.0
+    last_ts: float = 0.0
+
+
+class EWCorrelation:
+    """Exponentially weighted covariance/correlation, updated one sample at a time"""
+
+    def __init__(self, halflife: float = 50):
+        self.alpha = _alpha(halflife)
+        self.mean = np.zeros(0)
+        self.cov = np.zeros((0, 0))
+        self.samples = 0
+
+    def resize(self, n: int):
+        old = len(self.mean)
+        if n <= old:
+            return
+        self.mean = np.concatenate([self.mean, np.zeros(n - old)])
+        cov = np.zeros((n, n))
+        cov[:old, :old] = self.cov
+        self.cov = cov
+
+    def update(self, returns: np.ndarray):
+        d = returns - self.mean
+        self.mean += self.alpha * d
+        self.cov = (1 - self.alpha) * (self.cov + self.alpha * np.outer(d, d))
+        self.samples += 1
+
+    def correlation(self) -> np.ndarray:
+        std = np.sqrt(np.clip(np.diag(self.cov), 0, None))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.cov / np.outer(std, std)
+        corr[~np.isfinite(corr)] = 0.0
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, 0.0))
+        return np.clip(corr, -1.0, 1.0)
+
+
+@dataclass(frozen=True)
+class PairSnapshot:
+    pair: str
+    prices: Mapping[str, float]
+    bid: Optional[float]
+    ask: Optional[float]
+    vwap: Optional[float]
+    spot_vol: Optional[float]
+    atm_vol: Optional[float]
+    skew: Optional[float]
+    ticks: int
+    last_ts: float
+
+
+@dataclass(frozen=True)
+class ScopeSnapshot:
+    version: int
+    built_at: float
+    pairs: Mapping[str, PairSnapshot]
+    correlation_pairs: Tuple[str, ...]
+    correlations: np.ndarray
+    correlation_samples: int
+    ticks: int
+    exchanges: Tuple[str, ...] = field(default_factory=tuple)
+
+
+EMPTY_SNAPSHOT = ScopeSnapshot(0, 0.0, MappingProxyType({}), (), np.zeros((0, 0)), 0, 0)
+
+
+class TickStore:
+    """
+    Columnar tick store indexed by (pair, exchange).
+
+    Single writer (append/publish are serialized by a lock); any number of
+    lock-free readers via `snapshot`.
+    """
+
+    def __init__(self, capacity: int = 1000, vwap_window: int = 100,
+                 fast_halflife: float = 10, slow_halflife: float = 100,
+                 corr_halflife: float = 50, sample_interval: float = 1.0, min_returns: int = 20):
+        self.capacity = capacity
+        self.vwap_window = min(vwap_window, capacity)
+        self.fast_alpha = _alpha(fast_halflife)
+        self.slow_alpha = _alpha(slow_halflife)
+        self.sample_interval = sample_interval
+        self.min_returns = min_returns
+
+        self._rings: Dict[Tuple[str, str], TickRing] = {}
+        self._venues: Dict[str, Dict[str, TickRing]] = {}
+        self._stats: Dict[str, PairStats] = {}
+        self._pair_index: Dict[str, int] = {}
+        self._pending = np.zeros(0)
+        self._corr = EWCorrelation(corr_halflife)
+        self._last_sample_ts: Optional[float] = None
+
+        self._write_lock = threading.Lock()
+        self._snapshot = EMPTY_SNAPSHOT
+        self.ticks = 0
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _ring(self, pair: str, exchange: str) -> TickRing:
+        ring = self._rings.get((pair, exchange))
+        if ring is None:
+            ring = self._rings[(pair, exchange)] = TickRing(self.capacity)
+            self._venues.setdefault(pair, {})[exchange] = ring
+            if pair not in self._stats:
+                self._stats[pair] = PairStats(pair)
+                self._pair_index[pair] = len(self._pair_index)
+                self._pending = np.concatenate([self._pending, [0.0]])
+                self._corr.resize(len(self._pair_index))
+        return ring
+
+    def append(self, pair: str, exchange: str, price: float, volume: float = 0.0,
+               bid: Optional[float] = None, ask: Optional[float] = None,
+               ts: Optional[float] = None, reliability: float = 1.0):
+        ts = time.time() if ts is None else ts
+        with self._write_lock:
+            if self._last_sample_ts is None:
+                self._last_sample_ts = ts
+            elif ts - self._last_sample_ts >= self.sample_interval:
+                self._sample()
+                self._last_sample_ts = ts
+
+            ring = self._ring(pair, exchange)
+            stats = self._stats[pair]
+            previous = float(ring.latest()[PRICE]) if ring.count else None
+
+            # Value leaving the VWAP window (before it is overwritten)
+            if ring.count >= self.vwap_window:
+                old = ring.ago(self.vwap_window - 1)
+                leaving_pv, leaving_v = old[PRICE] * old[VOLUME], old[VOLUME]
+            else:
+                leaving_pv = leaving_v = 0.0
+
+            ring.append((ts, price, volume, price if bid is None else bid,
+                         price if ask is None else ask, reliability))
+            self.ticks += 1
+            stats.ticks += 1
+            stats.last_ts = ts
+
+            d_pv, d_v = price * volume - leaving_pv, volume - leaving_v
+            ring.pv_sum += d_pv
+            ring.v_sum += d_v
+            stats.pv_sum += d_pv
+            stats.v_sum += d_v
+            if ring.appends % self.capacity == 0:
+                self._resync_vwap(ring, stats)
+
+            if previous and price > 0:
+                r = math.log(price / previous)
+                if stats.returns == 0:
+                    stats.fast_var = stats.slow_var = r * r
+                stats.fast_var += self.fast_alpha * (r * r - stats.fast_var)
+                stats.slow_var += self.slow_alpha * (r * r - stats.slow_var)
+                if r > 0:
+                    stats.up_mean += self.slow_alpha * (r - stats.up_mean)
+                elif r < 0:
+                    stats.down_mean += self.slow_alpha * (r - stats.down_mean)
+                stats.returns += 1
+                # Pair return = average of its venues' returns
+                self._pending[self._pair_index[pair]] += r / len(self._venues[pair])
+
+    def append_tick(self, tick: Any):
+        """Append a ShadowScope MarketTick (or anything with the same attributes)"""
+        ts = tick.timestamp.timestamp() if hasattr(tick.timestamp, "timestamp") else float(tick.timestamp)
+        self.append(tick.pair, tick.exchange, tick.price, tick.volume, tick.bid, tick.ask, ts, tick.reliability)
+
+    def _resync_vwap(self, ring: TickRing, stats: PairStats):
+        """Recompute window sums exactly to stop floating-point drift"""
+        price, volume = ring.column("price", self.vwap_window), ring.column("volume", self.vwap_window)
+        pv, v = float(np.dot(price, volume)), float(volume.sum())
+        stats.pv_sum += pv - ring.pv_sum
+        stats.v_sum += v - ring.v_sum
+        ring.pv_sum, ring.v_sum = pv, v
+
+    def _sample(self):
+        if not self._pending.any():
+            return
+        self._corr.update(self._pending.copy())
+        self._pending[:] = 0.0
+
+    # ------------------------------------------------------------------
+    # Reads (writer side / direct)
+    # ------------------------------------------------------------------
+
+    def pairs(self) -> List[str]:
+        return list(self._venues)
+
+    def exchanges(self, pair: Optional[str] = None) -> List[str]:
+        if pair is not None:
+            return list(self._venues.get(pair, {}))
+        return sorted({exchange for _, exchange in self._rings})
+
+    def ring(self, pair: str, exchange: str) -> Optional[TickRing]:
+        return self._rings.get((pair, exchange))
+
+    def current_prices(self, pair: str) -> Dict[str, float]:
+        return {exchange: float(ring.latest()[PRICE])
+                for exchange, ring in self._venues.get(pair, {}).items() if ring.count}
+
+    def vwap(self, pair: str) -> Optional[float]:
+        stats = self._stats.get(pair)
+        if stats is None or stats.v_sum <= 0:
+            return None
+        return stats.pv_sum / stats.v_sum
+
+    def volatility(self, pair: str) -> Optional[Dict[str, float]]:
+        stats = self._stats.get(pair)
+        if stats is None or stats.returns < self.min_returns:
+            return None
+        return {
+            "spot_vol": math.sqrt(stats.fast_var) * VOL_SCALE,
+            "atm_vol": math.sqrt(stats.slow_var) * VOL_SCALE,
+            "skew": stats.up_mean - stats.down_mean
+        }
+
+    def correlation(self) -> Tuple[List[str], np.ndarray, int]:
+        with self._write_lock:
+            return list(self._pair_index), self._corr.correlation(), self._corr.samples
+
+    # ------------------------------------------------------------------
+    # Lock-free snapshot
+    # ------------------------------------------------------------------
+
+    def publish(self) -> ScopeSnapshot:
+        """Build an immutable snapshot and swap it in for readers"""
+        with self._write_lock:
+            pairs = {}
+            for pair, venues in self._venues.items():
+                bids = [r.latest()[BID] for r in venues.values() if r.count]
+                asks = [r.latest()[ASK] for r in venues.values() if r.count]
+                vol = self.volatility(pair) or {}
+                stats = self._stats[pair]
+                pairs[pair] = PairSnapshot(
+                    pair=pair,
+                    prices=MappingProxyType(self.current_prices(pair)),
+                    bid=float(max(bids)) if bids else None,
+                    ask=float(min(asks)) if asks else None,
+                    vwap=self.vwap(pair),
+                    spot_vol=vol.get("spot_vol"),
+                    atm_vol=vol.get("atm_vol"),
+                    skew=vol.get("skew"),
+                    ticks=stats.ticks,
+                    last_ts=stats.last_ts
+                )
+            correlations = self._corr.correlation()
+            correlations.setflags(write=False)
+            snapshot = ScopeSnapshot(
+                version=self._snapshot.version + 1,
+                built_at=time.time(),
+                pairs=MappingProxyType(pairs),
+                correlation_pairs=tuple(self._pair_index),
+                correlations=correlations,
+                correlation_samples=self._corr.samples,
+                ticks=self.ticks,
+                exchanges=tuple(self.exchanges())
+            )
+            self._snapshot = snapshot
+            return snapshot
+
+    @property
+    def snapshot(self) -> ScopeSnapshot:
+        return self._snapshot
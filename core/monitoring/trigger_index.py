@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+🎯 Trigger Index - price levels per symbol, found by binary search
+
+Take-profit/stop-loss ladders and price alerts are stored per symbol in two
+sorted arrays: upside triggers (fire when price >= level) and downside
+triggers (fire when price <= level). A new price finds every trigger it
+satisfies or crossed with bisect, so checking a tick is O(log n + hits)
+no matter how many alerts are armed.
+
+    index = TriggerIndex()
+    index.add("BTC", 100_000, ABOVE, payload=("TP1", position))
+    index.add("BTC", 90_000, BELOW, payload=("SL", position))
+    for trigger in index.update("BTC", price):   # edge-triggered, for streams
+        ...
+    index.satisfied("BTC", price)                # level-triggered, for polling
+    index.pop_satisfied("BTC", price, is_live)   # level-triggered, disarming (exit orders)
+"""
+
+import itertools
+import threading
+import uuid
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+ABOVE = "above"
+BELOW = "below"
+
+
+@dataclass(eq=False)
+class Trigger:
+    """One armed price level"""
+    symbol: str
+    level: float
+    direction: str
+    payload: Any = None
+    once: bool = False
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    seq: int = 0                    # arming order
+
+
+class _Side:
+    """Levels kept sorted ascending, triggers in the same order"""
+
+    __slots__ = ("levels", "triggers")
+
+    def __init__(self):
+        self.levels: List[float] = []
+        self.triggers: List[Trigger] = []
+
+    def insert(self, trigger: Trigger):
+        i = bisect_right(self.levels, trigger.level)
+        self.levels.insert(i, trigger.level)
+        self.triggers.insert(i, trigger)
+
+    def remove(self, trigger: Trigger) -> bool:
+        i = bisect_left(self.levels, trigger.level)
+        while i < len(self.levels) and self.levels[i] == trigger.level:
+            if self.triggers[i] is trigger:
+                del self.levels[i]
+                del self.triggers[i]
+                return True
+            i += 1
+        return False
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+
+class TriggerIndex:
+    """Per-symbol sorted upside/downside trigger levels"""
+
+    def __init__(self):
+        self._books: Dict[str, Tuple[_Side, _Side]] = {}
+        self._by_id: Dict[str, Trigger] = {}
+        self.last_price: Dict[str, float] = {}
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(symbol: str) -> str:
+        return symbol.upper()
+
+    def _book(self, symbol: str) -> Tuple[_Side, _Side]:
+        book = self._books.get(symbol)
+        if book is None:
+            book = self._books[symbol] = (_Side(), _Side())
+        return book
+
+    # ------------------------------------------------------------------
+    # Arming
+    # ------------------------------------------------------------------
+
+    def add(self, symbol: str, level: float, direction: str, payload: Any = None,
+            once: bool = False, trigger_id: Optional[str] = None) -> Trigger:
+        if direction not in (ABOVE, BELOW):
+            raise ValueError(f"direction must be '{ABOVE}' or '{BELOW}', got {direction!r}")
+        trigger = Trigger(self._key(symbol), float(level), direction, payload, once)
+        if trigger_id is not None:
+            trigger.id = trigger_id
+        with self._lock:
+            trigger.seq = next(self._seq)
+            if trigger.id in self._by_id:
+                self.remove(trigger.id)
+            above, below = self._book(trigger.symbol)
+            (above if direction == ABOVE else below).insert(trigger)
+            self._by_id[trigger.id] = trigger
+        return trigger
+
+    def remove(self, trigger: Union[Trigger, str]) -> bool:
+        with self._lock:
+            trigger = self._by_id.pop(trigger if isinstance(trigger, str) else trigger.id, None)
+            if trigger is None:
+                return False
+            above, below = self._books[trigger.symbol]
+            (above if trigger.direction == ABOVE else below).remove(trigger)
+            return True
+
+    def remove_where(self, predicate: Callable[[Trigger], bool], symbol: Optional[str] = None) -> int:
+        with self._lock:
+            doomed = [t for t in self.triggers(symbol) if predicate(t)]
+            for trigger in doomed:
+                self.remove(trigger)
+            return len(doomed)
+
+    def clear(self, symbol: Optional[str] = None):
+        with self._lock:
+            if symbol is None:
+                self._books.clear()
+                self._by_id.clear()
+                self.last_price.clear()
+            else:
+                self.remove_where(lambda t: True, symbol)
+
+    def triggers(self, symbol: Optional[str] = None) -> List[Trigger]:
+        with self._lock:
+            if symbol is not None:
+                above, below = self._books.get(self._key(symbol), (_Side(), _Side()))
+                return above.triggers + below.triggers
+            return list(self._by_id.values())
+
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return [s for s, (above, below) in self._books.items() if len(above) or len(below)]
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def satisfied(self, symbol: str, price: float) -> List[Trigger]:
+        """Every trigger the price is currently beyond (level-triggered)"""
+        with self._lock:
+            book = self._books.get(self._key(symbol))
+            if book is None:
+                return []
+            above, below = book
+            return (above.triggers[:bisect_right(above.levels, price)]
+                    + below.triggers[bisect_left(below.levels, price):][::-1])
+
+    def pop_satisfied(self, symbol: str, price: float,
+                      is_live: Optional[Callable[[Trigger], bool]] = None) -> List[Trigger]:
+        """
+        Disarm and return every trigger the price is beyond, in arming order.
+        Triggers failing `is_live` (e.g. orders cancelled elsewhere) are
+        dropped without being returned, so cancellation can stay lazy.
+        """
+        symbol = self._key(symbol)
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is None:
+                return []
+            above, below = book
+            i = bisect_right(above.levels, price)
+            j = bisect_left(below.levels, price)
+            hits = above.triggers[:i] + below.triggers[j:]
+            del above.levels[:i], above.triggers[:i], below.levels[j:], below.triggers[j:]
+            for trigger in hits:
+                del self._by_id[trigger.id]
+        hits.sort(key=lambda trigger: trigger.seq)
+        return [t for t in hits if is_live is None or is_live(t)]
+
+    def update(self, symbol: str, price: float) -> List[Trigger]:
+        """
+        Triggers crossed since the previous price for this symbol
+        (edge-triggered; the first price behaves like satisfied()).
+        `once` triggers are disarmed when they fire.
+        """
+        symbol = self._key(symbol)
+        with self._lock:
+            last = self.last_price.get(symbol)
+            self.last_price[symbol] = price
+            book = self._books.get(symbol)
+            if book is None:
+                return []
+            if last is None:
+                hits = self.satisfied(symbol, price)
+            else:
+                above, below = book
+                hits = []
+                if price > last:
+                    hits = above.triggers[bisect_right(above.levels, last):bisect_right(above.levels, price)]
+                elif price < last:
+                    hits = below.triggers[bisect_left(below.levels, price):bisect_left(below.levels, last)][::-1]
+            for trigger in hits:
+                if trigger.once:
+                    self.remove(trigger)
+            return hits
+
+    def update_many(self, prices: Dict[str, float]) -> List[Trigger]:
+        """Feed a bulk price fetch; returns every trigger crossed"""
+        hits: List[Trigger] = []
+        for symbol, price in prices.items():
+            if price is not None:
+                hits.extend(self.update(symbol, price))
+        return hits
+
+    def nearest(self, symbol: str, price: float) -> Tuple[Optional[Trigger], Optional[Trigger]]:
+        """Closest armed upside and downside trigger not yet reached"""
+        with self._lock:
+            book = self._books.get(self._key(symbol))
+            if book is None:
+                return None, None
+            above, below = book
+            i = bisect_right(above.levels, price)
+            j = bisect_left(below.levels, price)
+            return (above.triggers[i] if i < len(above) else None,
+                    below.triggers[j - 1] if j > 0 else None)
@@ -1,17 +1,21 @@
 """
 Regime Detection Module
 
-Contains HMM-based regime detection for adaptive trading strategies.
+Contains HMM-based regime detection for adaptive trading strategies
+and the shared watchlist regime service.
 """
 
-from .hmm_regime_detector import (
-    HMMRegimeDetector,
-    RegimeType,
-    TradingRules
-)
+from .regime_service import RegimeService, RegimeSnapshot, RegimeReading, regime_service
+
+try:
+    from .hmm_regime_detector import RegimeHMMDetector
+except ImportError:  # hmmlearn / scikit-learn not installed
+    RegimeHMMDetector = None
 
 __all__ = [
-    'HMMRegimeDetector',
-    'RegimeType',
-    'TradingRules'
+    'RegimeHMMDetector',
+    'RegimeService',
+    'RegimeSnapshot',
+    'RegimeReading',
+    'regime_service'
 ]
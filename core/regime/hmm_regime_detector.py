@@ -1,8 +1,15 @@
+import copy
 import logging
+import os
+import pickle
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 from hmmlearn import hmm
+from scipy.special import logsumexp
 from sklearn.preprocessing import StandardScaler
 
 logger = logging.getLogger(__name__)
@@ -19,57 +26,113 @@ class RegimeHMMDetector:
         self.n_components = self.config.get("n_components", 3) # Number of hidden states (regimes)
         self.covariance_type = self.config.get("covariance_type", "diag") # "spherical", "diag", "full", "tied"
         self.n_iter = self.config.get("n_iter", 100)
+        self.warm_start_n_iter = self.config.get("warm_start_n_iter", 10) # EM iterations when refining previous params
+        self.train_window = self.config.get("train_window") # Walk-forward: train on the trailing N bars (None = all)
+        self.retrain_interval = timedelta(hours=self.config.get("retrain_interval_hours", 24))
+        self.volatility_window = self.config.get("volatility_window", 20)
         self.random_state = self.config.get("random_state", 42)
+        self.model_path = self.config.get("model_path")
         self.hmm_model: Optional[hmm.GaussianHMM] = None
         self.scaler: Optional[StandardScaler] = None
+        self.trained_at: Optional[datetime] = None
         self.regime_names = self.config.get("regime_names", {0: "Bear", 1: "Sideways", 2: "Bull"})
 
+        # Online (forward-filter) state
+        self._emissions = None
+        self._log_transmat = None
+        self._log_alpha: Optional[np.ndarray] = None
+        self._last_close: Optional[float] = None
+        self._last_timestamp = None
+        self._returns = deque(maxlen=self.volatility_window)
+
+        if self.model_path and Path(self.model_path).exists():
+            self.load_model(self.model_path)
+
         logger.info(f"REGIME HMM Detector initialized with {self.n_components} components.")
 
-    def train_model(self, historical_data: pd.DataFrame):
+    def compute_features(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Log returns and rolling volatility from the 'Close' column.
+        Works on a copy - the caller's DataFrame is never modified.
+        """
+        close = data['Close'].astype(float)
+        returns = np.log(close / close.shift(1))
+        features = pd.DataFrame({
+            'returns': returns,
+            'volatility': returns.rolling(window=self.volatility_window).std()
+        }, index=data.index)
+        return features.dropna()
+
+    def train_model(self, historical_data: pd.DataFrame, warm_start: Optional[bool] = None):
         """
         Trains the HMM model using historical market data.
-        `historical_data` should contain features like 'returns' and 'volatility'.
-        Example features: log returns, rolling volatility.
+        `historical_data` should contain a 'Close' column; log returns and
+        rolling volatility are derived from it.
+
+        With warm_start (default: whenever a model already exists) EM starts
+        from the previous parameters and scaler and runs `warm_start_n_iter`
+        iterations, so walk-forward retrains are cheap and state indices -
+        and therefore regime names - stay stable between retrains.
         """
         if historical_data.empty:
             logger.error("Cannot train HMM model with empty historical data.")
             return
 
-        # Prepare features for HMM (e.g., daily returns and a measure of volatility)
-        # For this example, let's assume `historical_data` has a 'Close' column
         if 'Close' not in historical_data.columns:
             logger.error("Historical data must contain a 'Close' column for feature engineering.")
             return
-        
-        historical_data['returns'] = np.log(historical_data['Close'] / historical_data['Close'].shift(1))
-        historical_data['volatility'] = historical_data['returns'].rolling(window=self.config.get("volatility_window", 20)).std()
 
-        # Drop NaN values introduced by shift and rolling
-        features = historical_data[['returns', 'volatility']].dropna()
+        features = self.compute_features(historical_data)
+        if self.train_window:
+            features = features.tail(self.train_window)
 
         if features.empty:
             logger.error("Features are empty after dropping NaN. Not enough data to train.")
             return
 
-        self.scaler = StandardScaler()
-        scaled_features = self.scaler.fit_transform(features)
+        if warm_start is None:
+            warm_start = self.hmm_model is not None
+        warm_start = warm_start and self.hmm_model is not None and self.scaler is not None
 
-        self.hmm_model = hmm.GaussianHMM(n_components=self.n_components,
-                                         covariance_type=self.covariance_type,
-                                         n_iter=self.n_iter,
-                                         random_state=self.random_state)
+        if warm_start:
+            scaler = self.scaler
+            model = copy.deepcopy(self.hmm_model)
+            model.init_params = ""
+            model.n_iter = self.warm_start_n_iter
+        else:
+            scaler = StandardScaler().fit(features.to_numpy())
+            model = hmm.GaussianHMM(n_components=self.n_components,
+                                    covariance_type=self.covariance_type,
+                                    n_iter=self.n_iter,
+                                    random_state=self.random_state)
         try:
-            self.hmm_model.fit(scaled_features)
-            logger.info("HMM model trained successfully.")
+            model.fit(scaler.transform(features.to_numpy()))
         except Exception as e:
             logger.error(f"Error training HMM model: {e}")
-            self.hmm_model = None
+            if not warm_start:
+                self.hmm_model = None
+            return
+
+        self.hmm_model = model
+        self.scaler = scaler
+        self.trained_at = datetime.now()
+        self._prepare_online()
+        logger.info(f"HMM model trained successfully ({'warm start' if warm_start else 'cold start'}, "
+                    f"{len(features)} bars, {model.monitor_.iter} EM iterations).")
+
+        if self.model_path:
+            self.save_model(self.model_path)
+
+    def should_retrain(self) -> bool:
+        """True when there is no model or the last fit is older than retrain_interval_hours"""
+        return self.hmm_model is None or self.trained_at is None or \
+            datetime.now() - self.trained_at >= self.retrain_interval
 
     def predict_regime(self, latest_data: pd.DataFrame) -> Optional[str]:
         """
         Predicts the current market regime based on the latest data.
         `latest_data` should be a DataFrame with the same features used for training.
+        Runs full Viterbi decoding over the frame - use `update()` for per-bar inference.
         """
         if self.hmm_model is None or self.scaler is None:
             logger.warning("HMM model or scaler not trained. Cannot predict regime.")
@@ -84,27 +147,157 @@ class RegimeHMMDetector:
             logger.error("Latest data must contain a 'Close' column for feature engineering.")
             return "UNKNOWN_MISSING_CLOSE"
 
-        latest_data['returns'] = np.log(latest_data['Close'] / latest_data['Close'].shift(1))
-        latest_data['volatility'] = latest_data['returns'].rolling(window=self.config.get("volatility_window", 20)).std()
+        features = self.compute_features(latest_data)
 
-        features = latest_data[['returns', 'volatility']].dropna()
-        
         if features.empty:
             logger.warning("Features for latest data are empty after dropping NaN. Cannot predict.")
             return "UNKNOWN_INSUFFICIENT_FEATURES"
 
-        scaled_features = self.scaler.transform(features)
+        scaled_features = self.scaler.transform(features.to_numpy())
 
         try:
             # Predict the hidden states (regimes) for the given sequence
             hidden_states = self.hmm_model.predict(scaled_features)
             # The last predicted state is the most recent regime
             current_regime_index = hidden_states[-1]
-            return self.regime_names.get(current_regime_index, f"Regime_{current_regime_index}")
+            return self._regime_name(current_regime_index)
         except Exception as e:
             logger.error(f"Error predicting regime: {e}")
             return "UNKNOWN_PREDICTION_ERROR"
 
+    # ------------------------------------------------------------------
+    # Online inference (forward algorithm, O(K^2) per bar)
+    # ------------------------------------------------------------------
+
+    def _prepare_online(self):
+        """Cache per-state Gaussian terms and log transition matrix for the forward filter"""
+        model = self.hmm_model
+        covars = model.covars_  # always (K, D, D)
+        n_features = model.means_.shape[1]
+        inv_covars = np.linalg.inv(covars)
+        _, logdets = np.linalg.slogdet(covars)
+        log_norm = -0.5 * (n_features * np.log(2 * np.pi) + logdets)
+        self._emissions = (model.means_.copy(), inv_covars, log_norm)
+        with np.errstate(divide='ignore'):
+            self._log_transmat = np.log(model.transmat_)
+            self._log_startprob = np.log(model.startprob_)
+
+    def _log_emission(self, x: np.ndarray) -> np.ndarray:
+        means, inv_covars, log_norm = self._emissions
+        diff = x - means
+        return log_norm - 0.5 * np.einsum('ki,kij,kj->k', diff, inv_covars, diff)
+
+    def _forward_step(self, x: np.ndarray):
+        if self._log_alpha is None:
+            log_alpha = self._log_startprob + self._log_emission(x)
+        else:
+            log_alpha = logsumexp(self._log_alpha[:, None] + self._log_transmat, axis=0) + self._log_emission(x)
+        self._log_alpha = log_alpha - logsumexp(log_alpha)
+
+    def reset_filter(self):
+        """Drop the online state (next update starts a new sequence)"""
+        self._log_alpha = None
+        self._last_close = None
+        self._last_timestamp = None
+        self._returns.clear()
+
+    def update(self, close: float, timestamp=None) -> Optional[str]:
+        """
+        Feed one closed bar and return the filtered current regime.
+
+        Bars with a timestamp at or before the last one seen are ignored,
+        so re-feeding an overlapping window is harmless. Returns None until
+        enough bars have been seen to fill the volatility window.
+        """
+        if self.hmm_model is None or self.scaler is None:
+            logger.warning("HMM model or scaler not trained. Cannot update regime.")
+            return "UNKNOWN_UNTRAINED"
+
+        if timestamp is not None:
+            if self._last_timestamp is not None and timestamp <= self._last_timestamp:
+                return self.current_regime
+            self._last_timestamp = timestamp
+
+        close = float(close)
+        if self._last_close is not None:
+            self._returns.append(np.log(close / self._last_close))
+        self._last_close = close
+
+        if len(self._returns) == self.volatility_window:
+            returns = np.fromiter(self._returns, dtype=float)
+            features = np.array([returns[-1], returns.std(ddof=1)])
+            self._forward_step((features - self.scaler.mean_) / self.scaler.scale_)
+
+        return self.current_regime
+
+    def update_from_frame(self, data: pd.DataFrame) -> Optional[str]:
+        """Feed every row of `data` newer than the last bar seen (index must be timestamps)"""
+        if self._last_timestamp is not None:
+            data = data[data.index > self._last_timestamp]
+        for timestamp, close in zip(data.index, data['Close'].to_numpy()):
+            self.update(close, timestamp)
+        return self.current_regime
+
+    @property
+    def last_timestamp(self):
+        """Timestamp of the last bar fed to the online filter"""
+        return self._last_timestamp
+
+    @property
+    def current_regime(self) -> Optional[str]:
+        if self._log_alpha is None:
+            return None
+        return self._regime_name(int(np.argmax(self._log_alpha)))
+
+    def regime_probabilities(self) -> Dict[str, float]:
+        """Filtered P(regime | bars so far)"""
+        if self._log_alpha is None:
+            return {}
+        return {self._regime_name(i): float(p) for i, p in enumerate(np.exp(self._log_alpha))}
+
+    def _regime_name(self, index: int) -> str:
+        return self.regime_names.get(index, f"Regime_{index}")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save_model(self, path: Optional[str] = None):
+        """Pickle model + scaler so other processes can reuse them without refitting"""
+        path = Path(path or self.model_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "hmm_model": self.hmm_model,
+            "scaler": self.scaler,
+            "trained_at": self.trained_at,
+            "volatility_window": self.volatility_window
+        }
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(payload, f)
+        os.replace(tmp, path)
+        logger.info(f"HMM model saved to {path}")
+
+    def load_model(self, path: Optional[str] = None) -> bool:
+        path = Path(path or self.model_path)
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.error(f"Error loading HMM model from {path}: {e}")
+            return False
+
+        if payload.get("volatility_window") != self.volatility_window:
+            logger.warning(f"Ignoring {path}: trained with volatility_window={payload.get('volatility_window')}")
+            return False
+
+        self.hmm_model = payload["hmm_model"]
+        self.scaler = payload["scaler"]
+        self.trained_at = payload.get("trained_at")
+        self._prepare_online()
+        logger.info(f"HMM model loaded from {path} (trained {self.trained_at})")
+        return True
+
 # Example usage (for testing)
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
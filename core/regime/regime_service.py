@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+REGIME SERVICE - One shared regime view for the whole watchlist
+
+Computes the ADX / ATR-percentile regime (the taxonomy used by the
+Strategy Engine, LiveDataPipeline and the Manus framework) for every
+watched symbol in one vectorized pass over a stacked (symbols x bars)
+array, once per candle close, and publishes an immutable in-memory
+snapshot that every consumer reads instead of recomputing per symbol.
+
+Usage:
+    from core.regime.regime_service import regime_service
+
+    regime_service.watch(["BTC", "ETH", "SOL"])
+    regime_service.start()                      # refresh on every candle close
+    reading = regime_service.get("BTC")         # RegimeReading or None
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger("shadow.regime_service")
+
+REGIME_STRATEGY_TYPES = {
+    "High Volatility Trend": ["Trend Following", "Breakout", "Volatility", "Momentum"],
+    "Low Volatility Trend": ["Trend Following", "Pullback", "Momentum"],
+    "High Volatility Range": ["Mean Reversion", "Volatility", "Scalping", "Arbitrage"],
+    "Low Volatility Range": ["Mean Reversion", "Volatility Squeeze", "Accumulation"],
+    "Transitioning Market": ["Divergence", "Adaptive", "Harmonic"]
+}
+
+_TIMEFRAME_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _timeframe_seconds(timeframe: str) -> int:
+    return int(timeframe[:-1]) * _TIMEFRAME_UNITS[timeframe[-1]]
+
+
+def _rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean along the bar axis; NaN until the window is full (pandas rolling semantics)"""
+    out = np.full(x.shape, np.nan)
+    if x.shape[1] >= window:
+        out[:, window - 1:] = sliding_window_view(x, window, axis=1).mean(axis=-1)
+    return out
+
+
+def compute_regime_arrays(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    adx_period: int = 14,
+    atr_period: int = 14
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized ATR / ADX / ATR percentile for a stacked (symbols x bars) array
+
+    Rows may be left-padded with NaN for symbols with shorter history. The
+    math matches core.strategies.strategy_engine.MarketRegimeDetector; the
+    ATR percentile is the rank of the last ATR among all ATRs in the row.
+
+    Returns dict of 1-D arrays (one value per symbol): atr, adx,
+    atr_percentile, bars (valid bar count).
+    """
+    high, low, close = (np.asarray(a, dtype=float) for a in (high, low, close))
+    valid = ~np.isnan(close)
+
+    prev_close = np.full(close.shape, np.nan)
+    prev_close[:, 1:] = close[:, :-1]
+    with np.errstate(invalid='ignore'):
+        tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    atr = _rolling_mean(tr, atr_period)
+
+    high_diff = np.full(high.shape, np.nan)
+    low_diff = np.full(low.shape, np.nan)
+    high_diff[:, 1:] = np.diff(high, axis=1)
+    low_diff[:, 1:] = -np.diff(low, axis=1)
+    with np.errstate(invalid='ignore'):
+        plus_dm = np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0.0)
+        minus_dm = np.where((low_diff > high_diff) & (low_diff > 0), low_diff, 0.0)
+    plus_dm[~valid] = np.nan
+    minus_dm[~valid] = np.nan
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        plus_di = 100 * _rolling_mean(plus_dm, adx_period) / atr
+        minus_di = 100 * _rolling_mean(minus_dm, adx_period) / atr
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 0.0001)
+    adx = _rolling_mean(dx, adx_period)
+
+    # Average-rank percentile of the last ATR within each row
+    last_atr = atr[:, -1:]
+    with np.errstate(invalid='ignore'):
+        n = np.sum(~np.isnan(atr), axis=1)
+        less = np.sum(atr < last_atr, axis=1)
+        equal = np.sum(atr == last_atr, axis=1)
+        atr_percentile = (less + (equal + 1) / 2) / n * 100
+    atr_percentile = np.where(np.isnan(last_atr[:, 0]), np.nan, atr_percentile)
+
+    return {
+        "atr": atr[:, -1],
+        "adx": adx[:, -1],
+        "atr_percentile": atr_percentile,
+        "bars": valid.sum(axis=1)
+    }
+
+
+def classify_regime(adx: float, atr_percentile: float) -> str:
+    """ADX / ATR-percentile regime rules"""
+    if pd.isna(adx):
+        return "Transitioning Market"
+    if pd.isna(atr_percentile):
+        atr_percentile = 50
+    if adx > 25:
+        if atr_percentile > 70:
+            return "High Volatility Trend"
+        if atr_percentile < 30:
+            return "Low Volatility Trend"
+    elif adx < 20:
+        if atr_percentile > 70:
+            return "High Volatility Range"
+        if atr_percentile < 30:
+            return "Low Volatility Range"
+    return "Transitioning Market"
+
+
+def stack_ohlcv(frames: Dict[str, pd.DataFrame], bars: Optional[int] = None) -> Dict[str, Any]:
+    """Align per-symbol OHLCV frames into right-aligned (symbols x bars) arrays, NaN-padded on the left"""
+    symbols = [s for s, df in frames.items() if df is not None and not df.empty]
+    width = max((len(frames[s]) for s in symbols), default=0)
+    if bars:
+        width = min(width, bars)
+
+    arrays = {col: np.full((len(symbols), width), np.nan) for col in ("High", "Low", "Close")}
+    for row, symbol in enumerate(symbols):
+        df = frames[symbol]
+        columns = {c.capitalize(): c for c in df.columns}
+        for col, arr in arrays.items():
+            values = df[columns[col]].to_numpy(dtype=float)[-width:]
+            arr[row, width - len(values):] = values
+    return {"symbols": symbols, **arrays}
+
+
+@dataclass
+class RegimeReading:
+    """Regime for one symbol at one candle close"""
+    symbol: str
+    regime: str
+    adx: float
+    atr_percentile: float
+    atr: float
+    bars: int
+    recommended_types: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class RegimeSnapshot:
+    """Immutable published view - replaced wholesale on each refresh"""
+    readings: Dict[str, RegimeReading]
+    symbols: tuple  # watchlist at refresh time (failed fetches have no reading)
+    timeframe: str
+    computed_at: float
+    valid_until: float
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.valid_until
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timeframe": self.timeframe,
+            "computed_at": datetime.fromtimestamp(self.computed_at).isoformat(),
+            "valid_until": datetime.fromtimestamp(self.valid_until).isoformat(),
+            "regimes": {s: r.to_dict() for s, r in self.readings.items()}
+        }
+
+
+class RegimeService:
+    """
+    Watchlist-wide regime computation with a shared snapshot
+
+    - refresh() fetches every watched symbol (in parallel), stacks them and
+      classifies all of them in one vectorized pass
+    - the snapshot is valid until the next candle close; get() refreshes
+      lazily when it is stale, so on-demand callers never compute alone
+    - start() runs refresh() on every candle close in a daemon thread
+    """
+
+    MIN_BARS = 100  # same floor as the Strategy Engine detector
+
+    def __init__(
+        self,
+        fetch_ohlcv: Optional[Callable[[str, int], pd.DataFrame]] = None,
+        symbols: Optional[Iterable[str]] = None,
+        timeframe: str = "1h",
+        bars: int = 720,
+        adx_period: int = 14,
+        atr_period: int = 14,
+        max_workers: int = 8
+    ):
+        self.fetch_ohlcv = fetch_ohlcv or self._default_fetch
+        self.symbols: List[str] = []
+        self.timeframe = timeframe
+        self.bars = bars
+        self.adx_period = adx_period
+        self.atr_period = atr_period
+        self.max_workers = max_workers
+
+        self._snapshot: Optional[RegimeSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pipeline = None
+        self.refresh_count = 0
+
+        if symbols:
+            self.watch(symbols)
+
+    # ------------------------------------------------------------------
+    # Watchlist
+    # ------------------------------------------------------------------
+
+    def watch(self, symbols: Iterable[str]):
+        """Add symbols to the watchlist (picked up on the next refresh)"""
+        for symbol in symbols:
+            symbol = symbol.upper()
+            if symbol not in self.symbols:
+                self.symbols.append(symbol)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Optional[RegimeSnapshot]:
+        return self._snapshot
+
+    def get(self, symbol: str, refresh_if_stale: bool = True) -> Optional[RegimeReading]:
+        """Current reading for `symbol`; refreshes the whole watchlist once if the snapshot is stale"""
+        symbol = symbol.upper()
+        snap = self._snapshot
+        if refresh_if_stale and (snap is None or not snap.is_fresh() or symbol not in snap.symbols):
+            self.watch([symbol])
+            snap = self.refresh(only_if_stale=True)
+        return snap.readings.get(symbol) if snap else None
+
+    # ------------------------------------------------------------------
+    # Computing
+    # ------------------------------------------------------------------
+
+    def refresh(
+        self,
+        frames: Optional[Dict[str, pd.DataFrame]] = None,
+        only_if_stale: bool = False
+    ) -> RegimeSnapshot:
+        """
+        Recompute every watched symbol and publish a new snapshot
+
+        Args:
+            frames: Pre-fetched OHLCV per symbol (skips fetching)
+            only_if_stale: Return the current snapshot if another caller
+                           already refreshed it for this candle
+        """
+        with self._refresh_lock:
+            snap = self._snapshot
+            if only_if_stale and snap is not None and snap.is_fresh() \
+                    and all(s in snap.symbols for s in self.symbols):
+                return snap
+
+            if frames is None:
+                frames = self._fetch_all(self.symbols)
+            readings = self.compute(frames)
+
+            now = time.time()
+            snap = RegimeSnapshot(
+                readings=readings,
+                symbols=tuple(dict.fromkeys([*self.symbols, *frames])),
+                timeframe=self.timeframe,
+                computed_at=now,
+                valid_until=self._next_close(now)
+            )
+            self._snapshot = snap
+            self.refresh_count += 1
+            logger.info(f"Regimes refreshed for {len(readings)}/{len(snap.symbols)} symbols")
+            return snap
+
+    def compute(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, RegimeReading]:
+        """One vectorized pass over all frames"""
+        stacked = stack_ohlcv(frames, self.bars)
+        if not stacked["symbols"]:
+            return {}
+
+        arrays = compute_regime_arrays(
+            stacked["High"], stacked["Low"], stacked["Close"],
+            adx_period=self.adx_period, atr_period=self.atr_period
+        )
+
+        readings = {}
+        for i, symbol in enumerate(stacked["symbols"]):
+            bars = int(arrays["bars"][i])
+            if bars < self.MIN_BARS:
+                regime, adx, atr_pct = "Insufficient Data", 0.0, 50.0
+            else:
+                adx = float(arrays["adx"][i])
+                atr_pct = float(arrays["atr_percentile"][i])
+                regime = classify_regime(adx, atr_pct)
+                adx = 0.0 if np.isnan(adx) else adx
+                atr_pct = 50.0 if np.isnan(atr_pct) else atr_pct
+            atr = float(arrays["atr"][i])
+            readings[symbol] = RegimeReading(
+                symbol=symbol,
+                regime=regime,
+                adx=round(adx, 2),
+                atr_percentile=round(atr_pct, 2),
+                atr=round(atr, 6) if not np.isnan(atr) else 0.0,
+                bars=bars,
+                recommended_types=REGIME_STRATEGY_TYPES.get(regime, [])
+            )
+        return readings
+
+    def _fetch_all(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        def fetch(symbol):
+            try:
+                return self.fetch_ohlcv(symbol, self.bars)
+            except Exception as e:
+                logger.warning(f"OHLCV fetch failed for {symbol}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(symbols)))) as pool:
+            return dict(zip(symbols, pool.map(fetch, symbols)))
+
+    def _default_fetch(self, symbol: str, bars: int) -> pd.DataFrame:
+        if self._pipeline is None:
+            from core.integrations.live_data_pipeline import LiveDataPipeline
+            self._pipeline = LiveDataPipeline()
+        days = max(1, -(-bars * _timeframe_seconds(self.timeframe) // 86400))
+        return self._pipeline.get_ohlcv(symbol, days=days)
+
+    def _next_close(self, now: float) -> float:
+        period = _timeframe_seconds(self.timeframe)
+        return (now // period + 1) * period
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def start(self, settle_seconds: float = 5.0):
+        """Refresh on every candle close (plus a short settle delay for the exchange)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(settle_seconds,), name="regime-service", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, settle_seconds: float):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Regime refresh failed: {e}")
+            wait = self._next_close(time.time()) - time.time() + settle_seconds
+            self._stop.wait(max(wait, 1.0))
+
+
+# Process-wide service shared by all consumers
+regime_service = RegimeService()
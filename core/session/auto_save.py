@@ -27,6 +27,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from core.config.brain_store import get_brain_store
+
 # Paths
 PROJECT_ROOT = Path("/Volumes/LegacySafe/SS_III")
 SESSIONS_DIR = PROJECT_ROOT / "memory" / "SESSIONS"
@@ -206,36 +209,30 @@ class AutoCompactSave:
 
     def _update_brain(self, updates: Dict[str, Any]):
         """Update BRAIN.json with session changes."""
-        try:
-            brain = json.loads(BRAIN_PATH.read_text())
-        except:
-            brain = {}
-
-        # Add session record
-        if "sessions" not in brain:
-            brain["sessions"] = []
-
-        brain["sessions"].append({
-            "date": self.date_str,
-            "time": self.time_str,
-            "type": "ACC",
-            "file": str(self.session_file)
-        })
-
-        # Keep only last 30 sessions
-        brain["sessions"] = brain["sessions"][-30:]
-
-        # Apply custom updates
-        for key, value in updates.items():
-            if isinstance(value, dict) and key in brain and isinstance(brain[key], dict):
-                brain[key].update(value)
-            else:
-                brain[key] = value
-
-        # Update last_session timestamp
-        brain["last_session"] = self.timestamp.isoformat()
-
-        BRAIN_PATH.write_text(json.dumps(brain, indent=2))
+        def apply(brain):
+            # Add session record, keep only last 30 sessions
+            sessions = brain.get("sessions")
+            if not isinstance(sessions, list):
+                sessions = []
+            sessions.append({
+                "date": self.date_str,
+                "time": self.time_str,
+                "type": "ACC",
+                "file": str(self.session_file)
+            })
+            brain["sessions"] = sessions[-30:]
+
+            # Apply custom updates
+            for key, value in updates.items():
+                if isinstance(value, dict) and key in brain and isinstance(brain[key], dict):
+                    brain[key].update(value)
+                else:
+                    brain[key] = value
+
+            # Update last_session timestamp
+            brain["last_session"] = self.timestamp.isoformat()
+
+        get_brain_store(BRAIN_PATH).update(apply, ["sessions", "last_session", *updates], touch=False)
 
     def _push_to_replit(self, summary: str, accomplishments: List[str]):
         """Push session summary to Replit."""
@@ -4,6 +4,6 @@ Sovereign Shadow III - Signals Package
 On-chain and market signal modules for enhanced trading intelligence.
 """
 
-from .onchain_signals import OnChainSignals
+from .onchain_signals import FlowOnChainSignals
 
-__all__ = ['OnChainSignals']
+__all__ = ['FlowOnChainSignals']
@@ -39,6 +39,8 @@ try:
 except ImportError:
     CCXT_AVAILABLE = False
 
+from core.exchanges.client_pool import get_exchange
+
 
 @dataclass
 class FundingOpportunity:
@@ -123,10 +125,7 @@ class FundingArbScanner:
         """Initialize CCXT exchange clients"""
         for exchange_id in self.config['exchanges']:
             try:
-                exchange_class = getattr(ccxt, exchange_id)
-                self.exchanges[exchange_id] = exchange_class({
-                    'enableRateLimit': True,
-                })
+                self.exchanges[exchange_id] = get_exchange(exchange_id)
                 print(f"[OK] {exchange_id} initialized")
             except Exception as e:
                 print(f"[WARN] {exchange_id} failed: {e}")
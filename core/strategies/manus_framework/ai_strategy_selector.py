@@ -5,7 +5,7 @@ Intelligently selects the optimal strategy based on market regime
 """
 import json
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from market_regime_detector import MarketRegimeDetector
 
 class AIStrategySelector:
@@ -56,19 +56,21 @@ class AIStrategySelector:
         candidate_strategies.sort(key=lambda x: x['score'], reverse=True)
         return candidate_strategies
     
-    def select_strategy(self, market_data: pd.DataFrame, portfolio_constraints: Dict = None) -> Dict:
+    def select_strategy(self, market_data: Optional[pd.DataFrame] = None, portfolio_constraints: Dict = None,
+                        symbol: Optional[str] = None) -> Dict:
         """
         Select the optimal strategy for current market conditions.
         
         Args:
             market_data: DataFrame with OHLCV data
             portfolio_constraints: Optional dict with constraints like max_risk, preferred_types, etc.
+            symbol: Use the shared regime service reading for this symbol
         
         Returns:
             Dict with selected strategy and reasoning
         """
         # Step 1: Detect current market regime
-        regime_info = self.regime_detector.detect_regime(market_data)
+        regime_info = self.regime_detector.detect_regime(market_data, symbol=symbol)
         regime = regime_info['regime']
         metrics = regime_info
         
@@ -140,7 +142,8 @@ class AIStrategySelector:
             List of strategy allocations with weights
         """
         # Detect regime
-        regime, metrics = self.regime_detector.detect_regime(market_data)
+        metrics = self.regime_detector.detect_regime(market_data)
+        regime = metrics['regime']
         recommended_types = self.regime_map.get(regime, [])
         
         # Get all compatible strategies
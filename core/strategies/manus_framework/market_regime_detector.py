@@ -3,9 +3,14 @@
 Market Regime Detector
 Analyzes market data to determine the current trading regime
 """
+import sys
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 class MarketRegimeDetector:
     """
@@ -87,16 +92,38 @@ class MarketRegimeDetector:
         atr_percentile = atr.rolling(window=self.atr_lookback).apply(percentile_rank, raw=False)
         return atr_percentile
     
-    def detect_regime(self, df: pd.DataFrame) -> Tuple[str, Dict]:
+    def detect_regime(self, df: Optional[pd.DataFrame] = None, symbol: Optional[str] = None) -> Dict:
         """
         Detect the current market regime.
         
         Args:
             df: DataFrame with columns ['High', 'Low', 'Close'] or ['high', 'low', 'close']
+            symbol: Read the shared regime service snapshot (one computation
+                    per candle for the whole watchlist) instead of recomputing
         
         Returns:
-            Tuple of (regime_name, regime_metrics)
+            Dict with regime, adx, atr_percentile, atr and recommended_strategy_types
         """
+        if symbol:
+            from core.regime.regime_service import regime_service
+            reading = regime_service.get(symbol)
+            if reading is not None:
+                return {
+                    "regime": reading.regime,
+                    "adx": reading.adx,
+                    "atr_percentile": reading.atr_percentile,
+                    "atr": reading.atr,
+                    "recommended_strategy_types": self.get_recommended_strategies(reading.regime)
+                }
+        if df is None:
+            return {
+                "regime": "Insufficient Data",
+                "adx": 0,
+                "atr_percentile": 50,
+                "atr": 0.0,
+                "recommended_strategy_types": []
+            }
+
         # Normalize column names
         df_normalized = df.copy()
         df_normalized.columns = df_normalized.columns.str.capitalize()
@@ -178,7 +205,8 @@ if __name__ == "__main__":
         detector = MarketRegimeDetector()
         
         # Detect regime
-        regime, metrics = detector.detect_regime(df)
+        metrics = detector.detect_regime(df)
+        regime = metrics['regime']
         
         print(f"\n📊 Current Market Regime: {regime}")
         print(f"\nMetrics:")
@@ -59,7 +59,8 @@ class StrategyExecutionEngine:
             Dict with analysis and selection results
         """
         # Detect current regime
-        regime, metrics = self.regime_detector.detect_regime(market_data)
+        metrics = self.regime_detector.detect_regime(market_data)
+        regime = metrics['regime']
         
         # Check for regime change
         regime_changed = (regime != self.current_regime)
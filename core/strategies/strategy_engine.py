@@ -27,9 +27,6 @@ BRAIN_PATH = SS3_ROOT / "BRAIN.json"
 STRATEGY_DB = SS3_ROOT / "data" / "strategy_performance.db"
 STRATEGY_LIBRARY = SS3_ROOT / "core" / "strategies" / "strategy_library.json"
 
-# Ensure data directory exists
-(SS3_ROOT / "data").mkdir(exist_ok=True)
-
 
 class MarketRegimeDetector:
     """
@@ -84,49 +81,51 @@ class MarketRegimeDetector:
 
         return adx
 
-    def detect_regime(self, df: pd.DataFrame) -> Dict:
-        """Detect current market regime from OHLCV data"""
+    def detect_regime(self, df: Optional[pd.DataFrame] = None, symbol: Optional[str] = None) -> Dict:
+        """
+        Detect current market regime from OHLCV data
+
+        With `symbol`, reads the shared regime service snapshot (computed
+        once per candle for the whole watchlist) instead of recomputing.
+        Falls back to `df` when the service has no reading for the symbol,
+        and reports "Insufficient Data" when there is neither.
+        """
+        if symbol:
+            from core.regime.regime_service import regime_service
+            reading = regime_service.get(symbol)
+            if reading is not None:
+                return reading.to_dict()
+
+        insufficient = {
+            "regime": "Insufficient Data",
+            "adx": 0,
+            "atr_percentile": 50,
+            "recommended_types": []
+        }
+        if df is None:
+            return insufficient
+
         # Normalize column names
         df_norm = df.copy()
         df_norm.columns = df_norm.columns.str.capitalize()
 
         if len(df_norm) < self.atr_lookback:
-            return {
-                "regime": "Insufficient Data",
-                "adx": 0,
-                "atr_percentile": 50,
-                "recommended_types": []
-            }
-
-        # Calculate indicators
-        atr = self.calculate_atr(df_norm['High'], df_norm['Low'], df_norm['Close'])
-        adx = self.calculate_adx(df_norm['High'], df_norm['Low'], df_norm['Close'])
-
-        # ATR percentile
-        atr_pct = (atr.rank(pct=True) * 100).iloc[-1]
-
-        current_adx = adx.iloc[-1]
-        current_atr_pct = atr_pct if not pd.isna(atr_pct) else 50
-
-        # Determine regime
-        if pd.isna(current_adx):
-            regime = "Transitioning Market"
-        elif current_adx > 25:
-            if current_atr_pct > 70:
-                regime = "High Volatility Trend"
-            elif current_atr_pct < 30:
-                regime = "Low Volatility Trend"
-            else:
-                regime = "Transitioning Market"
-        elif current_adx < 20:
-            if current_atr_pct > 70:
-                regime = "High Volatility Range"
-            elif current_atr_pct < 30:
-                regime = "Low Volatility Range"
-            else:
-                regime = "Transitioning Market"
-        else:
-            regime = "Transitioning Market"
+            return insufficient
+
+        # Same vectorized kernel the regime service runs over the watchlist
+        from core.regime.regime_service import compute_regime_arrays, classify_regime
+        arrays = compute_regime_arrays(
+            df_norm['High'].to_numpy()[None, :],
+            df_norm['Low'].to_numpy()[None, :],
+            df_norm['Close'].to_numpy()[None, :],
+            adx_period=self.adx_period,
+            atr_period=self.atr_period
+        )
+
+        current_adx = arrays["adx"][0]
+        current_atr_pct = arrays["atr_percentile"][0]
+        current_atr_pct = current_atr_pct if not pd.isna(current_atr_pct) else 50
+        regime = classify_regime(current_adx, current_atr_pct)
 
         return {
             "regime": regime,
@@ -145,6 +144,7 @@ class PerformanceTracker:
 
     def _init_database(self):
         """Initialize SQLite database"""
+        Path(self.db_path).parent.mkdir(exist_ok=True)  # Ensure data directory exists
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -356,18 +356,19 @@ class StrategyEngine:
         STRATEGY_LIBRARY.write_text(json.dumps(default, indent=2))
         return default
 
-    def analyze(self, market_data: pd.DataFrame) -> Dict:
+    def analyze(self, market_data: pd.DataFrame, symbol: Optional[str] = None) -> Dict:
         """
         Full analysis: detect regime, select strategy, return recommendation.
 
         Args:
             market_data: DataFrame with OHLCV columns
+            symbol: If given, regime comes from the shared regime service snapshot
 
         Returns:
             Complete analysis with regime, strategy, confidence
         """
         # Step 1: Detect regime
-        regime_info = self.regime_detector.detect_regime(market_data)
+        regime_info = self.regime_detector.detect_regime(market_data, symbol=symbol)
         regime = regime_info['regime']
 
         # Step 2: Get candidates for this regime
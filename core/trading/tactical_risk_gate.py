@@ -14,17 +14,22 @@ Part of the Sovereign Shadow Trading System
 
 import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import numpy as np
 import pandas as pd
 from core.risk.advanced_risk_module import SentinelAdvancedRiskModule
 from core.filters.market_filters import OracleMarketFilters
 from core.regime.hmm_regime_detector import RegimeHMMDetector
 from core.agents.reflect_agent import ReflectAgent
 from core.ml.freqai_scaffold import AdaptFreqAIScaffold
-from core.ml.orderbook_rl_scaffold import DepthOrderBookRLEnv
+try:
+    from core.ml.orderbook_rl_scaffold import DepthOrderBookRLEnv
+except ImportError:  # gymnasium is optional; only the depth RL simulation needs it
+    DepthOrderBookRLEnv = None
 from core.signals.onchain_signals import FlowOnChainSignals
 
 logger = logging.getLogger(__name__)
@@ -129,8 +134,12 @@ class TacticalRiskGate:
         self.reflect_agent = ReflectAgent(self.config.get("reflect_config", {"initial_capital": 1660.0}))
         # Initialize Adapt FreqAI Scaffold
         self.adapt_freqai_scaffold = AdaptFreqAIScaffold(self.config.get("freqai_config", {}))
+        # FreqAI signals for the current bar: (bar, model_version) -> {asset: {"signal", "probability"}}
+        self.freqai_bar_seconds = self.config.get("freqai_config", {}).get("bar_seconds", 60)
+        self._freqai_cache_key: Optional[Tuple[int, int]] = None
+        self._freqai_cache: Dict[str, Dict[str, Any]] = {}
         # Initialize Depth Order Book RL Environment
-        self.depth_rl_env = DepthOrderBookRLEnv(self.config.get("depth_config", {}))
+        self.depth_rl_env = DepthOrderBookRLEnv(self.config.get("depth_config", {})) if DepthOrderBookRLEnv else None
         # Initialize Flow On-Chain Signals Module
         self.flow_onchain_signals = FlowOnChainSignals(self.config.get("flow_config", {}))
 
@@ -213,10 +222,33 @@ class TacticalRiskGate:
         self.adapt_freqai_scaffold.train_model(data.copy())
         logger.info("ADAPT FreqAI model training initiated.")
 
-    def get_freqai_signal(self, current_features: pd.DataFrame) -> Optional[Any]:
-        return self.adapt_freqai_scaffold.predict_signal(current_features.copy())
+    def _freqai_bar_key(self, bar_time: Optional[float] = None) -> Tuple[int, int]:
+        bar = int((bar_time if bar_time is not None else time.time()) // self.freqai_bar_seconds)
+        key = (bar, self.adapt_freqai_scaffold.model_version)
+        if key != self._freqai_cache_key: # New bar or hot-swapped model
+            self._freqai_cache_key = key
+            self._freqai_cache = {}
+        return key
+
+    def score_freqai_watchlist(self, features_by_asset: Mapping[str, pd.DataFrame],
+                              bar_time: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Score every asset in one model call and cache the signals for the current bar"""
+        self._freqai_bar_key(bar_time)
+        pending = {asset: frame for asset, frame in features_by_asset.items() if asset not in self._freqai_cache}
+        if pending:
+            self._freqai_cache.update(self.adapt_freqai_scaffold.predict_batch(pending))
+        return {asset: self._freqai_cache[asset] for asset in features_by_asset if asset in self._freqai_cache}
+
+    def get_freqai_signal(self, current_features: pd.DataFrame, asset: Optional[str] = None,
+                          bar_time: Optional[float] = None) -> Optional[Any]:
+        """Cached per asset for the current bar when `asset` is given"""
+        if asset is None:
+            return self.adapt_freqai_scaffold.predict_signal(current_features.copy())
+        return self.score_freqai_watchlist({asset: current_features}, bar_time)[asset]["signal"]
 
     def run_depth_rl_simulation(self, initial_state: Optional[Dict] = None) -> Dict:
+        if self.depth_rl_env is None:
+            raise ImportError("Depth RL simulation needs gymnasium (pip install gymnasium)")
         # Simplified: In a real scenario, initial_state would be derived from live data
         obs, info = self.depth_rl_env.reset()
         if initial_state:
@@ -551,7 +583,7 @@ class TacticalRiskGate:
             'close': [request.entry_price],
             'volume': [10000.0] # Dummy volume
         })
-        freqai_signal = self.get_freqai_signal(freqai_features)
+        freqai_signal = self.get_freqai_signal(freqai_features, asset=request.asset)
 
         if freqai_signal == 0 and request.side == "long": # Assuming 0 is a bearish/no-buy signal
             return ValidationResult(
@@ -572,14 +604,14 @@ class TacticalRiskGate:
         if rl_simulation_result["final_portfolio_value"] < self.config.get("depth_config", {}).get("min_acceptable_portfolio_value_after_rl", self.GLOBAL_MAX_POSITION_USD):
             return ValidationResult(
                 approved=False,
-                reason=f"❌ DEPTH RL: Simulation shows negative outcome. Final PnL: ${rl_simulation_result["final_portfolio_value"]:.2f}"
+                reason=f"❌ DEPTH RL: Simulation shows negative outcome. Final PnL: ${rl_simulation_result['final_portfolio_value']:.2f}"
             )
         elif rl_simulation_result["total_reward"] < self.config.get("depth_config", {}).get("min_acceptable_rl_reward", 0.0):
             size_adj *= self.config.get("depth_config", {}).get("rl_negative_reward_size_reduction_factor", 0.9)
-            warnings.append(f"⚠️ DEPTH RL: Simulation shows low reward ({rl_simulation_result["total_reward"]:.2f}). Size reduced to {size_adj:.1f}×")
+            warnings.append(f"⚠️ DEPTH RL: Simulation shows low reward ({rl_simulation_result['total_reward']:.2f}). Size reduced to {size_adj:.1f}×")
 
             size_adj *= self.config.get("depth_config", {}).get("rl_negative_reward_size_reduction_factor", 0.9)
-            warnings.append(f"⚠️ DEPTH RL: Simulation shows low reward ({rl_simulation_result["total_reward"]:.2f}). Size reduced to {size_adj:.1f}×")
+            warnings.append(f"⚠️ DEPTH RL: Simulation shows low reward ({rl_simulation_result['total_reward']:.2f}). Size reduced to {size_adj:.1f}×")
 
         # 7. On-Chain Signals Filter (FLOW)
         self.update_flow_onchain_data(asset=request.asset) # Fetch latest on-chain data
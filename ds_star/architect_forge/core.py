@@ -13,6 +13,8 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 
+from .verification_pool import VerificationPool, write_shared_ohlcv
+
 
 @dataclass
 class StrategyResult:
@@ -46,8 +48,12 @@ class ArchitectForge:
     MIN_WIN_RATE = 0.40
     MAX_DRAWDOWN = 0.30
 
+    # Exchange the generated get_ohlcv() pulls from
+    DATA_EXCHANGE = "binance"
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
+        self._market_client = None
 
         # Load system prompt
         self.system_prompt = self._load_system_prompt()
@@ -63,6 +69,15 @@ class ArchitectForge:
         self.log_dir = Path(__file__).parent.parent.parent / "logs" / "architect_forge"
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parallel verification (candidate variants backtested side by side)
+        self.pool = VerificationPool(
+            self.sandbox_dir / "pool",
+            max_workers=self.config.get("verify_workers"),
+            timeout=self.config.get("verify_timeout", 60),
+            cpu_seconds=self.config.get("verify_cpu_seconds", 60),
+            memory_mb=self.config.get("verify_memory_mb", 2048)
+        )
+
     def _load_system_prompt(self) -> str:
         """Load the Architect Forge system prompt"""
         import yaml
@@ -79,7 +94,8 @@ class ArchitectForge:
         symbols: List[str] = None,
         timeframe: str = "1d",
         backtest_days: int = 90,
-        initial_equity: float = 10000
+        initial_equity: float = 10000,
+        parallel: bool = True
     ) -> StrategyResult:
         """
         Build a trading strategy from natural language request
@@ -90,6 +106,8 @@ class ArchitectForge:
             timeframe: Trading timeframe
             backtest_days: Days of data for backtest
             initial_equity: Starting equity for backtest
+            parallel: Verify all refinement variants at once (first
+                      acceptable one wins) instead of the sequential loop
 
         Returns:
             StrategyResult with verified strategy or failure reasons
@@ -100,6 +118,13 @@ class ArchitectForge:
         strategy_spec = self._parse_request(request)
         strategy_code = self._generate_code(strategy_spec, symbols, timeframe)
 
+        if parallel:
+            result = self._build_parallel(
+                strategy_code, symbols, timeframe, backtest_days, initial_equity
+            )
+            self._log_build(request, result)
+            return result
+
         result = StrategyResult(status="failed")
 
         # Phase 2 & 3: Verify and refine loop
@@ -154,6 +179,71 @@ class ArchitectForge:
 
         return result
 
+    def _build_parallel(
+        self,
+        strategy_code: str,
+        symbols: List[str],
+        timeframe: str,
+        days: int,
+        equity: float
+    ) -> StrategyResult:
+        """Phase 2 & 3 in one round: verify every refinement variant concurrently"""
+        result = StrategyResult(status="failed")
+        variants = self._generate_variants(strategy_code)
+
+        try:
+            data_path = self._load_shared_data(symbols[0], timeframe, days)
+        except Exception as e:
+            result.errors.append(f"Data load failed: {e}")
+            return result
+
+        outcome = self.pool.verify(variants, data_path, equity, accept=self._metrics_acceptable)
+        won = outcome.winning_result
+
+        if won is not None:
+            result.status = "verified"
+            result.summary = won.metrics
+            result.strategy_code = variants[won.index]
+            result.risk_note = self._generate_risk_note(won.metrics)
+            result.refinement_iterations = won.index
+            return result
+
+        result.refinement_iterations = len(variants) - 1
+        for candidate in outcome.results:
+            if candidate.error:
+                result.errors.append(f"Variant {candidate.index}: {candidate.error}")
+        if any(c.status == "rejected" for c in outcome.results):
+            result.errors.append(f"Could not achieve acceptable metrics across {len(variants)} variants")
+        return result
+
+    def _generate_variants(self, code: str) -> List[str]:
+        """
+        Base strategy plus the refinements the sequential loop would try
+
+        Variant order mirrors refinement order. The pool launches them in
+        that order and takes the first to pass, so a less-modified variant
+        only wins over a later one if it finishes first (or in the same poll).
+        """
+        tighter_entries = self._refine_strategy(code, {"win_rate_pct": 0}, "")
+        tighter_stops = self._refine_strategy(code, {"max_drawdown_pct": 100}, "")
+        both = self._refine_strategy(tighter_entries, {"max_drawdown_pct": 100}, "")
+
+        variants = []
+        for variant in (code, tighter_entries, tighter_stops, both):
+            if variant not in variants:
+                variants.append(variant)
+        return variants[:self.MAX_REFINEMENTS + 1]
+
+    def _load_shared_data(self, symbol: str, timeframe: str, days: int) -> Path:
+        """Fetch OHLCV once (via the shared MarketDataClient cache) and mmap it to disk"""
+        if self._market_client is None:
+            from ..synoptic_core.market_data_client import MarketDataClient
+            self._market_client = MarketDataClient(exchange_id=self.DATA_EXCHANGE)
+
+        df = self._market_client.get_ohlcv(symbol, timeframe, days)
+        tag = f"{symbol.replace('/', '')}_{timeframe}_{days}"
+        return write_shared_ohlcv(df, self.sandbox_dir / "data", tag=tag)
+
     def _parse_request(self, request: str) -> Dict[str, Any]:
         """
         Parse natural language request into strategy specification
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+ARCHITECT FORGE - Parallel Verification Pool
+Backtests candidate strategy variants side by side in sandboxed subprocesses
+
+- OHLCV is loaded once and written to a memory-mapped .npy file that every
+  candidate process maps read-only (no per-candidate exchange fetch)
+- Each candidate runs under wall-clock timeout plus CPU / address-space
+  rlimits (POSIX)
+- The first candidate whose metrics pass the acceptance check wins; the
+  rest are killed or never started
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows - no rlimits
+    resource = None
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+@dataclass
+class CandidateResult:
+    """Outcome of one candidate backtest"""
+    index: int
+    status: str  # passed | rejected | error | timeout | cancelled
+    metrics: Optional[Dict[str, Any]] = None
+    error: str = ""
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PoolOutcome:
+    """Result of a verification round"""
+    winner: Optional[int]
+    results: List[CandidateResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def winning_result(self) -> Optional[CandidateResult]:
+        return self.results[self.winner] if self.winner is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "winner": self.winner,
+            "elapsed_seconds": self.elapsed_seconds,
+            "results": [r.to_dict() for r in self.results]
+        }
+
+
+def write_shared_ohlcv(df, directory: Path, tag: str = "") -> Path:
+    """
+    Persist an OHLCV DataFrame as a float64 (rows x 6) .npy for mmap sharing
+
+    Accepts either a 'timestamp' column or a DatetimeIndex. The file name is
+    content-addressed so an unchanged dataset is written only once.
+    """
+    import pandas as pd
+
+    frame = df
+    if 'timestamp' not in frame.columns:
+        frame = df.reset_index()
+        frame = frame.rename(columns={frame.columns[0]: 'timestamp'})
+
+    ts = pd.to_datetime(frame['timestamp']).astype('datetime64[ms]').astype('int64')
+    values = np.column_stack([ts.to_numpy(dtype=np.float64)] + [
+        frame[col].to_numpy(dtype=np.float64) for col in OHLCV_COLUMNS[1:]
+    ])
+
+    digest = hashlib.sha1(values.tobytes()).hexdigest()[:16]
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"ohlcv_{tag}_{digest}.npy" if tag else directory / f"ohlcv_{digest}.npy"
+
+    if not path.exists():
+        tmp = path.with_suffix(".tmp.npy")
+        out = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float64, shape=values.shape)
+        out[:] = values
+        out.flush()
+        del out
+        os.replace(tmp, path)
+    return path
+
+
+def load_shared_ohlcv(path: str):
+    """Map a shared OHLCV .npy read-only and wrap it as the DataFrame strategies expect"""
+    import pandas as pd
+
+    arr = np.load(path, mmap_mode='r')
+    df = pd.DataFrame(arr[:, 1:], columns=OHLCV_COLUMNS[1:])
+    df.insert(0, 'timestamp', pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'))
+    return df
+
+
+class VerificationPool:
+    """
+    Runs candidate strategy files concurrently against one shared dataset
+
+    Candidates are generated ARCHITECT FORGE scripts exposing
+    `execute_backtest(data, initial_equity)`.
+    """
+
+    def __init__(
+        self,
+        work_dir: Path,
+        max_workers: Optional[int] = None,
+        timeout: float = 60.0,
+        cpu_seconds: Optional[int] = 60,
+        memory_mb: Optional[int] = 2048,
+        python: str = sys.executable
+    ):
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers or max(1, min(4, os.cpu_count() or 1))
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.python = python
+
+    def verify(
+        self,
+        candidates: List[str],
+        data_path: Path,
+        initial_equity: float = 10000,
+        accept: Callable[[Dict[str, Any]], bool] = lambda metrics: True
+    ) -> PoolOutcome:
+        """
+        Backtest every candidate until one is accepted
+
+        Args:
+            candidates: Strategy source code, in preference order
+            data_path: Shared OHLCV .npy from write_shared_ohlcv
+            initial_equity: Starting equity passed to execute_backtest
+            accept: Metrics predicate - the first candidate to satisfy it wins
+
+        Returns:
+            PoolOutcome (winner index or None, per-candidate results)
+        """
+        started = time.monotonic()
+        run_id = f"{os.getpid()}_{int(time.time() * 1000)}"
+        results: List[Optional[CandidateResult]] = [None] * len(candidates)
+        pending = list(range(len(candidates)))
+        running: Dict[int, Dict[str, Any]] = {}
+        winner = None
+
+        try:
+            while (pending or running) and winner is None:
+                while pending and len(running) < self.max_workers:
+                    index = pending.pop(0)
+                    running[index] = self._launch(index, candidates[index], data_path, initial_equity, run_id)
+
+                for index in list(running):
+                    job = running[index]
+                    elapsed = time.monotonic() - job["started"]
+
+                    if job["proc"].poll() is None:
+                        if elapsed > self.timeout:
+                            self._kill(job)
+                            results[index] = CandidateResult(
+                                index, "timeout", error="Strategy execution timed out",
+                                elapsed_seconds=round(elapsed, 3)
+                            )
+                            del running[index]
+                        continue
+
+                    del running[index]
+                    results[index] = self._collect(index, job, elapsed, accept)
+                    if results[index].status == "passed":
+                        winner = index
+                        break
+
+                if winner is None and running:
+                    time.sleep(0.01)
+        finally:
+            for index, job in running.items():
+                self._kill(job)
+                results[index] = CandidateResult(
+                    index, "cancelled", elapsed_seconds=round(time.monotonic() - job["started"], 3)
+                )
+            for index in pending:
+                results[index] = CandidateResult(index, "cancelled")
+
+        return PoolOutcome(
+            winner=winner,
+            results=[r for r in results if r is not None],
+            elapsed_seconds=round(time.monotonic() - started, 3)
+        )
+
+    def _launch(self, index: int, code: str, data_path: Path, equity: float, run_id: str) -> Dict[str, Any]:
+        base = self.work_dir / f"candidate_{run_id}_{index}"
+        script = base.with_suffix(".py")
+        script.write_text(code)
+        stdout = open(base.with_suffix(".out"), "w+")
+        stderr = open(base.with_suffix(".err"), "w+")
+
+        env = dict(os.environ)
+        # One BLAS thread per candidate - parallelism comes from the pool
+        env.setdefault("OMP_NUM_THREADS", "1")
+        env.setdefault("OPENBLAS_NUM_THREADS", "1")
+        env.setdefault("MKL_NUM_THREADS", "1")
+
+        proc = subprocess.Popen(
+            [self.python, str(Path(__file__).resolve()), "--run", str(script), str(data_path), str(equity)],
+            stdout=stdout,
+            stderr=stderr,
+            cwd=str(self.work_dir),
+            env=env,
+            preexec_fn=self._limits if resource is not None else None
+        )
+        return {"proc": proc, "started": time.monotonic(), "stdout": stdout, "stderr": stderr,
+                "files": [script, base.with_suffix(".out"), base.with_suffix(".err")]}
+
+    def _limits(self):
+        """Applied in the child before exec"""
+        if self.cpu_seconds:
+            resource.setrlimit(resource.RLIMIT_CPU, (self.cpu_seconds, self.cpu_seconds + 1))
+        if self.memory_mb:
+            limit = self.memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    def _collect(self, index: int, job: Dict[str, Any], elapsed: float, accept) -> CandidateResult:
+        stdout, stderr = job["stdout"], job["stderr"]
+        stdout.seek(0)
+        stderr.seek(0)
+        out, err = stdout.read(), stderr.read()
+        stdout.close()
+        stderr.close()
+        self._remove_files(job)
+        elapsed = round(elapsed, 3)
+
+        if job["proc"].returncode != 0:
+            return CandidateResult(index, "error", error=err.strip() or f"Exit code {job['proc'].returncode}",
+                                   elapsed_seconds=elapsed)
+        try:
+            metrics = json.loads(out)
+        except json.JSONDecodeError:
+            return CandidateResult(index, "error", error=f"Invalid output: {out}", elapsed_seconds=elapsed)
+
+        status = "passed" if accept(metrics) else "rejected"
+        return CandidateResult(index, status, metrics=metrics, elapsed_seconds=elapsed)
+
+    @staticmethod
+    def _kill(job: Dict[str, Any]):
+        proc = job["proc"]
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        job["stdout"].close()
+        job["stderr"].close()
+        VerificationPool._remove_files(job)
+
+    @staticmethod
+    def _remove_files(job: Dict[str, Any]):
+        """Candidate script and captured output are only needed until collected"""
+        for path in job["files"]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _run_candidate(strategy_path: str, data_path: str, equity: float) -> Dict[str, Any]:
+    """Child-process entry: import the strategy and backtest it on the shared data"""
+    spec = importlib.util.spec_from_file_location("forge_candidate", strategy_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.execute_backtest(load_shared_ohlcv(data_path), initial_equity=equity)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--run":
+        print(json.dumps(_run_candidate(sys.argv[2], sys.argv[3], float(sys.argv[4]))))
+    else:
+        print("usage: verification_pool.py --run <strategy.py> <ohlcv.npy> <initial_equity>")
+        sys.exit(2)
@@ -235,6 +235,58 @@ class CEXClient:
             pass
         return None
     
+    STABLECOINS = ('USD', 'USDC', 'USDT', 'DAI', 'BUSD')
+    
+    @classmethod
+    def get_bulk_prices(cls, symbols: List[str], session: Optional[requests.Session] = None) -> Dict[str, float]:
+        """
+        USD prices for many symbols in at most two requests.
+        
+        Coinbase's exchange-rates endpoint quotes every listed currency
+        against USD in one response; anything it misses is filled from a
+        single CoinGecko simple/price call.
+        """
+        http = session or requests
+        wanted = {s.upper() for s in symbols if s}
+        prices = {s: 1.0 for s in wanted if s in cls.STABLECOINS}
+        missing = wanted - set(prices)
+        
+        if missing:
+            try:
+                response = http.get(
+                    f"{cls.COINBASE_BASE_URL}/exchange-rates",
+                    params={"currency": "USD"},
+                    timeout=5
+                )
+                if response.status_code == 200:
+                    rates = response.json().get("data", {}).get("rates", {})
+                    for symbol in list(missing):
+                        mapping = cls.SYMBOL_MAPPING.get(symbol, {})
+                        rate = float(rates.get(mapping.get("coinbase") or symbol, 0) or 0)
+                        if rate > 0:
+                            prices[symbol] = 1.0 / rate
+                            missing.discard(symbol)
+            except Exception as e:
+                print(f"Coinbase bulk price error: {e}")
+        
+        ids = {cls.SYMBOL_MAPPING[s]["coingecko"]: s for s in missing
+               if cls.SYMBOL_MAPPING.get(s, {}).get("coingecko")}
+        if ids:
+            try:
+                response = http.get(
+                    f"{cls.COINGECKO_BASE_URL}/simple/price",
+                    params={"ids": ",".join(sorted(ids)), "vs_currencies": "usd"},
+                    timeout=10
+                )
+                if response.status_code == 200:
+                    for cg_id, quote in response.json().items():
+                        if cg_id in ids and quote.get("usd"):
+                            prices[ids[cg_id]] = float(quote["usd"])
+            except Exception as e:
+                print(f"CoinGecko bulk price error: {e}")
+        
+        return prices
+    
     @classmethod
     def get_all_exchange_prices(cls, symbol: str) -> Dict[str, Any]:
         """Get price from all exchanges for a single symbol."""
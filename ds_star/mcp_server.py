@@ -5,6 +5,7 @@ Unified Model Context Protocol server exposing all DS-STAR modules
 
 Tools:
 - synoptic_core_assess: Smart Asset Score analysis
+- synoptic_core_assess_many: Smart Asset Scores for a watchlist
 - architect_forge_build: Strategy generation
 - oracle_query: Natural language market questions
 - gatekeeper_clean: Data normalization
@@ -59,6 +60,15 @@ class DSStarMCPServer:
                 },
                 "handler": self._handle_synoptic
             },
+            "synoptic_core_assess_many": {
+                "description": "Smart Asset Scores for a whole watchlist in one call (shared bulk data requests, concurrent streams)",
+                "parameters": {
+                    "assets": {"type": "array", "description": "Asset symbols (e.g., ['BTC', 'ETH', 'SOL'])"},
+                    "timeframe": {"type": "string", "description": "Data timeframe (1h, 4h, 1d)", "default": "1d"},
+                    "lookback_days": {"type": "integer", "description": "Days of history to analyze", "default": 30}
+                },
+                "handler": self._handle_synoptic_many
+            },
             "architect_forge_build": {
                 "description": "Build a verified trading strategy from natural language description",
                 "parameters": {
@@ -140,6 +150,15 @@ class DSStarMCPServer:
         result = self.synoptic.assess(asset, timeframe, days)
         return result.to_dict()
 
+    async def _handle_synoptic_many(self, args: dict) -> dict:
+        """Handle synoptic_core_assess_many tool"""
+        assets = args.get("assets") or ["BTC"]
+        timeframe = args.get("timeframe", "1d")
+        days = args.get("lookback_days", 30)
+
+        results = await asyncio.to_thread(self.synoptic.assess_many, assets, timeframe, days)
+        return {asset: score.to_dict() for asset, score in results.items()}
+
     async def _handle_architect(self, args: dict) -> dict:
         """Handle architect_forge_build tool"""
         request = args.get("request", "")
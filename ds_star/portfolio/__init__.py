@@ -1,6 +1,9 @@
 from .exchange_clients import CoinbaseClient, KrakenClient, OKXClient, BinanceUSClient
 from .ledger import LedgerService
-from .ledger_wallets import LedgerWalletClient
+try:
+    from .ledger_wallets import LedgerWalletClient
+except ImportError:  # optional hardware-wallet support
+    LedgerWalletClient = None
 from .aave_client import AaveClient
 from .aggregator import PortfolioAggregator
 
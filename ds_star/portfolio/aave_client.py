@@ -16,12 +16,15 @@ class AaveClient:
     AAVE_V3_POOL = "0x87870Bca3F3fD6335C3F4ce8392D69350B4fA4E2"
     ETHERSCAN_V2_URL = "https://api.etherscan.io/v2/api"
     
-    def __init__(self):
+    def __init__(self, watcher=None):
         raw_addr = os.environ.get('AAVE_USER_ADDRESS', '') or os.environ.get('LEDGER_ETH_ADDRESS', '')
         if raw_addr.startswith('n0x'):
             raw_addr = raw_addr[1:]
         self.user_address = raw_addr
         self.etherscan_key = os.environ.get('ETHERSCAN_API_KEY', '')
+        # Optional core.aave.aave_watcher.AaveBlockWatcher: serves the per-block
+        # snapshot instead of an Etherscan round trip
+        self.watcher = watcher
     
     def is_configured(self) -> bool:
         """Check if AAVE tracking is configured."""
@@ -35,7 +38,7 @@ class AaveClient:
                 'error': 'AAVE_USER_ADDRESS or ETHERSCAN_API_KEY not configured'
             }
         
-        position = self._fetch_from_etherscan()
+        position = self._from_watcher() or self._fetch_from_etherscan()
         
         if position and not position.get('error'):
             position['configured'] = True
@@ -56,6 +59,26 @@ class AaveClient:
             'last_updated': datetime.now().isoformat()
         }
     
+    def _from_watcher(self) -> Optional[Dict[str, Any]]:
+        """Position from the block watcher's cached snapshot, if it has one."""
+        if self.watcher is None:
+            return None
+        view = self.watcher.health(self.user_address)
+        if view is None:
+            return None
+        health_factor = view['health_factor']
+        return {
+            'collateral_usd': view['collateral_usd'],
+            'debt_usd': view['debt_usd'],
+            'health_factor': round(health_factor, 2) if health_factor < 100 else 999,
+            'net_worth_usd': round(view['collateral_usd'] - view['debt_usd'], 2),
+            'liquidation_threshold': view['liquidation_threshold_pct'],
+            'liquidation_drop_pct': view['liquidation_drop_pct'],
+            'block': view['block'],
+            'positions': [],
+            'source': 'aave_watcher'
+        }
+    
     def _fetch_from_etherscan(self) -> Optional[Dict[str, Any]]:
         """
         Call AAVE Pool getUserAccountData(address) via Etherscan V2 API.
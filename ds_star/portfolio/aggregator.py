@@ -1,32 +1,69 @@
 """
 Portfolio Aggregator
 Combines exchange balances + manual ledger entries + live prices
+
+Venue balances are fetched concurrently over one pooled HTTP session, each
+venue bounded by its own timeout; a venue that is slow or failing falls
+back to its last good balances (marked stale) instead of holding up the
+rest. Prices come from one bulk quote. The summary is cached with
+stale-while-revalidate: within `summary_ttl` it is served as-is, up to
+`summary_max_stale` it is served immediately while one background refresh
+runs, and only beyond that does a caller wait for fresh data.
 """
 
 import os
 import json
+import threading
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait
 
-from .exchange_clients import CoinbaseClient, KrakenClient, OKXClient, BinanceUSClient
+from .exchange_clients import CoinbaseClient, KrakenClient, OKXClient, BinanceUSClient, get_http_session
 from .ledger import LedgerService
-from .ledger_wallets import LedgerWalletClient
+
+try:
+    from .ledger_wallets import LedgerWalletClient
+except ImportError:
+    LedgerWalletClient = None
 from ds_star.data_feeds.cex_client import CEXClient
 
 
+def _timed(fetch):
+    started = time.monotonic()
+    result = fetch()
+    return result, round((time.monotonic() - started) * 1000, 1)
+
+
 class PortfolioAggregator:
     """Aggregates holdings from all sources with live pricing."""
     
-    def __init__(self):
-        self.coinbase = CoinbaseClient()
-        self.kraken = KrakenClient()
-        self.okx = OKXClient()
-        self.binance_us = BinanceUSClient()
-        self.ledger_wallet = LedgerWalletClient()
+    SOURCES = ['coinbase', 'kraken', 'okx', 'binance_us', 'ledger', 'manual']
+    
+    def __init__(self, venue_timeout: float = 8.0, summary_ttl: float = 30.0, summary_max_stale: float = 300.0):
+        session = get_http_session()
+        # raise_errors: a failed venue must fall back to last good balances, not read as empty
+        self.coinbase = CoinbaseClient(session=session, timeout=venue_timeout, raise_errors=True)
+        self.kraken = KrakenClient(session=session, timeout=venue_timeout, raise_errors=True)
+        self.okx = OKXClient(session=session, timeout=venue_timeout, raise_errors=True)
+        self.binance_us = BinanceUSClient(session=session, timeout=venue_timeout, raise_errors=True)
+        self.ledger_wallet = LedgerWalletClient() if LedgerWalletClient else None
         self.ledger = LedgerService()
+        self.session = session
+        self.venue_timeout = venue_timeout
+        self.summary_ttl = summary_ttl
+        self.summary_max_stale = summary_max_stale
         self.price_cache: Dict[str, float] = {}
         self.last_refresh: Optional[str] = None
+        self.venue_status: Dict[str, Dict[str, Any]] = {}
+        self._last_holdings: Dict[str, List[Dict[str, Any]]] = {}
+        # Long-lived pool: a hung venue keeps its worker without blocking the next refresh
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="portfolio-venue")
+        self._summary: Optional[Dict[str, Any]] = None
+        self._summary_at = 0.0
+        self._summary_lock = threading.Lock()
+        self._build_lock = threading.RLock()
+        self._refreshing = False
     
     def get_exchange_status(self) -> Dict[str, bool]:
         """Check which exchanges are configured."""
@@ -35,72 +72,102 @@ class PortfolioAggregator:
             'kraken': self.kraken.is_configured(),
             'okx': self.okx.is_configured(),
             'binance_us': self.binance_us.is_configured(),
-            'ledger': self.ledger_wallet.is_configured()
+            'ledger': bool(self.ledger_wallet and self.ledger_wallet.is_configured())
         }
     
+    def _venue_fetchers(self) -> Dict[str, Any]:
+        fetchers = {}
+        if self.coinbase.is_configured():
+            fetchers['coinbase'] = self.coinbase.get_accounts
+        if self.kraken.is_configured():
+            fetchers['kraken'] = self.kraken.get_balances
+        if self.okx.is_configured():
+            fetchers['okx'] = self.okx.get_balances
+        if self.binance_us.is_configured():
+            fetchers['binance_us'] = self.binance_us.get_balances
+        if self.ledger_wallet and self.ledger_wallet.is_configured():
+            fetchers['ledger'] = self.ledger_wallet.get_all_balances
+        return fetchers
+    
     def fetch_all_holdings(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Fetch holdings from all configured exchanges and ledger."""
-        holdings = {
-            'coinbase': [],
-            'kraken': [],
-            'okx': [],
-            'binance_us': [],
-            'ledger': [],
-            'manual': []
-        }
+        """Fetch holdings from all configured exchanges and ledger (concurrently, partial on timeout)."""
+        holdings: Dict[str, List[Dict[str, Any]]] = {source: [] for source in self.SOURCES}
         
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            futures = {}
-            
-            if self.coinbase.is_configured():
-                futures[executor.submit(self.coinbase.get_accounts)] = 'coinbase'
-            if self.kraken.is_configured():
-                futures[executor.submit(self.kraken.get_balances)] = 'kraken'
-            if self.okx.is_configured():
-                futures[executor.submit(self.okx.get_balances)] = 'okx'
-            if self.binance_us.is_configured():
-                futures[executor.submit(self.binance_us.get_balances)] = 'binance_us'
-            if self.ledger_wallet.is_configured():
-                futures[executor.submit(self.ledger_wallet.get_all_balances)] = 'ledger'
-            
-            for future in as_completed(futures):
-                source = futures[future]
+        futures = {self._executor.submit(_timed, fetch): source for source, fetch in self._venue_fetchers().items()}
+        done, pending = wait(futures, timeout=self.venue_timeout)
+        
+        status: Dict[str, Dict[str, Any]] = {}
+        for future, source in futures.items():
+            latency_ms = self.venue_timeout * 1000
+            if future in pending:
+                error = f"timeout after {self.venue_timeout}s"
+            else:
                 try:
-                    result = future.result()
-                    holdings[source] = result
+                    holdings[source], latency_ms = future.result()
+                    self._last_holdings[source] = holdings[source]
+                    status[source] = {'ok': True, 'stale': False, 'latency_ms': latency_ms}
+                    continue
                 except Exception as e:
-                    print(f"Error fetching {source}: {e}")
+                    error = str(e)
+            print(f"Error fetching {source}: {error}")
+            holdings[source] = self._last_holdings.get(source, [])
+            status[source] = {'ok': False, 'stale': source in self._last_holdings,
+                              'error': error, 'latency_ms': latency_ms}
         
         holdings['manual'] = self.ledger.get_all_entries()
+        self.venue_status = status
         self.last_refresh = datetime.now().isoformat()
         
         return holdings
     
     def get_live_prices(self, symbols: List[str]) -> Dict[str, float]:
-        """Get live prices for symbols."""
-        prices = {}
+        """Get live prices for symbols from one bulk quote."""
+        prices = CEXClient.get_bulk_prices(symbols, session=self.session)
+        self.price_cache.update(prices)
         
+        # Last known price beats valuing a holding at zero when the quote source hiccups
         for symbol in symbols:
-            if symbol.upper() in ['USD', 'USDC', 'USDT', 'DAI', 'BUSD']:
-                prices[symbol.upper()] = 1.0
-                continue
-            
-            try:
-                price_data = CEXClient.get_coinbase_price(symbol)
-                if price_data:
-                    prices[symbol.upper()] = price_data['price']
-                else:
-                    price_data = CEXClient.get_coingecko_price(symbol)
-                    if price_data:
-                        prices[symbol.upper()] = price_data['price']
-            except:
-                pass
-        
-        self.price_cache.update(prices)
+            symbol = symbol.upper()
+            if symbol not in prices and symbol in self.price_cache:
+                prices[symbol] = self.price_cache[symbol]
         return prices
     
     def get_portfolio_summary(self, force_refresh: bool = False) -> Dict[str, Any]:
-        """Get complete portfolio summary with valuations."""
+        """Get complete portfolio summary with valuations (stale-while-revalidate cached)."""
+        with self._summary_lock:
+            age = time.monotonic() - self._summary_at
+            cached = self._summary
+            if cached is not None and not force_refresh:
+                if age < self.summary_ttl:
+                    return dict(cached, cache_age_s=round(age, 1), stale=False)
+                if age < self.summary_max_stale:
+                    if not self._refreshing:
+                        self._refreshing = True
+                        threading.Thread(target=self._refresh_summary, name="portfolio-refresh",
+                                         daemon=True).start()
+                    return dict(cached, cache_age_s=round(age, 1), stale=True)
+        with self._build_lock:
+            # Another caller may have refreshed while we waited
+            age = time.monotonic() - self._summary_at
+            if self._summary is not None and not force_refresh and age < self.summary_ttl:
+                return dict(self._summary, cache_age_s=round(age, 1), stale=False)
+            return dict(self._refresh_summary(), cache_age_s=0.0, stale=False)
+    
+    def _refresh_summary(self) -> Dict[str, Any]:
+        started = time.monotonic()
+        with self._build_lock:
+            try:
+                summary = self._build_summary()
+            finally:
+                with self._summary_lock:
+                    self._refreshing = False
+            with self._summary_lock:
+                self._summary = summary
+                self._summary_at = started
+        return summary
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        """Fetch holdings and prices and value everything."""
         holdings_by_source = self.fetch_all_holdings()
         
         all_holdings: List[Dict[str, Any]] = []
@@ -159,7 +226,7 @@ class PortfolioAggregator:
             h['unrealized_pnl'] = h['usd_value'] - h['cost_basis'] if h['cost_basis'] > 0 else None
         
         source_totals = {}
-        for source in ['coinbase', 'kraken', 'okx', 'binance_us', 'ledger', 'manual']:
+        for source in self.SOURCES:
             source_value = sum(
                 s['value'] for h in holdings_list for s in h['sources'] if s['source'] == source
             )
@@ -178,6 +245,8 @@ class PortfolioAggregator:
             'holdings': holdings_list,
             'sources': source_totals,
             'exchange_status': exchange_status,
+            'venue_status': dict(self.venue_status),
+            'partial': any(not v['ok'] for v in self.venue_status.values()),
             'last_refresh': self.last_refresh,
             'asset_count': len(holdings_list)
         }
@@ -8,20 +8,55 @@ import time
 import hmac
 import hashlib
 import base64
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import urllib.parse
 
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+class VenueError(Exception):
+    """A venue balance request failed (HTTP status, API error or transport error)."""
+
+
+def _venue_failure(client, message: str, cause: Optional[Exception] = None) -> List[Dict[str, Any]]:
+    """Report a failed balance fetch: raise for callers that asked to, else the legacy empty list."""
+    print(message)
+    if client.raise_errors:
+        raise VenueError(message) from cause
+    return []
+
+
+def get_http_session() -> requests.Session:
+    """Process-wide keep-alive session shared by all venue clients (one TLS handshake per host)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
 class CoinbaseClient:
     """Coinbase authenticated client for fetching account balances."""
     
     BASE_URL = "https://api.coinbase.com"
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, timeout: float = 10,
+                 raise_errors: bool = False):
         self.api_key = os.environ.get('COINBASE_API_KEY', '')
         self.api_secret = os.environ.get('COINBASE_API_SECRET', '')
+        self.session = session or get_http_session()
+        self.timeout = timeout
+        self.raise_errors = raise_errors  # aggregator: failures must not read as "no holdings"
     
     def _sign_request(self, method: str, path: str, body: str = '') -> Dict[str, str]:
         """Create Coinbase API signature headers."""
@@ -54,7 +89,7 @@ class CoinbaseClient:
         try:
             path = '/v2/accounts'
             headers = self._sign_request('GET', path)
-            response = requests.get(f"{self.BASE_URL}{path}", headers=headers, timeout=10)
+            response = self.session.get(f"{self.BASE_URL}{path}", headers=headers, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -70,12 +105,11 @@ class CoinbaseClient:
                             'account_id': account.get('id', '')
                         })
                 return holdings
-            else:
-                print(f"Coinbase error: {response.status_code} - {response.text}")
+            return _venue_failure(self, f"Coinbase error: {response.status_code} - {response.text}")
+        except VenueError:
+            raise
         except Exception as e:
-            print(f"Coinbase fetch error: {e}")
-        
-        return []
+            return _venue_failure(self, f"Coinbase fetch error: {e}", e)
 
 
 class KrakenClient:
@@ -83,9 +117,13 @@ class KrakenClient:
     
     BASE_URL = "https://api.kraken.com"
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, timeout: float = 10,
+                 raise_errors: bool = False):
         self.api_key = os.environ.get('KRAKEN_API_KEY', '')
         self.api_secret = os.environ.get('KRAKEN_PRIVATE_KEY', '')
+        self.session = session or get_http_session()
+        self.timeout = timeout
+        self.raise_errors = raise_errors  # aggregator: failures must not read as "no holdings"
     
     def _sign_request(self, path: str, data: Dict) -> Dict[str, str]:
         """Create Kraken API signature."""
@@ -123,18 +161,17 @@ class KrakenClient:
             data = {'nonce': str(int(time.time() * 1000))}
             headers = self._sign_request(path, data.copy())
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.BASE_URL}{path}",
                 headers=headers,
                 data=urllib.parse.urlencode(data),
-                timeout=10
+                timeout=self.timeout
             )
             
             if response.status_code == 200:
                 result = response.json()
                 if result.get('error'):
-                    print(f"Kraken API error: {result['error']}")
-                    return []
+                    return _venue_failure(self, f"Kraken API error: {result['error']}")
                 
                 holdings = []
                 for asset, amount in result.get('result', {}).items():
@@ -148,10 +185,11 @@ class KrakenClient:
                             'raw_asset': asset
                         })
                 return holdings
+            return _venue_failure(self, f"Kraken error: {response.status_code} - {response.text}")
+        except VenueError:
+            raise
         except Exception as e:
-            print(f"Kraken fetch error: {e}")
-        
-        return []
+            return _venue_failure(self, f"Kraken fetch error: {e}", e)
     
     def _normalize_symbol(self, kraken_asset: str) -> str:
         """Convert Kraken asset codes to standard symbols."""
@@ -174,10 +212,14 @@ class OKXClient:
     
     BASE_URL = "https://www.okx.com"
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, timeout: float = 10,
+                 raise_errors: bool = False):
         self.api_key = os.environ.get('OKX_API_KEY', '')
         self.api_secret = os.environ.get('OKX_SECRET_KEY', '')
         self.passphrase = os.environ.get('OKX_PASSPHRASE', '')
+        self.session = session or get_http_session()
+        self.timeout = timeout
+        self.raise_errors = raise_errors  # aggregator: failures must not read as "no holdings"
     
     def _sign_request(self, method: str, path: str, body: str = '') -> Dict[str, str]:
         """Create OKX API signature headers."""
@@ -213,13 +255,12 @@ class OKXClient:
             path = '/api/v5/account/balance'
             headers = self._sign_request('GET', path)
             
-            response = requests.get(f"{self.BASE_URL}{path}", headers=headers, timeout=10)
+            response = self.session.get(f"{self.BASE_URL}{path}", headers=headers, timeout=self.timeout)
             
             if response.status_code == 200:
                 result = response.json()
                 if result.get('code') != '0':
-                    print(f"OKX API error: {result.get('msg')}")
-                    return []
+                    return _venue_failure(self, f"OKX API error: {result.get('msg')}")
                 
                 holdings = []
                 for account in result.get('data', []):
@@ -237,10 +278,11 @@ class OKXClient:
                                 'source': 'okx'
                             })
                 return holdings
+            return _venue_failure(self, f"OKX error: {response.status_code} - {response.text}")
+        except VenueError:
+            raise
         except Exception as e:
-            print(f"OKX fetch error: {e}")
-        
-        return []
+            return _venue_failure(self, f"OKX fetch error: {e}", e)
 
 
 class BinanceUSClient:
@@ -248,9 +290,13 @@ class BinanceUSClient:
     
     BASE_URL = "https://api.binance.us"
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, timeout: float = 10,
+                 raise_errors: bool = False):
         self.api_key = os.environ.get('BINANCE_US_API_KEY', '')
         self.api_secret = os.environ.get('BINANCE_US_SECRET_KEY', '')
+        self.session = session or get_http_session()
+        self.timeout = timeout
+        self.raise_errors = raise_errors  # aggregator: failures must not read as "no holdings"
     
     def _sign_request(self, params: Dict) -> str:
         """Create Binance.US HMAC-SHA256 signature."""
@@ -281,11 +327,11 @@ class BinanceUSClient:
             
             headers = {'X-MBX-APIKEY': self.api_key}
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.BASE_URL}{endpoint}",
                 headers=headers,
                 params=params,
-                timeout=10
+                timeout=self.timeout
             )
             
             if response.status_code == 200:
@@ -306,9 +352,8 @@ class BinanceUSClient:
                             'source': 'binance_us'
                         })
                 return holdings
-            else:
-                print(f"Binance.US error: {response.status_code} - {response.text}")
+            return _venue_failure(self, f"Binance.US error: {response.status_code} - {response.text}")
+        except VenueError:
+            raise
         except Exception as e:
-            print(f"Binance.US fetch error: {e}")
-        
-        return []
+            return _venue_failure(self, f"Binance.US fetch error: {e}", e)
@@ -1,60 +1,218 @@
 """
 Manual Ledger Service for Portfolio Holdings
 Stores and manages manual entries for wallets/holdings not on exchanges
+
+Backed by SQLite (WAL) instead of rewriting one JSON file per mutation:
+- entries are indexed by id, symbol and source
+- aggregated holdings live in their own table, kept current by triggers on
+  every insert/update/delete, so reading them is O(symbols)
+- exchange CSV exports import in a single transaction and are idempotent
+- an existing ledger.json is migrated on first open (ids preserved)
 """
 
-import os
+import csv
+import hashlib
+import io
 import json
+import logging
+import os
+import re
+import sqlite3
 import uuid
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
 from datetime import datetime
-from threading import Lock
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
 
 LEDGER_FILE = "ledger.json"
-file_lock = Lock()
+
+ALLOWED_FIELDS = ['symbol', 'amount', 'source', 'cost_basis', 'date_acquired', 'notes', 'tags']
+
+# Header aliases for exchange exports (Coinbase, Kraken, generic), lowercase
+CSV_COLUMNS = {
+    'id': ['id', 'transaction id', 'trade id', 'txid', 'refid'],
+    'symbol': ['symbol', 'asset', 'asset name', 'currency', 'coin', 'asset symbol'],
+    'amount': ['amount', 'quantity', 'quantity transacted', 'quantity acquired', 'size', 'vol'],
+    'cost_basis': ['cost basis', 'cost basis (usd)', 'total (inclusive of fees and/or spread)',
+                   'subtotal', 'cost', 'cost basis usd'],
+    'date_acquired': ['date acquired', 'timestamp', 'date', 'time', 'date acquired (utc)'],
+    'side': ['transaction type', 'type', 'side'],
+    'notes': ['notes', 'description'],
+}
+OUTFLOW_TYPES = {'sell', 'send', 'withdrawal', 'withdraw', 'convert', 'convert_from', 'disposal'}
+# Coinbase writes a conversion as one row for the source asset; the note names the other leg
+CONVERTED_RE = re.compile(r'converted\s+([\d.,]+)\s+(\w+)\s+to\s+([\d.,]+)\s+(\w+)', re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    amount REAL NOT NULL DEFAULT 0,
+    source TEXT NOT NULL DEFAULT 'manual',
+    cost_basis REAL,
+    date_acquired TEXT,
+    notes TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    external_id TEXT UNIQUE
+);
+CREATE INDEX IF NOT EXISTS idx_entries_symbol ON entries(symbol);
+CREATE INDEX IF NOT EXISTS idx_entries_source ON entries(source COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS holdings (
+    symbol TEXT PRIMARY KEY,
+    amount REAL NOT NULL DEFAULT 0,
+    cost_basis REAL NOT NULL DEFAULT 0,
+    entries INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT OR IGNORE INTO holdings(symbol) VALUES (NEW.symbol);
+    UPDATE holdings SET amount = amount + NEW.amount,
+                        cost_basis = cost_basis + COALESCE(NEW.cost_basis, 0),
+                        entries = entries + 1
+    WHERE symbol = NEW.symbol;
+END;
+
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    UPDATE holdings SET amount = amount - OLD.amount,
+                        cost_basis = cost_basis - COALESCE(OLD.cost_basis, 0),
+                        entries = entries - 1
+    WHERE symbol = OLD.symbol;
+    DELETE FROM holdings WHERE symbol = OLD.symbol AND entries <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE OF symbol, amount, cost_basis ON entries BEGIN
+    UPDATE holdings SET amount = amount - OLD.amount,
+                        cost_basis = cost_basis - COALESCE(OLD.cost_basis, 0),
+                        entries = entries - 1
+    WHERE symbol = OLD.symbol;
+    DELETE FROM holdings WHERE symbol = OLD.symbol AND entries <= 0;
+    INSERT OR IGNORE INTO holdings(symbol) VALUES (NEW.symbol);
+    UPDATE holdings SET amount = amount + NEW.amount,
+                        cost_basis = cost_basis + COALESCE(NEW.cost_basis, 0),
+                        entries = entries + 1
+    WHERE symbol = NEW.symbol;
+END;
+"""
+
+
+def _parse_number(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    text = str(value).strip().replace(',', '').replace('$', '')
+    if not text:
+        return None
+    if text.startswith('(') and text.endswith(')'):
+        text = '-' + text[1:-1]
+    try:
+        return float(text)
+    except ValueError:
+        return None
 
 
 class LedgerService:
     """Service for managing manual portfolio ledger entries."""
-    
-    def __init__(self, ledger_path: str = LEDGER_FILE):
+
+    def __init__(self, ledger_path: str = LEDGER_FILE, db_path: Optional[str] = None):
         self.ledger_path = ledger_path
-        self._ensure_file_exists()
-    
-    def _ensure_file_exists(self):
-        """Create ledger file if it doesn't exist."""
-        if not os.path.exists(self.ledger_path):
-            self._save_ledger({'entries': [], 'last_updated': datetime.now().isoformat()})
-    
-    def _load_ledger(self) -> Dict[str, Any]:
-        """Load ledger from file."""
-        with file_lock:
+        if db_path is None:
+            db_path = ledger_path if ledger_path.endswith('.db') else str(Path(ledger_path).with_suffix('.db'))
+        self.db_path = db_path
+        self._lock = RLock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self._init_database()
+        self._migrate_json()
+
+    def _init_database(self):
+        """Create tables, indexes and holdings triggers."""
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT/ROLLBACK (caller holds self._lock)."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def _migrate_json(self):
+        """One-time import of the legacy ledger.json, preserving ids."""
+        if self.ledger_path.endswith('.db') or not os.path.exists(self.ledger_path):
+            return
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone():
+                return
             try:
                 with open(self.ledger_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return {'entries': [], 'last_updated': datetime.now().isoformat()}
-    
-    def _save_ledger(self, data: Dict[str, Any]):
-        """Save ledger to file."""
-        with file_lock:
-            data['last_updated'] = datetime.now().isoformat()
-            with open(self.ledger_path, 'w') as f:
-                json.dump(data, f, indent=2)
-    
+                    entries = json.load(f).get('entries', [])
+            except (json.JSONDecodeError, OSError):
+                entries = []
+            with self._transaction() as conn:
+                self._insert_rows(conn, entries)
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('migrated_json', ?)",
+                             (datetime.now().isoformat(),))
+        if entries:
+            logger.info(f"Migrated {len(entries)} ledger entries from {self.ledger_path} to {self.db_path}")
+
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        entry = dict(row)
+        entry.pop('external_id', None)
+        entry['tags'] = json.loads(entry.get('tags') or '[]')
+        return entry
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self._row_to_entry(r) for r in self.conn.execute(sql, tuple(params))]
+
+    def _insert_rows(self, conn: sqlite3.Connection, entries: Iterable[Dict[str, Any]]):
+        now = datetime.now().isoformat()
+        rows = [(
+            e.get('id') or str(uuid.uuid4()),
+            str(e.get('symbol', '')).upper(),
+            e.get('amount') or 0,
+            e.get('source') or 'manual',
+            e.get('cost_basis'),
+            e.get('date_acquired') or now[:10],
+            e.get('notes'),
+            json.dumps(e.get('tags') or []),
+            e.get('created_at') or now,
+            e.get('updated_at') or now,
+            e.get('external_id')
+        ) for e in entries]
+        conn.executemany("""
+            INSERT OR IGNORE INTO entries (
+                id, symbol, amount, source, cost_basis, date_acquired,
+                notes, tags, created_at, updated_at, external_id
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
     def get_all_entries(self) -> List[Dict[str, Any]]:
         """Get all ledger entries."""
-        ledger = self._load_ledger()
-        return ledger.get('entries', [])
-    
+        return self._query("SELECT * FROM entries ORDER BY rowid")
+
     def get_entry(self, entry_id: str) -> Optional[Dict[str, Any]]:
         """Get a single entry by ID."""
-        entries = self.get_all_entries()
-        for entry in entries:
-            if entry.get('id') == entry_id:
-                return entry
-        return None
-    
+        rows = self._query("SELECT * FROM entries WHERE id = ?", (entry_id,))
+        return rows[0] if rows else None
+
     def add_entry(
         self,
         symbol: str,
@@ -78,81 +236,187 @@ class LedgerService:
             'created_at': datetime.now().isoformat(),
             'updated_at': datetime.now().isoformat()
         }
-        
-        ledger = self._load_ledger()
-        ledger['entries'].append(entry)
-        self._save_ledger(ledger)
-        
+
+        with self._lock, self._transaction() as conn:
+            self._insert_rows(conn, [entry])
+
         return entry
-    
+
     def update_entry(self, entry_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an existing ledger entry."""
-        ledger = self._load_ledger()
-        entries = ledger.get('entries', [])
-        
-        for i, entry in enumerate(entries):
-            if entry.get('id') == entry_id:
-                allowed_fields = ['symbol', 'amount', 'source', 'cost_basis', 'date_acquired', 'notes', 'tags']
-                for field in allowed_fields:
-                    if field in updates:
-                        if field == 'symbol':
-                            entries[i][field] = updates[field].upper()
-                        else:
-                            entries[i][field] = updates[field]
-                entries[i]['updated_at'] = datetime.now().isoformat()
-                ledger['entries'] = entries
-                self._save_ledger(ledger)
-                return entries[i]
-        
-        return None
-    
+        changes = {}
+        for field in ALLOWED_FIELDS:
+            if field in updates:
+                if field == 'symbol':
+                    changes[field] = updates[field].upper()
+                elif field == 'tags':
+                    changes[field] = json.dumps(updates[field] or [])
+                else:
+                    changes[field] = updates[field]
+        changes['updated_at'] = datetime.now().isoformat()
+
+        assignments = ', '.join(f"{field} = ?" for field in changes)
+        with self._lock:
+            with self._transaction() as conn:
+                cursor = conn.execute(f"UPDATE entries SET {assignments} WHERE id = ?",
+                                      (*changes.values(), entry_id))
+            if cursor.rowcount == 0:
+                return None
+            return self.get_entry(entry_id)
+
     def delete_entry(self, entry_id: str) -> bool:
         """Delete a ledger entry."""
-        ledger = self._load_ledger()
-        entries = ledger.get('entries', [])
-        original_count = len(entries)
-        
-        entries = [e for e in entries if e.get('id') != entry_id]
-        
-        if len(entries) < original_count:
-            ledger['entries'] = entries
-            self._save_ledger(ledger)
-            return True
-        return False
-    
+        with self._lock, self._transaction() as conn:
+            return conn.execute("DELETE FROM entries WHERE id = ?", (entry_id,)).rowcount > 0
+
     def get_by_symbol(self, symbol: str) -> List[Dict[str, Any]]:
         """Get all entries for a specific symbol."""
-        entries = self.get_all_entries()
-        return [e for e in entries if e.get('symbol', '').upper() == symbol.upper()]
-    
+        return self._query("SELECT * FROM entries WHERE symbol = ? ORDER BY rowid", (symbol.upper(),))
+
     def get_by_source(self, source: str) -> List[Dict[str, Any]]:
         """Get all entries from a specific source."""
-        entries = self.get_all_entries()
-        return [e for e in entries if e.get('source', '').lower() == source.lower()]
-    
+        return self._query("SELECT * FROM entries WHERE source = ? COLLATE NOCASE ORDER BY rowid", (source,))
+
     def get_aggregated_holdings(self) -> Dict[str, float]:
         """Get aggregated holdings by symbol."""
-        entries = self.get_all_entries()
-        holdings = {}
-        for entry in entries:
-            symbol = entry.get('symbol', '').upper()
-            amount = entry.get('amount', 0)
-            holdings[symbol] = holdings.get(symbol, 0) + amount
-        return holdings
-    
+        with self._lock:
+            return {row['symbol']: row['amount']
+                    for row in self.conn.execute("SELECT symbol, amount FROM holdings ORDER BY symbol")}
+
     def get_stats(self) -> Dict[str, Any]:
         """Get ledger statistics."""
-        entries = self.get_all_entries()
-        symbols = set(e.get('symbol', '') for e in entries)
-        sources = set(e.get('source', '') for e in entries)
-        
-        total_cost_basis = sum(e.get('cost_basis', 0) or 0 for e in entries)
-        
+        with self._lock:
+            total_entries, total_cost_basis = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(cost_basis), 0) FROM entries").fetchone()
+            symbols = [r[0] for r in self.conn.execute("SELECT symbol FROM holdings")]
+            sources = [r[0] for r in self.conn.execute("SELECT DISTINCT source FROM entries")]
+
         return {
-            'total_entries': len(entries),
+            'total_entries': total_entries,
             'unique_symbols': len(symbols),
             'unique_sources': len(sources),
-            'symbols': list(symbols),
-            'sources': list(sources),
+            'symbols': symbols,
+            'sources': sources,
             'total_cost_basis': total_cost_basis
         }
+
+    def import_csv(
+        self,
+        csv_file: Union[str, os.PathLike, io.TextIOBase],
+        source: str = 'coinbase',
+        columns: Optional[Dict[str, str]] = None,
+        tags: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Import an exchange CSV export in one transaction.
+
+        Headers are matched case-insensitively against CSV_COLUMNS (override
+        with `columns={'symbol': 'Asset', ...}`). Sells/sends/converts are
+        stored as negative amounts that carry the pro-rata share of the
+        symbol's cost basis (negated), not the sale proceeds. A Coinbase
+        "Converted X A to Y B" row also adds the B leg, with the row's value
+        as its cost basis. Rows are keyed by source + transaction id (or a
+        hash of the row), so re-importing the same export adds nothing.
+        Any malformed row aborts the whole import.
+        """
+        if isinstance(csv_file, (str, os.PathLike)):
+            with open(csv_file, 'r', newline='', encoding='utf-8-sig') as f:
+                return self.import_csv(f, source=source, columns=columns, tags=tags)
+
+        # Coinbase exports start with a few lines of preamble before the header
+        lines = [line for line in csv_file if line.strip()]
+        for start, line in enumerate(lines):
+            cells = {c.strip().lower() for c in next(csv.reader([line]), [])}
+            if cells & set(CSV_COLUMNS['symbol']) and cells & set(CSV_COLUMNS['amount']):
+                break
+        else:
+            start = 0
+        reader = csv.DictReader(lines[start:])
+        headers = {h.strip().lower(): h for h in (reader.fieldnames or [])}
+        mapping = {}
+        for field, aliases in CSV_COLUMNS.items():
+            if columns and field in columns:
+                mapping[field] = columns[field]
+                continue
+            mapping[field] = next((headers[a] for a in aliases if a in headers), None)
+        if not mapping['symbol'] or not mapping['amount']:
+            raise ValueError(f"CSV needs symbol and amount columns, got {reader.fieldnames}")
+
+        entries = []
+        for line_no, row in enumerate(reader, start=start + 2):
+            get = lambda field: (row.get(mapping[field]) or '').strip() if mapping[field] else ''
+            amount = _parse_number(get('amount'))
+            if not get('symbol') or amount is None:
+                raise ValueError(f"Line {line_no}: missing symbol or amount")
+            side = get('side').lower().replace(' ', '_')
+            if side in OUTFLOW_TYPES and amount > 0:
+                amount = -amount
+            row_id = get('id') or hashlib.sha1(
+                json.dumps(row, sort_keys=True).encode()).hexdigest()
+            entry = {
+                'symbol': get('symbol'),
+                'amount': amount,
+                'source': source,
+                'cost_basis': _parse_number(get('cost_basis')),
+                'date_acquired': get('date_acquired')[:10] or None,
+                'notes': get('notes') or (side or None),
+                'tags': tags or ['import'],
+                'external_id': f"{source}:{row_id}"
+            }
+            entries.append(entry)
+            converted = CONVERTED_RE.search(get('notes')) if side == 'convert' else None
+            received = _parse_number(converted.group(3)) if converted else None
+            if received is not None:
+                entries.append({
+                    **entry,
+                    'symbol': converted.group(4),
+                    'amount': received,
+                    'external_id': f"{source}:{row_id}:to"
+                })
+
+        with self._lock:
+            before = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            with self._transaction() as conn:
+                self._insert_rows(conn, self._with_outflow_basis(conn, entries))
+            imported = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] - before
+
+        logger.info(f"Imported {imported}/{len(entries)} {source} rows into ledger")
+        return {'imported': imported, 'skipped': len(entries) - imported, 'rows': len(entries)}
+
+    @staticmethod
+    def _with_outflow_basis(conn: sqlite3.Connection, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        New import rows, in file order, with outflows costed at the running
+        average basis (holdings so far plus earlier rows of this import).
+        """
+        ids = [e['external_id'] for e in entries]
+        existing = set()
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            existing.update(r[0] for r in conn.execute(
+                f"SELECT external_id FROM entries WHERE external_id IN ({','.join('?' * len(chunk))})", chunk))
+
+        held: Dict[str, List[float]] = {}
+        fresh = []
+        for entry in entries:
+            if entry['external_id'] in existing:
+                continue
+            symbol = entry['symbol'].upper()
+            if symbol not in held:
+                row = conn.execute("SELECT amount, cost_basis FROM holdings WHERE symbol = ?", (symbol,)).fetchone()
+                held[symbol] = [row[0], row[1]] if row else [0.0, 0.0]
+            position = held[symbol]
+            if entry['amount'] < 0:
+                # Proceeds are not basis: release the disposed share of what was paid
+                quantity = min(-entry['amount'], position[0])
+                entry = {**entry, 'cost_basis': (
+                    -position[1] * quantity / position[0] if quantity > 0 and position[1] > 0 else None)}
+            position[0] += entry['amount']
+            position[1] += entry['cost_basis'] or 0
+            existing.add(entry['external_id'])
+            fresh.append(entry)
+        return fresh
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -6,13 +6,16 @@ Produces Smart Asset Scores from technical, on-chain, fundamental, and sentiment
 
 import json
 import os
-from typing import Dict, Any, Optional, List
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from typing import Callable, Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 
 # Import sub-clients
-from .market_data_client import MarketDataClient
+from .market_data_client import MarketDataClient, seconds_until_candle_close
 from .onchain_client import OnChainClient
 from .text_sources_client import TextSourcesClient
 
@@ -60,12 +63,40 @@ class SynopticCore:
         "sentiment": 0.20
     }
 
+    # Per-stream cache lifetime in seconds. Technicals are valid until the
+    # current candle closes (None = candle-aligned), fundamentals for a day.
+    STREAM_TTLS = {
+        "technical": None,
+        "on_chain": 900,
+        "fundamental": 86400,
+        "sentiment": 1800
+    }
+
+    # Per-stream wall-clock budget when gathering concurrently
+    STREAM_TIMEOUTS = {
+        "technical": 20.0,
+        "on_chain": 15.0,
+        "fundamental": 20.0,
+        "sentiment": 15.0
+    }
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.market_client = MarketDataClient()
         self.onchain_client = OnChainClient()
         self.text_client = TextSourcesClient()
 
+        self.stream_ttls = {**self.STREAM_TTLS, **self.config.get("stream_ttls", {})}
+        self.stream_timeouts = {**self.STREAM_TIMEOUTS, **self.config.get("stream_timeouts", {})}
+
+        # Stream results cached per (stream, asset, params) -> (expires_at, result)
+        self._stream_cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.config.get("max_workers", 16),
+            thread_name_prefix="synoptic"
+        )
+
         # Load system prompt
         self.system_prompt = self._load_system_prompt()
 
@@ -102,11 +133,164 @@ class SynopticCore:
         Returns:
             SmartAssetScore with thesis and recommendations
         """
-        # Gather all data streams
-        technical_data = self._get_technical_signals(asset, timeframe, lookback_days)
-        onchain_data = self._get_onchain_signals(asset, lookback_days)
-        fundamental_data = self._get_fundamental_signals(asset)
-        sentiment_data = self._get_sentiment_signals(asset)
+        # Gather all data streams concurrently
+        futures = self._submit_streams(asset, timeframe, lookback_days)
+        streams = self._collect_streams(futures, time.monotonic())
+        return self._build_score(asset, streams)
+
+    def assess_many(
+        self,
+        assets: List[str],
+        timeframe: str = "1d",
+        lookback_days: int = 30
+    ) -> Dict[str, SmartAssetScore]:
+        """
+        Assess a whole watchlist in one pass
+
+        Market-wide inputs are fetched once and shared by every asset: a
+        single DeFiLlama /protocols request for TVL and one Fear & Greed
+        reading. All per-asset streams then run concurrently.
+
+        Args:
+            assets: Asset symbols
+            timeframe: Data timeframe (1h, 4h, 1d)
+            lookback_days: How many days of data to analyze
+
+        Returns:
+            Dict of asset -> SmartAssetScore (input order preserved)
+        """
+        assets = list(dict.fromkeys(assets))
+
+        tvl_future = self._pool.submit(self.onchain_client.get_tvl_bulk, assets)
+        fg_future = self._pool.submit(self.text_client.get_fear_greed)
+        try:
+            tvl_map = tvl_future.result(timeout=self.stream_timeouts["on_chain"])
+        except Exception:
+            tvl_map = {}
+        try:
+            fear_greed = fg_future.result(timeout=self.stream_timeouts["sentiment"])
+        except Exception:
+            fear_greed = None
+
+        pending = {
+            asset: self._submit_streams(
+                asset, timeframe, lookback_days,
+                tvl=tvl_map.get(asset), fear_greed=fear_greed
+            )
+            for asset in assets
+        }
+        started = time.monotonic()
+
+        return {
+            asset: self._build_score(asset, self._collect_streams(futures, started))
+            for asset, futures in pending.items()
+        }
+
+    # =========================================================================
+    # STREAM GATHERING
+    # =========================================================================
+
+    def _submit_streams(
+        self,
+        asset: str,
+        timeframe: str,
+        lookback_days: int,
+        tvl: Optional[Dict[str, Any]] = None,
+        fear_greed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Start all four data streams for an asset on the shared pool"""
+        calls = {
+            "technical": (
+                (asset, timeframe, lookback_days),
+                lambda: self._get_technical_signals(asset, timeframe, lookback_days)
+            ),
+            "on_chain": (
+                (asset, lookback_days),
+                lambda: self._get_onchain_signals(asset, lookback_days, tvl=tvl)
+            ),
+            "fundamental": (
+                (asset,),
+                lambda: self._get_fundamental_signals(asset)
+            ),
+            "sentiment": (
+                (asset,),
+                lambda: self._get_sentiment_signals(asset, fear_greed=fear_greed)
+            ),
+        }
+        ttl_params = {"technical": timeframe}
+
+        return {
+            stream: self._pool.submit(
+                self._cached_stream, stream, key, fetch, ttl_params.get(stream)
+            )
+            for stream, (key, fetch) in calls.items()
+        }
+
+    def _collect_streams(self, futures: Dict[str, Any], started: float) -> Dict[str, Dict[str, Any]]:
+        """Wait for each stream up to its own timeout (measured from `started`)"""
+        streams = {}
+        for stream, future in futures.items():
+            timeout = self.stream_timeouts[stream]
+            remaining = max(0.0, timeout - (time.monotonic() - started))
+            try:
+                streams[stream] = future.result(timeout=remaining)
+            except FuturesTimeout:
+                streams[stream] = {
+                    "data": {},
+                    "signals": [f"{stream.replace('_', '-').title()} data timed out after {timeout:.0f}s"],
+                    "score_factors": {}
+                }
+            except Exception as e:
+                streams[stream] = {
+                    "data": {},
+                    "signals": [f"{stream.replace('_', '-').title()} data unavailable: {e}"],
+                    "score_factors": {}
+                }
+        return streams
+
+    def _cached_stream(
+        self,
+        stream: str,
+        key: tuple,
+        fetch: Callable[[], Dict[str, Any]],
+        timeframe: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Serve a stream from the TTL cache, fetching on miss"""
+        cache_key = (stream,) + key
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._stream_cache.get(cache_key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        result = fetch()
+
+        # Failed fetches come back with empty data, or with placeholder data the
+        # clients mark "unavailable" - don't pin either in cache
+        data = result.get("data")
+        if data and data.get("data_source") != "unavailable":
+            ttl = self.stream_ttls.get(stream)
+            if ttl is None:
+                ttl = seconds_until_candle_close(timeframe or "1d")
+            with self._cache_lock:
+                self._stream_cache[cache_key] = (time.monotonic() + ttl, result)
+        return result
+
+    def clear_cache(self, stream: Optional[str] = None):
+        """Drop cached stream results (all, or a single stream)"""
+        with self._cache_lock:
+            if stream is None:
+                self._stream_cache.clear()
+            else:
+                for key in [k for k in self._stream_cache if k[0] == stream]:
+                    del self._stream_cache[key]
+
+    def _build_score(self, asset: str, streams: Dict[str, Dict[str, Any]]) -> SmartAssetScore:
+        """Score gathered streams into a SmartAssetScore"""
+        technical_data = streams["technical"]
+        onchain_data = streams["on_chain"]
+        fundamental_data = streams["fundamental"]
+        sentiment_data = streams["sentiment"]
 
         # Calculate component scores
         technical_score = self._score_technical(technical_data)
@@ -221,10 +405,15 @@ class SynopticCore:
         except Exception as e:
             return {"data": {}, "signals": [f"Technical data unavailable: {e}"], "score_factors": {}}
 
-    def _get_onchain_signals(self, asset: str, days: int) -> Dict[str, Any]:
+    def _get_onchain_signals(
+        self,
+        asset: str,
+        days: int,
+        tvl: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Gather on-chain analysis signals"""
         try:
-            onchain = self.onchain_client.get_metrics(asset, days)
+            onchain = self.onchain_client.get_metrics(asset, days, tvl=tvl)
             signals = []
 
             # Whale activity
@@ -309,10 +498,10 @@ class SynopticCore:
         except Exception as e:
             return {"data": {}, "signals": [f"Fundamental data unavailable: {e}"], "score_factors": {}}
 
-    def _get_sentiment_signals(self, asset: str) -> Dict[str, Any]:
+    def _get_sentiment_signals(self, asset: str, fear_greed: Optional[int] = None) -> Dict[str, Any]:
         """Gather sentiment analysis signals"""
         try:
-            sentiment = self.text_client.get_sentiment(asset)
+            sentiment = self.text_client.get_sentiment(asset, fear_greed=fear_greed)
             signals = []
 
             # Overall sentiment score
@@ -2,22 +2,184 @@
 """
 Market Data Client for Synoptic Core
 Provides OHLCV data and technical indicators
+
+OHLCV frames and their indicator frames are cached in-process, keyed by
+(exchange, symbol, timeframe), and stay valid until the current bar closes.
+Every MarketDataClient in the process (SynopticCore, OracleInterface,
+ArchitectForge verification) shares the same cache.
 """
 
+import time
+import threading
+from collections import OrderedDict
 import ccxt
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 
+TIMEFRAME_SECONDS = {
+    "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800,
+    "1h": 3600, "2h": 7200, "4h": 14400, "6h": 21600, "8h": 28800, "12h": 43200,
+    "1d": 86400, "3d": 259200, "1w": 604800,
+}
+
+
+def timeframe_seconds(timeframe: str) -> int:
+    """Candle length in seconds for a ccxt-style timeframe string"""
+    if timeframe in TIMEFRAME_SECONDS:
+        return TIMEFRAME_SECONDS[timeframe]
+    units = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+    try:
+        return int(timeframe[:-1]) * units[timeframe[-1]]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+
+def seconds_until_candle_close(timeframe: str, now: Optional[float] = None) -> float:
+    """Seconds until the current (UTC-aligned) candle closes"""
+    period = timeframe_seconds(timeframe)
+    now = time.time() if now is None else now
+    return period - (now % period)
+
+
+def compute_indicator_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Full indicator columns for an OHLCV frame (same index as df)
+
+    Column names match what ArchitectForge-generated strategies expect
+    (rsi, macd, macd_signal, macd_hist, ema_20, ema_50, bb_*).
+    """
+    close = df['close']
+    high = df['high']
+    low = df['low']
+    frame = pd.DataFrame(index=df.index)
+
+    # RSI (14-period)
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rs = gain / loss
+    frame['rsi'] = 100 - (100 / (1 + rs))
+
+    # EMAs
+    frame['ema_20'] = close.ewm(span=20).mean()
+    frame['ema_50'] = close.ewm(span=50).mean()
+
+    # MACD
+    ema_12 = close.ewm(span=12).mean()
+    ema_26 = close.ewm(span=26).mean()
+    frame['macd'] = ema_12 - ema_26
+    frame['macd_signal'] = frame['macd'].ewm(span=9).mean()
+    frame['macd_hist'] = frame['macd'] - frame['macd_signal']
+
+    # ATR (Average True Range)
+    tr = pd.concat([
+        high - low,
+        abs(high - close.shift()),
+        abs(low - close.shift())
+    ], axis=1).max(axis=1)
+    frame['atr'] = tr.rolling(window=14).mean()
+
+    # Bollinger Bands
+    frame['bb_mid'] = close.rolling(window=20).mean()
+    frame['bb_std'] = close.rolling(window=20).std()
+    frame['bb_upper'] = frame['bb_mid'] + 2 * frame['bb_std']
+    frame['bb_lower'] = frame['bb_mid'] - 2 * frame['bb_std']
+
+    # Volume
+    frame['volume_sma_20'] = df['volume'].rolling(window=20).mean()
+
+    return frame
+
+
+class _CacheEntry:
+    """One cached OHLCV series plus indicator frames derived from it"""
+
+    __slots__ = ("df", "since_ms", "expires_at", "indicators")
+
+    def __init__(self, df: pd.DataFrame, since_ms: int, expires_at: float):
+        self.df = df
+        self.since_ms = since_ms
+        self.expires_at = expires_at
+        # (first_ts, last_ts, rows) -> (indicator frame, summary dict)
+        self.indicators: Dict[tuple, Tuple[pd.DataFrame, Dict[str, Any]]] = {}
+
+
+class OHLCVCache:
+    """
+    Process-wide OHLCV / indicator cache with candle-boundary expiry
+
+    Keys are (exchange_id, pair, timeframe). An entry expires when the bar
+    that was open at fetch time closes, so a 1d entry fetched at 23:59 UTC
+    lives one minute and one fetched at 00:01 lives ~24h.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, since_ms: int) -> Optional[_CacheEntry]:
+        """Live entry covering `since_ms`, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.time() or entry.since_ms > since_ms:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def peek(self, key: tuple) -> Optional[_CacheEntry]:
+        """Live entry regardless of coverage (no hit/miss accounting)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.time():
+                return None
+            return entry
+
+    def put(self, key: tuple, df: pd.DataFrame, since_ms: int, timeframe: str) -> _CacheEntry:
+        entry = _CacheEntry(df, since_ms, time.time() + seconds_until_candle_close(timeframe))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "keys": [list(k) for k in self._entries]
+            }
+
+
+# Shared by every MarketDataClient in the process
+OHLCV_CACHE = OHLCVCache()
+
+
 class MarketDataClient:
     """
     Fetches market data and calculates technical indicators
     Uses CCXT for exchange data access
     """
 
-    def __init__(self, exchange_id: str = "kraken"):
+    def __init__(self, exchange_id: str = "kraken", cache: Optional[OHLCVCache] = None):
+        self.exchange_id = exchange_id
+        self.cache = cache if cache is not None else OHLCV_CACHE
         try:
             self.exchange = getattr(ccxt, exchange_id)({
                 'enableRateLimit': True,
@@ -45,22 +207,94 @@ class MarketDataClient:
         """
         # Map common symbols to exchange format
         pair = f"{symbol}/USDT" if "/" not in symbol else symbol
+        key = (self.exchange_id, pair, timeframe)
+        since = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
+
+        entry = self.cache.get(key, since)
+        if entry is not None:
+            return self._slice(entry.df, key, since)
 
         try:
             if self.exchange:
-                since = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
                 ohlcv = self.exchange.fetch_ohlcv(pair, timeframe, since=since)
 
                 df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
                 df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
                 df.set_index('timestamp', inplace=True)
-                return df
+                if not df.empty:
+                    self.cache.put(key, df, since, timeframe)
+                df.attrs['ohlcv_key'] = key
+                return df.copy()
         except Exception as e:
             print(f"Exchange fetch failed: {e}")
 
         # Return mock data for development/offline use
         return self._mock_ohlcv(symbol, days)
 
+    @staticmethod
+    def _slice(df: pd.DataFrame, key: tuple, since_ms: int) -> pd.DataFrame:
+        """Copy of the cached rows at or after `since_ms`, tagged with its cache key"""
+        out = df.loc[df.index >= pd.to_datetime(since_ms, unit='ms')].copy()
+        out.attrs['ohlcv_key'] = key
+        return out
+
+    def get_indicator_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Indicator columns for an OHLCV frame
+
+        Frames returned by get_ohlcv carry their cache key, so the indicator
+        frame is computed once per bar and shared by every consumer asking
+        for the same rows. Other frames are computed directly.
+        """
+        return self._indicators_for(df)[0].copy()
+
+    def _indicators_for(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        key = df.attrs.get('ohlcv_key')
+        entry = self.cache.peek(key) if key is not None else None
+        signature = (df.index[0], df.index[-1], len(df))
+
+        if entry is not None:
+            cached = entry.indicators.get(signature)
+            if cached is not None:
+                return cached
+
+        frame = compute_indicator_frame(df)
+        computed = (frame, self._summarize(df, frame))
+        if entry is not None and signature[1] <= entry.df.index[-1]:
+            entry.indicators[signature] = computed
+        return computed
+
+    @staticmethod
+    def _summarize(df: pd.DataFrame, frame: pd.DataFrame) -> Dict[str, Any]:
+        """Latest-bar indicator dict (the get_indicators contract)"""
+        last = frame.iloc[-1]
+        close = float(df['close'].iloc[-1])
+
+        indicators = {
+            'close': close,
+            'high_period': float(df['high'].max()),
+            'low_period': float(df['low'].min())
+        }
+        indicators['rsi'] = float(last['rsi']) if not pd.isna(last['rsi']) else 50
+        indicators['ema_20'] = float(last['ema_20'])
+        indicators['ema_50'] = float(last['ema_50'])
+        indicators['macd'] = {
+            'macd': float(last['macd']),
+            'signal': float(last['macd_signal']),
+            'histogram': float(last['macd_hist'])
+        }
+        indicators['atr'] = float(last['atr']) if not pd.isna(last['atr']) else 0
+        indicators['atr_pct'] = (indicators['atr'] / indicators['close']) * 100
+        indicators['bb_upper'] = float(last['bb_upper'])
+        indicators['bb_lower'] = float(last['bb_lower'])
+        indicators['bb_middle'] = float(last['bb_mid'])
+
+        avg_volume = last['volume_sma_20']
+        current_volume = df['volume'].iloc[-1]
+        indicators['volume_ratio'] = float(current_volume / avg_volume) if avg_volume > 0 else 1.0
+
+        return indicators
+
     def _mock_ohlcv(self, symbol: str, days: int) -> pd.DataFrame:
         """Generate mock OHLCV data for testing"""
         # Base prices for common assets
@@ -104,64 +338,8 @@ class MarketDataClient:
         if df.empty:
             return {}
 
-        close = df['close']
-        high = df['high']
-        low = df['low']
-
-        indicators = {
-            'close': float(close.iloc[-1]),
-            'high_period': float(high.max()),
-            'low_period': float(low.min())
-        }
-
-        # RSI (14-period)
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        indicators['rsi'] = float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50
-
-        # EMAs
-        indicators['ema_20'] = float(close.ewm(span=20).mean().iloc[-1])
-        indicators['ema_50'] = float(close.ewm(span=50).mean().iloc[-1])
-
-        # MACD
-        ema_12 = close.ewm(span=12).mean()
-        ema_26 = close.ewm(span=26).mean()
-        macd_line = ema_12 - ema_26
-        signal_line = macd_line.ewm(span=9).mean()
-        histogram = macd_line - signal_line
-
-        indicators['macd'] = {
-            'macd': float(macd_line.iloc[-1]),
-            'signal': float(signal_line.iloc[-1]),
-            'histogram': float(histogram.iloc[-1])
-        }
-
-        # ATR (Average True Range)
-        tr = pd.concat([
-            high - low,
-            abs(high - close.shift()),
-            abs(low - close.shift())
-        ], axis=1).max(axis=1)
-        atr = tr.rolling(window=14).mean().iloc[-1]
-        indicators['atr'] = float(atr) if not pd.isna(atr) else 0
-        indicators['atr_pct'] = (indicators['atr'] / indicators['close']) * 100
-
-        # Bollinger Bands
-        sma_20 = close.rolling(window=20).mean()
-        std_20 = close.rolling(window=20).std()
-        indicators['bb_upper'] = float((sma_20 + 2 * std_20).iloc[-1])
-        indicators['bb_lower'] = float((sma_20 - 2 * std_20).iloc[-1])
-        indicators['bb_middle'] = float(sma_20.iloc[-1])
-
-        # Volume analysis
-        avg_volume = df['volume'].rolling(window=20).mean().iloc[-1]
-        current_volume = df['volume'].iloc[-1]
-        indicators['volume_ratio'] = float(current_volume / avg_volume) if avg_volume > 0 else 1.0
-
-        return indicators
+        summary = self._indicators_for(df)[1]
+        return {k: (dict(v) if isinstance(v, dict) else v) for k, v in summary.items()}
 
 
 # Test
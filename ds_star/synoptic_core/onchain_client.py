@@ -7,7 +7,7 @@ Provides whale movements, exchange flows, TVL, and address metrics
 import os
 import json
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
 
@@ -34,13 +34,19 @@ class OnChainClient:
             "AAVE": "0x7fc66500c84a76ad7e9c93437bfc5ac33e2ddae9"
         }
 
-    def get_metrics(self, asset: str, days: int = 30) -> Dict[str, Any]:
+    def get_metrics(
+        self,
+        asset: str,
+        days: int = 30,
+        tvl: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Get on-chain metrics for an asset
 
         Args:
             asset: Asset symbol (e.g., "BTC", "ETH", "SOL")
             days: Lookback period
+            tvl: Pre-fetched TVL entry (from get_tvl_bulk) - skips the per-asset call
 
         Returns:
             Dict with on-chain metrics
@@ -48,7 +54,7 @@ class OnChainClient:
         metrics = {}
 
         # Get TVL data from DeFiLlama (for DeFi protocols)
-        tvl_data = self._get_tvl(asset)
+        tvl_data = tvl if tvl is not None else self._get_tvl(asset)
         metrics.update(tvl_data)
 
         # Get whale/exchange flows (mocked for now, integrate real API later)
@@ -59,6 +65,8 @@ class OnChainClient:
         addr_data = self._get_address_metrics(asset, days)
         metrics.update(addr_data)
 
+        # A failed TVL lookup leaves neutral placeholders - mark the result
+        metrics["data_source"] = "unavailable" if tvl_data.get("tvl_source") == "unavailable" else "live"
         return metrics
 
     def _get_tvl(self, asset: str) -> Dict[str, Any]:
@@ -86,6 +94,9 @@ class OnChainClient:
                     "tvl_change_pct": tvl_change,
                     "tvl_source": "defillama"
                 }
+            if response.status_code in (400, 404):
+                # Not a DeFi protocol (BTC, XRP, ...) - a real answer, not a failure
+                return {"tvl_usd": 0, "tvl_change_pct": 0, "tvl_source": "none"}
         except Exception as e:
             pass
 
@@ -96,6 +107,44 @@ class OnChainClient:
             "tvl_source": "unavailable"
         }
 
+    def get_tvl_bulk(self, assets: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        TVL for many assets from one DeFiLlama /protocols request
+
+        Args:
+            assets: Asset symbols
+
+        Returns:
+            Dict of asset -> TVL entry (same shape as _get_tvl); assets with
+            no matching protocol get a neutral "none" entry, or "unavailable"
+            if the request itself failed
+        """
+        missing = {"tvl_usd": 0, "tvl_change_pct": 0, "tvl_source": "unavailable"}
+        wanted = {a.upper(): a for a in assets}
+        found: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            response = requests.get("https://api.llama.fi/protocols", timeout=15)
+            if response.status_code == 200:
+                missing = {**missing, "tvl_source": "none"}
+                for protocol in response.json():
+                    names = {
+                        str(protocol.get("slug", "")).upper(),
+                        str(protocol.get("name", "")).upper(),
+                    }
+                    for key in names & wanted.keys():
+                        if key in found:
+                            continue
+                        found[key] = {
+                            "tvl_usd": protocol.get("tvl") or 0,
+                            "tvl_change_pct": protocol.get("change_7d") or 0,
+                            "tvl_source": "defillama"
+                        }
+        except Exception:
+            pass
+
+        return {asset: dict(found.get(key, missing)) for key, asset in wanted.items()}
+
     def _get_flow_metrics(self, asset: str, days: int) -> Dict[str, Any]:
         """
         Get exchange and whale flow metrics
@@ -6,6 +6,8 @@ Provides fundamental data and sentiment analysis from text sources
 
 import os
 import json
+import time
+import threading
 import requests
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -41,6 +43,14 @@ class TextSourcesClient:
             "OP": "optimism"
         }
 
+        # One CoinGecko /coins/{id} document serves both fundamentals and
+        # sentiment, so the two streams share a single request per asset
+        self.detail_ttl = 1800
+        self._detail_cache: Dict[str, tuple] = {}
+        self._detail_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._fear_greed_cache: Optional[tuple] = None
+
     def get_fundamentals(self, asset: str) -> Dict[str, Any]:
         """
         Get fundamental data for an asset
@@ -57,62 +67,48 @@ class TextSourcesClient:
         # Get GitHub activity if available
         github_data = self._get_github_activity(asset)
 
-        # Merge data
+        # Merge data (placeholder fundamentals stay marked "unavailable")
         return {
             **cg_data,
             **github_data,
-            "data_source": "coingecko+github"
+            "data_source": cg_data.get("data_source", "coingecko+github")
         }
 
-    def get_sentiment(self, asset: str) -> Dict[str, Any]:
+    def get_sentiment(self, asset: str, fear_greed: Optional[int] = None) -> Dict[str, Any]:
         """
         Get sentiment data for an asset
 
         Args:
             asset: Asset symbol
+            fear_greed: Pre-fetched Fear & Greed value (shared across a batch)
 
         Returns:
             Dict with sentiment metrics
         """
         # Try to get from CoinGecko community data
-        cg_id = self.cg_ids.get(asset.upper(), asset.lower())
-
-        try:
-            url = f"https://api.coingecko.com/api/v3/coins/{cg_id}"
-            params = {
-                "localization": "false",
-                "tickers": "false",
-                "market_data": "false",
-                "community_data": "true",
-                "developer_data": "false"
+        data = self._get_coin_detail(asset)
+
+        if data is not None:
+            community = data.get("community_data") or {}
+            sentiment = data.get("sentiment_votes_up_percentage", 50)
+
+            # Calculate composite score
+            twitter_followers = community.get("twitter_followers") or 0
+            reddit_subscribers = community.get("reddit_subscribers") or 0
+
+            # Simple social volume score
+            social_score = min(100, (twitter_followers / 100000 + reddit_subscribers / 50000) * 10)
+
+            return {
+                "composite_score": int(sentiment if sentiment else 50),
+                "twitter_followers": twitter_followers,
+                "reddit_subscribers": reddit_subscribers,
+                "social_volume_change_pct": 0,  # Would need historical data
+                "fear_greed_index": fear_greed if fear_greed is not None else self._get_fear_greed(),
+                "social_score": social_score,
+                "data_source": "coingecko"
             }
 
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                community = data.get("community_data", {})
-                sentiment = data.get("sentiment_votes_up_percentage", 50)
-
-                # Calculate composite score
-                twitter_followers = community.get("twitter_followers", 0)
-                reddit_subscribers = community.get("reddit_subscribers", 0)
-
-                # Simple social volume score
-                social_score = min(100, (twitter_followers / 100000 + reddit_subscribers / 50000) * 10)
-
-                return {
-                    "composite_score": int(sentiment if sentiment else 50),
-                    "twitter_followers": twitter_followers,
-                    "reddit_subscribers": reddit_subscribers,
-                    "social_volume_change_pct": 0,  # Would need historical data
-                    "fear_greed_index": self._get_fear_greed(),
-                    "social_score": social_score
-                }
-
-        except Exception as e:
-            pass
-
         # Return neutral mock data
         return {
             "composite_score": 50,
@@ -120,43 +116,66 @@ class TextSourcesClient:
             "reddit_subscribers": 0,
             "social_volume_change_pct": 0,
             "fear_greed_index": 50,
-            "social_score": 50
+            "social_score": 50,
+            "data_source": "unavailable"
         }
 
-    def _get_coingecko_data(self, asset: str) -> Dict[str, Any]:
-        """Get data from CoinGecko API"""
-        cg_id = self.cg_ids.get(asset.upper(), asset.lower())
+    def _get_coin_detail(self, asset: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch (or reuse) the CoinGecko /coins/{id} document for an asset
 
-        try:
-            url = f"https://api.coingecko.com/api/v3/coins/{cg_id}"
-            params = {
-                "localization": "false",
-                "tickers": "false",
-                "market_data": "true",
-                "community_data": "false",
-                "developer_data": "true"
-            }
+        Concurrent callers for the same coin wait on one request.
+        """
+        cg_id = self.cg_ids.get(asset.upper(), asset.lower())
 
-            response = requests.get(url, params=params, timeout=10)
+        with self._locks_guard:
+            lock = self._detail_locks.setdefault(cg_id, threading.Lock())
 
-            if response.status_code == 200:
-                data = response.json()
-                dev_data = data.get("developer_data", {})
-                market_data = data.get("market_data", {})
+        with lock:
+            cached = self._detail_cache.get(cg_id)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
 
-                return {
-                    "github_commits_30d": dev_data.get("commit_count_4_weeks", 0),
-                    "github_stars": dev_data.get("stars", 0),
-                    "github_forks": dev_data.get("forks", 0),
-                    "last_major_update_days": 30,  # Would need additional API call
-                    "market_cap_rank": data.get("market_cap_rank", 999),
-                    "annual_inflation_pct": self._estimate_inflation(asset),
-                    "max_supply": market_data.get("max_supply"),
-                    "circulating_supply": market_data.get("circulating_supply")
+            try:
+                url = f"https://api.coingecko.com/api/v3/coins/{cg_id}"
+                params = {
+                    "localization": "false",
+                    "tickers": "false",
+                    "market_data": "true",
+                    "community_data": "true",
+                    "developer_data": "true"
                 }
 
-        except Exception as e:
-            pass
+                response = requests.get(url, params=params, timeout=10)
+
+                if response.status_code == 200:
+                    data = response.json()
+                    self._detail_cache[cg_id] = (time.monotonic() + self.detail_ttl, data)
+                    return data
+
+            except Exception:
+                pass
+
+            return None
+
+    def _get_coingecko_data(self, asset: str) -> Dict[str, Any]:
+        """Get data from CoinGecko API"""
+        data = self._get_coin_detail(asset)
+
+        if data is not None:
+            dev_data = data.get("developer_data") or {}
+            market_data = data.get("market_data") or {}
+
+            return {
+                "github_commits_30d": dev_data.get("commit_count_4_weeks", 0),
+                "github_stars": dev_data.get("stars", 0),
+                "github_forks": dev_data.get("forks", 0),
+                "last_major_update_days": 30,  # Would need additional API call
+                "market_cap_rank": data.get("market_cap_rank", 999),
+                "annual_inflation_pct": self._estimate_inflation(asset),
+                "max_supply": market_data.get("max_supply"),
+                "circulating_supply": market_data.get("circulating_supply")
+            }
 
         # Return mock data
         return {
@@ -167,7 +186,8 @@ class TextSourcesClient:
             "market_cap_rank": 999,
             "annual_inflation_pct": 2.0,
             "max_supply": None,
-            "circulating_supply": None
+            "circulating_supply": None,
+            "data_source": "unavailable"
         }
 
     def _get_github_activity(self, asset: str) -> Dict[str, Any]:
@@ -207,15 +227,24 @@ class TextSourcesClient:
 
         return {}
 
+    def get_fear_greed(self) -> int:
+        """Crypto Fear & Greed Index (market-wide - fetched once per hour)"""
+        return self._get_fear_greed()
+
     def _get_fear_greed(self) -> int:
         """Get Crypto Fear & Greed Index"""
+        if self._fear_greed_cache and self._fear_greed_cache[0] > time.monotonic():
+            return self._fear_greed_cache[1]
+
         try:
             url = "https://api.alternative.me/fng/"
             response = requests.get(url, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
-                return int(data["data"][0]["value"])
+                value = int(data["data"][0]["value"])
+                self._fear_greed_cache = (time.monotonic() + 3600, value)
+                return value
 
         except Exception:
             pass
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Ladder Simulator - Offline Ladder Scoring
+=====================================================
+
+Vectorized counterpart to SimulatedLadderEngine._run_ladder_simulation.
+Instead of playing one ladder out in real time, thousands of GBM or
+bootstrapped price paths are simulated as a NumPy matrix and every path's
+tier fills and TP1/TP2/SL/timeout exits are resolved at once.
+
+Phases match the live simulator: a 5 minute entry window during which
+tiers fill when price trades through them, then a 30 minute monitoring
+window. TP1 sells 60% of the position, TP2 the remaining 40%; a stop
+closes everything still held; whatever is open at the end of monitoring
+is closed at market (TIMEOUT).
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TIER_WEIGHTS = [0.30, 0.25, 0.20, 0.15, 0.08, 0.02]
+TP1_FRACTION = 0.6
+
+# Outcome codes
+NO_FILL, TP2_HIT, TP1_HIT, SL_HIT, TIMEOUT, COGNITIVE_EXIT = range(6)
+OUTCOME_NAMES = ['NO_FILL', 'TP2_HIT', 'TP1_HIT', 'SL_HIT', 'TIMEOUT', 'COGNITIVE_EXIT']
+
+SECONDS_PER_DAY = 86400.0
+
+
+def build_ladder_config(signal: Dict[str, Any], ray_score: float) -> Dict[str, Any]:
+    """6-tier ladder with weights biased toward the low end of the entry zone"""
+    entry_low = signal.get('entry_low', signal['entry_price'] * 0.995)
+    entry_high = signal.get('entry_high', signal['entry_price'] * 1.005)
+    capital = signal['capital']
+    tier_count = len(TIER_WEIGHTS)
+
+    tiers = []
+    for i, weight in enumerate(TIER_WEIGHTS):
+        # Calculate tier price (bias toward lower prices)
+        ratio = i / (tier_count - 1)
+        curved_ratio = ratio ** 1.2  # Curve for lower bias
+        price = entry_low + (entry_high - entry_low) * curved_ratio
+        tier_capital = capital * weight
+
+        tiers.append({
+            'tier': i + 1,
+            'price': round(price, 8),
+            'quantity': round(tier_capital / price, 6),
+            'capital': round(tier_capital, 2),
+            'weight': weight,
+            'filled': False,
+            'fill_time': None,
+            'fill_price': None
+        })
+
+    return {
+        'symbol': signal['symbol'],
+        'tiers': tiers,
+        'tp1_price': signal['tp1_price'],
+        'tp2_price': signal.get('tp2_price', signal['tp1_price'] * 1.1),
+        'sl_price': signal['sl_price'],
+        'total_capital': capital,
+        'ray_score': ray_score
+    }
+
+
+@dataclass
+class LadderOutcomes:
+    """Per-path results of one ladder evaluated over a path matrix"""
+    outcome: np.ndarray  # (P,) outcome codes
+    invested: np.ndarray  # (P,) capital deployed
+    proceeds: np.ndarray  # (P,) net exit proceeds
+    filled_tiers: np.ndarray  # (P,) tiers filled
+    max_drawdown_pct: np.ndarray  # (P,) peak-to-trough of position equity
+    exit_step: np.ndarray  # (P,) monitoring step of the final exit
+
+    @property
+    def pnl(self) -> np.ndarray:
+        return self.proceeds - self.invested
+
+    @property
+    def roi_pct(self) -> np.ndarray:
+        return np.divide(self.pnl, self.invested, out=np.zeros_like(self.pnl),
+                         where=self.invested > 0) * 100
+
+    def summary(self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)) -> Dict[str, Any]:
+        n = len(self.outcome)
+        pnl = self.pnl
+        filled = self.invested > 0
+        counts = np.bincount(self.outcome, minlength=len(OUTCOME_NAMES))
+        return {
+            'paths': n,
+            'hit_probabilities': {name: float(counts[i] / n) for i, name in enumerate(OUTCOME_NAMES)},
+            'fill_probability': float(filled.mean()),
+            'average_fill_rate': float(self.filled_tiers.mean() / len(TIER_WEIGHTS) * 100),
+            'expected_pnl_usd': float(pnl.mean()),
+            'expected_roi_pct': float(self.roi_pct[filled].mean()) if filled.any() else 0.0,
+            'profit_probability': float((pnl > 0).mean()),
+            'pnl_percentiles_usd': {f'p{p:g}': float(v) for p, v in
+                                    zip(percentiles, np.percentile(pnl, percentiles))},
+            'drawdown_percentiles_pct': {f'p{p:g}': float(v) for p, v in
+                                         zip((50, 95, 99), np.percentile(self.max_drawdown_pct, (50, 95, 99)))}
+        }
+
+
+class MonteCarloLadderSimulator:
+    """
+    Scores ladders over simulated price paths.
+
+    volatility and drift are per day (fractions); paths are sampled every
+    `step_seconds` across the entry and monitoring windows. Slippage and fees
+    follow SimulatedLadderEngine: entries pay up to +slippage, TP exits get
+    favourable slippage, stops up to 2x adverse, timeouts up to 1x adverse.
+    """
+
+    def __init__(
+        self,
+        n_paths: int = 5000,
+        step_seconds: float = 5.0,
+        entry_seconds: float = 300,
+        monitor_seconds: float = 1800,
+        slippage_factor: float = 0.001,
+        fee_rate: float = 0.001,
+        seed: Optional[int] = None
+    ):
+        self.n_paths = n_paths
+        self.step_seconds = step_seconds
+        self.entry_steps = max(1, int(round(entry_seconds / step_seconds)))
+        self.monitor_steps = max(1, int(round(monitor_seconds / step_seconds)))
+        self.slippage_factor = slippage_factor
+        self.fee_rate = fee_rate
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def n_steps(self) -> int:
+        return self.entry_steps + self.monitor_steps
+
+    def gbm_paths(self, start_price: float, volatility: float = 0.02, drift: float = 0.0,
+                  n_paths: Optional[int] = None) -> np.ndarray:
+        """(P, steps + 1) geometric Brownian motion paths; column 0 is start_price"""
+        n_paths = n_paths or self.n_paths
+        dt = self.step_seconds / SECONDS_PER_DAY
+        sigma = volatility * np.sqrt(dt)
+        mu = (drift - 0.5 * volatility ** 2) * dt
+        log_returns = self.rng.standard_normal(size=(n_paths, self.n_steps), dtype=np.float32)
+        log_returns *= sigma
+        log_returns += mu
+        return self._paths_from_log_returns(start_price, log_returns)
+
+    def bootstrap_paths(self, start_price: float, returns: Sequence[float], block_size: int = 30,
+                        n_paths: Optional[int] = None) -> np.ndarray:
+        """
+        (P, steps + 1) paths from a moving-block bootstrap of historical
+        per-step returns (simple returns sampled at step_seconds)
+        """
+        n_paths = n_paths or self.n_paths
+        log_returns = np.log1p(np.asarray(returns, dtype=np.float32))
+        block_size = max(1, min(block_size, len(log_returns)))
+        n_blocks = -(-self.n_steps // block_size)
+        starts = self.rng.integers(0, len(log_returns) - block_size + 1, size=(n_paths, n_blocks))
+        idx = (starts[:, :, None] + np.arange(block_size)).reshape(n_paths, -1)[:, :self.n_steps]
+        return self._paths_from_log_returns(start_price, log_returns[idx])
+
+    @staticmethod
+    def _paths_from_log_returns(start_price: float, log_returns: np.ndarray) -> np.ndarray:
+        paths = np.empty((log_returns.shape[0], log_returns.shape[1] + 1), dtype=log_returns.dtype)
+        paths[:, 0] = 0.0
+        np.cumsum(log_returns, axis=1, out=paths[:, 1:])
+        np.exp(paths, out=paths)
+        paths *= start_price
+        return paths
+
+    def _uniform(self, low: float, high: float, n: int) -> np.ndarray:
+        return self.rng.uniform(low, high, size=n) if high > low else np.full(n, low)
+
+    def evaluate(self, ladder_config: Dict[str, Any], paths: np.ndarray) -> LadderOutcomes:
+        """Resolve fills and exits for every path of a (P, steps + 1) price matrix"""
+        n_paths = len(paths)
+        rows = np.arange(n_paths)
+        slip, fee = self.slippage_factor, self.fee_rate
+        tiers = ladder_config['tiers']
+        tier_prices = np.array([t['price'] for t in tiers])
+        tier_capital = np.array([t['capital'] for t in tiers])
+
+        entry = paths[:, :self.entry_steps + 1]
+        monitor = paths[:, self.entry_steps + 1:]
+        n_monitor = monitor.shape[1]
+        steps = np.arange(n_monitor)
+
+        # Entry phase - a tier fills once price trades at or below it
+        filled = entry.min(axis=1)[:, None] <= tier_prices[None, :]
+        fill_prices = tier_prices * (1 + self.rng.uniform(0, slip, size=filled.shape))
+        quantity = np.where(filled, tier_capital / fill_prices * (1 - fee), 0.0).sum(axis=1)
+        invested = np.where(filled, tier_capital, 0.0).sum(axis=1)
+        has_position = invested > 0
+
+        def first(mask, after=None):
+            if after is not None:
+                mask = mask & (steps[None, :] > after[:, None])
+            return np.where(mask.any(axis=1), mask.argmax(axis=1), n_monitor)
+
+        tp1_at = first(monitor >= ladder_config['tp1_price'])
+        tp2_at = first(monitor >= ladder_config['tp2_price'])
+        sl_mask = monitor <= ladder_config['sl_price']
+        sl_at = first(sl_mask)
+        sl_after_tp1 = first(sl_mask, after=np.minimum(tp1_at, n_monitor - 1))
+
+        outcome = np.full(n_paths, TIMEOUT)
+        # First exit (full position, or the 60% TP1 tranche) and the runner's exit
+        first_exit = np.full(n_paths, n_monitor - 1)
+        runner_exit = np.full(n_paths, -1)
+        first_mult = 1 - self._uniform(0, slip, n_paths)
+        runner_mult = np.ones(n_paths)
+
+        stopped = sl_at < tp1_at
+        took_profit = ~stopped & (tp1_at < n_monitor)
+        outcome[stopped] = SL_HIT
+        first_exit[stopped] = sl_at[stopped]
+        first_mult[stopped] = 1 - self._uniform(0, 2 * slip, stopped.sum())
+
+        first_exit[took_profit] = tp1_at[took_profit]
+        first_mult[took_profit] = 1 + self._uniform(-slip, 0, took_profit.sum())
+        runner_to_tp2 = took_profit & (tp2_at < sl_after_tp1)
+        runner_stopped = took_profit & ~runner_to_tp2 & (sl_after_tp1 < n_monitor)
+        runner_timeout = took_profit & ~runner_to_tp2 & ~runner_stopped
+        outcome[took_profit] = np.where(runner_to_tp2[took_profit], TP2_HIT, TP1_HIT)
+        runner_exit[runner_to_tp2] = tp2_at[runner_to_tp2]
+        runner_mult[runner_to_tp2] = 1 + self._uniform(-slip, 0, runner_to_tp2.sum())
+        runner_exit[runner_stopped] = sl_after_tp1[runner_stopped]
+        runner_mult[runner_stopped] = 1 - self._uniform(0, 2 * slip, runner_stopped.sum())
+        runner_exit[runner_timeout] = n_monitor - 1
+        runner_mult[runner_timeout] = 1 - self._uniform(0, slip, runner_timeout.sum())
+
+        if ladder_config.get('ray_score', 100) < 40:
+            # Cognitive rejection closes everything on the first monitoring tick
+            outcome[:] = COGNITIVE_EXIT
+            first_exit[:] = 0
+            first_mult = 1 - self._uniform(0, 1.5 * slip, n_paths)
+            took_profit = np.zeros(n_paths, dtype=bool)
+            runner_exit[:] = -1
+
+        first_qty = np.where(took_profit, quantity * TP1_FRACTION, quantity)
+        runner_qty = quantity - first_qty
+        first_value = first_qty * monitor[rows, first_exit] * first_mult * (1 - fee)
+        runner_value = runner_qty * monitor[rows, np.maximum(runner_exit, 0)] * runner_mult * (1 - fee)
+        proceeds = first_value + runner_value
+        final_exit = np.maximum(first_exit, runner_exit)
+
+        # Mark-to-market equity through the monitoring window, frozen after the final exit
+        held = np.where(steps[None, :] <= first_exit[:, None], quantity[:, None],
+                        np.where(steps[None, :] <= final_exit[:, None], runner_qty[:, None], 0.0))
+        realized = np.where(steps[None, :] > first_exit[:, None], first_value[:, None], 0.0)
+        equity = held * monitor + realized
+        equity = np.where(steps[None, :] > final_exit[:, None], proceeds[:, None], equity)
+        peak = np.maximum.accumulate(np.maximum(equity, invested[:, None]), axis=1)
+        drawdown = np.divide(peak - equity, peak, out=np.zeros_like(equity), where=peak > 0)
+        max_drawdown_pct = drawdown.max(axis=1) * 100 if n_monitor else np.zeros(n_paths)
+
+        outcome[~has_position] = NO_FILL
+        proceeds[~has_position] = 0.0
+        max_drawdown_pct[~has_position] = 0.0
+
+        return LadderOutcomes(
+            outcome=outcome,
+            invested=invested,
+            proceeds=proceeds,
+            filled_tiers=filled.sum(axis=1),
+            max_drawdown_pct=max_drawdown_pct,
+            exit_step=final_exit
+        )
+
+    def score(self, ladder_config: Dict[str, Any], start_price: float, volatility: float = 0.02,
+              drift: float = 0.0, returns: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """Outcome distribution for one ladder (bootstrapped when `returns` is given, else GBM)"""
+        if returns is not None and len(returns):
+            paths = self.bootstrap_paths(start_price, returns)
+        else:
+            paths = self.gbm_paths(start_price, volatility, drift)
+        summary = self.evaluate(ladder_config, paths).summary()
+        summary['symbol'] = ladder_config.get('symbol')
+        summary['path_model'] = 'bootstrap' if returns is not None and len(returns) else 'gbm'
+        return summary
+
+    def rank(self, candidates: List[Dict[str, Any]], start_price: float, volatility: float = 0.02,
+             drift: float = 0.0, returns: Optional[Sequence[float]] = None,
+             key: str = 'expected_pnl_usd') -> List[Dict[str, Any]]:
+        """
+        Score candidate ladders on one shared path matrix (common random
+        numbers, so differences come from the ladders, not the draws)
+        """
+        if returns is not None and len(returns):
+            paths = self.bootstrap_paths(start_price, returns)
+        else:
+            paths = self.gbm_paths(start_price, volatility, drift)
+        scored = []
+        for i, ladder in enumerate(candidates):
+            summary = self.evaluate(ladder, paths).summary()
+            summary['candidate'] = i
+            summary['symbol'] = ladder.get('symbol')
+            scored.append(summary)
+        return sorted(scored, key=lambda s: s[key], reverse=True)
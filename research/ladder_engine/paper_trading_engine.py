@@ -1,9 +1,8 @@
-import asyncio
-import time
 import random
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 import json
 import pandas as pd
@@ -14,6 +13,8 @@ from src.models.signal import TradingSignal, ExecutionLog
 from src.models.exchange_config import Position, RiskSettings
 from src.execution.exchange_adapters import ExchangeAdapterFactory
 from src.utils.config_manager import config_manager
+from core.monitoring.trigger_index import ABOVE, BELOW, TriggerIndex
+from .event_simulator import WallClock
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +58,11 @@ class LadderLevel:
 class MarketSimulator:
     """Realistic market data simulation"""
     
-    def __init__(self):
-        self.price_history: Dict[str, List[MarketData]] = {}
+    def __init__(self, clock=None, history_size: int = 1000):
+        self.clock = clock or WallClock()
+        self.replay_mode = False  # True: prices come from record_tick, not the random walk
+        self.history_size = history_size
+        self.price_history: Dict[str, deque] = {}
         self.current_prices: Dict[str, float] = {}
         self.volatility_profiles = {
             # Core Holdings (Ledger + Coinbase)
@@ -114,6 +118,13 @@ class MarketSimulator:
     
     def simulate_price_movement(self, symbol: str, time_delta_minutes: int = 1) -> MarketData:
         """Simulate realistic price movement"""
+        if self.replay_mode:
+            # Replayed ticks drive the price; quote the latest one
+            history = self.price_history.get(symbol)
+            if history:
+                return history[-1]
+            return self.record_tick(symbol, self.get_current_price(symbol))
+        
         current_price = self.current_prices.get(symbol, 100.0)
         volatility = self.get_volatility(symbol)
         
@@ -126,37 +137,38 @@ class MarketSimulator:
         price_change = current_price * (drift * dt + volatility * np.sqrt(dt) * random_factor)
         
         new_price = max(current_price + price_change, 0.00001)  # Prevent negative prices
-        self.current_prices[symbol] = new_price
+        return self.record_tick(symbol, new_price)
+    
+    def record_tick(self, symbol: str, price: float, volume: Optional[float] = None) -> MarketData:
+        """Set the current price (simulated or replayed) and append it to history"""
+        self.current_prices[symbol] = price
         
         # Calculate bid/ask spread (0.1% typical)
-        spread = new_price * 0.001
-        bid = new_price - spread / 2
-        ask = new_price + spread / 2
+        spread = price * 0.001
+        bid = price - spread / 2
+        ask = price + spread / 2
         
-        # Simulate volume (random but realistic)
-        base_volume = 1000000
-        volume_multiplier = 0.5 + random.random()  # 0.5x to 1.5x base volume
-        volume = base_volume * volume_multiplier
+        if volume is None:
+            # Simulate volume (random but realistic)
+            base_volume = 1000000
+            volume_multiplier = 0.5 + random.random()  # 0.5x to 1.5x base volume
+            volume = base_volume * volume_multiplier
         
         market_data = MarketData(
-            timestamp=datetime.utcnow(),
+            timestamp=self.clock.now(),
             symbol=symbol,
-            price=new_price,
+            price=price,
             volume=volume,
             bid=bid,
             ask=ask,
-            volatility=volatility
+            volatility=self.get_volatility(symbol)
         )
         
-        # Store in history
+        # Store in history (bounded - oldest points drop off in O(1))
         if symbol not in self.price_history:
-            self.price_history[symbol] = []
+            self.price_history[symbol] = deque(maxlen=self.history_size)
         self.price_history[symbol].append(market_data)
         
-        # Keep only last 1000 data points
-        if len(self.price_history[symbol]) > 1000:
-            self.price_history[symbol] = self.price_history[symbol][-1000:]
-        
         return market_data
     
     def get_current_price(self, symbol: str) -> float:
@@ -168,15 +180,19 @@ class MarketSimulator:
         if symbol not in self.price_history:
             return []
         
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_time = self.clock.now() - timedelta(hours=hours)
         return [data for data in self.price_history[symbol] if data.timestamp >= cutoff_time]
 
 class PaperTradingEngine:
     """Advanced paper trading simulation engine"""
     
-    def __init__(self):
-        self.market_simulator = MarketSimulator()
+    def __init__(self, clock=None):
+        # Wall clock by default; EventDrivenSimulator swaps in a VirtualClock
+        self.clock = clock or WallClock()
+        self.market_simulator = MarketSimulator(self.clock)
+        self.trigger_index = TriggerIndex()  # Pending TP/SL orders by trigger price
         self.active_positions: Dict[str, Position] = {}
+        self.positions_by_symbol: Dict[str, Set[str]] = {}  # Open signal ids per symbol, for per-tick marks
         self.active_ladders: Dict[str, List[LadderLevel]] = {}
         self.paper_balance = 10000.0  # Starting balance
         self.total_pnl = 0.0
@@ -336,6 +352,7 @@ class PaperTradingEngine:
                 
                 # Store position
                 self.active_positions[signal.signal_id] = position
+                self.positions_by_symbol.setdefault(position.symbol, set()).add(signal.signal_id)
                 
                 # Update balance
                 self.paper_balance -= (fill_result.filled_quantity * fill_result.filled_price + fill_result.fees)
@@ -398,9 +415,9 @@ class PaperTradingEngine:
         slippage = abs(fill_price - expected_price) / expected_price if expected_price > 0 else 0
         
         # Simulate fill delay
-        await asyncio.sleep(random.uniform(*self.fill_delay_seconds))
+        await self.clock.sleep(random.uniform(*self.fill_delay_seconds))
         
-        order_id = f"paper_{int(time.time())}_{random.randint(1000, 9999)}"
+        order_id = f"paper_{int(self.clock.time())}_{random.randint(1000, 9999)}"
         
         return OrderFill(
             order_id=order_id,
@@ -412,75 +429,66 @@ class PaperTradingEngine:
             filled_price=fill_price,
             fees=fees,
             slippage=slippage,
-            fill_time=datetime.utcnow(),
+            fill_time=self.clock.now(),
             partial_fill=filled_quantity < quantity
         )
     
     async def _setup_exit_orders(self, signal: TradingSignal, ladder_levels: List[LadderLevel]):
         """Set up TP and SL orders"""
+        side = 'long' if signal.action == 'buy' else 'short'
         for level in ladder_levels:
             if level.order_type in ['tp1', 'tp2', 'sl']:
-                level.order_id = f"exit_{int(time.time())}_{level.level}"
+                level.order_id = f"exit_{int(self.clock.time())}_{level.level}"
                 level.status = 'pending'
                 
+                self.trigger_index.add(signal.symbol, level.price, self._direction(side, level),
+                                       (signal.signal_id, level))
+                
                 self._log_execution(signal.id, f'{level.order_type}_placed', 
                                   f"{level.order_type.upper()} order placed @ ${level.price:.4f}")
     
+    @staticmethod
+    def _direction(side: str, level: LadderLevel) -> str:
+        """Longs take profit above / stop below; shorts the reverse"""
+        return ABOVE if (level.order_type == 'sl') == (side == 'short') else BELOW
+    
     async def monitor_positions(self):
         """Monitor active positions and execute ladder logic"""
         while True:
             try:
-                for signal_id, position in list(self.active_positions.items()):
-                    await self._monitor_position(signal_id, position)
+                for symbol in list(self.positions_by_symbol):
+                    market_data = self.market_simulator.simulate_price_movement(symbol)
+                    await self.on_price(symbol, market_data)
                 
-                await asyncio.sleep(1)  # Check every second
+                await self.clock.sleep(1)  # Check every second
                 
             except Exception as e:
                 logger.error(f"Position monitoring error: {e}")
-                await asyncio.sleep(5)
+                await self.clock.sleep(5)
     
-    async def _monitor_position(self, signal_id: str, position: Position):
-        """Monitor individual position for TP/SL triggers"""
-        try:
-            # Get current market price
-            market_data = self.market_simulator.simulate_price_movement(position.symbol)
+    async def on_price(self, symbol: str, market_data: MarketData):
+        """
+        Mark this symbol's open positions to the tick, then execute the TP/SL
+        orders the price crosses (only those - no per-position trigger checks)
+        """
+        for signal_id in self.positions_by_symbol.get(symbol, ()):
+            position = self.active_positions[signal_id]
             position.current_price = market_data.price
-            
-            # Update unrealized PnL
             position.calculate_pnl(market_data.price)
-            
-            # Check ladder levels
-            if signal_id in self.active_ladders:
-                ladder_levels = self.active_ladders[signal_id]
-                
-                for level in ladder_levels:
-                    if level.status == 'pending':
-                        await self._check_level_trigger(signal_id, position, level, market_data)
-            
-        except Exception as e:
-            logger.error(f"Position monitoring failed for {signal_id}: {e}")
-    
-    async def _check_level_trigger(self, signal_id: str, position: Position, 
-                                 level: LadderLevel, market_data: MarketData):
-        """Check if ladder level should be triggered"""
-        triggered = False
-        
-        if level.order_type == 'tp1' or level.order_type == 'tp2':
-            # Take profit trigger
-            if position.side == 'long' and market_data.price >= level.price:
-                triggered = True
-            elif position.side == 'short' and market_data.price <= level.price:
-                triggered = True
-        
-        elif level.order_type == 'sl':
-            # Stop loss trigger
-            if position.side == 'long' and market_data.price <= level.price:
-                triggered = True
-            elif position.side == 'short' and market_data.price >= level.price:
-                triggered = True
-        
-        if triggered:
+        
+        def is_live(trigger) -> bool:
+            signal_id, level = trigger.payload
+            return level.status == 'pending' and signal_id in self.active_ladders
+        
+        for trigger in self.trigger_index.pop_satisfied(symbol, market_data.price, is_live):
+            signal_id, level = trigger.payload
+            position = self.active_positions.get(signal_id)
+            if position is None or not is_live(trigger):
+                continue  # Closed by an earlier fill on this tick
             await self._execute_exit_order(signal_id, position, level, market_data)
+            if is_live(trigger):
+                # Exit failed - keep the order armed for the next tick
+                self.trigger_index.add(symbol, level.price, trigger.direction, trigger.payload)
     
     async def _execute_exit_order(self, signal_id: str, position: Position, 
                                 level: LadderLevel, market_data: MarketData):
@@ -535,11 +543,16 @@ class PaperTradingEngine:
                 # Check if position is fully closed
                 if position.remaining_quantity <= 0.001:  # Account for rounding
                     position.status = 'closed'
-                    position.closed_at = datetime.utcnow()
+                    position.closed_at = self.clock.now()
                     
                     # Remove from active positions
                     if signal_id in self.active_positions:
                         del self.active_positions[signal_id]
+                    open_ids = self.positions_by_symbol.get(position.symbol)
+                    if open_ids is not None:
+                        open_ids.discard(signal_id)
+                        if not open_ids:
+                            del self.positions_by_symbol[position.symbol]
                     
                     # Remove ladder
                     if signal_id in self.active_ladders:
@@ -27,6 +27,7 @@ import json
 
 from ..utils.secure_config_loader import SecureConfigLoader
 from ..utils.vault_siphon_router import VaultSiphonRouter
+from .monte_carlo_ladder import MonteCarloLadderSimulator, build_ladder_config
 
 logger = logging.getLogger(__name__)
 
@@ -132,53 +133,44 @@ class SimulatedLadderEngine:
     async def _create_simulation_config(self, signal: Dict[str, Any], ray_score: float) -> Dict[str, Any]:
         """Create simulation configuration from signal"""
         try:
-            entry_low = signal.get('entry_low', signal['entry_price'] * 0.995)
-            entry_high = signal.get('entry_high', signal['entry_price'] * 1.005)
-            capital = signal['capital']
-            
-            # Create 6-tier ladder with dynamic weighting
-            tier_weights = [0.30, 0.25, 0.20, 0.15, 0.08, 0.02]
-            tier_count = len(tier_weights)
-            
-            tiers = []
-            for i in range(tier_count):
-                # Calculate tier price (bias toward lower prices)
-                ratio = i / (tier_count - 1)
-                curved_ratio = ratio ** 1.2  # Curve for lower bias
-                price = entry_low + (entry_high - entry_low) * curved_ratio
-                
-                # Calculate tier allocation
-                weight = tier_weights[i]
-                tier_capital = capital * weight
-                quantity = tier_capital / price
-                
-                tiers.append({
-                    'tier': i + 1,
-                    'price': round(price, 8),
-                    'quantity': round(quantity, 6),
-                    'capital': round(tier_capital, 2),
-                    'weight': weight,
-                    'filled': False,
-                    'fill_time': None,
-                    'fill_price': None
-                })
-            
-            return {
-                'simulation_id': f"SIM_{int(time.time() * 1000)}",
-                'symbol': signal['symbol'],
-                'tiers': tiers,
-                'tp1_price': signal['tp1_price'],
-                'tp2_price': signal.get('tp2_price', signal['tp1_price'] * 1.1),
-                'sl_price': signal['sl_price'],
-                'total_capital': capital,
-                'ray_score': ray_score,
-                'start_time': datetime.utcnow().isoformat()
-            }
+            ladder_config = build_ladder_config(signal, ray_score)
+            ladder_config['simulation_id'] = f"SIM_{int(time.time() * 1000)}"
+            ladder_config['start_time'] = datetime.utcnow().isoformat()
+            return ladder_config
             
         except Exception as e:
             logger.error(f"❌ Simulation config creation failed: {e}")
             raise
     
+    def score_ladders(self, signals: List[Dict[str, Any]], ray_score: float = 75.0,
+                      n_paths: int = 5000, historical_returns: Optional[List[float]] = None,
+                      seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Offline Monte Carlo scoring of candidate ladders for one symbol
+        
+        Evaluates every signal's ladder over the same simulated paths (GBM at
+        market_volatility per day, or a bootstrap of historical_returns sampled
+        at the simulator's step) instead of playing each one out in real time.
+        
+        Returns:
+            One outcome distribution per signal, best expected PnL first
+        """
+        simulator = MonteCarloLadderSimulator(
+            n_paths=n_paths,
+            slippage_factor=self.slippage_factor,
+            fee_rate=self.fee_rate,
+            seed=seed
+        )
+        ladders = [build_ladder_config(signal, ray_score) for signal in signals]
+        ranked = simulator.rank(
+            ladders,
+            start_price=signals[0]['entry_price'],
+            volatility=self.market_volatility,
+            returns=historical_returns
+        )
+        logger.info(f"🎲 Scored {len(ladders)} ladders over {n_paths} paths")
+        return ranked
+    
     async def _initialize_price_feed(self, symbol: str, starting_price: float) -> None:
         """Initialize realistic price feed for simulation"""
         try:
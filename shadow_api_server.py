@@ -11,6 +11,12 @@ Endpoints:
 - POST /api/reject/<idx>  - Reject pending signal
 - GET  /api/regime        - Current market regime
 - GET  /api/watchlist     - Current watchlist
+- GET  /api/moondev/<sym> - MoonDev consensus (refreshed on candle close)
+- POST /api/cycle         - Queue an overnight_runner cycle (202 + job id)
+- GET  /api/jobs/<id>     - Background job status/result
+
+Dashboard payloads are precomputed snapshots served with ETag /
+If-None-Match, so unchanged polls get 304 and never touch the exchanges.
 
 Run: python web_api/app.py
 """
@@ -18,30 +24,39 @@ Run: python web_api/app.py
 import json
 import os
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 
 # Add project root to path
 SS3_ROOT = Path("/Volumes/LegacySafe/SS_III")
 sys.path.insert(0, str(SS3_ROOT))
 
+from core.config.brain_store import get_brain_store
+from core.dashboard.snapshots import JobQueue, SnapshotCache, SnapshotRefresher, file_signature
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for AlphaRunner
 
 # Paths
 BRAIN_JSON = SS3_ROOT / "BRAIN.json"
+BRAIN = get_brain_store(BRAIN_JSON)
 PENDING_QUEUE = SS3_ROOT / "data" / "pending_approvals.json"
 ALPHA_BIAS = SS3_ROOT / "config" / "alpha_bias.json"
 
+# Snapshots / background work
+MOONDEV_TIMEFRAME = "1h"
+MOONDEV_TIMEFRAME_SECONDS = 3600
+SNAPSHOTS = SnapshotCache()
+REFRESHER = SnapshotRefresher(SNAPSHOTS, timeframe_seconds=MOONDEV_TIMEFRAME_SECONDS)
+JOBS = JobQueue(max_workers=1)
+
 
 def load_brain() -> dict:
-    """Load BRAIN.json."""
-    if BRAIN_JSON.exists():
-        with open(BRAIN_JSON) as f:
-            return json.load(f)
-    return {}
+    """Load BRAIN.json (shared cached document - treat as read-only)."""
+    return BRAIN.read(copy=False)
 
 
 def load_pending() -> list:
@@ -67,6 +82,15 @@ def load_alpha_bias() -> dict:
     return {}
 
 
+def snapshot_response(snapshot) -> Response:
+    """Serve a precomputed snapshot; 304 when the client's If-None-Match still matches."""
+    response = Response(snapshot.body, status=snapshot.status, mimetype="application/json")
+    response.set_etag(snapshot.etag)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Snapshot-Age"] = f"{snapshot.age:.1f}"
+    return response.make_conditional(request)
+
+
 # ========== ENDPOINTS ==========
 
 @app.route('/api/', methods=['GET'])
@@ -81,8 +105,13 @@ def health():
 
 @app.route('/api/portfolio', methods=['GET'])
 def get_portfolio():
+    """Get current portfolio for AlphaRunner Dashboard (precomputed snapshot)."""
+    return snapshot_response(REFRESHER.get("portfolio"))
+
+
+def build_portfolio() -> dict:
     """
-    Get current portfolio for AlphaRunner Dashboard.
+    Portfolio payload for AlphaRunner Dashboard.
     Returns exact LegacyLoopData format expected by frontend types.ts.
     """
     brain = load_brain()
@@ -143,16 +172,20 @@ def get_portfolio():
         }
     }
 
-    return jsonify(response)
+    return response
 
 
 @app.route('/api/signals', methods=['GET'])
 def get_signals():
+    """Get trading signals for AlphaRunner (precomputed snapshot)."""
+    return snapshot_response(REFRESHER.get("signals"))
+
+
+def build_signals() -> list:
     """
-    Get trading signals for AlphaRunner.
+    Trading signals for AlphaRunner.
     Returns TradingAlert[] format.
     """
-    brain = load_brain()
     pending = load_pending()
     alpha_bias = load_alpha_bias()
 
@@ -189,7 +222,7 @@ def get_signals():
             "timestamp": datetime.now().isoformat()
         })
 
-    return jsonify(signals)
+    return signals
 
 
 @app.route('/api/pending', methods=['GET'])
@@ -250,7 +283,12 @@ def reject_signal(idx: int):
 
 @app.route('/api/regime', methods=['GET'])
 def get_regime():
-    """Get current market regime from alpha bias."""
+    """Get current market regime from alpha bias (precomputed snapshot)."""
+    return snapshot_response(REFRESHER.get("regime"))
+
+
+def build_regime() -> dict:
+    """Current market regime from alpha bias."""
     alpha_bias = load_alpha_bias()
     brain = load_brain()
 
@@ -258,12 +296,12 @@ def get_regime():
     regime = alpha_bias.get("market_regime", {})
     market_analysis = brain.get("market_analysis", {})
 
-    return jsonify({
+    return {
         "regime": regime,
         "cycle_indicators": market_analysis.get("cycle_indicators", {}),
         "key_levels": market_analysis.get("key_levels", {}),
         "opportunities": market_analysis.get("opportunities_2026", [])[:5]
-    })
+    }
 
 
 @app.route('/api/watchlist', methods=['GET'])
@@ -276,7 +314,7 @@ def get_watchlist():
 @app.route('/api/brain', methods=['GET'])
 def get_brain():
     """Get full BRAIN.json (for debugging)."""
-    return jsonify(load_brain())
+    return snapshot_response(REFRESHER.get("brain"))
 
 
 @app.route('/api/alpha-bias', methods=['GET'])
@@ -285,46 +323,50 @@ def get_alpha_bias():
     return jsonify(load_alpha_bias())
 
 
-@app.route('/api/moondev', methods=['GET'])
-@app.route('/api/moondev/<symbol>', methods=['GET'])
-def get_moondev_signals(symbol: str = 'BTC'):
+_exchange_lock = threading.Lock()
+
+
+def fetch_ohlcv(symbol: str, limit: int = 200):
+    """OHLCV from Binance US (public, no auth) through the process-wide client pool."""
+    import pandas as pd
+    from core.exchanges.client_pool import get_exchange
+
+    with _exchange_lock:
+        ohlcv = get_exchange('binanceus').fetch_ohlcv(f"{symbol}/USD", MOONDEV_TIMEFRAME, limit=limit)
+    df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    df.set_index('timestamp', inplace=True)
+    return df
+
+
+def build_moondev(symbol: str):
     """
-    Get MoonDev strategy signals for a symbol.
+    MoonDev strategy consensus for a symbol.
     Uses the 3 proven strategies: MomentumBreakout, BandedMACD, VolCliffArbitrage
     """
     try:
         from core.signals.moondev_signals import MoonDevSignals
-        import pandas as pd
-
-        df = None
 
         # Skip LiveDataPipeline (Coinbase auth issues), go straight to Binance US
-        # Fallback to Binance US (public, no auth needed for OHLCV)
-        if df is None or (hasattr(df, 'empty') and df.empty):
-            try:
-                import ccxt
-                exchange = ccxt.binanceus()
-                pair = f"{symbol}/USD"
-                ohlcv = exchange.fetch_ohlcv(pair, '1h', limit=200)
-                df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                df.set_index('timestamp', inplace=True)
-            except Exception:
-                pass
+        try:
+            df = fetch_ohlcv(symbol)
+        except Exception:
+            df = None
 
         if df is None or df.empty:
-            return jsonify({
+            return {
                 "error": f"No OHLCV data for {symbol}",
                 "symbol": symbol
-            }), 404
+            }, 404
 
         # Generate signals
         signals = MoonDevSignals()
         result = signals.get_consensus(df)
 
-        return jsonify({
+        return {
             "symbol": symbol,
             "timestamp": datetime.now().isoformat(),
+            "candle_close": str(df.index[-1]),
             "consensus": result['consensus'].name if hasattr(result['consensus'], 'name') else str(result['consensus']),
             "action": result['action'],
             "score": result['score'],
@@ -334,46 +376,89 @@ def get_moondev_signals(symbol: str = 'BTC'):
             "take_profit": result.get('take_profit'),
             "signals": result['signals'],
             "reasons": result.get('reasons', [])
-        })
+        }, 200
 
     except ImportError as e:
-        return jsonify({
+        return {
             "error": f"Module not available: {e}",
             "symbol": symbol
-        }), 500
+        }, 500
     except Exception as e:
-        return jsonify({
+        return {
             "error": str(e),
             "symbol": symbol
-        }), 500
+        }, 500
+
+
+@app.route('/api/moondev', methods=['GET'])
+@app.route('/api/moondev/<symbol>', methods=['GET'])
+def get_moondev_signals(symbol: str = 'BTC'):
+    """
+    Get MoonDev strategy signals for a symbol.
+    Computed once per candle; the first successful request for a symbol adds
+    it to the background refresher's (capped) watch list.
+    """
+    return snapshot_response(REFRESHER.get_symbol("moondev", symbol))
+
+
+_runner = None
+
+
+def run_cycle_job() -> dict:
+    """One overnight_runner cycle (runs on the job queue, runner reused across cycles)."""
+    global _runner
+    if _runner is None:
+        from bin.overnight_runner import OvernightRunner
+        _runner = OvernightRunner(interval_minutes=15, paper_mode=True)
+    result = _runner.run_cycle()
+
+    return {
+        "cycle": result.get('cycle'),
+        "timestamp": result.get('timestamp'),
+        "signals": result.get('signals', {}),
+        "opportunities": result.get('opportunities', []),
+        "council_opinion": result.get('council_opinion')
+    }
 
 
 @app.route('/api/cycle', methods=['POST'])
 def run_cycle():
     """
-    Trigger one overnight_runner cycle manually.
-    Returns signals and opportunities.
+    Queue one overnight_runner cycle.
+    Returns 202 with a job id; poll /api/jobs/<id> for signals and opportunities.
     """
-    try:
-        from bin.overnight_runner import OvernightRunner
+    job = JOBS.submit("cycle", run_cycle_job)
+    return jsonify({
+        "success": True,
+        "job_id": job["id"],
+        "status": job["status"],
+        "status_url": f"/api/jobs/{job['id']}"
+    }), 202
 
-        runner = OvernightRunner(interval_minutes=15, paper_mode=True)
-        result = runner.run_cycle()
 
-        return jsonify({
-            "success": True,
-            "cycle": result.get('cycle'),
-            "timestamp": result.get('timestamp'),
-            "signals": result.get('signals', {}),
-            "opportunities": result.get('opportunities', []),
-            "council_opinion": result.get('council_opinion')
-        })
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """Recent background jobs (without results)."""
+    return jsonify(JOBS.list(request.args.get("kind")))
 
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id: str):
+    """Background job status; includes the result once done."""
+    job = JOBS.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": f"Unknown job: {job_id}"}), 404
+    return jsonify(job)
+
+
+# ========== SNAPSHOTS ==========
+
+REFRESHER.register("portfolio", lambda: BRAIN.etag, build_portfolio)
+REFRESHER.register("signals", lambda: (file_signature(PENDING_QUEUE), file_signature(ALPHA_BIAS)), build_signals)
+REFRESHER.register("regime", lambda: (BRAIN.etag, file_signature(ALPHA_BIAS)), build_regime)
+REFRESHER.register("brain", lambda: BRAIN.etag, load_brain)
+REFRESHER.register_symbol("moondev", build_moondev)
+REFRESHER.watch("BTC")
 
 
 if __name__ == "__main__":
@@ -387,5 +472,10 @@ if __name__ == "__main__":
     print(f"  GET  http://localhost:{port}/api/portfolio - Portfolio")
     print(f"  GET  http://localhost:{port}/api/signals   - Signals")
     print(f"  GET  http://localhost:{port}/api/regime    - Market Regime")
+    print(f"  GET  http://localhost:{port}/api/moondev/<symbol> - MoonDev signals")
+    print(f"  POST http://localhost:{port}/api/cycle     - Queue trading cycle")
     print("")
+    # The debug reloader's parent process never serves requests - don't refresh there
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        REFRESHER.start()
     app.run(host="0.0.0.0", port=port, debug=debug)
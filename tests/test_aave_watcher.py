@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - AAVE Watcher Tests
+One multicall per block, per-block caching and local health-factor recomputation
+"""
+
+import pytest
+
+from core.aave.aave_watcher import (
+    AAVE_DATA_PROVIDER, AAVE_ORACLE, AAVE_POOL, MULTICALL3,
+    SEL_GET_ASSETS_PRICES, SEL_GET_RESERVE_CONFIG, SEL_GET_RESERVES_LIST,
+    SEL_GET_USER_ACCOUNT_DATA, SEL_GET_USER_RESERVE_DATA,
+    AaveBlockWatcher, decode_aggregate3, encode_address_array_call, encode_aggregate3,
+    encode_call, to_address, words,
+)
+
+USER = "0x" + "11" * 20
+WSTETH = "0x" + "aa" * 20
+USDC = "0x" + "bb" * 20
+WBTC = "0x" + "cc" * 20
+
+
+def _enc(*values):
+    return b"".join(int(v).to_bytes(32, "big") for v in values)
+
+
+def _enc_array(values):
+    return _enc(32, len(values), *values)
+
+
+def _decode_aggregate3_calls(calldata):
+    body = calldata[4:]
+    count = int.from_bytes(body[32:64], "big")
+    heads = 64
+    calls = []
+    for i in range(count):
+        at = heads + int.from_bytes(body[heads + 32 * i:heads + 32 * (i + 1)], "big")
+        target = to_address(int.from_bytes(body[at:at + 32], "big"))
+        data_at = at + int.from_bytes(body[at + 64:at + 96], "big")
+        length = int.from_bytes(body[data_at:data_at + 32], "big")
+        calls.append((target, body[data_at + 32:data_at + 32 + length]))
+    return calls
+
+
+class StubAaveNode:
+    """Local JSON-RPC stand-in for mainnet: Pool, DataProvider, Oracle and Multicall3"""
+
+    def __init__(self):
+        self.block = 100
+        self.reserves = {WSTETH: (18, 8100), USDC: (6, 7800), WBTC: (8, 7500)}  # decimals, LT bps
+        self.prices = {WSTETH: 4000 * 10**8, USDC: 10**8, WBTC: 100_000 * 10**8}
+        self.collateral = {(USER, WSTETH): 10 * 10**18}
+        self.debt = {(USER, USDC): 16_200 * 10**6}
+        self.requests = []
+
+    def __call__(self, method, params):
+        self.requests.append(method)
+        if method == "eth_blockNumber":
+            return hex(self.block)
+        assert method == "eth_call"
+        call, tag = params
+        data = bytes.fromhex(call["data"][2:])
+        return "0x" + self._dispatch(call["to"], data).hex()
+
+    def _base(self, asset, raw):
+        return raw * self.prices[asset] // 10 ** self.reserves[asset][0]
+
+    def _dispatch(self, to, data):
+        selector, args = data[:4].hex(), words(data[4:])
+        to = to.lower()
+        if to == MULTICALL3.lower():
+            results = [(True, self._dispatch(t, d)) for t, d in _decode_aggregate3_calls(data)]
+            tuples = []
+            for ok, ret in results:
+                tuples.append(_enc(int(ok), 64, len(ret)) + ret + bytes(-len(ret) % 32))
+            offset, heads = 32 * len(tuples), []
+            for t in tuples:
+                heads.append(_enc(offset))
+                offset += len(t)
+            return _enc(32, len(tuples)) + b"".join(heads) + b"".join(tuples)
+        if to == AAVE_POOL.lower() and selector == SEL_GET_RESERVES_LIST:
+            return _enc_array([int(r, 16) for r in self.reserves])
+        if to == AAVE_POOL.lower() and selector == SEL_GET_USER_ACCOUNT_DATA:
+            user = to_address(args[0])
+            coll = {a: self._base(a, v) for (u, a), v in self.collateral.items() if u == user}
+            debt = sum(self._base(a, v) for (u, a), v in self.debt.items() if u == user)
+            total = sum(coll.values())
+            lt = sum(v * self.reserves[a][1] for a, v in coll.items()) // total if total else 0
+            hf = total * lt * 10**18 // (debt * 10**4) if debt else 2**256 - 1
+            return _enc(total, debt, 0, lt, 7000, hf)
+        if to == AAVE_DATA_PROVIDER.lower() and selector == SEL_GET_RESERVE_CONFIG:
+            decimals, lt = self.reserves[to_address(args[0])]
+            return _enc(decimals, 7000, lt, 10500, 1000, 1, 1, 0, 1, 0)
+        if to == AAVE_DATA_PROVIDER.lower() and selector == SEL_GET_USER_RESERVE_DATA:
+            asset, user = to_address(args[0]), to_address(args[1])
+            coll = self.collateral.get((user, asset), 0)
+            return _enc(coll, 0, self.debt.get((user, asset), 0), 0, 0, 0, 0, 0, int(coll > 0))
+        if to == AAVE_ORACLE.lower() and selector == SEL_GET_ASSETS_PRICES:
+            assets = [to_address(w) for w in args[2:2 + args[1]]]
+            return _enc_array([self.prices[a] for a in assets])
+        raise AssertionError(f"unexpected call {to} {selector}")
+
+
+@pytest.fixture
+def node():
+    return StubAaveNode()
+
+
+@pytest.fixture
+def watcher(node):
+    return AaveBlockWatcher(node, [USER])
+
+
+class TestCodec:
+
+    def test_aggregate3_roundtrip(self):
+        calls = [(AAVE_POOL, encode_call(SEL_GET_USER_ACCOUNT_DATA, USER)),
+                 (AAVE_ORACLE, encode_address_array_call(SEL_GET_ASSETS_PRICES, [WSTETH, USDC]))]
+        calldata = encode_aggregate3(calls)
+        assert calldata[:4].hex() == "82ad56cb"
+        assert _decode_aggregate3_calls(calldata) == [(t.lower(), d) for t, d in calls]
+
+        node = StubAaveNode()
+        results = decode_aggregate3(node._dispatch(MULTICALL3, calldata))
+        assert [ok for ok, _ in results] == [True, True]
+        assert words(results[1][1])[2:] == [4000 * 10**8, 10**8]
+
+
+class TestBlockDriven:
+
+    def test_one_multicall_per_block(self, node, watcher):
+        watcher.poll()
+        first = node.requests.count("eth_call")
+        # reserve list + decimals multicall + the block multicall
+        assert first == 3
+
+        for _ in range(5):
+            assert watcher.poll() is None  # same block: only eth_blockNumber
+        assert node.requests.count("eth_call") == first
+
+        node.block += 1
+        state = watcher.poll()
+        assert state.block == 101
+        assert node.requests.count("eth_call") == first + 1
+
+    def test_only_held_reserves_read_after_discovery(self, node, watcher):
+        watcher.poll()
+        assert len(watcher.block_state().prices) == 3
+        node.block += 1
+        watcher.poll()
+        assert set(watcher.block_state().prices) == {WSTETH, USDC}
+
+    def test_new_reserve_position_seen_before_rescan(self, node, watcher):
+        watcher.poll()
+        node.block += 1
+        watcher.poll()
+        assert set(watcher.block_state().prices) == {WSTETH, USDC}
+
+        # Supply WBTC: the account totals move, the narrowed reserves do not
+        node.collateral[(USER, WBTC)] = 10**8
+        node.block += 1
+        calls = node.requests.count("eth_call")
+        state = watcher.poll()
+        assert node.requests.count("eth_call") == calls + 2
+        assert WBTC in state.accounts[USER].reserves
+        assert watcher.health(USER)["collateral_usd"] == pytest.approx(140_000)
+
+        node.block += 1
+        calls = node.requests.count("eth_call")
+        watcher.poll()
+        assert node.requests.count("eth_call") == calls + 1
+        assert set(watcher.block_state().prices) == {WSTETH, USDC, WBTC}
+
+    def test_results_cached_per_block(self, node, watcher):
+        watcher.refresh(100)
+        calls = node.requests.count("eth_call")
+        assert watcher.refresh(100) is watcher.block_state(100)
+        assert node.requests.count("eth_call") == calls
+
+
+class TestLocalHealth:
+
+    def test_matches_onchain_health_factor(self, watcher):
+        watcher.poll()
+        view = watcher.health(USER)
+        # 10 wstETH * 4000 * 0.81 / 16200 = 2.0
+        assert view["health_factor"] == pytest.approx(2.0)
+        assert view["health_factor"] == pytest.approx(view["onchain_health_factor"])
+        assert view["collateral_usd"] == 40_000 and view["debt_usd"] == 16_200
+        assert view["liquidation_drop_pct"] == pytest.approx(50.0)
+        assert view["liquidation_prices"][WSTETH] == pytest.approx(2000.0)
+        assert view["level"] == "CAUTION"
+
+    def test_price_tick_reprices_without_rpc(self, node, watcher):
+        watcher.poll()
+        calls = len(node.requests)
+        watcher.on_price(WSTETH, 3000)
+        view = watcher.health(USER)
+        assert view["health_factor"] == pytest.approx(1.5)
+        assert view["repriced"] is True
+        assert len(node.requests) == calls
+
+        # The next block's chain prices replace the off-chain tick
+        node.block += 1
+        watcher.poll()
+        assert watcher.health(USER)["repriced"] is False
+        assert watcher.health(USER)["health_factor"] == pytest.approx(2.0)
+
+
+class TestAlerts:
+
+    def test_level_transitions_fire_once(self, node, watcher):
+        alerts = []
+        watcher.subscribe(alerts.append)
+        watcher.poll()
+        assert [a["level"] for a in alerts] == ["CAUTION"]
+
+        watcher.on_price(WSTETH, 3000)   # HF 1.5
+        watcher.on_price(WSTETH, 2990)   # still CRITICAL, no new alert
+        assert [a["level"] for a in alerts] == ["CAUTION", "CRITICAL"]
+        assert alerts[-1]["previous_level"] == "CAUTION"
+
+        node.block += 1
+        watcher.poll()                    # back to chain price (HF 2.0)
+        assert [a["level"] for a in alerts] == ["CAUTION", "CRITICAL", "CAUTION"]
+
+    def test_failed_listener_does_not_break_others(self, watcher):
+        seen = []
+        watcher.subscribe(lambda alert: 1 / 0)
+        watcher.subscribe(seen.append)
+        watcher.poll()
+        assert len(seen) == 1
+
+
+class TestAaveClient:
+
+    def test_serves_watcher_snapshot(self, watcher, monkeypatch):
+        module = pytest.importorskip("ds_star.portfolio.aave_client", exc_type=ImportError)
+        monkeypatch.setenv("AAVE_USER_ADDRESS", USER)
+        monkeypatch.setenv("ETHERSCAN_API_KEY", "test")
+        watcher.poll()
+        client = module.AaveClient(watcher=watcher)
+        monkeypatch.setattr(client, "_fetch_from_etherscan", lambda: pytest.fail("hit etherscan"))
+        position = client.get_position()
+        assert position["source"] == "aave_watcher"
+        assert position["health_factor"] == 2.0 and position["block"] == 100
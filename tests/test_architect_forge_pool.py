@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Architect Forge Verification Pool Tests
+Parallel candidate backtests over shared memory-mapped OHLCV
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ds_star.architect_forge import ArchitectForge
+from ds_star.architect_forge.verification_pool import (
+    VerificationPool,
+    load_shared_ohlcv,
+    write_shared_ohlcv,
+)
+
+CANDIDATE = '''
+import time
+
+def execute_backtest(data, initial_equity=10000):
+    time.sleep({delay})
+    return {{"rows": len(data), "trades": {trades}, "first_close": float(data["close"].iloc[0])}}
+'''
+
+
+def _candidate(delay=0.0, trades=10):
+    return CANDIDATE.format(delay=delay, trades=trades)
+
+
+@pytest.fixture
+def ohlcv():
+    n = 50
+    prices = np.linspace(100, 150, n)
+    return pd.DataFrame({
+        'timestamp': pd.date_range("2025-01-01", periods=n, freq="h"),
+        'open': prices,
+        'high': prices + 1,
+        'low': prices - 1,
+        'close': prices,
+        'volume': np.full(n, 1000.0)
+    })
+
+
+@pytest.fixture
+def data_path(ohlcv, tmp_path):
+    return write_shared_ohlcv(ohlcv, tmp_path / "data", tag="BTC")
+
+
+class TestSharedData:
+
+    def test_round_trip(self, ohlcv, data_path):
+        df = load_shared_ohlcv(str(data_path))
+        assert list(df.columns) == list(ohlcv.columns)
+        assert df['close'].tolist() == ohlcv['close'].tolist()
+        assert (df['timestamp'] == ohlcv['timestamp']).all()
+
+    def test_content_addressed(self, ohlcv, data_path, tmp_path):
+        assert write_shared_ohlcv(ohlcv, tmp_path / "data", tag="BTC") == data_path
+        assert write_shared_ohlcv(ohlcv.set_index('timestamp'), tmp_path / "data", tag="BTC") == data_path
+
+
+class TestVerificationPool:
+
+    def test_first_accepted_wins_and_rest_cancelled(self, data_path, tmp_path):
+        pool = VerificationPool(tmp_path / "pool", max_workers=2, timeout=10)
+        candidates = [_candidate(delay=5), _candidate(delay=0), _candidate(delay=0)]
+
+        outcome = pool.verify(candidates, data_path, accept=lambda m: m["trades"] >= 5)
+
+        assert outcome.winner == 1
+        assert outcome.winning_result.metrics["rows"] == 50
+        assert outcome.results[0].status == "cancelled"
+        assert outcome.results[2].status == "cancelled"
+        assert outcome.elapsed_seconds < 5
+        assert list((tmp_path / "pool").iterdir()) == []
+
+    def test_rejected_and_error_candidates(self, data_path, tmp_path):
+        pool = VerificationPool(tmp_path / "pool", max_workers=3, timeout=10)
+        candidates = [_candidate(trades=1), "raise SystemExit('broken')", _candidate(trades=1)]
+
+        outcome = pool.verify(candidates, data_path, accept=lambda m: m["trades"] >= 5)
+
+        assert outcome.winner is None
+        assert [r.status for r in outcome.results] == ["rejected", "error", "rejected"]
+        assert "broken" in outcome.results[1].error
+        assert list((tmp_path / "pool").iterdir()) == []
+
+    def test_timeout(self, data_path, tmp_path):
+        pool = VerificationPool(tmp_path / "pool", timeout=0.5)
+        outcome = pool.verify([_candidate(delay=5)], data_path)
+
+        assert outcome.winner is None
+        assert outcome.results[0].status == "timeout"
+        assert outcome.elapsed_seconds < 5
+        assert list((tmp_path / "pool").iterdir()) == []
+
+
+class TestArchitectForgeParallel:
+
+    @pytest.fixture
+    def forge(self, tmp_path):
+        f = ArchitectForge({"verify_timeout": 30})
+        f.sandbox_dir = tmp_path
+        f.log_dir = tmp_path
+        f.pool = VerificationPool(tmp_path / "pool", timeout=30)
+        return f
+
+    def test_variants_deduplicated(self, forge):
+        code = "rsi < 30 and rsi > 70\nstop_loss_pct: float = 0.05"
+        variants = forge._generate_variants(code)
+        assert len(variants) == 4
+        assert variants[0] == code
+
+        assert forge._generate_variants("no tunable thresholds") == ["no tunable thresholds"]
+
+    def test_shared_data_loaded_once(self, forge):
+        from ds_star.synoptic_core.market_data_client import MarketDataClient, OHLCVCache
+
+        forge._market_client = MarketDataClient(cache=OHLCVCache())
+        forge._market_client.exchange = None  # mock data, no network
+
+        path = forge._load_shared_data("BTC/USDT", "1d", 120)
+        assert len(load_shared_ohlcv(str(path))) == 120
+
+    def test_parallel_build(self, forge, monkeypatch):
+        from ds_star.synoptic_core.market_data_client import MarketDataClient, OHLCVCache
+
+        forge._market_client = MarketDataClient(cache=OHLCVCache())
+        forge._market_client.exchange = None
+        monkeypatch.setattr(forge, "_metrics_acceptable", lambda m: "trades" in m)
+
+        result = forge.build("RSI mean reversion on BTC", timeframe="1d", backtest_days=200)
+
+        assert result.status == "verified"
+        assert result.refinement_iterations == 0
+        assert result.summary["initial_equity"] == 10000
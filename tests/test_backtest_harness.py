@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Backtest Harness Tests
+Strategy extraction from generated scripts and the pooled library run
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.agents.backtest_harness import (
+    discover_strategy_files,
+    extract_strategy_source,
+    run_strategy_library,
+    strip_side_effects,
+)
+
+STRATEGY = '''
+import pandas as pd
+from backtesting import Backtest, Strategy
+
+data = pd.read_csv('/Users/md/Dropbox/BTC-USD-15m.csv')
+LOOKBACK = 5
+
+class Momentum(Strategy):
+    def init(self):
+        pass
+
+    def next(self):
+        print(f"🌙 bar {len(self.data)}")
+        if len(self.data) > LOOKBACK and not self.position:
+            self.buy()
+        elif len(self.data) % 10 == 0 and self.position:
+            self.position.close()
+
+bt = Backtest(data, Momentum, cash=1_000_000)
+print(bt.run())
+'''
+
+
+def _ohlcv(n=300):
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame({
+        'timestamp': pd.date_range("2025-01-01", periods=n, freq="15min"),
+        'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+        'volume': np.ones(n) * 1000
+    })
+
+
+class TestExtraction:
+
+    def test_fenced_reply(self):
+        text = "I'll fix the strategy. Here's the code:\n\n```python\n" + STRATEGY + "```\n\nKey changes: ..."
+        source = extract_strategy_source(text)
+        assert source.startswith("import pandas")
+        assert "Key changes" not in source
+
+    def test_unclosed_fence_and_bare_prose(self):
+        assert "class Momentum" in extract_strategy_source("Sure!\n```python\n" + STRATEGY)
+        text = "Below is the complete fixed code.\n\n" + STRATEGY + "\nThese changes keep the logic intact.\n"
+        source = extract_strategy_source(text)
+        assert source.lstrip().startswith("import pandas")
+        assert "These changes" not in source
+
+    def test_broken_code_is_not_truncated(self):
+        broken = STRATEGY.replace('print(f"🌙 bar {len(self.data)}")', 'print("🌙 MOON\n")')
+        source = extract_strategy_source(broken)
+        assert "bt = Backtest" in source
+        with pytest.raises(SyntaxError):
+            strip_side_effects(source)
+
+    def test_side_effects_and_prints_removed(self):
+        source = strip_side_effects(STRATEGY)
+        assert "read_csv" not in source
+        assert "bt.run" not in source
+        assert "print" not in source
+        assert "LOOKBACK = 5" in source
+        assert "class Momentum" in source
+
+
+class TestDiscovery:
+
+    def test_prefers_final_versions(self, tmp_path):
+        for name in ("A_BT.py", "A_BTFinal.py", "B_BT.py", "C_BTFinal.py", "D_PKG.py", "A_BT.json"):
+            (tmp_path / name).write_text("")
+        assert [p.name for p in discover_strategy_files(tmp_path)] == ["A_BTFinal.py", "B_BT.py", "C_BTFinal.py"]
+        assert len(discover_strategy_files(tmp_path, prefer_final=False)) == 4
+
+
+class TestLibraryRun:
+
+    def test_structured_rows_with_failure_isolation(self, tmp_path):
+        if not hasattr(pytest.importorskip("backtesting"), "Backtest"):
+            pytest.skip("backtesting.py is not installed")
+        (tmp_path / "Good_BTFinal.py").write_text(STRATEGY)
+        (tmp_path / "Broken_BT.py").write_text("from backtesting import Strategy\nclass X(Strategy):\n    def init(self) pass\n")
+        (tmp_path / "Slow_BT.py").write_text(STRATEGY.replace("def init(self):\n        pass",
+                                                              "def init(self):\n        while True: pass"))
+
+        table = run_strategy_library(discover_strategy_files(tmp_path), _ohlcv(),
+                                     work_dir=tmp_path / "cache", max_workers=2, timeout=5)
+        by_file = table.set_index('file')
+
+        assert by_file.loc['Good_BTFinal.py', 'status'] == 'ok'
+        assert by_file.loc['Good_BTFinal.py', 'strategy'] == 'Momentum'
+        assert by_file.loc['Good_BTFinal.py', 'trades'] > 0
+        assert by_file.loc['Broken_BT.py', 'status'] == 'error'
+        assert by_file.loc['Slow_BT.py', 'status'] == 'timeout'
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Brain Store Tests
+Cached BRAIN.json reads, atomic partial writes and change notification
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from core.config.brain_store import BrainStore, get_brain_store, get_path, set_path
+
+
+@pytest.fixture
+def brain_file(tmp_path):
+    path = tmp_path / "BRAIN.json"
+    path.write_text(json.dumps({"version": "3.0", "portfolio": {"exchanges": {"total": 100}}}, indent=2))
+    return path
+
+
+def _append_trades(path, worker, count):
+    store = BrainStore(path)
+    for i in range(count):
+        store.update(lambda brain: brain.setdefault("trade_history", []).append(f"{worker}-{i}"))
+
+
+class TestPaths:
+
+    def test_get_and_set_nested(self):
+        doc = {"a": {"b": 1}}
+        set_path(doc, "a.c.d", 2)
+        assert get_path(doc, "a.c.d") == 2
+        assert get_path(doc, "a.b.x", "missing") == "missing"
+        assert get_path(doc, ["a", "b"]) == 1
+
+
+class TestReads:
+
+    def test_cached_until_file_changes(self, brain_file):
+        store = BrainStore(brain_file)
+        for _ in range(50):
+            assert store.get("portfolio.exchanges.total") == 100
+        assert store.parses == 1
+
+        # Foreign writer (legacy write_text) is picked up via mtime/size/inode
+        brain_file.write_text(json.dumps({"portfolio": {"exchanges": {"total": 250}}}))
+        os.utime(brain_file, ns=(1, 1))
+        assert store.get("portfolio.exchanges.total") == 250
+        assert store.parses == 2
+
+    def test_copies_are_private(self, brain_file):
+        store = BrainStore(brain_file)
+        store.read()["portfolio"]["exchanges"]["total"] = -1
+        assert store.get("portfolio.exchanges.total") == 100
+
+    def test_missing_and_corrupt_files(self, tmp_path):
+        store = BrainStore(tmp_path / "BRAIN.json")
+        assert store.read() == {}
+        store.set("mission.target_usd", 662)
+        (tmp_path / "BRAIN.json").write_text("{ truncated")
+        assert store.get("mission.target_usd") == 662  # last good copy
+
+    def test_registry_shares_instances(self, brain_file):
+        assert get_brain_store(brain_file) is get_brain_store(str(brain_file))
+
+
+class TestWrites:
+
+    def test_partial_updates_keep_other_keys(self, brain_file):
+        store = BrainStore(brain_file)
+        store.set("portfolio.snapshot_time", "2025-01-01")
+        store.merge("portfolio.exchanges", {"coinbase": 40})
+
+        on_disk = json.loads(brain_file.read_text())
+        assert on_disk["version"] == "3.0"
+        assert on_disk["portfolio"] == {"exchanges": {"total": 100, "coinbase": 40}, "snapshot_time": "2025-01-01"}
+        assert "last_updated" in on_disk
+        assert not [p for p in brain_file.parent.iterdir() if p.suffix == ".tmp"]
+
+    def test_failed_mutation_leaves_file_untouched(self, brain_file):
+        before = brain_file.read_text()
+
+        def explode(brain):
+            brain["portfolio"] = None
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            BrainStore(brain_file).update(explode)
+        assert brain_file.read_text() == before
+
+    def test_concurrent_threads_do_not_clobber(self, brain_file):
+        store = BrainStore(brain_file)
+        threads = [threading.Thread(target=lambda w=w: [store.update(
+            lambda b, i=i: b.setdefault("trade_history", []).append(f"{w}-{i}")) for i in range(20)])
+            for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(store.get("trade_history")) == 80
+
+    def test_concurrent_processes_do_not_clobber(self, brain_file):
+        ctx = multiprocessing.get_context("spawn")
+        procs = [ctx.Process(target=_append_trades, args=(brain_file, w, 15)) for w in range(3)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(60)
+        assert sorted(json.loads(brain_file.read_text())["trade_history"]) == \
+            sorted(f"{w}-{i}" for w in range(3) for i in range(15))
+
+
+class TestNotifications:
+
+    def test_local_and_external_changes(self, brain_file):
+        store = BrainStore(brain_file)
+        store.read()
+        seen = []
+        unsubscribe = store.subscribe(lambda paths, brain: seen.append((paths, brain.get("pending_trade"))))
+
+        store.set("pending_trade", {"id": "T1"})
+        brain_file.write_text(json.dumps({"pending_trade": None, "padding": "x"}))
+        store.read()
+        unsubscribe()
+        store.set("pending_trade", {"id": "T2"})
+
+        assert seen == [(["pending_trade"], {"id": "T1"}), ([None], None)]
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Broadcast Hub Tests
+Per-client queues, coalescing of stale frames and slow-client isolation
+"""
+
+import asyncio
+import json
+
+from core.dashboard.broadcast_hub import BroadcastHub
+
+
+class FakeSocket:
+    def __init__(self, name, delay=0.0, fail_with=None):
+        self.client = (name, 1234)
+        self.delay = delay
+        self.fail_with = fail_with
+        self.received = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.closed_with = None
+
+    async def send_text(self, text):
+        await self.gate.wait()
+        if self.fail_with:
+            raise self.fail_with
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def _events(sock):
+    return [(m.get("event"), m.get("n")) for m in sock.received]
+
+
+class TestFanOut:
+
+    def test_slow_client_does_not_delay_others(self):
+        async def scenario():
+            hub = BroadcastHub()
+            fast, slow = FakeSocket("fast"), FakeSocket("slow", delay=0.2)
+            hub.add(fast)
+            hub.add(slow)
+            for n in range(5):
+                hub.publish({"event": "trade_completed", "n": n})
+            await asyncio.sleep(0.05)
+            assert len(fast.received) == 5
+            assert len(slow.received) <= 1
+            await hub.close()
+        asyncio.run(scenario())
+
+    def test_serializes_once(self, monkeypatch):
+        async def scenario():
+            hub = BroadcastHub()
+            calls = []
+            original = hub.serialize
+            monkeypatch.setattr(hub, "serialize", lambda m: calls.append(1) or original(m))
+            socks = [FakeSocket(f"c{i}") for i in range(4)]
+            for s in socks:
+                hub.add(s)
+            assert hub.publish({"event": "trade_completed", "n": 1}) == 4
+            await hub.drain()
+            assert len(calls) == 1
+            assert all(s.received == [{"event": "trade_completed", "n": 1}] for s in socks)
+            await hub.close()
+        asyncio.run(scenario())
+
+
+class TestBackpressure:
+
+    def test_dashboard_frames_coalesce_to_latest(self):
+        async def scenario():
+            hub = BroadcastHub()
+            sock = FakeSocket("wifi")
+            sock.gate.clear()  # stalled client
+            hub.add(sock)
+            await asyncio.sleep(0)
+            for n in range(50):
+                hub.publish({"event": "market_update", "n": n})
+            hub.publish({"event": "trade_completed", "n": 0})
+            hub.publish({"event": "market_update", "n": 99})
+            sock.gate.set()
+            await hub.drain()
+            await asyncio.sleep(0.01)
+            # the queued market frame kept its position but carries the latest payload
+            assert _events(sock) == [("market_update", 99), ("trade_completed", 0)]
+            stats = hub.stats()["clients"][0]
+            assert stats["coalesced"] == 50
+            await hub.close()
+        asyncio.run(scenario())
+
+    def test_full_queue_drops_stale_frames_first(self):
+        async def scenario():
+            hub = BroadcastHub(max_queue=3)
+            sock = FakeSocket("wifi")
+            sock.gate.clear()
+            hub.add(sock)
+            hub.publish({"event": "trade_completed", "n": -1})
+            await asyncio.sleep(0)  # sender picks it up and blocks
+            hub.publish({"event": "market_update", "n": 1})
+            hub.publish({"event": "trade_completed", "n": 2})
+            hub.publish({"event": "stats_update", "n": 3})
+            hub.publish({"event": "trade_completed", "n": 4})  # full: evicts market_update
+            sock.gate.set()
+            await hub.drain()
+            await asyncio.sleep(0.01)
+            assert _events(sock) == [("trade_completed", -1), ("trade_completed", 2),
+                                     ("stats_update", 3), ("trade_completed", 4)]
+            assert hub.stats()["clients"][0]["dropped"] == 1
+            await hub.close()
+        asyncio.run(scenario())
+
+    def test_client_that_cannot_keep_up_is_disconnected(self):
+        async def scenario():
+            hub = BroadcastHub(max_queue=2)
+            sock = FakeSocket("dead-wifi")
+            sock.gate.clear()
+            hub.add(sock)
+            for n in range(4):
+                hub.publish({"event": "trade_completed", "n": n})
+            await asyncio.sleep(0.01)
+            assert len(hub) == 0
+            assert hub.disconnected_slow == 1
+            assert sock.closed_with == 1013
+        asyncio.run(scenario())
+
+
+class TestFailures:
+
+    def test_disconnect_error_removes_client(self):
+        class WebSocketDisconnect(Exception):
+            pass
+
+        async def scenario():
+            hub = BroadcastHub()
+            hub.add(FakeSocket("gone", fail_with=WebSocketDisconnect()))
+            ok = FakeSocket("ok")
+            hub.add(ok)
+            hub.publish({"event": "trade_completed"})
+            await asyncio.sleep(0.01)
+            assert hub.websockets == [ok]
+            await hub.close()
+        asyncio.run(scenario())
+
+    def test_personal_messages_and_lag_metrics(self):
+        async def scenario():
+            hub = BroadcastHub()
+            sock = FakeSocket("phone", delay=0.01)
+            hub.add(sock)
+            assert hub.send_to(sock, {"type": "pong"})
+            hub.publish({"event": "trade_completed"})
+            await hub.drain()
+            await asyncio.sleep(0.03)
+            stats = hub.stats()["clients"][0]
+            assert sock.received[0] == {"type": "pong"}
+            assert stats["sent"] == 2
+            assert stats["max_lag_ms"] >= 10
+            assert stats["client"] == "phone:1234"
+            await hub.close()
+            assert hub.send_to(sock, {"type": "pong"}) is False
+        asyncio.run(scenario())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Exchange Client Pool Tests
+One ccxt client per venue/credentials, with markets primed from the disk cache
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+ccxt = pytest.importorskip("ccxt")
+
+from core.exchanges.client_pool import ClientPool
+
+MARKETS = [{
+    "id": "XBTUSD", "symbol": "BTC/USD", "base": "BTC", "quote": "USD",
+    "baseId": "XBT", "quoteId": "USD", "type": "spot", "spot": True, "active": True,
+    "precision": {"amount": 1e-8, "price": 0.1}, "limits": {}, "info": {},
+}]
+
+
+def _cache_file(directory: Path, venue: str = "kraken") -> Path:
+    files = list(directory.glob(f"{venue}_*.json"))
+    assert len(files) == 1, files
+    return files[0]
+
+
+class Factory:
+    """Real ccxt clients whose market download is counted instead of sent"""
+
+    def __init__(self):
+        self.created = []
+        self.downloads = 0
+
+    def __call__(self, venue, config):
+        client = getattr(ccxt, venue)(config)
+
+        def fetch_markets(params={}):
+            self.downloads += 1
+            return MARKETS
+
+        client.fetch_markets = fetch_markets
+        client.fetch_currencies = lambda params={}: {}
+        self.created.append((venue, config))
+        return client
+
+
+@pytest.fixture
+def factory():
+    return Factory()
+
+
+@pytest.fixture
+def pool(tmp_path, factory):
+    return ClientPool(cache_dir=tmp_path, markets_ttl=3600, factory=factory)
+
+
+class TestClientPool:
+
+    def test_one_client_per_venue_and_credentials(self, pool, factory):
+        public = pool.get("kraken")
+        assert pool.get("Kraken") is public
+        assert pool.get("kraken", apiKey=None, secret=None) is public   # unset keys share the public client
+        keyed = pool.get("kraken", apiKey="k", secret="s")
+        assert keyed is not public
+        assert pool.get("kraken", apiKey="k", secret="s") is keyed
+        assert pool.get("kraken", apiKey="k", secret="other") is not keyed
+        assert len(factory.created) == 3
+        assert factory.created[0][1]["enableRateLimit"] is True
+
+    def test_secrets_not_kept_in_pool_keys(self, pool):
+        pool.get("kraken", apiKey="my-key", secret="my-secret")
+        assert not any("my-secret" in str(key) for key in pool.clients())
+
+    def test_markets_downloaded_once_then_served_from_disk(self, tmp_path, factory):
+        first = ClientPool(cache_dir=tmp_path, factory=factory).get("kraken")
+        assert factory.downloads == 1
+        assert _cache_file(tmp_path).exists()
+
+        # A new process (fresh pool) starts from the cache
+        second = ClientPool(cache_dir=tmp_path, factory=factory).get("kraken")
+        assert factory.downloads == 1
+        assert second.market("BTC/USD")["id"] == "XBTUSD"
+        second.load_markets()
+        assert factory.downloads == 1
+        assert first is not second
+
+    def test_stale_cache_is_refreshed(self, tmp_path, factory):
+        ClientPool(cache_dir=tmp_path, factory=factory).get("kraken")
+        stale = time.time() - 7200
+        os.utime(_cache_file(tmp_path), (stale, stale))
+        ClientPool(cache_dir=tmp_path, markets_ttl=3600, factory=factory).get("kraken")
+        assert factory.downloads == 2
+
+    def test_cache_keyed_by_non_credential_config(self, tmp_path, factory):
+        pool = ClientPool(cache_dir=tmp_path, factory=factory)
+        pool.get("kraken")
+        pool.get("kraken", apiKey="k", secret="s")        # same setup, credentials only
+        assert factory.downloads == 1
+        pool.get("kraken", options={"defaultType": "future"})
+        assert factory.downloads == 2
+        assert len(list(tmp_path.glob("kraken_*.json"))) == 2
+
+        # A fresh process with the futures setup reads its own file
+        ClientPool(cache_dir=tmp_path, factory=factory).get("kraken", options={"defaultType": "future"})
+        assert factory.downloads == 2
+
+    def test_market_load_failure_is_not_fatal(self, pool):
+        def broken(venue, config):
+            client = getattr(ccxt, venue)(config)
+            client.fetch_markets = lambda params={}: (_ for _ in ()).throw(ccxt.NetworkError("offline"))
+            client.fetch_currencies = lambda params={}: {}
+            return client
+
+        pool.factory = broken
+        client = pool.get("kraken")
+        assert not client.markets
+
+    def test_invalidate_and_close(self, pool, factory, tmp_path):
+        pool.get("kraken")
+        pool.invalidate("kraken")
+        assert list(tmp_path.glob("kraken_*.json")) == []
+        pool.close_all()
+        assert pool.clients() == {}
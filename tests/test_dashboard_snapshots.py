@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Dashboard Snapshot Tests
+Precomputed payloads, per-candle refresh and the background job queue
+"""
+
+import json
+import threading
+import time
+
+from core.dashboard.snapshots import JobQueue, SnapshotCache, SnapshotRefresher, candle_index, file_signature
+
+
+def _wait(queue, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+class TestSnapshotCache:
+
+    def test_rebuilds_only_when_source_changes(self):
+        cache = SnapshotCache()
+        calls = []
+        build = lambda: calls.append(1) or {"value": len(calls)}
+
+        first = cache.get_or_build("portfolio", "v1", build)
+        assert cache.get_or_build("portfolio", "v1", build) is first
+        second = cache.get_or_build("portfolio", "v2", build)
+
+        assert len(calls) == 2
+        assert json.loads(second.body) == {"value": 2}
+        assert first.etag != second.etag
+
+    def test_etag_is_content_hash(self):
+        cache = SnapshotCache()
+        a = cache.put("a", {"x": 1}, "s1")
+        b = cache.put("a", {"x": 1}, "s2")
+        assert a.etag == b.etag
+
+    def test_single_flight_under_concurrent_polls(self):
+        cache = SnapshotCache()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"ok": True}
+
+        threads = [threading.Thread(target=cache.get_or_build, args=("signals", 1, slow)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+
+    def test_errors_cached_briefly(self):
+        cache = SnapshotCache(error_ttl=0.05)
+
+        def boom():
+            raise RuntimeError("exchange down")
+
+        snapshot = cache.get_or_build("moondev:BTC", 1, boom)
+        assert snapshot.status == 500
+        assert cache.get_or_build("moondev:BTC", 1, lambda: {"ok": 1}).status == 500
+        time.sleep(0.06)
+        assert cache.get_or_build("moondev:BTC", 1, lambda: {"ok": 1}).status == 200
+
+    def test_status_tuple_and_listeners(self):
+        cache = SnapshotCache()
+        changed = []
+        cache.subscribe(lambda snap: changed.append(snap.key))
+        snapshot = cache.get_or_build("moondev:XYZ", 1, lambda: ({"error": "no data"}, 404))
+        cache.put("moondev:XYZ", {"error": "no data"}, 2, status=404)
+        assert snapshot.status == 404
+        assert changed == ["moondev:XYZ"]
+
+
+class TestRefresher:
+
+    def test_static_snapshots_follow_file_signature(self, tmp_path):
+        path = tmp_path / "pending.json"
+        path.write_text("[]")
+        refresher = SnapshotRefresher(SnapshotCache())
+        refresher.register("signals", lambda: file_signature(path), lambda: json.loads(path.read_text()))
+
+        assert json.loads(refresher.get("signals").body) == []
+        path.write_text('[{"symbol": "ETH"}]')
+        refresher.run_once()
+        assert json.loads(refresher.cache.peek("signals").body) == [{"symbol": "ETH"}]
+
+    def test_symbols_rebuilt_once_per_candle(self):
+        built = []
+        refresher = SnapshotRefresher(SnapshotCache(), timeframe_seconds=3600, close_delay=5)
+        refresher.register_symbol("moondev", lambda s: built.append(s) or {"symbol": s})
+        refresher.watch("btc")
+
+        close = 3600 * 500_000
+        refresher.run_once(now=close - 10)
+        refresher.run_once(now=close + 1)   # bar closed, but inside close_delay
+        assert built == ["BTC"]
+        refresher.run_once(now=close + 6)
+        assert built == ["BTC", "BTC"]
+
+    def test_on_demand_symbol_is_watched(self):
+        refresher = SnapshotRefresher(SnapshotCache())
+        refresher.register_symbol("moondev", lambda s: {"symbol": s})
+        snapshot = refresher.get_symbol("moondev", "sol")
+        assert json.loads(snapshot.body) == {"symbol": "SOL"}
+        assert refresher.symbols == ["SOL"]
+        assert refresher.get_symbol("moondev", "SOL") is snapshot
+
+    def test_failed_or_excess_symbols_not_watched(self):
+        refresher = SnapshotRefresher(SnapshotCache(), max_on_demand=2)
+        refresher.register_symbol("moondev", lambda s: ({"error": "unknown"}, 404) if s == "NOPE" else {"symbol": s})
+        refresher.watch("btc")
+
+        assert refresher.get_symbol("moondev", "nope").status == 404
+        assert refresher.symbols == ["BTC"]
+
+        for symbol in ("eth", "sol", "eth", "ada"):
+            refresher.get_symbol("moondev", symbol)
+        # Least recently requested on-demand symbol dropped; watch() ones are kept
+        assert refresher.symbols == ["ADA", "BTC", "ETH"]
+
+    def test_unkept_symbols_leave_no_cache_entries(self):
+        cache = SnapshotCache()
+        refresher = SnapshotRefresher(cache, max_on_demand=2)
+        refresher.register_symbol("moondev", lambda s: ({"error": "unknown"}, 404) if s.startswith("NOPE") else {"symbol": s})
+
+        for i in range(100):
+            refresher.get_symbol("moondev", f"nope{i}")
+        for symbol in ("eth", "sol", "ada"):
+            refresher.get_symbol("moondev", symbol)
+
+        assert sorted(cache.keys()) == ["moondev:ADA", "moondev:SOL"]
+        assert sorted(cache._build_locks) == ["moondev:ADA", "moondev:SOL"]
+
+    def test_background_thread(self):
+        refresher = SnapshotRefresher(SnapshotCache(), poll_seconds=0.01)
+        refresher.register("health", lambda: candle_index(1), lambda: {"ok": True})
+        refresher.start()
+        try:
+            deadline = time.time() + 2
+            while refresher.cache.peek("health") is None and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            refresher.stop()
+        assert refresher.cache.peek("health") is not None
+
+
+class TestJobQueue:
+
+    def test_job_lifecycle_and_dedupe(self):
+        queue = JobQueue()
+        release = threading.Event()
+        first = queue.submit("cycle", lambda: release.wait(5) and {"cycle": 1})
+        again = queue.submit("cycle", lambda: {"cycle": 2})
+        assert again["id"] == first["id"]
+        assert first["status"] == "queued"
+
+        release.set()
+        job = _wait(queue, first["id"])
+        assert job["status"] == "done"
+        assert job["result"] == {"cycle": 1}
+        assert "result" not in queue.list()[0]
+        queue.shutdown()
+
+    def test_failures_are_recorded(self):
+        queue = JobQueue()
+
+        def fail():
+            raise ValueError("runner import failed")
+
+        job = _wait(queue, queue.submit("cycle", fail)["id"])
+        assert job["status"] == "failed"
+        assert job["error"] == "runner import failed"
+        assert queue.get("missing") is None
+        queue.shutdown()
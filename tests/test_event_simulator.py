@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Event Simulator Tests
+Virtual clock and event-ordered tick replay
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from core.monitoring.trigger_index import ABOVE, BELOW, TriggerIndex
+from research.ladder_engine.event_simulator import (
+    EventDrivenSimulator,
+    VirtualClock,
+    synthetic_ticks,
+)
+
+START = datetime(2025, 1, 1)
+
+
+class FakeMarket:
+    def __init__(self):
+        self.clock = None
+        self.replay_mode = False
+        self.current_prices = {}
+
+    def record_tick(self, symbol, price, volume=None):
+        self.current_prices[symbol] = price
+        return SimpleNamespace(symbol=symbol, price=price, timestamp=self.clock.now())
+
+
+class FakeEngine:
+    """Minimal engine surface: long entries at market, TP above / SL below"""
+
+    def __init__(self):
+        self.clock = None
+        self.market_simulator = FakeMarket()
+        self.trigger_index = TriggerIndex()
+        self.ticks = []
+        self.fills = []
+        self.open = set()
+
+    async def process_signal(self, signal):
+        await self.clock.sleep(3)  # fill delay costs virtual time only
+        self.open.add(signal.signal_id)
+        self.trigger_index.add(signal.symbol, signal.tp1_price, ABOVE, (signal.signal_id, 'tp1'))
+        self.trigger_index.add(signal.symbol, signal.sl_price, BELOW, (signal.signal_id, 'sl'))
+        return {'success': True, 'signal_id': signal.signal_id, 'filled_at': self.clock.now()}
+
+    async def on_price(self, symbol, market_data):
+        self.ticks.append((market_data.timestamp, symbol, market_data.price))
+        for trigger in self.trigger_index.pop_satisfied(symbol, market_data.price,
+                                                        lambda t: t.payload[0] in self.open):
+            signal_id, kind = trigger.payload
+            self.open.discard(signal_id)
+            self.fills.append((signal_id, kind, market_data.price, self.clock.now()))
+
+
+def _signal(signal_id, symbol='BTCUSDT', tp=105.0, sl=95.0):
+    return SimpleNamespace(signal_id=signal_id, symbol=symbol, tp1_price=tp, sl_price=sl)
+
+
+def _minutes(*prices, start=START):
+    return [(start + timedelta(minutes=i), p) for i, p in enumerate(prices)]
+
+
+class TestVirtualClock:
+
+    def test_sleep_advances_and_never_rewinds(self):
+        clock = VirtualClock(START)
+        asyncio.run(clock.sleep(90))
+        assert clock.now() == START + timedelta(seconds=90)
+        clock.advance_to(START)
+        assert clock.now() == START + timedelta(seconds=90)
+
+
+class TestEventDrivenSimulator:
+
+    def test_merges_sources_in_time_order(self):
+        engine = FakeEngine()
+        sim = EventDrivenSimulator(engine, VirtualClock(START))
+        sim.add_ticks('BTCUSDT', _minutes(100, 101, 102))
+        sim.add_ticks('ETHUSDT', [(START + timedelta(seconds=30 + 60 * i), p) for i, p in enumerate((10, 11))])
+        summary = sim.run_sync()
+
+        assert engine.market_simulator.replay_mode
+        assert [t[1] for t in engine.ticks] == ['BTCUSDT', 'ETHUSDT', 'BTCUSDT', 'ETHUSDT', 'BTCUSDT']
+        assert summary['ticks'] == 5
+        assert summary['virtual_time'] == START + timedelta(minutes=2)
+
+    def test_signal_then_exit_on_crossing_tick(self):
+        engine = FakeEngine()
+        sim = EventDrivenSimulator(engine, VirtualClock(START))
+        sim.add_ticks('BTCUSDT', _minutes(100, 103, 104, 106, 90))
+        sim.add_signal(START + timedelta(seconds=30), _signal('s1'))
+        sim.run_sync()
+
+        assert sim.signal_results[0]['filled_at'] == START + timedelta(seconds=33)
+        assert engine.fills == [('s1', 'tp1', 106, START + timedelta(minutes=3))]
+
+    def test_until_and_callbacks(self):
+        engine = FakeEngine()
+        sim = EventDrivenSimulator(engine, VirtualClock(START))
+        sim.add_ticks('BTCUSDT', _minutes(*range(100, 110)))
+        seen = []
+        sim.call_at(START + timedelta(minutes=2, seconds=1), lambda: seen.append(sim.clock.now()))
+        sim.run_sync(until=START + timedelta(minutes=4))
+
+        assert len(engine.ticks) == 5
+        assert seen == [START + timedelta(minutes=2, seconds=1)]
+
+    def test_month_of_minute_ticks_in_seconds(self):
+        engine = FakeEngine()
+        sim = EventDrivenSimulator(engine, VirtualClock(START))
+        minutes = 30 * 24 * 60
+        for i, symbol in enumerate(('BTCUSDT', 'ETHUSDT')):
+            sim.add_ticks(symbol, synthetic_ticks(100.0, START, minutes, daily_volatility=0.05, seed=i))
+        for day in range(30):
+            sim.add_signal(START + timedelta(days=day, hours=1), _signal(f"s{day}", tp=101, sl=99))
+
+        started = time.perf_counter()
+        summary = sim.run_sync()
+        assert summary['ticks'] == 2 * minutes
+        assert summary['virtual_time'] >= START + timedelta(days=29)
+        assert len(engine.fills) == 30
+        assert time.perf_counter() - started < 10.0
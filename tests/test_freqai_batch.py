@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - FreqAI Batch Scoring Tests
+Watchlist scoring in one model call and the risk gate's per-bar cache
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.ml.freqai_scaffold import AdaptFreqAIScaffold
+from core.trading.tactical_risk_gate import TacticalRiskGate
+
+FEATURES = ['open', 'high', 'low', 'close', 'volume']
+
+
+def _frame(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    close = rng.random(n) * 100
+    df = pd.DataFrame({col: rng.random(n) * 100 for col in FEATURES})
+    df['close'] = close
+    df['signal'] = (close > 50).astype(int)
+    return df
+
+
+@pytest.fixture(scope="module")
+def scaffold():
+    scaffold = AdaptFreqAIScaffold({"n_estimators": 10, "n_jobs": 1, "scale_features": True})
+    scaffold.train_model(_frame())
+    return scaffold
+
+
+class CountingModel:
+    """Wraps a fitted model and counts predict_proba calls"""
+
+    def __init__(self, model):
+        self.model = model
+        self.classes_ = model.classes_
+        self.calls = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        return self.model.predict_proba(X)
+
+
+class TestPredictBatch:
+
+    def test_matches_single_row_predictions(self, scaffold):
+        watchlist = {f"SYM{i}": _frame(5, seed=i)[FEATURES] for i in range(20)}
+        results = scaffold.predict_batch(watchlist)
+
+        assert set(results) == set(watchlist)
+        for symbol, frame in watchlist.items():
+            assert results[symbol]["signal"] == scaffold.predict_signal(frame.iloc[[-1]])
+            assert 0.5 <= results[symbol]["probability"] <= 1.0
+
+    def test_frame_indexed_by_symbol(self, scaffold):
+        stacked = _frame(3, seed=9)[FEATURES]
+        stacked.index = ["BTC", "ETH", "SOL"]
+        results = scaffold.predict_batch(stacked)
+        assert list(results) == ["BTC", "ETH", "SOL"]
+        assert results["ETH"]["signal"] == scaffold.predict_signal(stacked.loc[["ETH"]])
+
+    def test_one_model_call_for_the_watchlist(self, scaffold):
+        counting = CountingModel(scaffold.model)
+        local = AdaptFreqAIScaffold({"n_jobs": 1})
+        local.swap_model(counting, scaffold.scaler)
+
+        local.predict_batch({f"SYM{i}": _frame(2, seed=i)[FEATURES] for i in range(50)})
+        assert counting.calls == 1
+
+    def test_invalid_and_untrained(self, scaffold):
+        results = scaffold.predict_batch({"BTC": _frame(2)[FEATURES], "BAD": pd.DataFrame({"close": [1.0]})})
+        assert results["BAD"]["signal"] == "NO_SIGNAL_INVALID_FEATURES"
+        assert results["BTC"]["signal"] in (0, 1)
+
+        untrained = AdaptFreqAIScaffold().predict_batch({"BTC": _frame(2)[FEATURES]})
+        assert untrained["BTC"]["signal"] == "NO_SIGNAL_UNTRAINED"
+
+
+class TestRiskGateBarCache:
+
+    @pytest.fixture
+    def gate(self, scaffold, tmp_path):
+        config_path = tmp_path / "tactical_scalp_config.json"
+        config_path.write_text(json.dumps({"freqai_config": {"n_jobs": 1, "bar_seconds": 60}}))
+        gate = TacticalRiskGate(str(config_path))
+        counting = CountingModel(scaffold.model)
+        gate.adapt_freqai_scaffold.swap_model(counting, scaffold.scaler)
+        return gate, counting
+
+    def test_cached_for_the_current_bar(self, gate):
+        gate, counting = gate
+        watchlist = {f"SYM{i}": _frame(2, seed=i)[FEATURES] for i in range(10)}
+
+        gate.score_freqai_watchlist(watchlist, bar_time=120.0)
+        gate.get_freqai_signal(watchlist["SYM3"], asset="SYM3", bar_time=150.0)
+        assert counting.calls == 1
+
+        gate.get_freqai_signal(watchlist["SYM3"], asset="SYM3", bar_time=180.0)
+        assert counting.calls == 2
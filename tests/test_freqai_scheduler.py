@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - FreqAI Training Scheduler Tests
+Warm-start fits, feature caching and background hot-swaps
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.ml.freqai_scaffold import AdaptFreqAIScaffold, fit_model
+from core.ml.freqai_scheduler import FeatureCache, FreqAITrainingScheduler
+
+
+def _frame(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    close = rng.random(n) * 100
+    return pd.DataFrame({
+        'open': rng.random(n) * 100,
+        'high': rng.random(n) * 100 + 10,
+        'low': rng.random(n) * 100 - 10,
+        'close': close,
+        'volume': rng.random(n) * 10000,
+        'signal': (close > 50).astype(int)
+    }, index=pd.date_range("2025-01-01", periods=n, freq="h"))
+
+
+class TestWarmStart:
+
+    def test_rolling_forest_keeps_newest_trees(self):
+        config = {"n_estimators": 10, "warm_start_trees": 4, "n_jobs": 1}
+        df = _frame()
+        X, y = df[['close']].to_numpy(), df['signal'].to_numpy()
+
+        model, _ = fit_model(config, X, y)
+        first_seeds = [t.random_state for t in model.estimators_]
+        warm, _ = fit_model(config, X, y, previous=(model, None))
+
+        assert len(warm.estimators_) == 10
+        assert [t.random_state for t in warm.estimators_[:6]] == first_seeds[4:]
+        assert len(model.estimators_) == 10  # live model untouched
+
+    def test_window_missing_a_class_rebuilds_forest(self):
+        config = {"n_estimators": 10, "warm_start_trees": 4, "n_jobs": 1}
+        df = _frame()
+        X = df[['close']].to_numpy()
+        y = np.digitize(df['close'].to_numpy(), [33, 66])  # three classes
+
+        model, _ = fit_model(config, X, y)
+        window = y < 2                                       # class 2 missing
+        warm, _ = fit_model(config, X[window], y[window], previous=(model, None))
+
+        assert list(warm.classes_) == [0, 1]
+        assert warm.predict_proba(X[:5]).shape == (5, 2)
+        assert list(model.classes_) == [0, 1, 2]
+
+    def test_partial_fit_models_update_incrementally(self):
+        config = {"model_type": "SGD", "scale_features": True}
+        df = _frame()
+        X, y = df[['close', 'volume']].to_numpy(), df['signal'].to_numpy()
+
+        model, scaler = fit_model(config, X, y)
+        warm, warm_scaler = fit_model(config, X, y, previous=(model, scaler))
+
+        assert warm is not model
+        assert warm_scaler is scaler
+        assert warm.t_ > model.t_
+
+    def test_adapt_model_uses_rolling_window(self):
+        scaffold = AdaptFreqAIScaffold({"n_estimators": 8, "train_window": 150, "n_jobs": 1})
+        scaffold.train_model(_frame())
+        assert scaffold.is_trained and scaffold.model_version == 1
+
+        scaffold.adapt_model(_frame(600, seed=1))
+        assert scaffold.model_version == 2
+        assert len(scaffold.model.estimators_) == 8
+        assert scaffold.predict_signal(_frame(1)) in (0, 1)
+
+
+class TestFeatureCache:
+
+    def test_only_new_rows_are_engineered(self):
+        def engineer(df):
+            return pd.DataFrame({'ma': df['close'].rolling(3).mean()}, index=df.index)
+
+        df = _frame(100)
+        cache = FeatureCache(engineer, lookback=2)
+        cache.get(df.iloc[:90])
+        features = cache.get(df)
+
+        assert cache.rows_engineered == 100
+        expected = engineer(df).dropna()
+        pd.testing.assert_frame_equal(features, expected)
+
+
+class TestScheduler:
+
+    def test_background_retrain_hot_swaps(self):
+        scaffold = AdaptFreqAIScaffold({"n_estimators": 8, "n_jobs": 1})
+        scheduler = FreqAITrainingScheduler(scaffold, train_window=300, retrain_interval=0)
+        try:
+            scheduler.submit(_frame())
+            assert scaffold.predict_signal(_frame(1)) in ("NO_SIGNAL_UNTRAINED", 0, 1)
+            scheduler.wait(timeout=60)
+
+            assert scaffold.is_trained
+            assert scheduler.retrain_count == 1
+            assert scaffold.predict_signal(_frame(1)) in (0, 1)
+        finally:
+            scheduler.shutdown()
+
+    def test_submissions_while_busy_are_coalesced(self):
+        scaffold = AdaptFreqAIScaffold({"n_estimators": 8, "n_jobs": 1})
+        scheduler = FreqAITrainingScheduler(scaffold, train_window=300, retrain_interval=0,
+                                            use_process=False)
+        try:
+            for seed in range(5):
+                scheduler.submit(_frame(seed=seed))
+            scheduler.wait(timeout=60)
+            assert 1 <= scheduler.retrain_count <= 2
+        finally:
+            scheduler.shutdown()
+
+    def test_predict_never_sees_torn_swap(self):
+        scaffold = AdaptFreqAIScaffold({"n_estimators": 4, "n_jobs": 1, "scale_features": True})
+        scaffold.train_model(_frame())
+        row = _frame(1)
+        errors = []
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                if scaffold.predict_signal(row) not in (0, 1):
+                    errors.append(True)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for seed in range(5):
+            scaffold.train_model(_frame(seed=seed))
+        stop.set()
+        thread.join()
+        assert not errors
+
+    def test_not_due_skips(self):
+        scaffold = AdaptFreqAIScaffold({"n_estimators": 4, "n_jobs": 1})
+        scheduler = FreqAITrainingScheduler(scaffold, retrain_interval=3600, use_process=False)
+        scheduler.last_trained_at = float("inf")
+        try:
+            assert scheduler.submit(_frame()) is None
+        finally:
+            scheduler.shutdown()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Ledger Store Tests
+Indexed SQLite ledger, incremental holdings and transactional CSV import
+"""
+
+import io
+import json
+
+import pytest
+
+COINBASE_CSV = """You can use this transaction report to inform your likely tax obligations.
+Transactions
+
+ID,Timestamp,Transaction Type,Asset,Quantity Transacted,Subtotal,Notes
+a1,2025-01-03 10:00:00 UTC,Buy,BTC,0.5,"45,000.00",Bought BTC
+a2,2025-02-03 10:00:00 UTC,Buy,ETH,4,"12,000.00",Bought ETH
+a3,2025-03-03 10:00:00 UTC,Sell,BTC,0.1,"9,500.00",Sold BTC
+"""
+
+
+def _basis(ledger):
+    return {r["symbol"]: r["cost_basis"] for r in ledger.conn.execute("SELECT symbol, cost_basis FROM holdings")}
+
+
+@pytest.fixture
+def ledger_module():
+    return pytest.importorskip("ds_star.portfolio.ledger", exc_type=ImportError)
+
+
+@pytest.fixture
+def ledger(ledger_module, tmp_path):
+    service = ledger_module.LedgerService(str(tmp_path / "ledger.json"))
+    yield service
+    service.close()
+
+
+class TestEntries:
+
+    def test_crud_keeps_holdings_in_sync(self, ledger):
+        btc = ledger.add_entry("btc", 1.0, source="Ledger", cost_basis=30_000)
+        ledger.add_entry("BTC", 0.5, source="cold")
+        eth = ledger.add_entry("eth", 2.0)
+        assert ledger.get_aggregated_holdings() == {"BTC": 1.5, "ETH": 2.0}
+
+        updated = ledger.update_entry(btc["id"], {"amount": 2.0, "tags": ["hw"]})
+        assert updated["amount"] == 2.0 and updated["tags"] == ["hw"]
+        ledger.update_entry(eth["id"], {"symbol": "weth"})
+        assert ledger.get_aggregated_holdings() == {"BTC": 2.5, "WETH": 2.0}
+
+        assert ledger.delete_entry(eth["id"]) is True
+        assert ledger.delete_entry(eth["id"]) is False
+        assert ledger.get_aggregated_holdings() == {"BTC": 2.5}
+        assert ledger.update_entry("missing", {"amount": 1}) is None
+
+    def test_indexed_lookups(self, ledger):
+        ledger.add_entry("BTC", 1.0, source="Ledger")
+        ledger.add_entry("ETH", 1.0, source="ledger")
+        ledger.add_entry("ETH", 3.0, source="manual")
+        assert [e["amount"] for e in ledger.get_by_symbol("eth")] == [1.0, 3.0]
+        assert len(ledger.get_by_source("LEDGER")) == 2
+        plan = " ".join(r[3] for r in ledger.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM entries WHERE symbol = ?", ("ETH",)))
+        assert "idx_entries_symbol" in plan
+
+    def test_stats(self, ledger):
+        ledger.add_entry("BTC", 1.0, cost_basis=100)
+        ledger.add_entry("ETH", 1.0, source="cold", cost_basis=50)
+        stats = ledger.get_stats()
+        assert stats["total_entries"] == 2 and stats["unique_sources"] == 2
+        assert stats["total_cost_basis"] == 150
+        assert sorted(stats["symbols"]) == ["BTC", "ETH"]
+
+
+class TestMigration:
+
+    def test_legacy_json_migrated_once(self, ledger_module, tmp_path):
+        path = tmp_path / "ledger.json"
+        path.write_text(json.dumps({"entries": [
+            {"id": "keep-me", "symbol": "XRP", "amount": 100, "source": "manual", "tags": ["old"]}
+        ]}))
+        first = ledger_module.LedgerService(str(path))
+        assert first.get_entry("keep-me")["tags"] == ["old"]
+        first.delete_entry("keep-me")
+        first.close()
+
+        again = ledger_module.LedgerService(str(path))
+        assert again.get_all_entries() == []
+        again.close()
+
+
+class TestCsvImport:
+
+    def test_coinbase_export(self, ledger):
+        result = ledger.import_csv(io.StringIO(COINBASE_CSV), source="coinbase")
+        assert result == {"imported": 3, "skipped": 0, "rows": 3}
+        assert ledger.get_aggregated_holdings() == pytest.approx({"BTC": 0.4, "ETH": 4.0})
+        assert ledger.get_by_source("coinbase")[0]["cost_basis"] == 45_000.0
+
+        # Re-importing the same export is a no-op
+        assert ledger.import_csv(io.StringIO(COINBASE_CSV), source="coinbase")["imported"] == 0
+
+    def test_bad_row_rolls_back_whole_import(self, ledger):
+        bad = "Asset,Quantity\nBTC,1\nETH,not-a-number\n"
+        with pytest.raises(ValueError):
+            ledger.import_csv(io.StringIO(bad), source="kraken")
+        assert ledger.get_all_entries() == []
+        assert ledger.get_aggregated_holdings() == {}
+
+    def test_thousands_of_rows_in_one_transaction(self, ledger):
+        rows = "\n".join(f"t{i},SOL,0.01" for i in range(5000))
+        ledger.import_csv(io.StringIO("ID,Asset,Amount\n" + rows), source="okx")
+        assert ledger.get_aggregated_holdings()["SOL"] == pytest.approx(50.0)
+        assert ledger.get_stats()["total_entries"] == 5000
+
+    def test_sell_releases_pro_rata_basis(self, ledger):
+        export = (
+            "ID,Timestamp,Transaction Type,Asset,Quantity Transacted,Total (inclusive of fees and/or spread)\n"
+            "b1,2025-01-03,Buy,BTC,1,40100\n"
+            "b2,2025-02-03,Sell,BTC,0.5,25000\n"
+        )
+        ledger.import_csv(io.StringIO(export), source="coinbase")
+
+        assert ledger.get_aggregated_holdings() == {"BTC": 0.5}
+        assert _basis(ledger) == {"BTC": pytest.approx(20_050)}
+        assert ledger.get_stats()["total_cost_basis"] == pytest.approx(20_050)
+
+        # A later export overlapping the first costs only its new rows
+        export += "b3,2025-03-03,Sell,BTC,0.25,15000\n"
+        assert ledger.import_csv(io.StringIO(export), source="coinbase")["imported"] == 1
+        assert _basis(ledger) == {"BTC": pytest.approx(10_025)}
+
+    def test_convert_is_an_outflow_with_a_target_leg(self, ledger):
+        export = (
+            "ID,Timestamp,Transaction Type,Asset,Quantity Transacted,Subtotal,Notes\n"
+            "c1,2025-01-03,Buy,ETH,2,6000,Bought ETH\n"
+            "c2,2025-02-03,Convert,ETH,2,6200,Converted 2 ETH to 0.1 BTC\n"
+        )
+        result = ledger.import_csv(io.StringIO(export), source="coinbase")
+
+        assert result["imported"] == 3
+        assert ledger.get_aggregated_holdings() == pytest.approx({"ETH": 0.0, "BTC": 0.1})
+        assert _basis(ledger) == pytest.approx({"ETH": 0.0, "BTC": 6200.0})
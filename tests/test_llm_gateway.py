@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - LLM Gateway Tests
+Cache, coalescing and metrics against a local stub LM Studio server
+"""
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.ai import llm_gateway
+from core.ai.llm_gateway import LLMGateway, normalize_prompt
+from core.integrations.local_llm import LocalLLM
+
+
+class _StubLLMHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible /chat/completions endpoint."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.hits += 1
+        time.sleep(self.server.delay)
+        prompt = body["messages"][0]["content"]
+        payload = {"choices": [{"message": {"content": f"echo: {prompt}"}}]}
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubLLMHandler)
+    server.hits = 0
+    server.delay = 0.2
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fresh_gateway(monkeypatch):
+    gw = LLMGateway(ttl_seconds=60, max_entries=8)
+    monkeypatch.setattr("core.integrations.local_llm.gateway", gw)
+    return gw
+
+
+class TestLLMGateway:
+    """Test cache keying, TTL, eviction and coalescing"""
+
+    def test_normalize_prompt(self):
+        assert normalize_prompt("  Analyze\n\nBTC   now ") == "Analyze BTC now"
+
+    def test_cache_hit_skips_fetch(self):
+        gw = LLMGateway()
+        calls = []
+        fetch = lambda: calls.append(1) or "ok"
+
+        assert gw.call("p", "m", "Analyze BTC", fetch, temperature=0.3, caller="a") == "ok"
+        assert gw.call("p", "m", "Analyze   BTC ", fetch, temperature=0.3, caller="b") == "ok"
+        assert len(calls) == 1
+
+        metrics = gw.get_metrics()["callers"]
+        assert metrics["a"]["upstream_calls"] == 1
+        assert metrics["b"]["cache_hits"] == 1
+
+    def test_temperature_and_model_are_part_of_key(self):
+        gw = LLMGateway()
+        calls = []
+        fetch = lambda: calls.append(1) or "ok"
+
+        gw.call("p", "m", "q", fetch, temperature=0.3)
+        gw.call("p", "m", "q", fetch, temperature=0.7)
+        gw.call("p", "m2", "q", fetch, temperature=0.3)
+        assert len(calls) == 3
+
+    def test_ttl_expiry(self):
+        gw = LLMGateway(ttl_seconds=0.05)
+        calls = []
+        fetch = lambda: calls.append(1) or "ok"
+
+        gw.call("p", "m", "q", fetch)
+        time.sleep(0.1)
+        gw.call("p", "m", "q", fetch)
+        assert len(calls) == 2
+
+    def test_lru_eviction(self):
+        gw = LLMGateway(max_entries=2)
+        for prompt in ("a", "b", "c"):
+            gw.call("p", "m", prompt, lambda: prompt)
+        assert gw.get_metrics()["cache_entries"] == 2
+
+        calls = []
+        gw.call("p", "m", "a", lambda: calls.append(1) or "a")
+        assert calls == [1]
+
+    def test_error_results_not_cached(self):
+        gw = LLMGateway()
+        calls = []
+        fetch = lambda: calls.append(1) or "Error: down"
+
+        gw.call("p", "m", "q", fetch, should_cache=llm_gateway.is_ok_text)
+        gw.call("p", "m", "q", fetch, should_cache=llm_gateway.is_ok_text)
+        assert len(calls) == 2
+
+    def test_exception_propagates_to_followers(self):
+        gw = LLMGateway()
+        barrier = threading.Event()
+        errors = []
+
+        def fetch():
+            barrier.wait(1)
+            raise RuntimeError("boom")
+
+        def worker():
+            try:
+                gw.call("p", "m", "q", fetch)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        barrier.set()
+        for t in threads:
+            t.join()
+        assert errors == ["boom"] * 3
+
+    def test_followers_give_up_after_timeout(self):
+        gw = LLMGateway()
+        release = threading.Event()
+        errors = []
+
+        def leader():
+            gw.call("p", "m", "q", lambda: release.wait(2) and "late")
+
+        threads = [threading.Thread(target=leader)]
+        threads[0].start()
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            gw.call("p", "m", "q", lambda: "unused", caller="follower", timeout=0.1)
+        assert time.monotonic() - started < 1
+        assert gw.get_metrics()["callers"]["follower"]["errors"] == 1
+        release.set()
+        threads[0].join()
+
+
+class TestSmartAIThroughGateway:
+    """SmartAI.ask caches under the provider that answered"""
+
+    def test_fallback_answer_cached_under_fallback_provider(self, monkeypatch):
+        from core.ai import smart_ai
+
+        gw = LLMGateway()
+        monkeypatch.setattr(smart_ai, "gateway", gw)
+        ai = smart_ai.SmartAI(auto_test=False)
+        anthropic, openai = smart_ai.PROVIDERS[0], smart_ai.PROVIDERS[1]
+        ai.working_provider = anthropic
+
+        def upstream(message, system_prompt=None, retries=2):
+            ai.working_provider = openai     # anthropic key expired mid-request
+            return "from openai"
+
+        monkeypatch.setattr(ai, "_ask_upstream", upstream)
+        assert ai.ask("BTC?") == "from openai"
+
+        assert gw.make_key("anthropic", anthropic["model"], "BTC?") not in gw._cache
+        assert gw.make_key("openai", openai["model"], "BTC?") in gw._cache
+
+        monkeypatch.setattr(ai, "_ask_upstream", lambda *a, **k: pytest.fail("served from cache"))
+        assert ai.ask("BTC?") == "from openai"
+
+
+class TestLocalLLMThroughGateway:
+    """LocalLLM.analyze against a stub server"""
+
+    def test_concurrent_identical_prompts_coalesce(self, stub_server, fresh_gateway):
+        llm = LocalLLM(base_url=f"http://127.0.0.1:{stub_server.server_port}")
+        results = []
+
+        def worker():
+            results.append(llm.analyze("BTC outlook?", caller="agent"))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert stub_server.hits == 1
+        assert results == ["echo: BTC outlook?"] * 5
+
+        stats = fresh_gateway.get_metrics()["callers"]["agent"]
+        assert stats["calls"] == 5
+        assert stats["upstream_calls"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["upstream_latency_s"] >= 0.2
+        assert stats["completion_tokens"] > 0
+
+        llm.analyze("BTC outlook?")
+        assert stub_server.hits == 1
+
+    def test_use_cache_false_bypasses_gateway(self, stub_server, fresh_gateway):
+        stub_server.delay = 0
+        llm = LocalLLM(base_url=f"http://127.0.0.1:{stub_server.server_port}")
+        llm.analyze("ETH?", use_cache=False)
+        llm.analyze("ETH?", use_cache=False)
+        assert stub_server.hits == 2
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Market Data Cache Tests
+Candle-aligned OHLCV cache and shared indicator frames
+"""
+
+import time
+
+import pytest
+
+from ds_star.synoptic_core.market_data_client import (
+    MarketDataClient,
+    OHLCVCache,
+    compute_indicator_frame,
+)
+
+HOUR_MS = 3600 * 1000
+
+
+class FakeExchange:
+    """Returns hourly candles ending at the current hour"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def fetch_ohlcv(self, pair, timeframe, since=None):
+        self.calls += 1
+        now_ms = int(time.time() * 1000)
+        first = (since // HOUR_MS + 1) * HOUR_MS
+        rows = []
+        t = first
+        i = 0
+        while t <= now_ms:
+            price = 100 + (i % 17) - (i % 5)
+            rows.append([t, price, price + 2, price - 2, price + 1, 1000 + i])
+            t += HOUR_MS
+            i += 1
+        return rows
+
+
+@pytest.fixture
+def client():
+    c = MarketDataClient(cache=OHLCVCache())
+    c.exchange = FakeExchange()
+    return c
+
+
+class TestOHLCVCache:
+
+    def test_repeat_fetch_is_memory_lookup(self, client):
+        first = client.get_ohlcv("BTC", "1h", 10)
+        second = client.get_ohlcv("BTC", "1h", 10)
+
+        assert client.exchange.calls == 1
+        assert second.equals(first)
+        assert client.cache.stats()["hits"] == 1
+
+    def test_shorter_lookback_served_from_longer_entry(self, client):
+        long = client.get_ohlcv("BTC", "1h", 10)
+        short = client.get_ohlcv("BTC", "1h", 3)
+
+        assert client.exchange.calls == 1
+        assert len(short) < len(long)
+        assert short.index[-1] == long.index[-1]
+
+    def test_longer_lookback_refetches(self, client):
+        client.get_ohlcv("BTC", "1h", 3)
+        client.get_ohlcv("BTC", "1h", 10)
+        assert client.exchange.calls == 2
+
+    def test_key_includes_timeframe_and_exchange(self, client):
+        client.get_ohlcv("BTC", "1h", 3)
+        client.get_ohlcv("BTC/USDT", "1h", 3)
+        assert client.exchange.calls == 1
+
+        client.get_ohlcv("BTC", "4h", 3)
+        assert client.exchange.calls == 2
+
+        other = MarketDataClient(exchange_id="binanceus", cache=client.cache)
+        other.exchange = client.exchange
+        other.get_ohlcv("BTC", "1h", 3)
+        assert client.exchange.calls == 3
+
+    def test_entry_expires_at_candle_close(self, client):
+        client.get_ohlcv("BTC", "1h", 3)
+        entry = client.cache.peek(("kraken", "BTC/USDT", "1h"))
+        remaining = entry.expires_at - time.time()
+        assert 0 < remaining <= 3600
+
+        entry.expires_at = time.time() - 1
+        client.get_ohlcv("BTC", "1h", 3)
+        assert client.exchange.calls == 2
+
+    def test_callers_cannot_mutate_cache(self, client):
+        df = client.get_ohlcv("BTC", "1h", 3)
+        df['close'] = 0
+        assert client.get_ohlcv("BTC", "1h", 3)['close'].iloc[-1] != 0
+
+    def test_mock_data_not_cached(self, client):
+        client.exchange = None
+        client.get_ohlcv("BTC", "1d", 30)
+        assert client.cache.stats()["entries"] == 0
+
+
+class TestIndicatorFrame:
+
+    def test_indicator_frame_shared_between_consumers(self, client, monkeypatch):
+        computed = []
+        import ds_star.synoptic_core.market_data_client as mdc
+        real = mdc.compute_indicator_frame
+        monkeypatch.setattr(mdc, "compute_indicator_frame", lambda df: computed.append(1) or real(df))
+
+        summary = client.get_indicators(client.get_ohlcv("BTC", "1h", 10))
+        frame = client.get_indicator_frame(client.get_ohlcv("BTC", "1h", 10))
+
+        assert len(computed) == 1
+        assert summary["rsi"] == pytest.approx(frame["rsi"].iloc[-1])
+        assert summary["macd"]["histogram"] == pytest.approx(frame["macd_hist"].iloc[-1])
+
+    def test_summary_matches_direct_computation(self, client):
+        df = client._mock_ohlcv("ETH", 90)
+        frame = compute_indicator_frame(df)
+        summary = client.get_indicators(df)
+
+        assert summary["ema_50"] == pytest.approx(frame["ema_50"].iloc[-1])
+        assert summary["bb_middle"] == pytest.approx(frame["bb_mid"].iloc[-1])
+        assert summary["close"] == pytest.approx(df["close"].iloc[-1])
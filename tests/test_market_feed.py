@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Market Feed Tests
+Single upstream subscription fanned out to local Unix-socket subscribers
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from core.monitoring.market_feed import (
+    MarketFeedClient, MarketFeedDaemon, Tick, TickCache, normalize_coinbase, stream_ticks,
+)
+
+
+def _ticker(product, price, **extra):
+    return json.dumps(dict({"type": "ticker", "product_id": product, "price": str(price)}, **extra))
+
+
+class FakeUpstream:
+    """Stands in for the exchange websocket: records subscribes, replays pushed messages"""
+
+    def __init__(self):
+        self.connects = 0
+        self.sent = []
+        self.queue = asyncio.Queue()
+
+    def __call__(self, url):
+        upstream = self
+
+        class _Conn:
+            async def __aenter__(self):
+                upstream.connects += 1
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def send(self, text):
+                upstream.sent.append(json.loads(text))
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                return await upstream.queue.get()
+
+        return _Conn()
+
+    def push(self, product, price, **extra):
+        self.queue.put_nowait(_ticker(product, price, **extra))
+
+    def push_raw(self, **message):
+        self.queue.put_nowait(json.dumps(message))
+
+
+@pytest.fixture
+def sock_path(tmp_path):
+    return str(tmp_path / "feed.sock")
+
+
+async def _settle(seconds=0.05):
+    await asyncio.sleep(seconds)
+
+
+class TestNormalize:
+
+    def test_coinbase_ticker(self):
+        tick = normalize_coinbase(json.loads(_ticker("BTC-USD", 100000, open_24h="95000", best_bid="99999")))
+        assert (tick.symbol, tick.price, tick.bid) == ("BTC", 100000.0, 99999.0)
+        assert tick.change_24h_pct == pytest.approx(5.263, abs=1e-3)
+        assert normalize_coinbase({"type": "subscriptions"}) is None
+        assert tick.as_ticker_message()["product_id"] == "BTC-USD"
+
+    def test_cache_change_over_window(self):
+        cache = TickCache(history_step=30)
+        for minute in range(0, 61):
+            cache.update(Tick("ETH", "ETH-USD", 100.0 + minute, ts=1_000_000 + minute * 60))
+        assert cache.change_pct("ETH", 3600) == pytest.approx(60.0)
+        assert cache.change_pct("ETH", 7200) is None
+
+
+class TestDaemon:
+
+    def test_one_upstream_many_subscribers(self, sock_path):
+        async def scenario():
+            upstream = FakeUpstream()
+            daemon = MarketFeedDaemon(["BTC-USD"], socket_path=sock_path, connect=upstream)
+            await daemon.start()
+            await asyncio.wait_for(daemon.connected.wait(), 1)
+
+            received = {name: [] for name in ("scanner", "risk", "alerts")}
+
+            async def consume(name, symbols, count):
+                async for tick in stream_ticks(symbols, socket_path=sock_path):
+                    received[name].append((tick.symbol, tick.price))
+                    if len(received[name]) == count:
+                        return
+
+            tasks = [asyncio.create_task(consume("scanner", ["BTC", "FET"], 2)),
+                     asyncio.create_task(consume("risk", ["*"], 2)),
+                     asyncio.create_task(consume("alerts", ["BTC"], 1))]
+            await _settle()
+            upstream.push("BTC-USD", 100000)
+            await _settle()
+            upstream.push("FET-USD", 0.25)
+            await asyncio.wait_for(asyncio.gather(*tasks), 2)
+
+            assert upstream.connects == 1
+            # FET was not streamed yet: the scanner's subscribe extended the upstream subscription
+            assert upstream.sent[0]["product_ids"] == ["BTC-USD"]
+            assert upstream.sent[1]["product_ids"] == ["FET-USD"]
+            assert received["scanner"] == [("BTC", 100000.0), ("FET", 0.25)]
+            assert received["risk"] == [("BTC", 100000.0), ("FET", 0.25)]
+            assert received["alerts"] == [("BTC", 100000.0)]
+            await daemon.stop()
+        asyncio.run(scenario())
+
+    def test_slow_subscriber_gets_latest_not_backlog(self, sock_path):
+        async def scenario():
+            upstream = FakeUpstream()
+            daemon = MarketFeedDaemon(["BTC-USD"], socket_path=sock_path, connect=upstream)
+            await daemon.start()
+            reader, writer = await asyncio.open_unix_connection(sock_path)
+            writer.write(b'{"op": "subscribe", "symbols": ["BTC"]}\n')
+            await writer.drain()
+            await _settle()
+            for i in range(200):
+                daemon.publish(Tick("BTC", "BTC-USD", 100.0 + i, ts=time.time()))
+            await _settle()
+            lines = []
+            while True:
+                try:
+                    lines.append(json.loads(await asyncio.wait_for(reader.readline(), 0.1)))
+                except asyncio.TimeoutError:
+                    break
+            assert len(lines) < 200
+            assert lines[-1]["price"] == 299.0
+            writer.close()
+            await daemon.stop()
+        asyncio.run(scenario())
+
+    def test_upstream_reconnects(self, sock_path):
+        async def scenario():
+            upstream = FakeUpstream()
+            calls = {"n": 0}
+
+            def flaky(url):
+                calls["n"] += 1
+                if calls["n"] == 1:
+                    raise ConnectionError("rate limited")
+                return upstream(url)
+
+            daemon = MarketFeedDaemon(["BTC-USD"], socket_path=sock_path, connect=flaky, reconnect_delay=0.01)
+            await daemon.start()
+            await asyncio.wait_for(daemon.connected.wait(), 1)
+            assert daemon.stats["upstream_errors"] == 1 and upstream.connects == 1
+            await daemon.stop()
+        asyncio.run(scenario())
+
+    def test_rejected_product_dropped_and_reported(self, sock_path):
+        async def scenario():
+            upstream = FakeUpstream()
+            daemon = MarketFeedDaemon(["BTC-USD", "ETH-USD"], socket_path=sock_path, connect=upstream)
+            await daemon.start()
+            await asyncio.wait_for(daemon.connected.wait(), 1)
+            # One subscribe per product, so one bad id cannot sink the batch
+            assert [m["product_ids"] for m in upstream.sent] == [["BTC-USD"], ["ETH-USD"]]
+            upstream.push_raw(type="subscriptions", channels=[])
+            upstream.push_raw(type="subscriptions", channels=[])
+
+            reader, writer = await asyncio.open_unix_connection(sock_path)
+            writer.write(b'{"op": "subscribe", "symbols": ["NOPE", "SOL", "BAD/COIN"]}\n')
+            await writer.drain()
+            await _settle()
+            assert [m["product_ids"] for m in upstream.sent[2:]] == [["NOPE-USD"], ["SOL-USD"]]
+
+            upstream.push_raw(type="error", message="Failed to subscribe", reason="NOPE-USD is not a valid product")
+            upstream.push_raw(type="subscriptions", channels=[])
+            upstream.push("SOL-USD", 150)
+            messages = [json.loads(await asyncio.wait_for(reader.readline(), 1)) for _ in range(3)]
+
+            errors = {m["product_id"]: m["reason"] for m in messages if m["type"] == "error"}
+            assert errors == {"BAD/COIN-USD": "malformed product id",
+                              "NOPE-USD": "NOPE-USD is not a valid product"}
+            assert [m["symbol"] for m in messages if m["type"] == "tick"] == ["SOL"]
+            assert daemon.products == {"BTC-USD", "ETH-USD", "SOL-USD"}
+            assert "NOPE-USD" in daemon.rejected
+            writer.close()
+            await daemon.stop()
+        asyncio.run(scenario())
+
+    def test_error_without_product_blames_oldest_unacked(self, sock_path):
+        async def scenario():
+            upstream = FakeUpstream()
+            daemon = MarketFeedDaemon(["AAA-USD", "BTC-USD"], socket_path=sock_path, connect=upstream)
+            await daemon.start()
+            await asyncio.wait_for(daemon.connected.wait(), 1)
+            upstream.push_raw(type="error", message="Failed to subscribe", reason="")
+            upstream.push_raw(type="subscriptions", channels=[])
+            await _settle()
+            assert daemon.products == {"BTC-USD"}
+            await daemon.stop()
+        asyncio.run(scenario())
+
+
+class TestSyncClient:
+
+    def test_client_prices_and_history_seed(self, sock_path):
+        async def scenario():
+            upstream = FakeUpstream()
+            daemon = MarketFeedDaemon(["BTC-USD"], socket_path=sock_path, connect=upstream)
+            await daemon.start()
+            now = time.time()
+            daemon.publish(Tick("BTC", "BTC-USD", 90.0, ts=now - 3700))
+            daemon.publish(Tick("BTC", "BTC-USD", 99.0, ts=now))
+
+            client = MarketFeedClient(["BTC"], socket_path=sock_path).start()
+            loop = asyncio.get_running_loop()
+            assert await loop.run_in_executor(None, client.wait_for, ["BTC"], 2.0)
+            assert client.get_price("BTC") == 99.0
+            assert client.change_pct("BTC", 3600) == pytest.approx(10.0)
+            assert client.get_price("ETH") is None
+
+            daemon.publish(Tick("BTC", "BTC-USD", 101.0, ts=time.time()))
+            await _settle(0.1)
+            assert client.get_price("BTC") == 101.0
+            await loop.run_in_executor(None, client.stop)
+            await daemon.stop()
+        asyncio.run(scenario())
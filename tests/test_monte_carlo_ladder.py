@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Monte Carlo Ladder Tests
+Vectorized tier fills, TP1/TP2/SL/timeout exits and outcome distributions
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from research.ladder_engine.monte_carlo_ladder import (
+    COGNITIVE_EXIT,
+    NO_FILL,
+    SL_HIT,
+    TIMEOUT,
+    TP1_HIT,
+    TP2_HIT,
+    MonteCarloLadderSimulator,
+    build_ladder_config,
+)
+
+SIGNAL = {
+    'symbol': 'BTC/USD',
+    'entry_price': 100.0,
+    'capital': 1000.0,
+    'tp1_price': 102.0,
+    'tp2_price': 104.0,
+    'sl_price': 97.0
+}
+
+
+@pytest.fixture
+def ladder():
+    return build_ladder_config(SIGNAL, ray_score=75)
+
+
+@pytest.fixture
+def sim():
+    # 3 entry steps + 5 monitoring steps, frictionless for exact arithmetic
+    return MonteCarloLadderSimulator(step_seconds=1, entry_seconds=3, monitor_seconds=5,
+                                     slippage_factor=0.0, fee_rate=0.0, seed=0)
+
+
+def _paths(*rows):
+    return np.array(rows, dtype=np.float64)
+
+
+class TestLadderConfig:
+
+    def test_tiers_match_live_engine_layout(self, ladder):
+        prices = [t['price'] for t in ladder['tiers']]
+        assert prices[0] == pytest.approx(99.5) and prices[-1] == pytest.approx(100.5)
+        assert prices == sorted(prices)
+        assert sum(t['capital'] for t in ladder['tiers']) == pytest.approx(1000.0)
+
+
+class TestEvaluate:
+
+    def test_exit_paths(self, sim, ladder):
+        paths = _paths(
+            [100, 99, 99, 99, 101, 104.5, 104.5, 104.5, 104.5],  # full fill, straight through TP2
+            [100, 99, 99, 99, 102.5, 101, 96, 96, 96],           # TP1, runner stopped
+            [100, 99, 99, 99, 98, 96.5, 99, 99, 99],             # stopped before TP1
+            [100, 99, 99, 99, 100, 100, 100, 100, 101],          # timeout
+            [101, 101, 101, 101, 90, 90, 90, 90, 90]             # never trades into the ladder
+        )
+        out = sim.evaluate(ladder, paths)
+
+        assert list(out.outcome) == [TP2_HIT, TP1_HIT, SL_HIT, TIMEOUT, NO_FILL]
+        assert list(out.filled_tiers) == [6, 6, 6, 6, 0]
+        assert out.invested[0] == pytest.approx(1000.0)
+
+        qty = sum(t['capital'] / t['price'] for t in ladder['tiers'])
+        assert out.proceeds[0] == pytest.approx(qty * 104.5)
+        assert out.proceeds[1] == pytest.approx(qty * (0.6 * 102.5 + 0.4 * 96))
+        assert out.proceeds[2] == pytest.approx(qty * 96.5)
+        assert out.proceeds[3] == pytest.approx(qty * 101)
+        assert out.pnl[4] == 0
+
+    def test_partial_fill_only_buys_touched_tiers(self, sim, ladder):
+        paths = _paths([100.5, 100.2, 100.1, 100.1, 100, 100, 100, 100, 100])
+        out = sim.evaluate(ladder, paths)
+        touched = [t for t in ladder['tiers'] if t['price'] >= 100.1]
+        assert out.filled_tiers[0] == len(touched)
+        assert out.invested[0] == pytest.approx(sum(t['capital'] for t in touched))
+
+    def test_cognitive_exit(self, sim):
+        ladder = build_ladder_config(SIGNAL, ray_score=30)
+        out = sim.evaluate(ladder, _paths([100, 99, 99, 99, 98, 110, 110, 110, 110]))
+        assert out.outcome[0] == COGNITIVE_EXIT
+        qty = sum(t['capital'] / t['price'] for t in ladder['tiers'])
+        assert out.proceeds[0] == pytest.approx(qty * 98)
+
+    def test_drawdown_tracks_open_position(self, sim, ladder):
+        paths = _paths([100, 99, 99, 99, 101, 100, 99.5, 101, 101])
+        out = sim.evaluate(ladder, paths)
+        qty = sum(t['capital'] / t['price'] for t in ladder['tiers'])
+        assert out.max_drawdown_pct[0] == pytest.approx((1 - 99.5 * qty / (101 * qty)) * 100)
+
+
+class TestDistributions:
+
+    def test_summary_probabilities(self, ladder):
+        sim = MonteCarloLadderSimulator(n_paths=4000, seed=1)
+        summary = sim.score(ladder, 100.0, volatility=0.2)
+
+        assert summary['paths'] == 4000
+        assert sum(summary['hit_probabilities'].values()) == pytest.approx(1.0)
+        assert summary['hit_probabilities']['TP2_HIT'] > 0
+        assert summary['hit_probabilities']['SL_HIT'] > 0
+        pct = summary['pnl_percentiles_usd']
+        assert pct['p5'] <= pct['p50'] <= pct['p95']
+        assert summary['path_model'] == 'gbm'
+
+    def test_bootstrap_paths(self, ladder):
+        sim = MonteCarloLadderSimulator(n_paths=200, seed=2)
+        returns = np.random.default_rng(0).normal(0, 0.002, 5000)
+        paths = sim.bootstrap_paths(100.0, returns)
+        assert paths.shape == (200, sim.n_steps + 1)
+        assert (paths[:, 0] == 100.0).all()
+        assert sim.score(ladder, 100.0, returns=returns)['path_model'] == 'bootstrap'
+
+    def test_rank_uses_common_paths(self):
+        sim = MonteCarloLadderSimulator(n_paths=2000, seed=3)
+        tight = build_ladder_config(dict(SIGNAL, sl_price=99.0), 75)
+        wide = build_ladder_config(SIGNAL, 75)
+        ranked = sim.rank([tight, wide], 100.0, volatility=0.1)
+        assert {r['candidate'] for r in ranked} == {0, 1}
+        assert ranked[0]['expected_pnl_usd'] >= ranked[1]['expected_pnl_usd']
+        by_candidate = {r['candidate']: r for r in ranked}
+        assert by_candidate[0]['hit_probabilities']['SL_HIT'] > by_candidate[1]['hit_probabilities']['SL_HIT']
+
+    def test_thousands_of_paths_quickly(self, ladder):
+        sim = MonteCarloLadderSimulator(n_paths=5000, seed=4)
+        started = time.perf_counter()
+        sim.score(ladder, 100.0, volatility=0.05)
+        # The real-time simulator needs ~35 minutes per path
+        assert time.perf_counter() - started < 2.0
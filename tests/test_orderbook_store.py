@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Order Book Store Tests
+Streamed binary recording, chunk rotation and memory-mapped replay
+"""
+
+import numpy as np
+import pytest
+
+from core.ml.orderbook_store import (
+    HEADER_SIZE,
+    OrderBookReader,
+    OrderBookRecorder,
+    read_header,
+    record_width,
+)
+from core.ml.vector_orderbook_env import VectorDepthOrderBookEnv
+
+
+def _book(t, levels=3):
+    mid = 100 + t
+    bids = [[mid - 0.5 - i, 1.0 + i] for i in range(levels)]
+    asks = [[mid + 0.5 + i, 2.0 + i] for i in range(levels)]
+    return bids, asks
+
+
+def _record(directory, n, levels=3, **kwargs):
+    with OrderBookRecorder(directory, "BTC/USD", levels=levels, **kwargs) as recorder:
+        for t in range(n):
+            recorder.record(1000.0 + t, *_book(t, levels))
+    return recorder
+
+
+class TestOrderBookStore:
+
+    def test_round_trip(self, tmp_path):
+        recorder = _record(tmp_path, 10)
+        path = recorder.chunk_paths[0]
+
+        header = read_header(path)
+        assert header["levels"] == 3 and header["symbol"] == "BTC/USD"
+        assert path.stat().st_size == HEADER_SIZE + 10 * record_width(3) * 8
+
+        ts, bids, asks = OrderBookReader(path).load()
+        assert ts.tolist() == [1000.0 + t for t in range(10)]
+        assert bids[4].tolist() == _book(4)[0]
+        assert asks[9].tolist() == _book(9)[1]
+
+    def test_chunk_rotation_and_directory_reader(self, tmp_path):
+        recorder = _record(tmp_path, 25, chunk_records=10, flush_every=4)
+        assert len(recorder.chunk_paths) == 3
+        assert recorder.records_written == 25
+
+        reader = OrderBookReader(tmp_path, symbol="BTC/USD")
+        assert len(reader) == 25
+        assert [len(t) for t, _, _ in reader.iter_chunks()] == [10, 10, 5]
+        ts, _, _ = reader.load()
+        assert np.all(np.diff(ts) == 1)
+
+    def test_directory_with_several_symbols_needs_symbol(self, tmp_path):
+        _record(tmp_path, 5)
+        with OrderBookRecorder(tmp_path, "BTC", levels=3) as recorder:
+            recorder.record(1.0, *_book(0))
+
+        with pytest.raises(ValueError, match="pass symbol="):
+            OrderBookReader(tmp_path)
+        # "BTC" is a file-name prefix of "BTC_USD" chunks; the header decides
+        assert len(OrderBookReader(tmp_path, symbol="BTC")) == 1
+        assert len(OrderBookReader(tmp_path, symbol="BTC/USD")) == 5
+        with pytest.raises(FileNotFoundError):
+            OrderBookReader(tmp_path, symbol="ETH/USD")
+
+    def test_views_are_memory_mapped(self, tmp_path):
+        recorder = _record(tmp_path, 5)
+        chunk = OrderBookReader(recorder.chunk_paths[0]).chunks[0]
+        ts, bids, asks = chunk.timestamps, chunk.bids, chunk.asks
+
+        assert isinstance(chunk.records, np.memmap)
+        assert np.shares_memory(bids, chunk.records) and np.shares_memory(asks, chunk.records)
+        assert not bids.flags.writeable
+
+    def test_shallow_books_padded_and_deep_truncated(self, tmp_path):
+        with OrderBookRecorder(tmp_path, "ETH/USD", levels=4) as recorder:
+            recorder.record(1.0, [[10, 1]], [[11, 1]] * 6)
+        _, bids, asks = OrderBookReader(recorder.chunk_paths[0]).load()
+        assert bids[0].tolist() == [[10, 1], [0, 0], [0, 0], [0, 0]]
+        assert asks.shape == (1, 4, 2)
+
+    def test_torn_trailing_record_ignored(self, tmp_path):
+        recorder = _record(tmp_path, 6)
+        with open(recorder.chunk_paths[0], "ab") as f:
+            f.write(b"\x00" * 17)
+        assert len(OrderBookReader(recorder.chunk_paths[0])) == 6
+
+    def test_rejects_foreign_files(self, tmp_path):
+        bad = tmp_path / "x.obk"
+        bad.write_bytes(b"JUNK" + b"\x00" * 100)
+        with pytest.raises(ValueError):
+            OrderBookReader(bad)
+
+    def test_vector_env_replays_recording(self, tmp_path):
+        _record(tmp_path, 40)
+        env = VectorDepthOrderBookEnv.from_snapshots(tmp_path, 4, {"num_levels": 3, "max_steps": 10}, seed=0)
+        env.reset()
+        assert env.mid_price == pytest.approx(100 + env.cursor)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Portfolio Aggregator Tests
+Concurrent venue fetches, bulk quotes and stale-while-revalidate summaries
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from ds_star.data_feeds.cex_client import CEXClient
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    @property
+    def text(self):
+        return str(self.payload)
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, headers=None):
+        self.calls.append(url)
+        for suffix, payload in self.routes.items():
+            if url.endswith(suffix):
+                if isinstance(payload, Exception):
+                    raise payload
+                if isinstance(payload, FakeResponse):
+                    return payload
+                return FakeResponse(payload)
+        return FakeResponse({}, 404)
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        return self.get(url, timeout=timeout)
+
+
+class FakeVenue:
+    def __init__(self, holdings, delay=0.0, error=None):
+        self.holdings = holdings
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def is_configured(self):
+        return True
+
+    def get_balances(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return list(self.holdings)
+
+    get_accounts = get_balances
+
+
+class TestBulkPrices:
+
+    def test_one_request_covers_all_symbols(self):
+        session = FakeSession({"/exchange-rates": {"data": {"rates": {"BTC": "0.00001", "ETH": "0.0005"}}}})
+        prices = CEXClient.get_bulk_prices(["btc", "ETH", "USDC"], session=session)
+        assert prices == pytest.approx({"BTC": 100_000.0, "ETH": 2_000.0, "USDC": 1.0})
+        assert len(session.calls) == 1
+
+    def test_coingecko_fills_the_gaps(self):
+        session = FakeSession({
+            "/exchange-rates": {"data": {"rates": {"BTC": "0.00001"}}},
+            "/simple/price": {"solana": {"usd": 150.0}, "aave": {"usd": 300.0}}
+        })
+        prices = CEXClient.get_bulk_prices(["BTC", "SOL", "AAVE", "UNKNOWN"], session=session)
+        assert prices == pytest.approx({"BTC": 100_000.0, "SOL": 150.0, "AAVE": 300.0})
+        assert len(session.calls) == 2
+
+
+@pytest.fixture
+def aggregator(tmp_path, monkeypatch):
+    module = pytest.importorskip("ds_star.portfolio.aggregator", exc_type=ImportError)
+    monkeypatch.chdir(tmp_path)
+    agg = module.PortfolioAggregator(venue_timeout=0.3, summary_ttl=0.2, summary_max_stale=5.0)
+    agg.coinbase = FakeVenue([{"symbol": "BTC", "amount": 1.0}])
+    agg.kraken = FakeVenue([{"symbol": "ETH", "amount": 10.0}], delay=0.1)
+    agg.okx = FakeVenue([{"symbol": "ETH", "amount": 5.0}], delay=0.1)
+    agg.binance_us = FakeVenue([], error=RuntimeError("auth failed"))
+    agg.ledger_wallet = None
+    monkeypatch.setattr(CEXClient, "get_bulk_prices",
+                        classmethod(lambda cls, symbols, session=None: {"BTC": 100.0, "ETH": 10.0}))
+    return agg
+
+
+class TestAggregator:
+
+    def test_venues_fetched_concurrently_with_partial_results(self, aggregator):
+        started = time.monotonic()
+        holdings = aggregator.fetch_all_holdings()
+        assert time.monotonic() - started < 0.19  # not 0.1 + 0.1 in series
+        assert holdings["kraken"] and holdings["okx"] and holdings["binance_us"] == []
+        assert aggregator.venue_status["binance_us"] == {
+            "ok": False, "stale": False, "error": "auth failed",
+            "latency_ms": aggregator.venue_status["binance_us"]["latency_ms"]}
+
+    def test_slow_venue_times_out_and_serves_last_good(self, aggregator):
+        aggregator.fetch_all_holdings()
+        aggregator.okx.delay = 1.0
+        started = time.monotonic()
+        holdings = aggregator.fetch_all_holdings()
+        assert time.monotonic() - started < 0.6
+        assert holdings["okx"] == [{"symbol": "ETH", "amount": 5.0}]
+        assert aggregator.venue_status["okx"]["stale"] is True
+
+    def test_summary_values_and_flags_partial(self, aggregator):
+        summary = aggregator.get_portfolio_summary()
+        assert summary["net_worth"] == 250.0
+        assert summary["partial"] is True
+        assert summary["stale"] is False
+
+    def test_stale_while_revalidate(self, aggregator):
+        aggregator.get_portfolio_summary()
+        assert aggregator.get_portfolio_summary()["stale"] is False
+        assert aggregator.coinbase.calls == 1
+
+        time.sleep(0.25)
+        aggregator.coinbase.holdings = [{"symbol": "BTC", "amount": 2.0}]
+        started = time.monotonic()
+        stale = aggregator.get_portfolio_summary()
+        assert time.monotonic() - started < 0.05  # served from cache, refresh in background
+        assert stale["stale"] is True and stale["net_worth"] == 250.0
+
+        deadline = time.monotonic() + 2
+        while aggregator.coinbase.calls < 2 or aggregator._refreshing:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert aggregator.get_portfolio_summary()["net_worth"] == 350.0
+
+    def test_cold_callers_share_one_build(self, aggregator):
+        threads = [threading.Thread(target=aggregator.get_portfolio_summary) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert aggregator.coinbase.calls == 1
+        aggregator.get_portfolio_summary(force_refresh=True)
+        assert aggregator.coinbase.calls == 2
+
+
+KRAKEN_OK = {"error": [], "result": {"XXBT": "0.5"}}
+
+
+@pytest.fixture
+def real_clients(monkeypatch):
+    module = pytest.importorskip("ds_star.portfolio.exchange_clients", exc_type=ImportError)
+    monkeypatch.setenv("KRAKEN_API_KEY", "key")
+    monkeypatch.setenv("KRAKEN_PRIVATE_KEY", "c2VjcmV0")
+    monkeypatch.setenv("BINANCE_US_API_KEY", "key")
+    monkeypatch.setenv("BINANCE_US_SECRET_KEY", "secret")
+    return module
+
+
+class TestVenueClientErrors:
+
+    @pytest.mark.parametrize("failure", [
+        FakeResponse({"error": "boom"}, 503),
+        FakeResponse({"error": ["EAPI:Invalid key"], "result": {}}),
+        requests.Timeout("read timed out"),
+    ])
+    def test_failures_raise_when_asked(self, real_clients, failure):
+        session = FakeSession({"/0/private/Balance": failure})
+        client = real_clients.KrakenClient(session=session, raise_errors=True)
+        with pytest.raises(real_clients.VenueError):
+            client.get_balances()
+        # Legacy callers keep the empty-list behaviour
+        assert real_clients.KrakenClient(session=session).get_balances() == []
+
+    def test_aggregator_keeps_last_good_on_real_client_errors(self, real_clients, aggregator):
+        session = FakeSession({"/0/private/Balance": KRAKEN_OK,
+                               "/api/v3/account": FakeResponse({"msg": "down"}, 500)})
+        aggregator.kraken = real_clients.KrakenClient(session=session, raise_errors=True)
+        aggregator.binance_us = real_clients.BinanceUSClient(session=session, raise_errors=True)
+
+        holdings = aggregator.fetch_all_holdings()
+        assert holdings["kraken"][0]["symbol"] == "BTC"
+        assert aggregator.venue_status["binance_us"]["ok"] is False
+
+        session.routes["/0/private/Balance"] = FakeResponse({"error": "bad gateway"}, 502)
+        holdings = aggregator.fetch_all_holdings()
+        assert holdings["kraken"][0]["amount"] == 0.5
+        assert aggregator.venue_status["kraken"]["ok"] is False
+        assert aggregator.venue_status["kraken"]["stale"] is True
+
+    def test_aggregator_builds_raising_clients(self, aggregator):
+        fresh = type(aggregator)()
+        assert all(c.raise_errors for c in (fresh.coinbase, fresh.kraken, fresh.okx, fresh.binance_us))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Realtime Risk Bridge Tests
+Per-bar regime updates through the bridge, including gap re-priming,
+and tick ingestion from the shared market feed
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("hmmlearn")
+
+from core.integrations import realtime_risk_bridge as rb
+from core.monitoring import market_feed
+from core.monitoring.market_feed import Tick
+
+
+class FakePipeline:
+    """Serves hourly bars up to `now` - the last one is still forming"""
+
+    def __init__(self, prices, now):
+        self.prices = prices
+        self.now = now
+        self.requests = []
+
+    def get_ohlcv(self, symbol, days=30):
+        self.requests.append(days)
+        return self.prices.iloc[:self.now].tail(days * 24)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    n = 400
+    vol = np.where(np.arange(n) < 200, 0.005, 0.03)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, vol)))
+    return pd.DataFrame({'Close': close}, index=pd.date_range("2025-01-01", periods=n, freq="h"))
+
+
+@pytest.fixture
+def bridge(monkeypatch, tmp_path):
+    monkeypatch.setattr(rb, "TacticalRiskGate", lambda: None)
+    monkeypatch.setattr(rb, "ReflectAgent", lambda: None)
+    monkeypatch.setattr(rb, "MOONDEV_AVAILABLE", False)
+    return rb.RealtimeRiskBridge({
+        "regime_config": {"model_path": str(tmp_path / "regime_hmm.pkl"), "volatility_window": 20}
+    })
+
+
+def _batch_posterior(detector, frame):
+    features = detector.scaler.transform(detector.compute_features(frame).to_numpy())
+    return detector.hmm_model.predict_proba(features)[-1]
+
+
+class TestRegimeUpdates:
+
+    def test_bar_close_then_gap_reprime(self, bridge, prices, monkeypatch):
+        detector = bridge.regime_detector
+        pipeline = FakePipeline(prices, now=300)
+        bridge._regime_pipeline = pipeline
+        resets = []
+        reset_filter = detector.reset_filter
+        monkeypatch.setattr(detector, "reset_filter", lambda: resets.append(pipeline.now) or reset_filter())
+
+        # First run trains on 30 days and primes the filter
+        bridge.update_regime_detection(force=True)
+        assert pipeline.requests == [30]
+        assert resets == [300]
+        assert detector.last_timestamp == prices.index[298]
+
+        # One more bar closes - only the last day is pulled and one bar is fed
+        pipeline.now = 301
+        bridge.update_regime_detection(force=True)
+        assert pipeline.requests == [30, 1]
+        assert resets == [300]
+        assert detector.last_timestamp == prices.index[299]
+        assert bridge.risk_state.current_regime == detector.current_regime
+
+        # Bridge was down for a day and a half - the filter is re-primed from history
+        pipeline.now = 360
+        bridge.update_regime_detection(force=True)
+        assert pipeline.requests == [30, 1, 1, 30]
+        assert resets == [300, 360]
+        assert detector.last_timestamp == prices.index[358]
+        expected = _batch_posterior(detector, prices.iloc[:359])
+        assert list(detector.regime_probabilities().values()) == pytest.approx(expected, abs=1e-6)
+
+
+class TestMarketFeedIngest:
+
+    def test_feed_ticks_reach_bridge(self, bridge, monkeypatch):
+        requested = []
+
+        async def fake_stream_ticks(symbols):
+            requested.append(list(symbols))
+            yield Tick(symbol="BTC", product_id="BTC-USD", price=50000.0,
+                       high_24h=51000.0, low_24h=49000.0, volume_24h=12.5, ts=1_700_000_000)
+            yield Tick(symbol="ETH", product_id="ETH-USD", price=3000.0, ts=1_700_000_001)
+            yield Tick(symbol="BTC", product_id="BTC-USD", price=50100.0, ts=1_700_000_002)
+
+        monkeypatch.setattr(market_feed, "feed_available", lambda: True)
+        monkeypatch.setattr(market_feed, "stream_ticks", fake_stream_ticks)
+        monitor = rb.WebSocketRiskMonitor(bridge)
+
+        assert asyncio.run(monitor.connect_feed(["BTC-USD", "ETH-USD"])) is True
+
+        assert requested == [["BTC", "ETH"]]
+        assert bridge.current_prices == {"BTC": 50100.0, "ETH": 3000.0}
+        assert [t.price for t in bridge.price_history["BTC"]] == [50000.0, 50100.0]
+        first = bridge.price_history["BTC"][0]
+        assert (first.high_24h, first.low_24h, first.volume_24h) == (51000.0, 49000.0, 12.5)
+        assert first.source == "market_feed"
+        # Missing 24h stats fall back to the tick price
+        eth = bridge.price_history["ETH"][0]
+        assert (eth.high_24h, eth.low_24h, eth.volume_24h) == (3000.0, 3000.0, 0)
+
+    def test_feed_error_falls_back(self, bridge, monkeypatch):
+        async def broken_stream_ticks(symbols):
+            raise ConnectionError("daemon went away")
+            yield
+
+        monkeypatch.setattr(market_feed, "feed_available", lambda: True)
+        monkeypatch.setattr(market_feed, "stream_ticks", broken_stream_ticks)
+        monitor = rb.WebSocketRiskMonitor(bridge)
+
+        assert asyncio.run(monitor.connect_feed(["BTC-USD"])) is False
+        assert bridge.current_prices == {}
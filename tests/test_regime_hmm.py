@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Regime HMM Tests
+Online forward filter, warm-started walk-forward retrains and model persistence
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("hmmlearn")
+
+from core.regime.hmm_regime_detector import RegimeHMMDetector
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    n = 400
+    vol = np.where(np.arange(n) < 200, 0.005, 0.03)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, vol)))
+    return pd.DataFrame({'Close': close}, index=pd.date_range("2025-01-01", periods=n, freq="h"))
+
+
+@pytest.fixture
+def detector(prices):
+    d = RegimeHMMDetector({"n_components": 3, "volatility_window": 20})
+    d.train_model(prices.iloc[:300])
+    return d
+
+
+class TestRegimeHMMDetector:
+
+    def test_predict_does_not_mutate_input(self, detector, prices):
+        frame = prices.tail(60).copy()
+        detector.predict_regime(frame)
+        assert list(frame.columns) == ['Close']
+
+    def test_online_filter_matches_batch_posterior(self, detector, prices):
+        features = detector.scaler.transform(detector.compute_features(prices).to_numpy())
+
+        for timestamp, close in zip(prices.index, prices['Close']):
+            detector.update(close, timestamp)
+
+        expected = detector.hmm_model.predict_proba(features)[-1]
+        probs = list(detector.regime_probabilities().values())
+        assert probs == pytest.approx(expected, abs=1e-6)
+
+        # Streaming the same frame again is a no-op
+        before = detector.regime_probabilities()
+        detector.update_from_frame(prices)
+        assert detector.regime_probabilities() == before
+
+    def test_incremental_updates_track_batch(self, detector, prices):
+        detector.update_from_frame(prices.iloc[:100])
+        for end in (150, 250, 400):
+            detector.update_from_frame(prices.iloc[:end])
+            features = detector.scaler.transform(detector.compute_features(prices.iloc[:end]).to_numpy())
+            expected = detector.hmm_model.predict_proba(features)[-1]
+            assert list(detector.regime_probabilities().values()) == pytest.approx(expected, abs=1e-6)
+
+    def test_warm_start_retrain_keeps_states(self, detector, prices):
+        means_before = detector.hmm_model.means_.copy()
+        detector.train_model(prices.iloc[20:320])
+
+        assert detector.hmm_model.monitor_.iter <= detector.warm_start_n_iter
+        assert np.abs(detector.hmm_model.means_ - means_before).max() < 0.5
+
+    def test_should_retrain(self, detector):
+        assert RegimeHMMDetector().should_retrain()
+        assert not detector.should_retrain()
+        detector.retrain_interval = detector.retrain_interval * 0
+        assert detector.should_retrain()
+
+    def test_model_persisted_across_instances(self, prices, tmp_path):
+        path = tmp_path / "regime.pkl"
+        trained = RegimeHMMDetector({"model_path": str(path)})
+        trained.train_model(prices)
+        assert path.exists()
+
+        reused = RegimeHMMDetector({"model_path": str(path)})
+        assert not reused.should_retrain()
+        assert reused.predict_regime(prices.tail(60)) == trained.predict_regime(prices.tail(60))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Regime Service Tests
+Vectorized watchlist regimes and the shared snapshot
+"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.regime.regime_service import (
+    RegimeService,
+    compute_regime_arrays,
+    stack_ohlcv,
+)
+
+
+def _ohlcv(n, seed, vol=0.01):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, vol, n)))
+    spread = np.abs(rng.normal(0, vol, n)) * close
+    return pd.DataFrame({
+        'Open': close,
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': np.ones(n)
+    }, index=pd.date_range("2025-01-01", periods=n, freq="h"))
+
+
+def _reference(df, period=14):
+    """Per-symbol pandas computation the service replaces"""
+    high, low, close = df['High'], df['Low'], df['Close']
+    tr = pd.concat([high - low, abs(high - close.shift()), abs(low - close.shift())], axis=1).max(axis=1)
+    atr = tr.rolling(window=period).mean()
+    high_diff, low_diff = high.diff(), -low.diff()
+    plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
+    minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
+    plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
+    minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di + 0.0001)
+    adx = dx.rolling(window=period).mean()
+    return adx.iloc[-1], (atr.rank(pct=True) * 100).iloc[-1], atr.iloc[-1]
+
+
+class FakeFetcher:
+    def __init__(self, frames, delay=0.0):
+        self.frames = frames
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol, bars):
+        with self.lock:
+            self.calls.append(symbol)
+        time.sleep(self.delay)
+        if symbol not in self.frames:
+            raise ValueError("unknown symbol")
+        return self.frames[symbol]
+
+
+@pytest.fixture
+def frames():
+    return {
+        "BTC": _ohlcv(720, 1, vol=0.02),
+        "ETH": _ohlcv(500, 2),
+        "SOL": _ohlcv(300, 3, vol=0.03),
+        "NEW": _ohlcv(60, 4)
+    }
+
+
+class TestVectorizedKernel:
+
+    def test_matches_per_symbol_pandas(self, frames):
+        stacked = stack_ohlcv(frames)
+        arrays = compute_regime_arrays(stacked["High"], stacked["Low"], stacked["Close"])
+
+        for i, symbol in enumerate(stacked["symbols"]):
+            adx, atr_pct, atr = _reference(frames[symbol])
+            assert arrays["bars"][i] == len(frames[symbol])
+            assert arrays["atr"][i] == pytest.approx(atr)
+            assert arrays["atr_percentile"][i] == pytest.approx(atr_pct)
+            assert arrays["adx"][i] == pytest.approx(adx, nan_ok=True)
+
+    def test_stack_accepts_lowercase_columns(self, frames):
+        lower = {"BTC": frames["BTC"].rename(columns=str.lower)}
+        stacked = stack_ohlcv(lower, bars=100)
+        assert stacked["Close"].shape == (1, 100)
+        assert stacked["Close"][0, -1] == frames["BTC"]["Close"].iloc[-1]
+
+
+class TestRegimeService:
+
+    def test_one_refresh_serves_every_symbol(self, frames):
+        fetch = FakeFetcher(frames)
+        service = RegimeService(fetch_ohlcv=fetch, symbols=["BTC", "ETH", "SOL", "NEW"])
+
+        btc = service.get("BTC")
+        eth = service.get("eth")
+
+        assert service.refresh_count == 1
+        assert sorted(fetch.calls) == ["BTC", "ETH", "NEW", "SOL"]
+        assert btc.bars == 720 and eth.bars == 500
+        assert service.get("NEW").regime == "Insufficient Data"
+        assert btc.recommended_types
+
+    def test_concurrent_readers_share_one_refresh(self, frames):
+        fetch = FakeFetcher(frames, delay=0.1)
+        service = RegimeService(fetch_ohlcv=fetch, symbols=["BTC", "ETH"])
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(service.get("BTC"))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert service.refresh_count == 1
+        assert len({id(r) for r in results}) == 1
+
+    def test_stale_snapshot_refreshes(self, frames):
+        service = RegimeService(fetch_ohlcv=FakeFetcher(frames), symbols=["BTC"])
+        service.get("BTC")
+        snap = service.snapshot()
+        object.__setattr__(snap, "valid_until", time.time() - 1)
+
+        service.get("BTC")
+        assert service.refresh_count == 2
+        assert service.snapshot() is not snap
+
+    def test_failed_symbol_does_not_trigger_refresh_storm(self, frames):
+        service = RegimeService(fetch_ohlcv=FakeFetcher(frames), symbols=["BTC", "DOGE"])
+
+        assert service.get("DOGE") is None
+        assert service.get("DOGE") is None
+        assert service.get("BTC") is not None
+        assert service.refresh_count == 1
+
+    def test_snapshot_valid_until_candle_close(self, frames):
+        service = RegimeService(fetch_ohlcv=FakeFetcher(frames), symbols=["BTC"], timeframe="1h")
+        snap = service.refresh()
+        assert snap.valid_until % 3600 == 0
+        assert 0 < snap.valid_until - snap.computed_at <= 3600
+        assert "BTC" in snap.to_dict()["regimes"]
+
+
+@pytest.fixture
+def shared_service(frames, monkeypatch):
+    module = sys.modules[RegimeService.__module__]  # core.regime re-exports an instance under the same name
+    service = RegimeService(fetch_ohlcv=FakeFetcher(frames), symbols=["BTC"])
+    monkeypatch.setattr(module, "regime_service", service)
+    return service
+
+
+class TestDetectorsReadSharedSnapshot:
+
+    def test_strategy_engine_unknown_symbol_without_data(self, shared_service):
+        from core.strategies.strategy_engine import MarketRegimeDetector
+        reading = MarketRegimeDetector().detect_regime(symbol="DOGE")
+        assert reading["regime"] == "Insufficient Data"
+        assert reading["recommended_types"] == []
+
+    def test_strategy_engine_falls_back_to_frame(self, shared_service, frames):
+        from core.strategies.strategy_engine import MarketRegimeDetector
+        reading = MarketRegimeDetector().detect_regime(frames["BTC"], symbol="DOGE")
+        assert reading["regime"] != "Insufficient Data"
+
+    def test_manus_detector_uses_service(self, shared_service, monkeypatch):
+        from core.strategies.manus_framework.market_regime_detector import MarketRegimeDetector
+        detector = MarketRegimeDetector()
+        monkeypatch.setattr(detector, "calculate_atr", lambda *a: pytest.fail("recomputed locally"))
+        expected = shared_service.get("BTC")
+        result = detector.detect_regime(symbol="BTC")
+        assert result["regime"] == expected.regime and result["adx"] == expected.adx
+        assert result["recommended_strategy_types"] == detector.get_recommended_strategies(expected.regime)
+        assert detector.detect_regime(symbol="DOGE")["regime"] == "Insufficient Data"
+        refreshes = shared_service.refresh_count
+        detector.detect_regime(symbol="DOGE")
+        assert shared_service.refresh_count == refreshes
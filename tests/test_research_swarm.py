@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Research Swarm Tests
+Parallel fan-out, per-source timeouts, report cache and background Manus polling
+"""
+
+import time
+import threading
+from datetime import datetime
+
+import pytest
+
+from core.integrations import research_swarm as rs
+from core.integrations.research_swarm import ResearchResult, ResearchSwarm, ManusPoller
+
+
+def _result(source, query):
+    return ResearchResult(
+        source=source,
+        query=query,
+        analysis=f"{source} analysis",
+        confidence=60.0,
+        sources_cited=[],
+        scholarly_refs=["Ref A"],
+        timestamp=datetime.now().isoformat()
+    )
+
+
+class FakeManus:
+    def __init__(self, complete_after=2):
+        self.complete_after = complete_after
+        self.polls = 0
+        self.created = 0
+
+    def create_task(self, prompt, agent_profile=None, task_mode=None):
+        self.created += 1
+        time.sleep(0.2)
+        return {'task_id': 'task-1', 'task_url': 'https://manus/task-1'}
+
+    def get_task(self, task_id):
+        self.polls += 1
+        if self.polls >= self.complete_after:
+            return {
+                'status': 'completed',
+                'output': [{'role': 'assistant', 'content': [{'type': 'output_text', 'text': 'deep dive'}]}]
+            }
+        return {'status': 'running'}
+
+
+class FakeGemini:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = 0
+
+    def research(self, query, context=""):
+        self.calls += 1
+        time.sleep(self.delay)
+        return _result('gemini', query)
+
+
+class FakeDSStar:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+
+    def analyze(self, query, asset=None):
+        time.sleep(self.delay)
+        return _result('ds_star', query)
+
+
+@pytest.fixture
+def swarm(monkeypatch):
+    monkeypatch.setattr(rs, 'ManusClient', lambda: FakeManus())
+    monkeypatch.setattr(rs, 'GeminiResearcher', lambda: FakeGemini())
+    monkeypatch.setattr(rs, 'DSStarAnalyzer', lambda: FakeDSStar())
+    monkeypatch.delenv('REPLIT_API_URL', raising=False)
+    s = ResearchSwarm(gemini_timeout=2, ds_star_timeout=2, manus_dispatch_timeout=2)
+    s.manus_poller = ManusPoller(s.manus, initial_interval=0.02, max_interval=0.05)
+    yield s
+    s.manus_poller.stop()
+
+
+class TestResearchSwarm:
+
+    def test_sources_run_concurrently(self, swarm):
+        started = time.monotonic()
+        report = swarm.research("BTC regime?", asset="BTC", wait_for_manus=False)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.5  # three 0.2s sources, not 0.6s sequential
+        assert report['sources']['gemini']['status'] == 'complete'
+        assert report['sources']['ds_star']['status'] == 'complete'
+
+    def test_independent_timeouts(self, swarm):
+        swarm.gemini.delay = 1.0
+        swarm.timeouts['gemini'] = 0.3
+
+        report = swarm.research("BTC regime?", asset="BTC", wait_for_manus=False)
+
+        assert report['raw_results']['gemini']['status'] == 'timeout'
+        assert report['sources']['ds_star']['status'] == 'complete'
+        assert report['degraded'] is True
+        # Degraded reports are not served from cache
+        assert swarm.get_cached_report("BTC regime?", "BTC") is None
+
+    def test_report_cached_per_query_asset_day(self, swarm):
+        first = swarm.research("BTC  regime?", asset="btc", wait_for_manus=False)
+        second = swarm.research("btc regime?", asset="BTC", wait_for_manus=False)
+        third = swarm.research("btc regime?", asset="ETH", wait_for_manus=False)
+
+        assert second is first
+        assert third is not first
+        assert swarm.gemini.calls == 2
+
+    def test_wait_for_manus_folds_result_in(self, swarm):
+        report = swarm.research("BTC regime?", asset="BTC", wait_for_manus=True, manus_timeout=5)
+
+        assert report['sources']['manus']['status'] == 'complete'
+        assert report['raw_results']['manus']['analysis'] == 'deep dive'
+
+    def test_background_manus_updates_cache_and_calls_back(self, swarm):
+        updated = []
+        done = threading.Event()
+
+        def on_complete(report):
+            updated.append(report)
+            done.set()
+
+        swarm.manus.complete_after = 3
+        report = swarm.research(
+            "BTC regime?", asset="BTC", wait_for_manus=False, on_manus_complete=on_complete
+        )
+        assert report['sources']['manus']['status'] == 'pending'
+
+        assert done.wait(5)
+        assert updated[0]['sources']['manus']['status'] == 'complete'
+        assert swarm.get_cached_report("BTC regime?", "BTC")['sources']['manus']['status'] == 'complete'
+
+    def test_overlapping_submits_do_not_starve_sources(self, swarm):
+        swarm._pool.shutdown(wait=False)
+        swarm._pool = rs.ThreadPoolExecutor(max_workers=2)
+
+        futures = [
+            swarm.submit(f"{asset} regime?", asset=asset, wait_for_manus=False)
+            for asset in ("BTC", "ETH")
+        ]
+        reports = [f.result(timeout=10) for f in futures]
+
+        for report in reports:
+            assert report['degraded'] is False
+            assert report['sources']['gemini']['status'] == 'complete'
+
+
+class TestManusPoller:
+
+    def test_exponential_backoff_and_timeout(self):
+        manus = FakeManus(complete_after=10 ** 6)
+        poller = ManusPoller(manus, initial_interval=0.01, backoff=2.0, max_interval=0.08)
+
+        watch = poller.watch('task-x', timeout=0.3)
+        assert watch.wait(2)
+        assert watch.status == 'timeout'
+        # 0.01, 0.02, 0.04, 0.08, 0.08... - far fewer polls than a fixed 10ms loop
+        assert 3 <= watch.polls <= 8
+
+    def test_callback_after_settle_runs_immediately(self):
+        poller = ManusPoller(FakeManus(complete_after=1), initial_interval=0.01)
+        watch = poller.watch('task-y')
+        assert watch.wait(2)
+
+        seen = []
+        watch.add_callback(lambda w: seen.append(w.status))
+        assert seen == ['complete']
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - RL Replay Buffer Tests
+Circular NumPy storage, prioritized sampling and the decoupled training loop
+"""
+
+import numpy as np
+import pytest
+
+from core.agents_highlevel.rl_rebalancing_agent import ReplayBuffer, RLRebalancingAgent
+
+
+def _fill(buffer, n, state_size=4):
+    for i in range(n):
+        state = np.full(state_size, i, dtype=np.float32)
+        buffer.push(state, i % 4, float(i), state + 1, i % 10 == 9)
+
+
+class CountingEnv:
+    """Ten-step episodes over random 16-dim states"""
+
+    def __init__(self):
+        self.rng = np.random.default_rng(0)
+        self.t = 0
+        self.resets = 0
+
+    def reset(self):
+        self.t = 0
+        self.resets += 1
+        return self.rng.random(16).astype(np.float32), {}
+
+    def step(self, action):
+        self.t += 1
+        return self.rng.random(16).astype(np.float32), 1.0, self.t >= 10, False, {}
+
+
+class TestReplayBuffer:
+
+    def test_typed_sample(self):
+        buffer = ReplayBuffer(100, seed=0)
+        _fill(buffer, 50)
+        states, actions, rewards, next_states, dones = buffer.sample(32)
+
+        assert states.shape == next_states.shape == (32, 4)
+        assert states.dtype == np.float32 and actions.dtype == np.int64
+        assert (next_states == states + 1).all()
+        # Rows stay aligned across arrays
+        assert (rewards == states[:, 0]).all()
+        assert (actions == states[:, 0].astype(int) % 4).all()
+        assert dones.dtype == np.float32
+
+    def test_wraps_around_capacity(self):
+        buffer = ReplayBuffer(10, state_size=4, seed=1)
+        _fill(buffer, 25)
+        assert len(buffer) == 10
+        assert sorted(buffer.rewards) == list(range(15, 25))
+
+    def test_push_batch_matches_push(self):
+        one, many = ReplayBuffer(8, seed=2), ReplayBuffer(8, seed=2)
+        _fill(one, 12)
+        states = np.repeat(np.arange(12, dtype=np.float32)[:, None], 4, axis=1)
+        many.push_batch(states, np.arange(12) % 4, np.arange(12), states + 1, np.arange(12) % 10 == 9)
+
+        assert len(many) == len(one) == 8
+        assert many.position == one.position
+        assert (many.states == one.states).all()
+        assert (many.dones == one.dones).all()
+
+    def test_small_buffer_returns_what_it_has(self):
+        buffer = ReplayBuffer(100, seed=3)
+        _fill(buffer, 5)
+        assert len(buffer.sample(32)[0]) == 5
+
+
+class TestPrioritizedReplay:
+
+    def test_high_priority_sampled_more(self):
+        buffer = ReplayBuffer(100, prioritized=True, alpha=1.0, seed=4)
+        _fill(buffer, 100)
+        buffer.update_priorities(np.arange(100), np.full(100, 0.01))
+        buffer.update_priorities(np.array([7]), np.array([10.0]))
+
+        _, idx, weights = buffer.sample_with_info(1000)
+        assert np.mean(idx == 7) > 0.8
+        # The over-sampled experience gets the smallest correction weight
+        assert weights[idx == 7].max() < weights[idx != 7].min()
+        assert weights.max() == pytest.approx(1.0)
+
+    def test_new_experiences_get_max_priority(self):
+        buffer = ReplayBuffer(10, prioritized=True, seed=5)
+        _fill(buffer, 3)
+        buffer.update_priorities(np.arange(3), np.array([0.1, 5.0, 0.1]))
+        _fill(buffer, 1)
+        assert buffer.priorities[3] == pytest.approx(5.0 + buffer.priority_eps)
+
+
+class TestTrainingLoop:
+
+    def test_steps_between_updates(self, tmp_path):
+        agent = RLRebalancingAgent(batch_size=8, model_path=str(tmp_path / "rl.pth"),
+                                   prioritized_replay=True)
+        env = CountingEnv()
+        summary = agent.learn(env, total_steps=100, train_every=10, gradient_steps=2, warmup_steps=20)
+
+        assert summary["episodes"] == 10
+        assert env.resets == 11
+        # Rounds at steps 20, 30, ..., 100
+        assert summary["updates"] == 18
+        assert len(agent.memory) == 100
+        assert agent.episode == 10
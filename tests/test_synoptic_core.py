@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Synoptic Core Tests
+Concurrent stream gathering, per-stream caches and batch assessment
+"""
+
+import time
+
+import pytest
+
+from ds_star.synoptic_core import text_sources_client
+from ds_star.synoptic_core.core import SynopticCore, SmartAssetScore
+from ds_star.synoptic_core.text_sources_client import TextSourcesClient
+from ds_star.synoptic_core.market_data_client import (
+    timeframe_seconds,
+    seconds_until_candle_close,
+)
+
+
+class FakeMarket:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = 0
+
+    def get_ohlcv(self, asset, timeframe, days):
+        self.calls += 1
+        time.sleep(self.delay)
+        return asset
+
+    def get_indicators(self, ohlcv):
+        return {"rsi": 45, "macd": {"histogram": 1}, "ema_20": 100, "ema_50": 90, "close": 110, "atr_pct": 3}
+
+
+class FakeOnChain:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = 0
+        self.bulk_calls = 0
+        self.tvl_seen = []
+
+    def get_metrics(self, asset, days, tvl=None):
+        self.calls += 1
+        self.tvl_seen.append(tvl)
+        time.sleep(self.delay)
+        return {"whale_net_flow": 1, "exchange_net_flow": -1, "active_address_growth": 2, "tvl_change_pct": 0}
+
+    def get_tvl_bulk(self, assets):
+        self.bulk_calls += 1
+        return {a: {"tvl_usd": 1, "tvl_change_pct": 0, "tvl_source": "defillama"} for a in assets}
+
+
+class FakeText:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.sentiment_delay = delay
+        self.fundamental_calls = 0
+        self.sentiment_calls = 0
+        self.fear_greed_calls = 0
+
+    def get_fundamentals(self, asset):
+        self.fundamental_calls += 1
+        time.sleep(self.delay)
+        return {"github_commits_30d": 120, "last_major_update_days": 10, "annual_inflation_pct": 1}
+
+    def get_sentiment(self, asset, fear_greed=None):
+        self.sentiment_calls += 1
+        time.sleep(self.sentiment_delay)
+        return {"composite_score": 60, "fear_greed_index": fear_greed or 50}
+
+    def get_fear_greed(self):
+        self.fear_greed_calls += 1
+        return 40
+
+
+@pytest.fixture
+def core(monkeypatch, tmp_path):
+    c = SynopticCore()
+    c.market_client = FakeMarket()
+    c.onchain_client = FakeOnChain()
+    c.text_client = FakeText()
+    c.log_dir = tmp_path
+    monkeypatch.setattr(c, "_log_analysis", lambda *a, **k: None)
+    return c
+
+
+class TestTimeframes:
+
+    def test_timeframe_seconds(self):
+        assert timeframe_seconds("15m") == 900
+        assert timeframe_seconds("4h") == 14400
+        assert timeframe_seconds("10m") == 600
+        with pytest.raises(ValueError):
+            timeframe_seconds("soon")
+
+    def test_seconds_until_candle_close(self):
+        assert seconds_until_candle_close("1h", now=3600 * 5 + 600) == 3000
+
+
+class TestSynopticCore:
+
+    def test_streams_gathered_concurrently(self, core):
+        started = time.monotonic()
+        result = core.assess("BTC")
+        elapsed = time.monotonic() - started
+
+        assert isinstance(result, SmartAssetScore)
+        assert elapsed < 0.5  # four 0.2s streams, not 0.8s sequential
+        assert "MACD bullish" in result.supporting_signals["technical"]
+
+    def test_stream_timeout_is_isolated(self, core):
+        core.text_client.sentiment_delay = 1.0
+        core.stream_timeouts["sentiment"] = 0.3
+
+        result = core.assess("BTC")
+
+        assert "timed out" in result.supporting_signals["sentiment"][0]
+        assert "MACD bullish" in result.supporting_signals["technical"]
+
+    def test_per_stream_cache(self, core):
+        core.assess("BTC")
+        core.assess("BTC")
+
+        assert core.market_client.calls == 1
+        assert core.text_client.fundamental_calls == 1
+
+        core.clear_cache("technical")
+        core.assess("BTC")
+        assert core.market_client.calls == 2
+        assert core.text_client.fundamental_calls == 1
+
+    def test_expired_stream_refetched(self, core):
+        core.stream_ttls["sentiment"] = 0.05
+        core.assess("BTC")
+        time.sleep(0.1)
+        core.assess("BTC")
+        assert core.text_client.sentiment_calls == 2
+        assert core.text_client.fundamental_calls == 1
+
+    def test_assess_many_shares_bulk_requests(self, core):
+        assets = ["BTC", "ETH", "SOL", "AAVE", "LINK"]
+
+        started = time.monotonic()
+        results = core.assess_many(assets)
+        elapsed = time.monotonic() - started
+
+        assert list(results) == assets
+        assert elapsed < 1.0  # 20 streams x 0.2s run side by side
+        assert core.onchain_client.bulk_calls == 1
+        assert core.text_client.fear_greed_calls == 1
+        assert all(tvl is not None for tvl in core.onchain_client.tvl_seen)
+        assert "Bullish sentiment (60/100)" in results["BTC"].supporting_signals["sentiment"]
+
+    def test_failed_fetch_not_cached(self, core, monkeypatch):
+        class RateLimited:
+            status_code = 429
+
+        monkeypatch.setattr(text_sources_client.requests, "get", lambda *a, **k: RateLimited())
+        text = TextSourcesClient()
+        calls = []
+
+        def get_fundamentals(asset):
+            calls.append(asset)
+            return text.get_fundamentals(asset)
+
+        monkeypatch.setattr(core.text_client, "get_fundamentals", get_fundamentals)
+
+        core.assess("BTC")
+        core.assess("BTC")
+
+        assert text.get_fundamentals("BTC")["data_source"] == "unavailable"
+        assert len(calls) == 2  # the placeholder fundamentals were not pinned for a day
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Tick Store Tests
+Columnar ring buffers, incremental VWAP/volatility/correlation and snapshots
+"""
+
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.monitoring.tick_store import EWCorrelation, TickStore, VOL_SCALE
+
+
+def _feed(store, pair, exchange, prices, volumes=None, start=0.0, step=1.0):
+    volumes = volumes if volumes is not None else [1.0] * len(prices)
+    for i, (price, volume) in enumerate(zip(prices, volumes)):
+        store.append(pair, exchange, price, volume, ts=start + i * step)
+
+
+class TestRing:
+
+    def test_capacity_and_order(self):
+        store = TickStore(capacity=5, vwap_window=5)
+        _feed(store, "BTC/USD", "coinbase", [1, 2, 3, 4, 5, 6, 7])
+        ring = store.ring("BTC/USD", "coinbase")
+        assert ring.count == 5
+        assert ring.column("price").tolist() == [3, 4, 5, 6, 7]
+        assert ring.column("ts", 2).tolist() == [5.0, 6.0]
+
+    def test_pair_index_without_key_scans(self):
+        store = TickStore()
+        store.append("BTC/USD", "coinbase", 100.0)
+        store.append("BTC/USD", "kraken", 101.0)
+        store.append("ETH/USD", "kraken", 10.0)
+        assert store.current_prices("BTC/USD") == {"coinbase": 100.0, "kraken": 101.0}
+        assert store.exchanges() == ["coinbase", "kraken"]
+        assert store.exchanges("ETH/USD") == ["kraken"]
+
+
+class TestIncrementalAnalytics:
+
+    def test_vwap_matches_window_recompute(self):
+        rng = np.random.default_rng(0)
+        store = TickStore(capacity=50, vwap_window=20)
+        prices = {ex: 100 + rng.normal(0, 1, 130).cumsum() for ex in ("coinbase", "okx")}
+        volumes = {ex: rng.exponential(5, 130) for ex in ("coinbase", "okx")}
+        for ex in prices:
+            _feed(store, "SOL/USD", ex, prices[ex], volumes[ex])
+        pv = sum(np.dot(prices[ex][-20:], volumes[ex][-20:]) for ex in prices)
+        v = sum(volumes[ex][-20:].sum() for ex in prices)
+        assert store.vwap("SOL/USD") == pytest.approx(pv / v, rel=1e-9)
+
+    def test_volatility_tracks_per_venue_returns(self):
+        store = TickStore(min_returns=20)
+        # Two venues quoting 1% apart must not show up as volatility
+        _feed(store, "ETH/USD", "coinbase", [100.0] * 30)
+        _feed(store, "ETH/USD", "okx", [101.0] * 30)
+        assert store.volatility("ETH/USD")["atm_vol"] == 0.0
+
+        store = TickStore(min_returns=20)
+        prices = [100 * (1.01 if i % 2 else 1.0) for i in range(41)]
+        _feed(store, "ETH/USD", "coinbase", prices)
+        vol = store.volatility("ETH/USD")
+        assert vol["atm_vol"] == pytest.approx(math.log(1.01) * VOL_SCALE, rel=1e-9)
+        assert vol["spot_vol"] == pytest.approx(vol["atm_vol"], rel=1e-9)
+        assert vol["skew"] > 0
+
+    def test_not_enough_returns(self):
+        store = TickStore(min_returns=20)
+        _feed(store, "ADA/USD", "kraken", [1.0, 1.1, 1.2])
+        assert store.volatility("ADA/USD") is None
+
+
+class TestCorrelation:
+
+    def test_ew_correlation_signs(self):
+        rng = np.random.default_rng(1)
+        store = TickStore(sample_interval=1.0, corr_halflife=200)
+        base = rng.normal(0, 0.01, 400)
+        noise = rng.normal(0, 0.01, 400)
+        a = 100 * np.exp(np.cumsum(base))
+        b = 50 * np.exp(np.cumsum(base))
+        c = 10 * np.exp(np.cumsum(-base))
+        d = 20 * np.exp(np.cumsum(noise))
+        for i in range(400):
+            for pair, series in (("A", a), ("B", b), ("C", c), ("D", d)):
+                store.append(pair, "okx", series[i], 1.0, ts=float(i))
+        pairs, corr, samples = store.correlation()
+        assert pairs == ["A", "B", "C", "D"] and samples > 300
+        assert corr[0, 1] == pytest.approx(1.0, abs=1e-6)
+        assert corr[0, 2] == pytest.approx(-1.0, abs=1e-6)
+        assert abs(corr[0, 3]) < 0.3
+        assert np.allclose(np.diag(corr), 1.0)
+
+    def test_matches_batch_ewm_covariance(self):
+        rng = np.random.default_rng(2)
+        returns = rng.normal(0, 1, (300, 3))
+        ew = EWCorrelation(halflife=30)
+        ew.resize(3)
+        for row in returns:
+            ew.update(row)
+        w = (1 - ew.alpha) ** np.arange(299, -1, -1)
+        mean = (w[:, None] * returns).sum(0) / w.sum()
+        batch = np.corrcoef(((returns - mean) * np.sqrt(w)[:, None]).T)
+        assert np.allclose(ew.correlation(), batch, atol=0.05)
+
+
+class TestSnapshot:
+
+    def test_publish_swaps_immutable_snapshot(self):
+        store = TickStore()
+        store.append("BTC/USD", "coinbase", 100.0, 1.0, bid=99.5, ask=100.5, ts=0.0)
+        store.append("BTC/USD", "kraken", 100.2, 1.0, bid=99.9, ask=100.6, ts=0.0)
+        before = store.snapshot
+        snap = store.publish()
+        assert store.snapshot is snap and snap.version == before.version + 1
+        btc = snap.pairs["BTC/USD"]
+        assert (btc.bid, btc.ask) == (99.9, 100.5)
+        assert btc.vwap == pytest.approx(100.1)
+
+        store.append("BTC/USD", "coinbase", 200.0, 1.0, ts=1.0)
+        assert snap.pairs["BTC/USD"].prices["coinbase"] == 100.0  # readers keep their view
+        with pytest.raises(TypeError):
+            snap.pairs["BTC/USD"].prices["coinbase"] = 0.0
+        with pytest.raises(ValueError):
+            snap.correlations[:] = 0.0
+
+
+class TestShadowScope:
+
+    def test_ticks_flow_into_store(self):
+        module = pytest.importorskip("core.monitoring.shadow_scope", exc_type=ImportError)
+        scope = module.ShadowScope()
+        for i in range(30):
+            for exchange in ("coinbase", "okx"):
+                scope._store_tick_data(module.MarketTick(
+                    exchange=exchange, pair="BTC/USD", price=45000.0 + (i % 3), volume=1.0,
+                    bid=44999.0, ask=45001.0, timestamp=datetime.fromtimestamp(1_700_000_000 + i),
+                    reliability=0.9))
+        assert set(scope.get_current_prices("BTC/USD")) == {"coinbase", "okx"}
+        assert scope.get_vwap("BTC/USD") == pytest.approx(45000.0, abs=2)
+        assert scope.get_volatility_surface("BTC/USD").atm_vol > 0
+        assert scope.get_snapshot().version == 0
+        scope.store.publish()
+        assert scope.get_snapshot().pairs["BTC/USD"].ticks == 60
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+🏴 Sovereign Shadow - Trigger Index Tests
+Bisect lookups for TP/SL ladders and alerts, and their wiring into the monitors
+"""
+
+import json
+import random
+from datetime import datetime
+
+import pytest
+
+from core.monitoring.trigger_index import ABOVE, BELOW, TriggerIndex
+
+
+def _brute_satisfied(triggers, price):
+    return {t.id for t in triggers
+            if (t.direction == ABOVE and price >= t.level) or (t.direction == BELOW and price <= t.level)}
+
+
+class TestTriggerIndex:
+
+    def test_satisfied_matches_linear_scan(self):
+        rng = random.Random(7)
+        index = TriggerIndex()
+        for i in range(500):
+            index.add(rng.choice(["BTC", "ETH"]), rng.uniform(50, 150), rng.choice([ABOVE, BELOW]))
+        for _ in range(200):
+            price = rng.uniform(40, 160)
+            hits = index.satisfied("BTC", price)
+            assert {t.id for t in hits} == _brute_satisfied(index.triggers("BTC"), price)
+
+    def test_update_fires_only_on_crossing(self):
+        index = TriggerIndex()
+        tp = index.add("BTC", 110, ABOVE, "TP")
+        sl = index.add("BTC", 90, BELOW, "SL")
+
+        assert index.update("BTC", 100) == []
+        assert index.update("BTC", 111) == [tp]
+        assert index.update("BTC", 115) == []          # still above, no re-fire
+        assert index.update("BTC", 100) == []
+        assert index.update("BTC", 85) == [sl]
+
+    def test_update_crosses_many_levels_in_one_tick(self):
+        index = TriggerIndex()
+        ladder = [index.add("SOL", level, ABOVE) for level in (120, 130, 140, 150)]
+        index.update("SOL", 100)
+        assert index.update("SOL", 145) == ladder[:3]
+
+    def test_first_price_behaves_like_satisfied(self):
+        index = TriggerIndex()
+        sl = index.add("eth", 3000, BELOW)
+        assert index.update("ETH", 2900) == [sl]
+
+    def test_once_triggers_disarm_and_ids_replace(self):
+        index = TriggerIndex()
+        index.add("BTC", 110, ABOVE, once=True, trigger_id="btc_up")
+        index.add("BTC", 120, ABOVE, once=True, trigger_id="btc_up")   # re-arm replaces
+        assert len(index) == 1
+        index.update("BTC", 100)
+        assert [t.level for t in index.update("BTC", 125)] == [120]
+        assert len(index) == 0
+
+    def test_remove_and_nearest(self):
+        index = TriggerIndex()
+        a = index.add("BTC", 110, ABOVE)
+        b = index.add("BTC", 110, ABOVE)
+        c = index.add("BTC", 90, BELOW)
+        assert index.remove(a) and not index.remove(a)
+        assert index.satisfied("BTC", 110) == [b]
+        assert index.nearest("BTC", 100) == (b, c)
+        assert index.remove_where(lambda t: True, "BTC") == 2
+        assert index.symbols() == []
+
+    def test_pop_satisfied_disarms_in_arming_order(self):
+        index = TriggerIndex()
+        index.add('BTC', 105, ABOVE, 'tp_a')
+        index.add('BTC', 110, ABOVE, 'tp_b')
+        index.add('BTC', 90, BELOW, 'sl_b')
+        index.add('BTC', 95, BELOW, 'sl_a')
+
+        assert index.pop_satisfied('BTC', 100) == []
+        assert [t.payload for t in index.pop_satisfied('BTC', 106)] == ['tp_a']
+        assert [t.payload for t in index.pop_satisfied('BTC', 89)] == ['sl_b', 'sl_a']
+        assert len(index) == 1
+        assert index.symbols() == ['BTC']
+
+    def test_pop_satisfied_boundaries_and_cancelled(self):
+        index = TriggerIndex()
+        index.add('ETH', 100, ABOVE, 'live')
+        index.add('ETH', 100, ABOVE, 'cancelled')
+        index.add('ETH', 100, BELOW, 'stop')
+        hits = index.pop_satisfied('ETH', 100, lambda t: t.payload != 'cancelled')
+        assert [t.payload for t in hits] == ['live', 'stop']
+        assert len(index) == 0 and index.triggers('ETH') == []
+
+    def test_rejects_unknown_direction(self):
+        with pytest.raises(ValueError):
+            TriggerIndex().add("BTC", 1, "sideways")
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    module = pytest.importorskip("bin.position_monitor", exc_type=ImportError)
+    (tmp_path / "BRAIN.json").write_text(json.dumps({"positions_monitor": {
+        "positions": [{"symbol": "RENDER", "qty": 100, "entry_price": 1.28,
+                       "take_profit": 1.60, "stop_loss": 1.15, "take_profit_2": 2.0}],
+        "watchlist": [{"symbol": "SUI", "alert_below": 3.0, "alert_above": 5.0}],
+    }}))
+    monkeypatch.setattr(module, "SS3_ROOT", tmp_path)
+    monkeypatch.setattr(module, "connect_feed", None)
+    monitor = module.PositionMonitor(dry_run=True)
+    monitor.notifications = []
+    monkeypatch.setattr(monitor, "notify", lambda title, message: monitor.notifications.append(title))
+    return monitor
+
+
+class TestPositionMonitor:
+
+    def test_check_position_uses_ladder(self, monitor):
+        position = monitor.positions[0]
+        assert monitor.check_position(position, 1.30)['action'] == 'HOLD'
+        assert monitor.check_position(position, 1.10)['action'] == 'SELL_SL'
+        assert monitor.check_position(position, 1.70)['action'] == 'SELL_TP1'
+        assert monitor.check_position(position, 2.10)['action'] == 'SELL_TP'
+
+    def test_run_check_fetches_prices_in_bulk(self, monitor):
+        calls = []
+
+        class Exchange:
+            def fetch_tickers(self, symbols):
+                calls.append(symbols)
+                return {"RENDER/USDC": {"last": 1.10}, "SUI/USDC": {"last": 6.0}}
+
+            def fetch_ticker(self, symbol):
+                pytest.fail("per-symbol fetch")
+
+        monitor.exchange = Exchange()
+        monitor.cycle_count = monitor.watchlist_check_interval - 1
+        results = monitor.run_check()
+        assert calls == [["RENDER/USDC", "SUI/USDC"]]
+        assert results[0]['action'] == 'SELL_SL'
+        assert monitor.positions == []
+        assert "ALERT: SUI above $5.0" in monitor.notifications
+
+    def test_handle_tick_reacts_to_crossings(self, monitor):
+        assert monitor.handle_tick("RENDER", 1.30) == []
+        assert [r['action'] for r in monitor.handle_tick("RENDER", 1.65)] == ['SELL_TP1']
+        assert monitor.positions[0].qty == pytest.approx(50)
+        assert monitor.handle_tick("RENDER", 1.66) == []     # no re-sell while above TP1
+        monitor.handle_tick("SUI", 2.5)
+        assert "ALERT: SUI below $3.0" in monitor.notifications
+
+
+class TestAlertManagerTicks:
+
+    def test_streamed_tick_crossing_tier_threshold(self, monkeypatch, tmp_path):
+        module = pytest.importorskip("bin.realtime_alerts", exc_type=ImportError)
+        monkeypatch.setattr(module, "PROJECT_ROOT", tmp_path)
+        manager = module.AlertManager()
+        tier = module.ASSET_TO_TIER["BTC"]
+        threshold = module.ASSET_TIERS[tier]["price_change_alert"]
+
+        manager.arm_triggers(module.PriceData("BTC", 100.0, 0.0, 0.0, 0, 0, datetime.now(), tier))
+        assert manager.on_price("BTC", 100 + threshold / 2) == []
+        alerts = manager.on_price("BTC", 100 + threshold + 0.1)
+        assert [a["type"] for a in alerts] == ["price_1h"]
+        assert alerts[0]["change"] == pytest.approx(threshold + 0.1)
+        assert manager.on_price("BTC", 100 - threshold - 1) == []   # cooldown